@@ -0,0 +1,93 @@
+"""요청 실행 예산 - 마감 시각과 agent 스텝 수 제한"""
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Sequence
+
+from langchain_core.messages import AIMessage, AnyMessage, HumanMessage, ToolMessage
+from langchain_core.runnables import RunnableConfig
+
+logger = logging.getLogger(__name__)
+
+REASON_DEADLINE = "deadline"
+REASON_MAX_STEPS = "max_steps"
+
+
+@dataclass
+class RequestBudget:
+    """한 요청(턴)의 실행 예산 - config["configurable"]로 노드에 전달"""
+    deadline: Optional[float] = None  # time.monotonic() 기준 마감 시각
+    max_steps: Optional[int] = None  # 한 턴에서 허용하는 agent(LLM) 호출 횟수
+
+    PARTIAL_ANSWER_KEY = "partial_answer"
+
+    @classmethod
+    def start(cls, timeout: Optional[float], max_steps: Optional[int]) -> "RequestBudget":
+        """지금부터 timeout초 뒤를 마감으로 하는 예산 생성"""
+        deadline = time.monotonic() + timeout if timeout else None
+        return cls(deadline=deadline, max_steps=max_steps)
+
+    @classmethod
+    def from_config(cls, config: Optional[RunnableConfig]) -> "RequestBudget":
+        """실행 설정에서 예산 복원 (없으면 제한 없음)"""
+        configurable = (config or {}).get("configurable", {})
+        return cls(deadline=configurable.get("deadline"), max_steps=configurable.get("max_steps"))
+
+    def to_configurable(self) -> Dict[str, Any]:
+        """config["configurable"]에 넣을 값"""
+        return {"deadline": self.deadline, "max_steps": self.max_steps}
+
+    def remaining(self) -> Optional[float]:
+        """남은 시간(초) - 마감이 없으면 None"""
+        if self.deadline is None:
+            return None
+        return max(self.deadline - time.monotonic(), 0.0)
+
+    def expired(self) -> bool:
+        """마감이 지났는지 확인"""
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+    def limit_timeout(self, timeout: Optional[float]) -> Optional[float]:
+        """개별 호출 타임아웃을 남은 시간으로 제한"""
+        remaining = self.remaining()
+        if remaining is None:
+            return timeout
+        return remaining if timeout is None else min(timeout, remaining)
+
+    def steps_used(self, messages: Sequence[AnyMessage]) -> int:
+        """현재 턴(마지막 사용자 메시지 이후)의 agent 응답 수"""
+        steps = 0
+        for message in reversed(messages):
+            if isinstance(message, HumanMessage):
+                break
+            if isinstance(message, AIMessage):
+                steps += 1
+        return steps
+
+    def steps_exhausted(self, messages: Sequence[AnyMessage]) -> bool:
+        """스텝 예산을 모두 사용했는지 확인"""
+        return self.max_steps is not None and self.steps_used(messages) >= self.max_steps
+
+    def partial_answer(self, messages: Sequence[AnyMessage], reason: str) -> AIMessage:
+        """예산 소진 시 지금까지 확인한 도구 결과로 부분 답변 생성"""
+        results = []
+        for message in reversed(messages):
+            if isinstance(message, HumanMessage):
+                break
+            if isinstance(message, ToolMessage) and message.status == "success":
+                results.append(f"- {message.content}")
+        results.reverse()
+
+        if reason == REASON_DEADLINE:
+            header = "응답 제한 시간 안에 답변을 완성하지 못했습니다."
+        else:
+            header = "답변에 필요한 처리 단계가 너무 많아 중간에 멈췄습니다."
+
+        if results:
+            content = f"{header} 지금까지 확인한 정보는 다음과 같습니다.\n" + "\n".join(results)
+        else:
+            content = f"죄송합니다. {header} 질문을 조금 더 구체적으로 다시 시도해주세요."
+
+        logger.warning(f"요청 예산 소진({reason}) - 부분 답변 반환")
+        return AIMessage(content=content, response_metadata={self.PARTIAL_ANSWER_KEY: reason})
@@ -0,0 +1,173 @@
+"""체크포인트 messages 채널 델타 인코딩 - 메시지 본문 인터닝"""
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from langgraph.checkpoint.serde.base import SerializerProtocol
+
+from .settings import agent_settings
+
+logger = logging.getLogger(__name__)
+
+MESSAGE_REFS = "__message_refs__"
+CONTENT_REFS = "__content_refs__"
+CONTENT_REF = "__content_ref__"
+
+# message_key -> (type, bytes)
+MessageBodies = Dict[str, Tuple[str, bytes]]
+
+
+class MessageDeltaCodec:
+    """
+    체크포인트의 messages 채널을 메시지 키 목록으로 바꿔 저장하는 코덱.
+
+    - 메시지 본문은 내용 해시(키)로 한 번만 저장하고, 체크포인트에는 키 목록만 남김
+    - 긴 문자열 내용(시스템 프롬프트, 도구 결과 등)은 메시지 ID와 분리해 스레드 간에도 한 번만 저장
+    - 이미 직렬화한 메시지 객체는 다시 직렬화하지 않으므로 스텝마다 새로 추가된 메시지만 인코딩
+    - 읽을 때는 캐시에 없는 본문만 불러와 역직렬화
+    - 체크포인트는 참조하는 본문 키(메시지 + 분리한 내용)를 모두 담으므로 체크포인터가 안 쓰는 본문을 정리할 수 있음
+    """
+
+    INTERN_MIN_CHARS = 64
+
+    def __init__(
+        self,
+        serde: SerializerProtocol,
+        channel: str = "messages",
+        cache_size: Optional[int] = None,
+    ):
+        self.serde = serde
+        self.channel = channel
+        self.cache_size = cache_size or agent_settings.checkpoint_message_cache_size
+        self._lock = threading.Lock()
+
+        # id(message) -> (message, key, 본문들): 객체를 함께 보관해 id 재사용을 막음
+        self._encoded: "OrderedDict[int, Tuple[Any, str, MessageBodies]]" = OrderedDict()
+        # key -> 역직렬화된 메시지
+        self._decoded: "OrderedDict[str, Any]" = OrderedDict()
+
+    @staticmethod
+    def is_encoded(value: Any) -> bool:
+        """키 목록으로 인코딩된 채널 값인지 확인"""
+        return isinstance(value, dict) and MESSAGE_REFS in value
+
+    def encode(self, values: Dict[str, Any]) -> Tuple[Dict[str, Any], MessageBodies]:
+        """채널 값의 messages를 키 목록으로 바꾸고, 참조하는 메시지 본문을 함께 반환"""
+        messages = values.get(self.channel)
+        if not isinstance(messages, list):
+            return values, {}
+
+        keys: List[str] = []
+        content_keys: Dict[str, None] = {}
+        bodies: MessageBodies = {}
+        with self._lock:
+            for message in messages:
+                key, encoded = self._encode_message(message)
+                keys.append(key)
+                content_keys.update((body_key, None) for body_key in encoded if body_key != key)
+                bodies.update(encoded)
+
+        return {**values, self.channel: {MESSAGE_REFS: keys, CONTENT_REFS: list(content_keys)}}, bodies
+
+    @classmethod
+    def referenced_keys(cls, value: Any) -> Optional[Set[str]]:
+        """채널 값이 참조하는 본문 키 (내용 참조 목록이 없는 이전 형식이면 None)"""
+        if value is None:
+            return set()
+        if not cls.is_encoded(value) or CONTENT_REFS not in value:
+            return None
+        return set(value[MESSAGE_REFS]) | set(value[CONTENT_REFS])
+
+    def decode(
+        self,
+        values: Dict[str, Any],
+        load_bodies: Callable[[Sequence[str]], MessageBodies],
+    ) -> Dict[str, Any]:
+        """키 목록을 메시지 목록으로 복원 (캐시에 없는 본문만 load_bodies로 조회)"""
+        refs = values.get(self.channel)
+        if not self.is_encoded(refs):
+            return values
+
+        keys = refs[MESSAGE_REFS]
+        with self._lock:
+            cached = {key: self._decoded[key] for key in dict.fromkeys(keys) if key in self._decoded}
+        missing = [key for key in dict.fromkeys(keys) if key not in cached]
+
+        if missing:
+            raw = {key: self.serde.loads_typed(body) for key, body in self._load(missing, load_bodies).items()}
+            content_keys = [
+                value[CONTENT_REF] for value in raw.values()
+                if isinstance(value, dict) and CONTENT_REF in value
+            ]
+            with self._lock:
+                contents = {key: self._decoded[key] for key in content_keys if key in self._decoded}
+            missing_contents = [key for key in dict.fromkeys(content_keys) if key not in contents]
+            if missing_contents:
+                contents.update(
+                    (key, self.serde.loads_typed(body))
+                    for key, body in self._load(missing_contents, load_bodies).items()
+                )
+
+            with self._lock:
+                for key, value in contents.items():
+                    self._remember_decoded(key, value)
+                for key, value in raw.items():
+                    if isinstance(value, dict) and CONTENT_REF in value:
+                        value = value["message"].model_copy(update={"content": contents[value[CONTENT_REF]]})
+                    cached[key] = value
+                    self._remember_decoded(key, value)
+
+        return {**values, self.channel: [cached[key] for key in keys]}
+
+    @staticmethod
+    def _load(keys: Sequence[str], load_bodies: Callable[[Sequence[str]], MessageBodies]) -> MessageBodies:
+        """본문 조회 - 누락된 키가 있으면 예외"""
+        loaded = load_bodies(keys)
+        for key in keys:
+            if key not in loaded:
+                raise KeyError(f"체크포인트 메시지 본문을 찾을 수 없습니다: {key}")
+        return {key: loaded[key] for key in keys}
+
+    def _encode_message(self, message: Any) -> Tuple[str, MessageBodies]:
+        """메시지 한 개 직렬화 (이미 직렬화한 객체는 캐시 사용)"""
+        cached = self._encoded.get(id(message))
+        if cached is not None and cached[0] is message:
+            self._encoded.move_to_end(id(message))
+            return cached[1], cached[2]
+
+        bodies: MessageBodies = {}
+        content = getattr(message, "content", None)
+        if isinstance(content, str) and len(content) >= self.INTERN_MIN_CHARS:
+            content_body = self.serde.dumps_typed(content)
+            content_key = self._hash(content_body)
+            bodies[content_key] = content_body
+            self._remember_decoded(content_key, content)
+            body = self.serde.dumps_typed(
+                {CONTENT_REF: content_key, "message": message.model_copy(update={"content": ""})}
+            )
+        else:
+            body = self.serde.dumps_typed(message)
+
+        key = self._hash(body)
+        bodies[key] = body
+
+        self._encoded[id(message)] = (message, key, bodies)
+        while len(self._encoded) > self.cache_size:
+            self._encoded.popitem(last=False)
+        self._remember_decoded(key, message)
+        return key, bodies
+
+    @staticmethod
+    def _hash(body: Tuple[str, bytes]) -> str:
+        """직렬화 본문의 키"""
+        return hashlib.blake2b(body[0].encode() + b"\0" + body[1], digest_size=16).hexdigest()
+
+    def _remember_decoded(self, key: str, message: Any) -> None:
+        """역직렬화된 메시지 캐시에 저장"""
+        self._decoded[key] = message
+        self._decoded.move_to_end(key)
+        while len(self._decoded) > self.cache_size:
+            self._decoded.popitem(last=False)
+
@@ -0,0 +1,330 @@
+"""LangGraph 체크포인터 - 메모리 사용량을 제한하는 인메모리 체크포인터"""
+import logging
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import BaseCheckpointSaver, ChannelVersions, Checkpoint, CheckpointMetadata, CheckpointTuple
+from langgraph.checkpoint.memory import InMemorySaver
+
+from ..utils.metrics import metrics
+from .checkpoint_codec import MessageBodies, MessageDeltaCodec
+from .settings import agent_settings
+
+logger = logging.getLogger(__name__)
+
+
+class BoundedMemorySaver(InMemorySaver):
+    """
+    스레드별 최신 N개 체크포인트만 보관하고, 유휴 스레드와 메모리 상한을 넘는 스레드를 정리하는 체크포인터.
+
+    - 체크포인트 저장 시 오래된 체크포인트와 더 이상 참조되지 않는 채널 값(blob)을 삭제
+    - 세션 타임아웃보다 오래 사용되지 않은 스레드는 삭제
+    - 전체 메모리가 상한을 넘으면 가장 오래 사용되지 않은 스레드부터 삭제 (LRU)
+    - delta_encoding 사용 시 messages 채널은 키 목록만 저장하고 메시지 본문은 한 번만 보관
+      (오래된 체크포인트를 정리할 때 남은 체크포인트가 참조하지 않는 본문도 해제)
+    - 자동으로 퇴출한 스레드는 on_evict(thread_id)로 알림 (체크포인트 밖의 스레드별 상태 정리용)
+    """
+
+    def __init__(
+        self,
+        max_checkpoints_per_thread: Optional[int] = None,
+        session_timeout: Optional[float] = None,
+        max_memory_bytes: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+        delta_encoding: Optional[bool] = None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        if delta_encoding is None:
+            delta_encoding = agent_settings.checkpoint_delta_encoding
+        self.codec = MessageDeltaCodec(self.serde) if delta_encoding else None
+        self.max_checkpoints_per_thread = max(
+            1, max_checkpoints_per_thread or agent_settings.checkpoint_max_per_thread
+        )
+        self.session_timeout = session_timeout or agent_settings.checkpoint_session_timeout
+        self.max_memory_bytes = max_memory_bytes or agent_settings.checkpoint_max_memory_mb * 1024 * 1024
+        self._clock = clock
+        self._lock = threading.RLock()
+        self.on_evict: Optional[Callable[[str], None]] = None
+
+        # 스레드별 접근 시각 (LRU 순서) 및 저장 키 인덱스
+        self._last_access: "OrderedDict[str, float]" = OrderedDict()
+        self._blob_keys: Dict[str, Set[Tuple]] = defaultdict(set)
+        self._write_keys: Dict[str, Set[Tuple]] = defaultdict(set)
+        self._thread_bytes: Dict[str, int] = {}
+
+        # 인터닝된 메시지 본문과 참조 스레드 수
+        self._message_bodies: MessageBodies = {}
+        self._message_refcount: Dict[str, int] = defaultdict(int)
+        self._thread_messages: Dict[str, Set[str]] = defaultdict(set)
+
+    # ------------------------------------------------------------------
+    # BaseCheckpointSaver 구현
+    # ------------------------------------------------------------------
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        """체크포인트 조회 - 조회한 스레드는 최근 사용으로 갱신"""
+        with self._lock:
+            thread_id = config["configurable"]["thread_id"]
+            if thread_id not in self.storage:
+                return None
+            self._touch(thread_id)
+            return super().get_tuple(config)
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """체크포인트 저장 후 오래된 체크포인트 정리 및 스레드 퇴출"""
+        with self._lock:
+            thread_id = config["configurable"]["thread_id"]
+            checkpoint_ns = config["configurable"]["checkpoint_ns"]
+            if self.codec and self.codec.channel in new_versions:
+                values, bodies = self.codec.encode(checkpoint["channel_values"])
+                checkpoint = {**checkpoint, "channel_values": values}
+                self._intern_messages(thread_id, bodies)
+            next_config = super().put(config, checkpoint, metadata, new_versions)
+
+            for channel, version in new_versions.items():
+                self._blob_keys[thread_id].add((thread_id, checkpoint_ns, channel, version))
+
+            self._touch(thread_id)
+            self._prune_thread(thread_id, checkpoint_ns)
+            self._thread_bytes[thread_id] = self._measure_thread(thread_id)
+            self._evict(current_thread_id=thread_id)
+            self._publish_metrics()
+            return next_config
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """중간 쓰기 저장 - 스레드 인덱스에 키 기록"""
+        with self._lock:
+            thread_id = config["configurable"]["thread_id"]
+            super().put_writes(config, writes, task_id, task_path)
+            self._write_keys[thread_id].add(
+                (thread_id, config["configurable"].get("checkpoint_ns", ""), config["configurable"]["checkpoint_id"])
+            )
+            self._touch(thread_id)
+            self._thread_bytes[thread_id] = self._measure_thread(thread_id)
+
+    def delete_thread(self, thread_id: str) -> None:
+        """스레드의 체크포인트, 쓰기, 채널 값을 모두 삭제"""
+        with self._lock:
+            self.storage.pop(thread_id, None)
+            for key in self._write_keys.pop(thread_id, set()):
+                self.writes.pop(key, None)
+            for key in self._blob_keys.pop(thread_id, set()):
+                self.blobs.pop(key, None)
+            self._release_messages(self._thread_messages.pop(thread_id, set()))
+            self._last_access.pop(thread_id, None)
+            self._thread_bytes.pop(thread_id, None)
+            self._publish_metrics()
+
+    def _load_blobs(self, thread_id: str, checkpoint_ns: str, versions: ChannelVersions) -> Dict[str, Any]:
+        """채널 값 복원 - 키 목록으로 저장된 messages는 인터닝된 본문으로 복원"""
+        values = super()._load_blobs(thread_id, checkpoint_ns, versions)
+        if self.codec is None:
+            return values
+        return self.codec.decode(
+            values,
+            lambda keys: {key: self._message_bodies[key] for key in keys if key in self._message_bodies},
+        )
+
+    def _intern_messages(self, thread_id: str, bodies: MessageBodies) -> None:
+        """스레드에 처음 등장한 메시지 본문만 저장"""
+        known = self._thread_messages[thread_id]
+        for key, body in bodies.items():
+            if key in known:
+                continue
+            known.add(key)
+            self._message_refcount[key] += 1
+            self._message_bodies.setdefault(key, body)
+
+    def _release_messages(self, keys: Iterable[str]) -> None:
+        """스레드가 더 이상 참조하지 않는 본문의 참조 수 감소 (0이 되면 본문 삭제)"""
+        for key in keys:
+            self._message_refcount[key] -= 1
+            if self._message_refcount[key] <= 0:
+                del self._message_refcount[key]
+                self._message_bodies.pop(key, None)
+
+    def _release_unreferenced_messages(self, thread_id: str) -> None:
+        """스레드의 남은 체크포인트가 참조하지 않는 메시지 본문 해제 (RemoveMessage로 빠진 메시지 등)"""
+        referenced: Set[str] = set()
+        for key in self._blob_keys[thread_id]:
+            blob = self.blobs.get(key)
+            if key[2] != self.codec.channel or blob is None or blob[0] == "empty":
+                continue
+            keys = self.codec.referenced_keys(self.serde.loads_typed(blob))
+            if keys is None:
+                return
+            referenced |= keys
+
+        known = self._thread_messages[thread_id]
+        unreferenced = known - referenced
+        if unreferenced:
+            known -= unreferenced
+            self._release_messages(unreferenced)
+
+    async def aflush(self, thread_id: Optional[str] = None) -> None:
+        """인메모리 체크포인터는 보류 중인 쓰기가 없음 (SqliteCheckpointSaver와 인터페이스 통일)"""
+        return None
+
+    # ------------------------------------------------------------------
+    # 정리 / 퇴출
+    # ------------------------------------------------------------------
+    def evict_idle_threads(self, idle_seconds: Optional[float] = None) -> List[str]:
+        """지정한 시간(기본: 세션 타임아웃)보다 오래 사용되지 않은 스레드 삭제"""
+        idle_seconds = self.session_timeout if idle_seconds is None else idle_seconds
+        with self._lock:
+            now = self._clock()
+            expired = [
+                thread_id
+                for thread_id, last_access in self._last_access.items()
+                if now - last_access > idle_seconds
+            ]
+            for thread_id in expired:
+                self.delete_thread(thread_id)
+                notify_evicted(self.on_evict, thread_id)
+
+            if expired:
+                metrics.increment("checkpointer.evicted_threads_total", len(expired))
+                logger.info(f"유휴 스레드 {len(expired)}개 체크포인트 삭제")
+            return expired
+
+    def _evict(self, current_thread_id: Optional[str] = None) -> None:
+        """세션 타임아웃과 메모리 상한에 따라 스레드 퇴출"""
+        # LRU 순서이므로 앞에서부터 만료된 스레드만 확인
+        now = self._clock()
+        while self._last_access:
+            thread_id, last_access = next(iter(self._last_access.items()))
+            if now - last_access <= self.session_timeout:
+                break
+            self.delete_thread(thread_id)
+            notify_evicted(self.on_evict, thread_id)
+            metrics.increment("checkpointer.evicted_threads_total")
+            logger.info(f"세션 타임아웃으로 스레드 체크포인트 삭제: {thread_id}")
+
+        while self.total_bytes > self.max_memory_bytes:
+            victim = next(
+                (thread_id for thread_id in self._last_access if thread_id != current_thread_id),
+                None,
+            )
+            if victim is None:
+                break
+            self.delete_thread(victim)
+            notify_evicted(self.on_evict, victim)
+            metrics.increment("checkpointer.evicted_threads_total")
+            logger.warning(f"메모리 상한 초과로 스레드 체크포인트 삭제: {victim}")
+
+    def _prune_thread(self, thread_id: str, checkpoint_ns: str) -> None:
+        """최신 N개를 제외한 체크포인트와 참조되지 않는 채널 값 삭제"""
+        checkpoints = self.storage[thread_id][checkpoint_ns]
+        if len(checkpoints) <= self.max_checkpoints_per_thread:
+            return
+
+        checkpoint_ids = sorted(checkpoints.keys())
+        stale_ids = checkpoint_ids[: -self.max_checkpoints_per_thread]
+        for checkpoint_id in stale_ids:
+            del checkpoints[checkpoint_id]
+            write_key = (thread_id, checkpoint_ns, checkpoint_id)
+            self.writes.pop(write_key, None)
+            self._write_keys[thread_id].discard(write_key)
+
+        # 남은 체크포인트가 참조하는 채널 버전만 유지
+        referenced = set()
+        for saved_checkpoint, _, _ in checkpoints.values():
+            channel_versions = self.serde.loads_typed(saved_checkpoint)["channel_versions"]
+            referenced.update(
+                (thread_id, checkpoint_ns, channel, version)
+                for channel, version in channel_versions.items()
+            )
+
+        for key in list(self._blob_keys[thread_id]):
+            if key[1] == checkpoint_ns and key not in referenced:
+                self.blobs.pop(key, None)
+                self._blob_keys[thread_id].discard(key)
+
+        if self.codec:
+            self._release_unreferenced_messages(thread_id)
+
+    def _touch(self, thread_id: str) -> None:
+        """스레드를 최근 사용으로 표시"""
+        self._last_access[thread_id] = self._clock()
+        self._last_access.move_to_end(thread_id)
+
+    # ------------------------------------------------------------------
+    # 메모리 사용량
+    # ------------------------------------------------------------------
+    def _measure_thread(self, thread_id: str) -> int:
+        """스레드가 사용하는 직렬화 바이트 수"""
+        size = 0
+        for checkpoints in self.storage.get(thread_id, {}).values():
+            for saved_checkpoint, saved_metadata, _ in checkpoints.values():
+                size += len(saved_checkpoint[1]) + len(saved_metadata[1])
+        for key in self._write_keys.get(thread_id, ()):
+            for _, _, value, _ in self.writes.get(key, {}).values():
+                size += len(value[1])
+        for key in self._blob_keys.get(thread_id, ()):
+            if key in self.blobs:
+                size += len(self.blobs[key][1])
+        for key in self._thread_messages.get(thread_id, ()):
+            if key in self._message_bodies:
+                size += len(self._message_bodies[key][1])
+        return size
+
+    @property
+    def total_bytes(self) -> int:
+        """전체 체크포인트 메모리 사용량 (직렬화 바이트 기준)"""
+        return sum(self._thread_bytes.values())
+
+    def get_memory_usage(self) -> Dict[str, Any]:
+        """스레드별 / 전체 메모리 사용량"""
+        with self._lock:
+            return {
+                "total_bytes": self.total_bytes,
+                "max_memory_bytes": self.max_memory_bytes,
+                "thread_count": len(self._last_access),
+                "checkpoint_count": sum(
+                    len(checkpoints)
+                    for namespaces in self.storage.values()
+                    for checkpoints in namespaces.values()
+                ),
+                "threads": dict(self._thread_bytes),
+            }
+
+    def _publish_metrics(self) -> None:
+        """메모리 사용량 게이지 갱신"""
+        metrics.set_gauge("checkpointer.memory_bytes", self.total_bytes)
+        metrics.set_gauge("checkpointer.threads", len(self._last_access))
+
+
+def notify_evicted(on_evict: Optional[Callable[[str], None]], thread_id: str) -> None:
+    """퇴출 알림 - 콜백 오류가 체크포인트 저장을 실패시키지 않도록 기록만 함"""
+    if on_evict is None:
+        return
+    try:
+        on_evict(thread_id)
+    except Exception as e:
+        logger.error(f"스레드 퇴출 콜백 실패 ({thread_id}): {e}")
+
+
+def create_checkpointer(backend: Optional[str] = None) -> BaseCheckpointSaver:
+    """설정(checkpointer_backend)에 맞는 체크포인터 생성"""
+    backend = backend or agent_settings.checkpointer_backend
+    if backend == "memory":
+        return BoundedMemorySaver()
+    if backend == "sqlite":
+        from .sqlite_checkpointer import SqliteCheckpointSaver
+        return SqliteCheckpointSaver()
+    raise ValueError(f"지원하지 않는 체크포인터 백엔드: {backend}")
@@ -2,22 +2,29 @@
 
 import logging
 from dependency_injector import containers, providers
-from src.agent.service import AgentService
 from src.model.container import ModelContainer
+from src.tools.container import ToolsContainer
 
 logger = logging.getLogger(__name__)
 
+
+def create_agent_service(**kwargs):
+    """AgentService 생성 - langgraph/langchain_core는 서비스가 처음 필요할 때 임포트"""
+    from src.agent.service import AgentService
+    return AgentService(**kwargs)
+
+
 class AgentContainer(containers.DeclarativeContainer):
     """Agent 도메인 의존성 주입 컨테이너 - dependency_injector 사용"""
     
     # 다른 컨테이너들
     model: ModelContainer = providers.Container(ModelContainer)
+    tools: ToolsContainer = providers.Container(ToolsContainer)
     
     # 서비스들
     service = providers.Singleton(
-        AgentService,
+        create_agent_service,
         model_execution_service=model.execution_service,
+        tool_service=tools.service,
+        model_router=model.router,
     )
-
-# 전역 컨테이너 인스턴스
-agent_container = AgentContainer()
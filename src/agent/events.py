@@ -0,0 +1,40 @@
+"""Agent 스트림 이벤트 - 답변 토큰과 도구 실행 시작/종료"""
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict
+
+EVENT_TOKEN = "token"
+EVENT_TOOL_START = "tool_start"
+EVENT_TOOL_END = "tool_end"
+EVENT_PARTIAL = "partial"  # 예산 소진으로 만든 부분 답변 (data: reason)
+EVENT_USAGE = "usage"
+EVENT_DONE = "done"
+EVENT_ERROR = "error"
+
+
+@dataclass
+class AgentEvent:
+    """스트림 이벤트 - data는 JSON으로 직렬화할 수 있는 딕셔너리"""
+    type: str
+    data: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def token(cls, text: str) -> "AgentEvent":
+        """답변 토큰 이벤트"""
+        return cls(EVENT_TOKEN, {"text": text})
+
+    @property
+    def text(self) -> str:
+        """토큰 이벤트의 텍스트 (다른 이벤트는 빈 문자열)"""
+        return self.data.get("text", "") if self.type == EVENT_TOKEN else ""
+
+
+async def token_texts(events: AsyncIterator[AgentEvent]) -> AsyncIterator[str]:
+    """이벤트 스트림에서 답변 토큰 텍스트만 추출 - 중간에 닫히면 원본 스트림도 닫음"""
+    try:
+        async for event in events:
+            if event.type == EVENT_TOKEN:
+                yield event.text
+    finally:
+        aclose = getattr(events, "aclose", None)
+        if aclose is not None:
+            await aclose()
@@ -1,11 +1,13 @@
 """LangGraph 그래프 구성"""
 import logging
-from typing import List
+from typing import List, Optional
 
-from langgraph.graph import StateGraph
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langchain_core.messages import AIMessage
+from langgraph.graph import END, StateGraph
 from langgraph.prebuilt import tools_condition
-from langgraph.checkpoint.memory import MemorySaver
 
+from .checkpointer import create_checkpointer
 from .nodes import AgentNode, ToolNode, LangGraphAgentState
 
 logger = logging.getLogger(__name__)
@@ -14,11 +16,20 @@ logger = logging.getLogger(__name__)
 class LangGraphBuilder:
     """LangGraph 빌더 클래스"""
     
+    @staticmethod
+    def tools_return_condition(state: LangGraphAgentState) -> str:
+        """도구 노드가 최종 답변을 만들었으면 종료, 아니면 agent로"""
+        last_message = state["messages"][-1]
+        if isinstance(last_message, AIMessage):
+            return END
+        return "agent"
+    
     @staticmethod
     def build_graph(
         agent_node: AgentNode,
         tool_node: ToolNode,
-        use_memory: bool = True
+        use_memory: bool = True,
+        checkpointer: Optional[BaseCheckpointSaver] = None
     ):
         """LangGraph를 구성합니다"""
         logger.info("LangGraph 구성 중...")
@@ -30,12 +41,12 @@ class LangGraphBuilder:
             .add_node("tools", tool_node)
             .set_entry_point("agent")
             .add_conditional_edges("agent", tools_condition)
-            .add_edge("tools", "agent")
+            .add_conditional_edges("tools", LangGraphBuilder.tools_return_condition, ["agent", END])
         )
         
         # 메모리 설정
         if use_memory:
-            checkpointer = MemorySaver()
+            checkpointer = checkpointer or create_checkpointer()
             compiled_graph = graph.compile(checkpointer=checkpointer)
         else:
             compiled_graph = graph.compile()
@@ -0,0 +1,212 @@
+"""대화 히스토리 관리 - 토큰 예산 기반 트리밍 및 롤링 요약"""
+import json
+import logging
+import math
+from collections import OrderedDict
+from typing import List, Optional, Sequence, Tuple
+
+from langchain_core.messages import AIMessage, AnyMessage, HumanMessage, SystemMessage, ToolMessage
+
+from .settings import agent_settings
+
+logger = logging.getLogger(__name__)
+
+
+class TokenEstimator:
+    """토크나이저 없이 빠르게 토큰 수를 추정합니다.
+
+    ASCII는 약 4글자당 1토큰, 한글 등 비ASCII 문자는 글자당 1토큰으로 보수적으로 계산합니다.
+    """
+
+    MESSAGE_OVERHEAD = 4
+
+    def estimate_text(self, text: str) -> int:
+        """문자열 토큰 수 추정"""
+        if not text:
+            return 0
+        ascii_count = sum(1 for char in text if ord(char) < 128)
+        return math.ceil(ascii_count / 4) + (len(text) - ascii_count)
+
+    def estimate_message(self, message: AnyMessage) -> int:
+        """메시지 토큰 수 추정 (내용 + 도구 호출 인자 + 메시지 오버헤드)"""
+        content = message.content if isinstance(message.content, str) else json.dumps(
+            message.content, ensure_ascii=False
+        )
+        tokens = self.MESSAGE_OVERHEAD + self.estimate_text(content)
+
+        for tool_call in getattr(message, "tool_calls", None) or []:
+            tokens += self.estimate_text(tool_call.get("name", ""))
+            tokens += self.estimate_text(json.dumps(tool_call.get("args", {}), ensure_ascii=False))
+
+        return tokens
+
+    def estimate_messages(self, messages: Sequence[AnyMessage]) -> int:
+        """메시지 목록 토큰 수 추정"""
+        return sum(self.estimate_message(message) for message in messages)
+
+
+class HistoryManager:
+    """토큰 예산 안에서 LLM에 보낼 대화 히스토리를 구성합니다.
+
+    - 시스템 프롬프트와 최근 턴은 그대로 유지
+    - 예산을 넘는 오래된 턴은 스레드별로 캐시된 롤링 요약에 접어 넣음
+    - 자르는 위치는 항상 사용자 메시지(턴 시작) 앞이라 도구 호출과 ToolMessage가 분리되지 않음
+    """
+
+    SUMMARY_HEADER = "이전 대화 요약:"
+    SUMMARY_LINE_CHARS = 200
+
+    def __init__(
+        self,
+        token_budget: Optional[int] = None,
+        max_messages: int = 50,
+        summary_max_tokens: Optional[int] = None,
+        trim_target_ratio: Optional[float] = None,
+        max_cached_threads: int = 1024,
+        estimator: Optional[TokenEstimator] = None,
+    ):
+        self.token_budget = token_budget or agent_settings.history_token_budget
+        self.max_messages = max_messages  # ChatbotConfig.max_history로 덮어씀
+        self.summary_max_tokens = summary_max_tokens or agent_settings.history_summary_max_tokens
+        self.trim_target_ratio = trim_target_ratio or agent_settings.history_trim_target_ratio
+        self.max_cached_threads = max_cached_threads
+        self.estimator = estimator or TokenEstimator()
+
+        # thread_id -> (마지막으로 요약에 접힌 메시지 ID, 요약문)
+        self._summaries: "OrderedDict[str, Tuple[str, str]]" = OrderedDict()
+
+    def prepare(
+        self,
+        system_prompt: str,
+        messages: Sequence[AnyMessage],
+        thread_id: Optional[str] = None,
+    ) -> List[AnyMessage]:
+        """시스템 프롬프트 + (요약) + 최근 턴으로 구성된 메시지 목록 반환"""
+        # 상태에 시스템 메시지가 있으면 그것을 우선 사용
+        conversation = [message for message in messages if not isinstance(message, SystemMessage)]
+        system_messages = [message for message in messages if isinstance(message, SystemMessage)]
+        if system_messages:
+            system_prompt = system_messages[0].content
+
+        cut = self._find_cut(system_prompt, conversation, thread_id)
+        if cut == 0:
+            return [SystemMessage(content=system_prompt)] + conversation
+
+        summary = self._summarize(conversation[:cut], thread_id)
+        logger.info(
+            f"히스토리 트리밍: {cut}개 메시지 요약, {len(conversation) - cut}개 유지 (스레드: {thread_id})"
+        )
+        system_content = f"{system_prompt}\n\n{self.SUMMARY_HEADER}\n{summary}"
+        return [SystemMessage(content=system_content)] + conversation[cut:]
+
+    def clear(self, thread_id: str) -> None:
+        """스레드의 요약 캐시 삭제"""
+        self._summaries.pop(thread_id, None)
+
+    def _turn_starts(self, conversation: Sequence[AnyMessage]) -> List[int]:
+        """턴 시작 위치(사용자 메시지 인덱스) 목록"""
+        return [index for index, message in enumerate(conversation) if isinstance(message, HumanMessage)]
+
+    def _fits(self, system_tokens: int, kept: Sequence[AnyMessage], budget: float) -> bool:
+        """유지할 메시지가 예산과 개수 제한을 만족하는지 확인"""
+        if len(kept) > self.max_messages:
+            return False
+        return system_tokens + self.estimator.estimate_messages(kept) <= budget
+
+    def _find_cut(
+        self,
+        system_prompt: str,
+        conversation: Sequence[AnyMessage],
+        thread_id: Optional[str],
+    ) -> int:
+        """요약으로 접을 메시지 개수(자르는 위치)를 결정"""
+        system_tokens = self.estimator.estimate_text(system_prompt) + TokenEstimator.MESSAGE_OVERHEAD
+        if self._fits(system_tokens, conversation, self.token_budget):
+            return 0
+
+        turn_starts = self._turn_starts(conversation)
+        if not turn_starts:
+            return 0
+
+        system_tokens += self.summary_max_tokens
+
+        # 이전 자르는 위치가 아직 예산 안이면 유지 (매 스텝 프롬프트 앞부분이 바뀌지 않도록)
+        previous_cut = self._previous_cut(conversation, thread_id)
+        if previous_cut in turn_starts and self._fits(
+            system_tokens, conversation[previous_cut:], self.token_budget
+        ):
+            return previous_cut
+
+        # 새로 자를 때는 목표 비율까지 줄여서 여유를 확보
+        target_budget = self.token_budget * self.trim_target_ratio
+        for cut in turn_starts:
+            if cut > 0 and self._fits(system_tokens, conversation[cut:], target_budget):
+                return cut
+
+        # 마지막 턴은 예산을 넘어도 그대로 유지
+        return turn_starts[-1]
+
+    def _previous_cut(self, conversation: Sequence[AnyMessage], thread_id: Optional[str]) -> Optional[int]:
+        """캐시된 요약 기준 이전 자르는 위치"""
+        cached = self._summaries.get(thread_id) if thread_id else None
+        if not cached:
+            return None
+
+        last_folded_id, _ = cached
+        for index, message in enumerate(conversation):
+            if message.id == last_folded_id:
+                return index + 1
+        return None
+
+    def _summarize(self, folded: Sequence[AnyMessage], thread_id: Optional[str]) -> str:
+        """접힌 메시지를 롤링 요약으로 변환 (캐시된 요약에 새로 접힌 부분만 추가)"""
+        previous_summary = ""
+        new_messages = list(folded)
+
+        cached = self._summaries.get(thread_id) if thread_id else None
+        if cached:
+            last_folded_id, cached_summary = cached
+            for index, message in enumerate(folded):
+                if message.id == last_folded_id:
+                    previous_summary = cached_summary
+                    new_messages = list(folded[index + 1:])
+                    break
+
+        lines = [line for line in previous_summary.split("\n") if line]
+        lines.extend(self._summarize_message(message) for message in new_messages)
+        lines = self._truncate_summary(lines)
+        summary = "\n".join(lines)
+
+        last_id = folded[-1].id if folded else None
+        if thread_id and last_id:
+            self._summaries[thread_id] = (last_id, summary)
+            self._summaries.move_to_end(thread_id)
+            while len(self._summaries) > self.max_cached_threads:
+                self._summaries.popitem(last=False)
+
+        return summary
+
+    def _summarize_message(self, message: AnyMessage) -> str:
+        """메시지 한 개를 요약 한 줄로 변환"""
+        content = message.content if isinstance(message.content, str) else str(message.content)
+        content = " ".join(content.split())[: self.SUMMARY_LINE_CHARS]
+
+        if isinstance(message, HumanMessage):
+            return f"- 사용자: {content}"
+        if isinstance(message, ToolMessage):
+            return f"- 도구 결과({message.name}): {content}"
+        if isinstance(message, AIMessage) and message.tool_calls:
+            calls = ", ".join(
+                f"{call['name']}({json.dumps(call.get('args', {}), ensure_ascii=False)})"
+                for call in message.tool_calls
+            )
+            return f"- 도구 호출: {calls}"
+        return f"- 어시스턴트: {content}"
+
+    def _truncate_summary(self, lines: List[str]) -> List[str]:
+        """요약이 최대 토큰을 넘으면 가장 오래된 줄부터 제거"""
+        tokens = sum(self.estimator.estimate_text(line) + 1 for line in lines)
+        while lines and tokens > self.summary_max_tokens:
+            tokens -= self.estimator.estimate_text(lines[0]) + 1
+            lines = lines[1:]
+        return lines
@@ -1,17 +1,26 @@
 """LangGraph 노드 정의 - 가독성 개선"""
+import asyncio
 import logging
+import time
 from datetime import datetime
-from typing import Annotated, Any, Dict, List, TypedDict
+from typing import Annotated, Any, Dict, List, Optional, TypedDict
 
-from langchain_core.language_models.chat_models import BaseChatModel
-from langchain_core.messages import AIMessage, AnyMessage, ToolMessage, SystemMessage
+from langchain_core.messages import AIMessage, AnyMessage, ToolMessage
 from langchain_core.runnables import Runnable, RunnableConfig
 from langchain_core.tools import BaseTool
 from langgraph.graph.message import add_messages
 
 # LLMService import 제거 - model_execution_service 사용
 from ..model.executors.langchain_tools import tools
+from ..model.registry import DEFAULT_MODEL_ID
+from ..model.routing import ModelRoutingPolicy
+from ..model.usage import record_usage
 from ..utils.exceptions import LLMInvocationException, ToolCallException
+from ..utils.metrics import metrics
+from .budget import REASON_DEADLINE, REASON_MAX_STEPS, RequestBudget
+from .history import HistoryManager
+from .policy import DirectReturnPolicy
+from .settings import agent_settings
 
 logger = logging.getLogger(__name__)
 
@@ -28,25 +37,52 @@ class AgentNode:
         self,
         model_execution_service,
         system_prompt: str,
+        history_manager: Optional[HistoryManager] = None,
+        model_router: Optional[ModelRoutingPolicy] = None,
     ):
         self.model_execution_service = model_execution_service
         self.system_prompt = system_prompt
+        self.history_manager = history_manager or HistoryManager()
+        # 없으면 항상 기본 모델
+        self.model_router = model_router
 
     async def __call__(
         self, state: LangGraphAgentState, config: RunnableConfig = None
     ) -> LangGraphAgentState:
         """노드 실행 - 참고 코드 스타일"""
         
-        # 모델 로드 및 도구 바인딩
-        model = await self.load_chat_model()
+        # 요청 예산(마감/스텝)을 다 썼으면 LLM을 호출하지 않고 부분 답변
+        budget = RequestBudget.from_config(config)
+        if budget.steps_exhausted(state["messages"]):
+            return self._partial_answer(budget, state["messages"], REASON_MAX_STEPS)
+        if budget.expired():
+            return self._partial_answer(budget, state["messages"], REASON_DEADLINE)
         
-        # 시스템 프롬프트 추가
-        messages = state["messages"]
-        if not messages or messages[0].type != "system":
-            messages = [SystemMessage(content=self.system_prompt)] + messages
+        # 턴 복잡도에 따라 모델 선택 후 로드 및 도구 바인딩
+        decision = self.model_router.select(state["messages"]) if self.model_router else None
+        model = await self.load_chat_model(decision.model_id if decision else DEFAULT_MODEL_ID)
+        
+        # 시스템 프롬프트 추가 및 토큰 예산에 맞춰 히스토리 정리
+        thread_id = (config or {}).get("configurable", {}).get("thread_id")
+        messages = self.history_manager.prepare(self.system_prompt, state["messages"], thread_id)
 
-        # LLM 호출
-        message = await self.invoke_chain(model, messages, config)
+        # LLM 호출 (남은 시간을 타임아웃으로 사용)
+        started_at = time.perf_counter()
+        try:
+            message = await asyncio.wait_for(
+                self.invoke_chain(model, messages, config), timeout=budget.remaining()
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"LLM 호출이 요청 마감 시간을 초과했습니다 (스레드: {thread_id})")
+            return self._partial_answer(budget, state["messages"], REASON_DEADLINE)
+        if decision is not None:
+            self.model_router.record_latency(decision, time.perf_counter() - started_at)
+        
+        # 토큰 사용량/비용 집계 (요청별/세션별/모델별)
+        if decision is not None:
+            record_usage(message, config, decision.model_name, self.model_router.pricing(decision))
+        else:
+            record_usage(message, config)
 
         # 메시지에 타임스탬프 추가 (참고 코드 스타일)
         if hasattr(message, 'additional_kwargs'):
@@ -62,15 +98,16 @@ class AgentNode:
         
         return {"messages": [message]}
 
-    async def load_chat_model(self) -> BaseChatModel:
-        """모델을 로드하고 도구를 바인딩합니다 (참고 코드 기반)"""
-        model = await self.model_execution_service.load_llm_model(1)  # 기본 GPT-4o 모델
-        
-        try:
-            return model.bind_tools(tools)
-        except Exception as e:
-            logger.error(f"Error binding tools: {e}")
-            return model
+    def _partial_answer(
+        self, budget: RequestBudget, messages: List[AnyMessage], reason: str
+    ) -> LangGraphAgentState:
+        """예산 소진 시 부분 답변으로 턴 종료 (도구 호출이 없으므로 그래프가 끝남)"""
+        metrics.increment(f"agent.budget.{reason}_exhausted_total")
+        return {"messages": [budget.partial_answer(messages, reason)]}
+
+    async def load_chat_model(self, model_id: int = DEFAULT_MODEL_ID) -> Runnable:
+        """도구가 바인딩된 모델을 로드합니다 (실행 서비스의 모델 풀 재사용)"""
+        return await self.model_execution_service.load_tool_bound_model(model_id, tools)
 
     def _validate_model_invocation(self, model: Runnable, messages: List[AnyMessage]) -> None:
         """모델 호출 검증 - 필요시 exception raise"""
@@ -92,10 +129,21 @@ class AgentNode:
 
 
 class ToolNode:
-    """도구 노드 - 가독성 개선"""
+    """도구 노드 - 여러 도구 호출을 동시에 실행"""
     
-    def __init__(self, tools_list):
+    def __init__(
+        self,
+        tools_list,
+        max_concurrency: Optional[int] = None,
+        tool_timeout: Optional[float] = None,
+        direct_return_policy: Optional[DirectReturnPolicy] = None,
+    ):
         self.tools = {tool.name: tool for tool in tools_list}
+        self.max_concurrency = agent_settings.tool_max_concurrency if max_concurrency is None else max_concurrency
+        if self.max_concurrency < 1:
+            raise ValueError(f"도구 동시 실행 수는 1 이상이어야 합니다: {self.max_concurrency}")
+        self.tool_timeout = tool_timeout or agent_settings.tool_timeout
+        self.direct_return_policy = direct_return_policy
     
     def _validate_tool_call(self, last_message: AnyMessage) -> None:
         """도구 호출 검증 - 필요시 exception raise"""
@@ -107,12 +155,19 @@ class ToolNode:
         if tool_name not in self.tools:
             raise ToolCallException(f"도구를 찾을 수 없습니다: {tool_name}")
     
-    def _create_tool_message(self, content: str, tool_id: str, tool_name: str) -> ToolMessage:
+    def _create_tool_message(
+        self, 
+        content: str, 
+        tool_id: str, 
+        tool_name: str, 
+        status: str = "success"
+    ) -> ToolMessage:
         """도구 메시지 생성"""
         tool_message = ToolMessage(
             content=content,
             tool_call_id=tool_id,
-            name=tool_name
+            name=tool_name,
+            status=status
         )
         
         # 타임스탬프 추가
@@ -122,33 +177,67 @@ class ToolNode:
         
         return tool_message
     
+    async def _execute_tool_call(
+        self, 
+        tool_call: Dict[str, Any], 
+        config: RunnableConfig, 
+        semaphore: asyncio.Semaphore
+    ) -> ToolMessage:
+        """단일 도구 호출 실행 - 실패 시 에러 ToolMessage 반환"""
+        tool_name = tool_call["name"]
+        tool_id = tool_call["id"]
+        tool = self.tools[tool_name]
+        budget = RequestBudget.from_config(config)
+        
+        async with semaphore:
+            # 도구 타임아웃은 요청의 남은 시간을 넘지 않음
+            timeout = budget.limit_timeout(self.tool_timeout)
+            try:
+                result = await asyncio.wait_for(
+                    tool.ainvoke(tool_call["args"], config=config),
+                    timeout=timeout
+                )
+            except asyncio.TimeoutError:
+                logger.warning(f"Tool {tool_name} timed out after {timeout:.1f}s")
+                return self._create_tool_message(
+                    f"도구 실행 시간이 초과되었습니다 ({timeout:.1f}초)", 
+                    tool_id, tool_name, status="error"
+                )
+            except Exception as e:
+                logger.error(f"Tool {tool_name} failed: {e}")
+                return self._create_tool_message(
+                    f"도구 실행 오류: {e}", tool_id, tool_name, status="error"
+                )
+        
+        logger.info(f"Tool {tool_name} executed successfully")
+        return self._create_tool_message(str(result), tool_id, tool_name)
+    
     async def __call__(
         self, 
         state: LangGraphAgentState, 
         config: RunnableConfig = None
     ) -> LangGraphAgentState:
-        """도구 실행 - validate 함수로 깔끔하게 처리"""
+        """도구 실행 - 동시 실행 후 tool_call 순서대로 결과 반환"""
         messages = state["messages"]
         last_message = messages[-1]
         
         # 도구 호출 검증
         self._validate_tool_call(last_message)
-        
-        tool_messages = []
         for tool_call in last_message.tool_calls:
-            tool_name = tool_call["name"]
-            tool_args = tool_call["args"]
-            tool_id = tool_call["id"]
-            
-            # 도구 존재 검증
-            self._validate_tool_exists(tool_name)
-            
-            # 도구 실행
-            tool = self.tools[tool_name]
-            result = await tool.ainvoke(tool_args)
-            
-            tool_message = self._create_tool_message(str(result), tool_id, tool_name)
-            tool_messages.append(tool_message)
-            logger.info(f"Tool {tool_name} executed successfully")
+            self._validate_tool_exists(tool_call["name"])
+        
+        # 동시 실행 (gather는 입력 순서대로 결과를 반환)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        tool_messages = await asyncio.gather(*[
+            self._execute_tool_call(tool_call, config, semaphore)
+            for tool_call in last_message.tool_calls
+        ])
+        
+        # 단순 조회는 도구 결과를 최종 답변으로 사용 (두 번째 LLM 호출 생략)
+        policy = self.direct_return_policy
+        if policy is not None and policy.should_return_directly(messages, tool_messages):
+            logger.info(f"도구 결과 직접 반환: {last_message.tool_calls[0]['name']}")
+            answer = policy.render(last_message, tool_messages[0], config)
+            return {"messages": list(tool_messages) + [answer]}
         
-        return {"messages": tool_messages}
\ No newline at end of file
+        return {"messages": list(tool_messages)}
@@ -0,0 +1,89 @@
+"""도구 결과 직접 반환 정책 - 단순 조회는 두 번째 LLM 호출 생략"""
+import logging
+import re
+from typing import Callable, Dict, List, Optional, Sequence
+
+from langchain_core.messages import AIMessage, AnyMessage, HumanMessage, ToolMessage
+from langchain_core.runnables import RunnableConfig
+
+from ..model.executors.langchain_tools import get_tool_service
+from .settings import agent_settings
+
+logger = logging.getLogger(__name__)
+
+# 단순 조회가 아님을 나타내는 표현 (계산, 비교, 분석 등은 모델이 답변을 구성해야 함)
+_NOT_LOOKUP_PATTERN = re.compile(
+    r"\d|비교|계산|분석|추천|전망|예측|평균|합계|차이|수익|손실|사면|팔면|살까|팔까|왜|어떻게|설명|그리고|\bvs\b|및|랑|하고",
+    re.IGNORECASE,
+)
+
+# 도구 결과 → 사용자 답변
+ToolResultRenderer = Callable[[AIMessage, ToolMessage, Optional[RunnableConfig]], str]
+
+
+def _render_stock_price(call_message: AIMessage, tool_message: ToolMessage, config: Optional[RunnableConfig]) -> str:
+    """시세 조회 결과를 한국어 답변으로 변환 (스레드에 기록된 시세 사용)"""
+    thread_id = (config or {}).get("configurable", {}).get("thread_id")
+    ticker = str(call_message.tool_calls[0]["args"].get("ticker", "")).upper()
+    tool_service = get_tool_service()
+    quote = tool_service.get_thread_quotes(thread_id).get(ticker)
+    if quote is None:
+        return tool_message.content
+    return tool_service.stock_service.format_quote_answer(quote)
+
+
+DEFAULT_RENDERERS: Dict[str, ToolResultRenderer] = {
+    "get_stock_price": _render_stock_price,
+}
+
+
+class DirectReturnPolicy:
+    """
+    모델이 허용된 도구를 정확히 한 번 호출했고 사용자 질문이 단순 조회이면,
+    도구 결과를 최종 답변으로 사용해 두 번째 LLM 호출을 생략하는 정책.
+    """
+
+    DIRECT_RETURN_KEY = "direct_return"
+
+    def __init__(
+        self,
+        tool_names: Optional[Sequence[str]] = None,
+        renderers: Optional[Dict[str, ToolResultRenderer]] = None,
+    ):
+        self.tool_names = set(tool_names or agent_settings.direct_return_tools)
+        self.renderers = {**DEFAULT_RENDERERS, **(renderers or {})}
+
+    def is_plain_lookup(self, user_input: str) -> bool:
+        """사용자 질문이 단순 조회인지 판별"""
+        return bool(user_input.strip()) and not _NOT_LOOKUP_PATTERN.search(user_input)
+
+    def should_return_directly(self, messages: Sequence[AnyMessage], tool_messages: List[ToolMessage]) -> bool:
+        """도구 결과를 그대로 최종 답변으로 쓸 수 있는지 확인"""
+        call_message = messages[-1]
+        if not isinstance(call_message, AIMessage) or len(call_message.tool_calls) != 1:
+            return False
+        if call_message.tool_calls[0]["name"] not in self.tool_names:
+            return False
+        if len(tool_messages) != 1 or tool_messages[0].status != "success":
+            return False
+
+        user_message = next((message for message in reversed(messages) if isinstance(message, HumanMessage)), None)
+        if user_message is None or not isinstance(user_message.content, str):
+            return False
+        return self.is_plain_lookup(user_message.content)
+
+    def render(
+        self,
+        call_message: AIMessage,
+        tool_message: ToolMessage,
+        config: Optional[RunnableConfig] = None,
+    ) -> AIMessage:
+        """도구 결과로 최종 답변 메시지 생성"""
+        renderer = self.renderers.get(tool_message.name)
+        content = renderer(call_message, tool_message, config) if renderer else tool_message.content
+        return AIMessage(content=content, response_metadata={self.DIRECT_RETURN_KEY: True})
+
+    @classmethod
+    def is_direct_answer(cls, message: AnyMessage) -> bool:
+        """직접 반환 정책으로 만들어진 답변인지 확인"""
+        return isinstance(message, AIMessage) and bool(message.response_metadata.get(cls.DIRECT_RETURN_KEY))
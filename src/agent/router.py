@@ -0,0 +1,115 @@
+"""빠른 경로 라우터 - LLM 없이 처리할 수 있는 단순 의도 판별"""
+import logging
+import re
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from ..utils.metrics import metrics
+from .settings import agent_settings
+
+logger = logging.getLogger(__name__)
+
+INTENT_CALCULATE = "calculate"
+INTENT_STOCK_PRICE = "stock_price"
+
+# 한글 종목명 → 티커
+TICKER_ALIASES = {
+    "애플": "AAPL",
+    "테슬라": "TSLA",
+    "엔비디아": "NVDA",
+    "마이크로소프트": "MSFT",
+    "마소": "MSFT",
+    "구글": "GOOGL",
+    "알파벳": "GOOGL",
+    "아마존": "AMZN",
+    "메타": "META",
+    "페이스북": "META",
+    "넷플릭스": "NFLX",
+    "에이엠디": "AMD",
+    "인텔": "INTC",
+    "코카콜라": "KO",
+}
+
+# 질문 끝에 붙는 표현 (계산식 뒤)
+_CALC_SUFFIX = r"(?:\s*(?:=|는|은|이|가)?\s*(?:얼마(?:야|예요|에요|인가요)?|계산\s*해\s*(?:줘|주세요)|몇이야)?\s*[?？.!]*)"
+_CALC_PATTERN = re.compile(rf"^(?P<expr>[\d\s.+\-*/×÷x^%()]+?){_CALC_SUFFIX}$")
+_HAS_OPERATOR = re.compile(r"\d\s*[+\-*/×÷x^%]\s*[\d(]|\)\s*[+\-*/×÷x^%]")
+
+_STOCK_PATTERN = re.compile(
+    r"^(?P<name>[A-Za-z]{1,5}|[가-힣]{2,8}?)\s*(?:의)?\s*"
+    r"(?:현재\s*)?(?:주가|주식\s*가격|가격|시세|현재가)\s*(?:는|은)?\s*"
+    r"(?:좀\s*)?(?:알려\s*(?:줘|주세요|줄래)|얼마(?:야|예요|에요|인가요)?|어때|어때요)?\s*[?？.!]*$"
+)
+
+
+@dataclass
+class RoutedIntent:
+    """판별된 의도"""
+    kind: str
+    argument: str
+
+
+class IntentRouter:
+    """
+    정규식과 티커 별칭으로 단순 질문을 판별하는 라우터.
+
+    - 순수 계산식 ("100 * 1.5는?") → calculate
+    - 단일 종목 시세 질문 ("AAPL 주가 알려줘", "애플 주가는?") → stock_price
+      (한글 별칭 또는 대문자로 쓴 알려진 티커만 - "gold 가격", "USD 가격" 등은 그래프로)
+    - 확신할 수 없는 입력은 None (그래프로 처리)
+    """
+
+    def __init__(self, tickers: Optional[Iterable[str]] = None):
+        tickers = agent_settings.fast_path_tickers if tickers is None else tickers
+        self.tickers = frozenset(tickers) | frozenset(TICKER_ALIASES.values())
+
+    def route(self, user_input: str) -> Optional[RoutedIntent]:
+        """입력을 빠른 경로 의도로 판별 - 히트율 메트릭 기록"""
+        intent = self._match(" ".join(user_input.split()))
+
+        metrics.increment("agent.router.requests_total")
+        if intent is not None:
+            metrics.increment("agent.router.hits_total")
+            metrics.increment(f"agent.router.{intent.kind}_total")
+        self._publish_hit_rate()
+        return intent
+
+    def record_fallback(self, intent: RoutedIntent) -> None:
+        """판별은 했지만 도구 실패 등으로 그래프로 넘긴 경우 기록"""
+        metrics.increment("agent.router.fallbacks_total")
+        logger.info(f"빠른 경로 실패, 그래프로 처리: {intent.kind}({intent.argument})")
+
+    def _match(self, text: str) -> Optional[RoutedIntent]:
+        """계산식 → 시세 질문 순서로 판별"""
+        calc_match = _CALC_PATTERN.match(text)
+        if calc_match and _HAS_OPERATOR.search(calc_match.group("expr")):
+            return RoutedIntent(INTENT_CALCULATE, self._normalize_expression(calc_match.group("expr")))
+
+        stock_match = _STOCK_PATTERN.match(text)
+        if stock_match:
+            ticker = self._resolve_ticker(stock_match.group("name"))
+            if ticker:
+                return RoutedIntent(INTENT_STOCK_PRICE, ticker)
+
+        return None
+
+    @staticmethod
+    def _normalize_expression(expression: str) -> str:
+        """계산기 문법으로 변환 (×, ÷, x, ^)"""
+        expression = expression.replace("×", "*").replace("÷", "/").replace("x", "*").replace("^", "**")
+        return " ".join(expression.split())
+
+    def _resolve_ticker(self, name: str) -> Optional[str]:
+        """종목명/티커를 티커로 변환 (모르는 이름, 소문자 영문 단어는 None)"""
+        if name in TICKER_ALIASES:
+            return TICKER_ALIASES[name]
+        if name.isupper() and name in self.tickers:
+            return name
+        return None
+
+    @staticmethod
+    def _publish_hit_rate() -> None:
+        """히트율 게이지 갱신"""
+        requests = metrics.get_counter("agent.router.requests_total")
+        hits = metrics.get_counter("agent.router.hits_total")
+        metrics.set_gauge("agent.router.hit_rate", hits / requests if requests else 0.0)
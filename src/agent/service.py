@@ -1,16 +1,32 @@
 """Agent 서비스 - 가독성 개선"""
 import logging
 import asyncio
+import hashlib
+import json
 import re
-from typing import AsyncGenerator
+import time
+import uuid
+from typing import Any, AsyncGenerator, Dict, Iterator, Optional
 
-from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage
+from langchain_core.messages import (
+    AIMessage, AIMessageChunk, BaseMessage, HumanMessage, RemoveMessage, ToolMessage,
+)
+from langgraph.errors import GraphRecursionError
 
 # LLMService import 제거 - model_execution_service 사용
-from ..model.executors.langchain_tools import tools
+from ..model.executors.langchain_tools import get_tool_service, tools
 from ..utils.exceptions import AgentException, LLMInvocationException, ToolCallException
+from ..model.settings import model_settings
+from ..model.usage import RequestUsage, usage_tracker
+from ..utils.metrics import metrics
+from .budget import REASON_MAX_STEPS, RequestBudget
+from .checkpointer import create_checkpointer
+from .events import EVENT_PARTIAL, EVENT_TOOL_END, EVENT_TOOL_START, AgentEvent, token_texts
 from .nodes import AgentNode, ToolNode
 from .graph import LangGraphBuilder
+from .policy import DirectReturnPolicy
+from .router import INTENT_CALCULATE, IntentRouter, RoutedIntent
+from .settings import agent_settings
 
 logger = logging.getLogger(__name__)
 
@@ -18,12 +34,13 @@ logger = logging.getLogger(__name__)
 class AgentService:
     """간단한 Agent 서비스 - 스트리밍과 도구 호출만"""
 
-    def __init__(self, model_execution_service):
+    def __init__(self, model_execution_service, tool_service=None, model_router=None):
         """Agent 서비스 초기화 - 의존성 주입"""
         logger.info("Agent 서비스 초기화 중...")
         
-        # 의존성 주입받은 서비스들
+        # 의존성 주입받은 서비스들 (도구 서비스는 도구 함수와 같은 싱글톤이어야 시세 기록이 공유됨)
         self.model_execution_service = model_execution_service
+        self.tool_service = tool_service or get_tool_service()
         
         # 시스템 프롬프트
         system_prompt = """당신은 주식 분석 전문가입니다. 사용자의 주식 관련 질문에 정확하고 도움이 되는 답변을 제공해주세요.
@@ -34,17 +51,27 @@ class AgentService:
 
 주식 가격을 조회할 때는 정확한 티커 심볼을 사용하고, 계산이 필요한 경우 calculate 도구를 활용해주세요."""
         
-        # 노드 생성
-        self.agent_node = AgentNode(self.model_execution_service, system_prompt)
-        self.tool_node = ToolNode(tools)
+        # 노드 생성 (모델 라우터가 없으면 항상 기본 모델)
+        self.agent_node = AgentNode(self.model_execution_service, system_prompt, model_router=model_router)
+        self.tool_node = ToolNode(
+            tools,
+            direct_return_policy=DirectReturnPolicy() if agent_settings.direct_return_enabled else None,
+        )
         
-        # 그래프 구성
+        # 그래프 구성 (설정에 따라 메모리 상한 인메모리 / SQLite 체크포인터 사용)
+        self.checkpointer = create_checkpointer()
+        # 체크포인터가 자동으로 퇴출한 스레드의 요약/시세/사용량도 함께 정리
+        self.checkpointer.on_evict = self._release_thread_state
         self.agent = LangGraphBuilder.build_graph(
             self.agent_node,
             self.tool_node,
-            use_memory=True
+            use_memory=True,
+            checkpointer=self.checkpointer
         )
         
+        # 단순 계산/시세 질문은 그래프(LLM) 없이 처리
+        self.router = IntentRouter() if agent_settings.fast_path_enabled else None
+        
         logger.info("Agent 서비스 초기화 완료")
 
     def _validate_input(self, user_input: str, thread_id: str) -> None:
@@ -66,39 +93,256 @@ class AgentService:
             response_parts.append(chunk)
         return ''.join(response_parts)
 
-    async def stream_response(self, user_input: str, thread_id: str = "default") -> AsyncGenerator[str, None]:
-        """스트리밍 응답 - validate 함수로 깔끔하게 처리"""
+    def _is_answer_token(self, message: BaseMessage, metadata: Dict[str, Any]) -> bool:
+        """사용자에게 보낼 답변 토큰인지 확인 (도구 호출 청크/도구 결과 제외)"""
+        if metadata.get("langgraph_node") == "tools":
+            # 도구 노드가 직접 반환한 최종 답변만 허용
+            return DirectReturnPolicy.is_direct_answer(message)
+        
+        if metadata.get("langgraph_node") != "agent":
+            return False
+        
+        if not isinstance(message, AIMessage) or not isinstance(message.content, str):
+            return False
+        
+        if isinstance(message, AIMessageChunk) and message.tool_call_chunks:
+            return False
+        
+        return bool(message.content) and not self.exists_tool_call(message)
+
+    def _tool_events(self, message: BaseMessage, metadata: Dict[str, Any]) -> Iterator[AgentEvent]:
+        """도구 실행 시작(agent의 도구 호출)/종료(도구 결과), 부분 답변 이벤트"""
+        node = metadata.get("langgraph_node")
+        if node == "agent" and isinstance(message, AIMessageChunk):
+            # 스트리밍 도구 호출은 이름이 담긴 첫 청크에서 시작으로 봄
+            for chunk in message.tool_call_chunks:
+                if chunk.get("name"):
+                    yield AgentEvent(EVENT_TOOL_START, {"id": chunk.get("id"), "name": chunk["name"]})
+        elif node == "agent" and isinstance(message, AIMessage):
+            for call in message.tool_calls:
+                yield AgentEvent(EVENT_TOOL_START, {"id": call.get("id"), "name": call["name"]})
+        elif node == "tools" and isinstance(message, ToolMessage):
+            yield AgentEvent(
+                EVENT_TOOL_END, {"id": message.tool_call_id, "name": message.name, "status": message.status}
+            )
+        if node == "agent" and isinstance(message, AIMessage):
+            # 예산 소진으로 노드가 만든 부분 답변 - 답변 토큰보다 먼저 알림
+            reason = message.response_metadata.get(RequestBudget.PARTIAL_ANSWER_KEY)
+            if reason:
+                yield AgentEvent(EVENT_PARTIAL, {"reason": reason})
+
+    async def stream_response(
+        self,
+        user_input: str,
+        thread_id: str = "default",
+        timeout: Optional[float] = None,
+        usage: Optional[RequestUsage] = None,
+    ) -> AsyncGenerator[str, None]:
+        """토큰 단위 스트리밍 응답 - usage를 넘기면 이 요청의 LLM 토큰 사용량을 누적"""
+        async for text in token_texts(self.stream_events(user_input, thread_id, timeout, usage)):
+            yield text
+
+    async def stream_events(
+        self,
+        user_input: str,
+        thread_id: str = "default",
+        timeout: Optional[float] = None,
+        usage: Optional[RequestUsage] = None,
+    ) -> AsyncGenerator[AgentEvent, None]:
+        """답변 토큰과 도구 실행 이벤트 스트리밍 - validate 함수로 깔끔하게 처리"""
         # 입력 검증
         self._validate_input(user_input, thread_id)
         
         # 비즈니스 로직 실행
-        config = {"configurable": {"thread_id": thread_id}}
+        # 요청 마감 시각과 스텝 예산을 노드에 전달 (LLM/도구 타임아웃이 남은 시간으로 제한됨)
+        budget = RequestBudget.start(timeout or agent_settings.request_timeout, agent_settings.max_agent_steps)
+        config = {
+            "configurable": {
+                "thread_id": thread_id,
+                **budget.to_configurable(),
+                **(usage.to_configurable() if usage is not None else {}),
+            },
+            # 노드가 스텝 예산으로 먼저 멈추므로 정상 흐름에서는 도달하지 않는 안전장치
+            "recursion_limit": agent_settings.max_agent_steps * 2 + 3,
+        }
+        started_at = time.perf_counter()
+        first_token_at = None
         
-        async for chunk in self.agent.astream(
-            {"messages": [HumanMessage(content=user_input)]},
-            config=config
-        ):
-            # AI 메시지 청크 처리
-            if "agent" in chunk:
-                for message in chunk["agent"]["messages"]:
-                    if isinstance(message, (AIMessage, AIMessageChunk)) and message.content:
-                        yield message.content
+        # 빠른 경로: 확신할 수 있는 단순 질문은 도구를 직접 호출해 템플릿 답변
+        intent = self.router.route(user_input) if self.router else None
+        if intent is not None:
+            answer = await self._answer_fast_path(intent, thread_id)
+            if answer is not None:
+                await self.record_turn(thread_id, user_input, answer)
+                metrics.observe("agent.fast_path_seconds", time.perf_counter() - started_at)
+                yield AgentEvent.token(answer)
+                return
+            self.router.record_fallback(intent)
+        
+        # messages 모드: LLM 토큰 청크를 생성 즉시 (chunk, metadata) 형태로 전달
+        # 턴 입력 메시지 ID는 취소 시 이 턴에 기록된 메시지를 찾는 기준
+        turn_input = HumanMessage(content=user_input, id=str(uuid.uuid4()))
+        try:
+            stream = self.agent.astream(
+                {"messages": [turn_input]},
+                config=config,
+                stream_mode="messages"
+            )
+            try:
+                async for message, metadata in stream:
+                    for event in self._tool_events(message, metadata):
+                        yield event
+                    if not self._is_answer_token(message, metadata):
+                        continue
+                    
+                    if first_token_at is None:
+                        first_token_at = time.perf_counter()
+                        ttft = first_token_at - started_at
+                        metrics.observe("agent.ttft_seconds", ttft)
+                        logger.info(f"첫 토큰 응답 시간(TTFT): {ttft * 1000:.0f}ms (스레드: {thread_id})")
                     
-            # 도구 실행 결과 처리
-            elif "tools" in chunk:
-                for message in chunk["tools"]["messages"]:
-                    if isinstance(message, AIMessage) and message.content:
-                        yield message.content
+                    yield AgentEvent.token(message.content)
+            finally:
+                # 중간에 닫혀도 그래프 실행(진행 중인 LLM/도구 호출 포함)을 먼저 정리
+                await stream.aclose()
+        except (asyncio.CancelledError, GeneratorExit):
+            # 클라이언트 연결 종료 등으로 취소 - 진행 중인 LLM/도구 호출은 그래프 태스크와 함께 취소됨
+            metrics.increment("agent.runs_cancelled_total")
+            logger.info(f"Agent 실행 취소 (스레드: {thread_id})")
+            await self._discard_turn(thread_id, turn_input.id)
+            raise
+        except GraphRecursionError:
+            # 노드의 스텝 예산을 우회한 루프 - 마지막 상태로 부분 답변
+            logger.warning(f"그래프 재귀 한도 도달 (스레드: {thread_id})")
+            metrics.increment(f"agent.budget.{REASON_MAX_STEPS}_exhausted_total")
+            state_config = {"configurable": {"thread_id": thread_id}}
+            state = await self.agent.aget_state(state_config)
+            answer = budget.partial_answer(state.values.get("messages", []), REASON_MAX_STEPS)
+            await self.agent.aupdate_state(state_config, {"messages": [answer]}, as_node="agent")
+            yield AgentEvent(EVENT_PARTIAL, {"reason": REASON_MAX_STEPS})
+            yield AgentEvent.token(answer.content)
+        
+        # turn 모드 체크포인터는 턴이 끝난 뒤 최종 상태만 저장
+        await self.checkpointer.aflush(thread_id)
+        metrics.observe("agent.response_seconds", time.perf_counter() - started_at)
+    
+    async def _discard_turn(self, thread_id: str, turn_input_id: str) -> None:
+        """취소된 턴이 기록한 메시지를 되돌려 대화 상태를 턴 시작 전으로 복원 (도구 결과 없는 도구 호출 등이 남지 않음)"""
+        config = {"configurable": {"thread_id": thread_id}}
+        messages = (await self.agent.aget_state(config)).values.get("messages", [])
+        start = next((i for i, message in enumerate(messages) if message.id == turn_input_id), None)
+        if start is None:
+            # 입력이 기록되기 전에 취소됨
+            return
+        if start == 0:
+            # 첫 턴이면 스레드 자체와 스레드별 상태(요약, 시세, 사용량)를 삭제
+            self.checkpointer.delete_thread(thread_id)
+            self._release_thread_state(thread_id)
+        else:
+            await self.agent.aupdate_state(
+                config, {"messages": [RemoveMessage(id=message.id) for message in messages[start:]]}, as_node="agent"
+            )
+            await self.checkpointer.aflush(thread_id)
+        metrics.increment("agent.turns_discarded_total")
+        logger.info(f"취소된 턴의 메시지 {len(messages) - start}개 되돌림 (스레드: {thread_id})")
+    
+    async def _answer_fast_path(self, intent: RoutedIntent, thread_id: str) -> Optional[str]:
+        """빠른 경로 답변 생성 - 실패하면 None (그래프로 처리)"""
+        try:
+            if intent.kind == INTENT_CALCULATE:
+                result = self.tool_service.calculator_service.calculate(
+                    intent.argument, self.tool_service.get_thread_quotes(thread_id)
+                )
+                if not result.is_success:
+                    return None
+                value = result.result
+                text = f"{int(value):,}" if value == value.to_integral_value() else f"{float(value):,.10g}"
+                return f"계산 결과: {intent.argument} = {text}"
             
-            # 기타 메시지 (예: 중간 상태)는 무시
-            else:
-                pass
+            quote = await self.tool_service.get_stock_quote(intent.argument, thread_id)
+            return self.tool_service.stock_service.format_quote_answer(quote)
+        except Exception as e:
+            logger.warning(f"빠른 경로 도구 호출 실패: {e}")
+            return None
     
-    def clear_history(self, thread_id: str = "default"):
-        """대화 히스토리 초기화 (InMemorySaver는 thread_id별로 자동 관리)"""
-        logger.info(f"대화 히스토리 초기화 요청: {thread_id}")
-        # InMemorySaver는 별도 clear 메서드 없음, 새 thread_id 사용시 자동 초기화 효과
-        pass
+    def get_response_fingerprint(self) -> str:
+        """같은 질문에 같은 답변을 기대할 수 있는 조건(모델 설정 + 프롬프트 버전)의 지문"""
+        prompt_version = {
+            "system_prompt": self.agent_node.system_prompt,
+            "tools": sorted(tool.name for tool in tools),
+        }
+        dumped = json.dumps(
+            {"model": model_settings.model_dump(), "prompt": prompt_version},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(dumped.encode("utf-8")).hexdigest()
+    
+    async def has_history(self, thread_id: str) -> bool:
+        """스레드에 저장된 대화가 있는지 확인"""
+        config = {"configurable": {"thread_id": thread_id}}
+        return await self.checkpointer.aget_tuple(config) is not None
+    
+    async def record_turn(self, thread_id: str, user_input: str, answer: str) -> None:
+        """그래프를 실행하지 않고 만든 답변(캐시 등)을 대화 히스토리에 기록"""
+        config = {"configurable": {"thread_id": thread_id}}
+        await self.agent.aupdate_state(
+            config,
+            {"messages": [HumanMessage(content=user_input), AIMessage(content=answer)]},
+            as_node="agent",
+        )
+        await self.checkpointer.aflush(thread_id)
+    
+    def get_quote_expiry(self, thread_id: str) -> Optional[float]:
+        """스레드 답변에 사용된 시세 중 가장 먼저 만료되는 시각"""
+        return self.tool_service.get_thread_quote_expiry(thread_id)
+    
+    def set_session_timeout(self, session_timeout: float) -> None:
+        """세션 타임아웃 설정 - 이 시간 동안 사용되지 않은 스레드의 체크포인트는 삭제"""
+        self.checkpointer.session_timeout = session_timeout
+    
+    def set_max_history(self, max_history: int) -> None:
+        """LLM에 보내는 최대 히스토리 메시지 수 설정 (넘는 오래된 턴은 요약으로 접힘)"""
+        self.agent_node.history_manager.max_messages = max_history
+    
+    def get_memory_usage(self) -> dict:
+        """체크포인터 메모리 사용량 반환"""
+        return self.checkpointer.get_memory_usage()
+    
+    def _thread_bytes(self, thread_id: str) -> int:
+        """스레드가 사용 중인 체크포인트 메모리 (직렬화 바이트 기준)"""
+        return self.get_memory_usage()["threads"].get(thread_id, 0)
+    
+    def _release_thread_state(self, thread_id: str) -> None:
+        """체크포인트 밖에 남은 스레드별 상태(히스토리 요약, 조회한 시세) 삭제"""
+        self.agent_node.history_manager.clear(thread_id)
+        self.tool_service.clear_thread_quotes(thread_id)
+        usage_tracker.clear_session(thread_id)
+    
+    def clear_history(self, thread_id: str = "default") -> int:
+        """대화 히스토리 초기화 - 스레드의 체크포인트와 관련 상태를 삭제하고 해제된 바이트 수 반환"""
+        reclaimed = self._thread_bytes(thread_id)
+        self.checkpointer.delete_thread(thread_id)
+        self._release_thread_state(thread_id)
+        
+        metrics.increment("agent.sessions_cleared_total")
+        logger.info(f"대화 히스토리 초기화: {thread_id} ({reclaimed} bytes 해제)")
+        return reclaimed
+    
+    def purge_idle_sessions(self, idle_seconds: Optional[float] = None) -> Dict[str, Any]:
+        """지정한 시간(기본: 세션 타임아웃)보다 오래 사용되지 않은 스레드를 일괄 삭제"""
+        before = self.get_memory_usage()["total_bytes"]
+        # 스레드별 상태는 체크포인터의 퇴출 알림(on_evict)으로 정리됨
+        purged = self.checkpointer.evict_idle_threads(idle_seconds)
+        after = self.get_memory_usage()["total_bytes"]
+        
+        logger.info(f"유휴 세션 일괄 삭제: {len(purged)}개 ({before - after} bytes 해제)")
+        return {
+            "purged_threads": len(purged),
+            "thread_ids": purged,
+            "reclaimed_bytes": max(before - after, 0),
+            "remaining_bytes": after,
+        }
 
     def exists_tool_call(self, message: AIMessage) -> bool:
         """AIMessage 객체에 tool_calls가 있는지 확인합니다."""
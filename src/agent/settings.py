@@ -0,0 +1,55 @@
+"""Agent 설정 관리"""
+import logging
+from typing import List
+from pydantic_settings import BaseSettings
+
+from ..utils.settings import LazySettings
+
+logger = logging.getLogger(__name__)
+
+
+class AgentSettings(BaseSettings):
+    """Agent 실행 관련 설정 - Pydantic 기반"""
+    
+    # 도구 실행 설정
+    tool_max_concurrency: int = 4
+    tool_timeout: float = 15.0
+    
+    # 요청 실행 예산 (초과 시 지금까지의 결과로 부분 답변)
+    request_timeout: float = 60.0  # 요청 전체 마감 시간(초) - LLM/도구 타임아웃을 남은 시간으로 제한
+    max_agent_steps: int = 6  # 한 턴에서 허용하는 agent(LLM) 호출 횟수
+    
+    # 도구 결과 직접 반환 (허용된 도구 1회 호출 + 단순 조회이면 두 번째 LLM 호출 생략)
+    direct_return_enabled: bool = True
+    direct_return_tools: List[str] = ["get_stock_price"]
+    
+    # 빠른 경로 라우터 (단순 계산/시세 질문은 LLM 없이 처리)
+    fast_path_enabled: bool = True
+    # 한글 별칭 외에 빠른 경로로 처리할 티커 (대문자로 쓴 경우만, 나머지 영문 단어는 그래프로 처리)
+    fast_path_tickers: List[str] = ["AAPL", "TSLA", "NVDA", "MSFT", "GOOGL", "GOOG", "AMZN", "META", "NFLX", "AMD", "INTC", "KO"]
+    
+    # 대화 히스토리 설정 (토큰 수는 로컬 추정치 기준)
+    history_token_budget: int = 6000
+    history_summary_max_tokens: int = 600
+    history_trim_target_ratio: float = 0.75
+    
+    # 체크포인터 설정
+    checkpoint_max_per_thread: int = 3
+    checkpoint_session_timeout: float = 3600  # ChatbotConfig.session_timeout으로 덮어씀
+    checkpoint_max_memory_mb: int = 256
+    checkpointer_backend: str = "memory"  # memory | sqlite
+    checkpoint_sqlite_path: str = "data/checkpoints.sqlite"
+    checkpoint_sqlite_write_mode: str = "step"  # step: 스텝마다 저장 | turn: 턴 종료 시 최종 상태만 저장
+    checkpoint_sqlite_cache_size: int = 256
+    checkpoint_delta_encoding: bool = True  # messages 채널을 메시지 키 목록 + 인터닝된 본문으로 저장
+    checkpoint_message_cache_size: int = 4096
+    
+    model_config = {
+        "env_file": ".env",
+        "env_file_encoding": "utf-8",
+        "extra": "ignore",
+    }
+
+
+# 전역 설정 인스턴스
+agent_settings: AgentSettings = LazySettings(AgentSettings)  # 처음 접근할 때 로드
@@ -0,0 +1,803 @@
+"""LangGraph 체크포인터 - SQLite(WAL) 기반 영속 체크포인터"""
+import asyncio
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+    writes_sort_key,
+)
+
+from ..utils.metrics import metrics
+from .checkpoint_codec import MessageBodies, MessageDeltaCodec
+from .checkpointer import notify_evicted
+from .settings import agent_settings
+
+logger = logging.getLogger(__name__)
+
+# (task_id, idx) -> (task_id, channel, (type, bytes), task_path)
+SavedWrites = Dict[Tuple[str, int], Tuple[str, str, Tuple[str, bytes], str]]
+
+WRITE_MODE_STEP = "step"
+WRITE_MODE_TURN = "turn"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    checkpoint_id TEXT NOT NULL,
+    parent_checkpoint_id TEXT,
+    checkpoint_type TEXT NOT NULL,
+    checkpoint BLOB NOT NULL,
+    metadata_type TEXT NOT NULL,
+    metadata BLOB NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+);
+CREATE TABLE IF NOT EXISTS writes (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    checkpoint_id TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    channel TEXT NOT NULL,
+    value_type TEXT NOT NULL,
+    value BLOB NOT NULL,
+    task_path TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+);
+CREATE TABLE IF NOT EXISTS messages (
+    message_key TEXT PRIMARY KEY,
+    value_type TEXT NOT NULL,
+    value BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS thread_messages (
+    thread_id TEXT NOT NULL,
+    message_key TEXT NOT NULL,
+    PRIMARY KEY (thread_id, message_key)
+);
+CREATE INDEX IF NOT EXISTS idx_checkpoints_updated_at ON checkpoints (thread_id, updated_at);
+CREATE INDEX IF NOT EXISTS idx_thread_messages_key ON thread_messages (message_key);
+"""
+
+
+@dataclass
+class _SavedCheckpoint:
+    """직렬화된 체크포인트 한 건 (+ 해당 체크포인트의 중간 쓰기)"""
+    checkpoint_id: str
+    parent_checkpoint_id: Optional[str]
+    checkpoint: Tuple[str, bytes]
+    metadata: Tuple[str, bytes]
+    writes: SavedWrites = field(default_factory=dict)
+    persisted: bool = False
+    persisted_writes: Set[Tuple[str, int]] = field(default_factory=set)
+    # 델타 인코딩 시 체크포인트가 참조하는 메시지 본문 (DB에 기록한 뒤 비움)
+    message_bodies: MessageBodies = field(default_factory=dict)
+
+    @property
+    def size(self) -> int:
+        """직렬화 바이트 수"""
+        return (
+            len(self.checkpoint[1])
+            + len(self.metadata[1])
+            + sum(len(value[2][1]) for value in self.writes.values())
+        )
+
+
+class SqliteCheckpointSaver(BaseCheckpointSaver[str]):
+    """
+    SQLite(WAL) 파일에 체크포인트를 저장하는 체크포인터.
+
+    - 여러 uvicorn 워커가 같은 파일을 공유하므로 세션이 워커와 무관하게 이어짐
+    - write_mode="step": 그래프 스텝마다 (이전 스텝의 쓰기 + 새 체크포인트)를 한 트랜잭션으로 저장
+    - write_mode="turn": 스텝 중에는 메모리에만 두고 flush 시 턴의 최종 상태만 저장
+    - 진행 중인 턴의 최신 체크포인트는 메모리(pending)에 두고 쓰기를 모으며, flush 시 캐시로 옮김
+    - 읽기는 스레드별 최신 체크포인트를 담은 LRU 캐시를 먼저 사용 (DB의 최신 ID와 일치할 때만)
+    - delta_encoding 사용 시 메시지 본문은 messages 테이블에 한 번만 저장하고 체크포인트에는 키 목록만 저장
+      (오래된 체크포인트를 정리할 때 남은 체크포인트가 참조하지 않는 본문도 삭제)
+    - 유휴로 삭제한 스레드는 on_evict(thread_id)로 알림 (체크포인트 밖의 스레드별 상태 정리용)
+    - _lock은 DB 연결을, _pending_lock은 보류 목록만 보호 (이벤트 루프는 _pending_lock만 잡으며
+      _pending_lock은 DB 작업 중에 잡지 않으므로 다른 워커와의 잠금 경합이 루프를 막지 않음)
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        write_mode: Optional[str] = None,
+        cache_size: Optional[int] = None,
+        max_checkpoints_per_thread: Optional[int] = None,
+        session_timeout: Optional[float] = None,
+        clock: Callable[[], float] = time.time,
+        delta_encoding: Optional[bool] = None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        if delta_encoding is None:
+            delta_encoding = agent_settings.checkpoint_delta_encoding
+        self.codec = MessageDeltaCodec(self.serde) if delta_encoding else None
+        self.path = path or agent_settings.checkpoint_sqlite_path
+        self.write_mode = write_mode or agent_settings.checkpoint_sqlite_write_mode
+        if self.write_mode not in (WRITE_MODE_STEP, WRITE_MODE_TURN):
+            raise ValueError(f"지원하지 않는 체크포인트 쓰기 모드: {self.write_mode}")
+        self.cache_size = cache_size or agent_settings.checkpoint_sqlite_cache_size
+        self.max_checkpoints_per_thread = max(
+            1, max_checkpoints_per_thread or agent_settings.checkpoint_max_per_thread
+        )
+        self.session_timeout = session_timeout or agent_settings.checkpoint_session_timeout
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._pending_lock = threading.Lock()
+        self.on_evict: Optional[Callable[[str], None]] = None
+
+        # 아직 DB에 쓰지 않은 (thread_id, checkpoint_ns)별 최신 체크포인트
+        self._pending: Dict[Tuple[str, str], _SavedCheckpoint] = {}
+        # DB에 저장된 (thread_id, checkpoint_ns)별 최신 체크포인트 LRU 캐시
+        self._cache: "OrderedDict[Tuple[str, str], _SavedCheckpoint]" = OrderedDict()
+        # thread_id별로 DB에 이미 기록한 메시지 키 (새로 추가된 본문만 쓰기 위함)
+        self._known_messages: "OrderedDict[str, Set[str]]" = OrderedDict()
+
+        self._conn = self._connect()
+        self._last_idle_sweep = self._clock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """WAL 모드로 SQLite 연결 생성"""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+
+        conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.executescript(SCHEMA)
+        logger.info(f"SQLite 체크포인터 연결: {self.path} (쓰기 모드: {self.write_mode})")
+        return conn
+
+    # ------------------------------------------------------------------
+    # 동기 API
+    # ------------------------------------------------------------------
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        """체크포인트 조회 - 미저장분 → 캐시 → DB 순서"""
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = get_checkpoint_id(config)
+        latest = checkpoint_id is None
+        key = (thread_id, checkpoint_ns)
+
+        with self._lock:
+            with self._pending_lock:
+                pending = self._pending.get(key)
+            if checkpoint_id is None:
+                if pending and not pending.persisted:
+                    return self._to_tuple(thread_id, checkpoint_ns, pending)
+                # 다른 워커가 더 최신 체크포인트를 썼을 수 있으므로 DB의 최신 ID를 확인 (인덱스 조회)
+                checkpoint_id = self._latest_checkpoint_id(thread_id, checkpoint_ns)
+                if checkpoint_id is None:
+                    # 다른 워커가 스레드를 삭제했을 수 있으므로 기록한 메시지 키도 잊음
+                    self._known_messages.pop(thread_id, None)
+                    return None
+
+            if pending and pending.checkpoint_id == checkpoint_id:
+                return self._to_tuple(thread_id, checkpoint_ns, pending)
+
+            cached = self._cache.get(key)
+            if cached and cached.checkpoint_id == checkpoint_id:
+                self._cache.move_to_end(key)
+                metrics.increment("checkpointer.cache_hits_total")
+                return self._to_tuple(thread_id, checkpoint_ns, cached)
+
+            saved = self._load_checkpoint(thread_id, checkpoint_ns, checkpoint_id)
+            if saved is None:
+                return None
+
+            if latest:
+                # 다른 워커가 이어 썼을 수 있음 - 그 워커가 정리한 본문을 다시 쓰도록 기록한 키를 잊음
+                self._known_messages.pop(thread_id, None)
+            metrics.increment("checkpointer.cache_misses_total")
+            if cached is None or saved.checkpoint_id >= cached.checkpoint_id:
+                self._remember(key, saved)
+            return self._to_tuple(thread_id, checkpoint_ns, saved)
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        """체크포인트 목록 조회 (미저장분은 먼저 flush)"""
+        with self._lock:
+            thread_id = config["configurable"]["thread_id"] if config else None
+            self.flush(thread_id)
+
+            query = "SELECT thread_id, checkpoint_ns, checkpoint_id FROM checkpoints"
+            conditions, params = [], []
+            if config:
+                conditions.append("thread_id = ?")
+                params.append(thread_id)
+                checkpoint_ns = config["configurable"].get("checkpoint_ns")
+                if checkpoint_ns is not None:
+                    conditions.append("checkpoint_ns = ?")
+                    params.append(checkpoint_ns)
+                if checkpoint_id := get_checkpoint_id(config):
+                    conditions.append("checkpoint_id = ?")
+                    params.append(checkpoint_id)
+            if before and (before_id := get_checkpoint_id(before)):
+                conditions.append("checkpoint_id < ?")
+                params.append(before_id)
+            if conditions:
+                query += " WHERE " + " AND ".join(conditions)
+            query += " ORDER BY checkpoint_id DESC"
+            rows = self._conn.execute(query, params).fetchall()
+
+        for row_thread_id, row_ns, row_checkpoint_id in rows:
+            if limit is not None and limit <= 0:
+                break
+            with self._lock:
+                saved = self._load_checkpoint(row_thread_id, row_ns, row_checkpoint_id)
+            if saved is None:
+                continue
+
+            checkpoint_tuple = self._to_tuple(row_thread_id, row_ns, saved)
+            if filter and not all(
+                checkpoint_tuple.metadata.get(query_key) == query_value
+                for query_key, query_value in filter.items()
+            ):
+                continue
+
+            if limit is not None:
+                limit -= 1
+            yield checkpoint_tuple
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """체크포인트 저장 - step 모드는 즉시 한 트랜잭션으로, turn 모드는 flush까지 보류"""
+        key, batch = self._stage(config, checkpoint, metadata)
+        self._commit_stage(key, batch)
+        return self._next_config(key, checkpoint)
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """중간 쓰기 저장 - 해당 체크포인트에 모아두었다가 다음 저장 시 함께 기록"""
+        if self._merge_writes(config, writes, task_id, task_path):
+            return
+
+        # 이미 DB에 저장된 체크포인트의 쓰기 - 보류 목록으로 다시 올림
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+        with self._lock:
+            target = self._load_checkpoint(thread_id, checkpoint_ns, checkpoint_id)
+        if target is None:
+            logger.warning(f"쓰기 대상 체크포인트를 찾을 수 없습니다: {checkpoint_id}")
+            return
+        target.persisted = True
+        target.persisted_writes = set(target.writes)
+
+        with self._pending_lock:
+            current = self._pending.get((thread_id, checkpoint_ns))
+            if current is None or current.checkpoint_id != checkpoint_id:
+                self._pending[(thread_id, checkpoint_ns)] = target
+        self._merge_writes(config, writes, task_id, task_path)
+
+    def delete_thread(self, thread_id: str) -> None:
+        """스레드의 체크포인트와 쓰기를 모두 삭제"""
+        with self._lock:
+            with self._pending_lock:
+                for key in [key for key in self._pending if key[0] == thread_id]:
+                    del self._pending[key]
+            for key in [key for key in self._cache if key[0] == thread_id]:
+                del self._cache[key]
+            self._known_messages.pop(thread_id, None)
+
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute("DELETE FROM checkpoints WHERE thread_id = ?", (thread_id,))
+                self._conn.execute("DELETE FROM writes WHERE thread_id = ?", (thread_id,))
+                message_keys = [
+                    row[0]
+                    for row in self._conn.execute(
+                        "SELECT message_key FROM thread_messages WHERE thread_id = ?", (thread_id,)
+                    )
+                ]
+                self._conn.execute("DELETE FROM thread_messages WHERE thread_id = ?", (thread_id,))
+                self._delete_orphan_messages(message_keys)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def flush(self, thread_id: Optional[str] = None) -> None:
+        """보류 중인 체크포인트를 DB에 기록하고 캐시로 옮김 (thread_id가 없으면 전체)"""
+        with self._lock:
+            with self._pending_lock:
+                keys = [key for key in self._pending if thread_id is None or key[0] == thread_id]
+                flushed = [(key, self._pending.pop(key)) for key in keys]
+            for key, saved in flushed:
+                if not saved.persisted or set(saved.writes) - saved.persisted_writes:
+                    self._write_batch(key, [saved])
+                self._remember(key, saved)
+
+    def close(self) -> None:
+        """보류분을 기록하고 연결 종료"""
+        with self._lock:
+            self.flush()
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    # 비동기 API - DB 작업은 이벤트 루프를 막지 않도록 스레드에서 실행
+    # ------------------------------------------------------------------
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        items = await asyncio.to_thread(
+            lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+        )
+        for item in items:
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        # 뒤이어 오는 put_writes가 이 체크포인트를 찾을 수 있도록 보류 목록 등록은 즉시 수행 (DB 잠금 없음)
+        key, batch = self._stage(config, checkpoint, metadata)
+        if batch:
+            await asyncio.to_thread(self._commit_stage, key, batch)
+        return self._next_config(key, checkpoint)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        # 보류 중인 체크포인트의 쓰기는 메모리에만 모음 - DB에서 읽어야 할 때만 스레드에서 실행
+        if not self._merge_writes(config, writes, task_id, task_path):
+            await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await asyncio.to_thread(self.delete_thread, thread_id)
+
+    async def aflush(self, thread_id: Optional[str] = None) -> None:
+        """보류 중인 체크포인트를 DB에 기록 (비동기)"""
+        await asyncio.to_thread(self.flush, thread_id)
+
+    def get_next_version(self, current: Optional[str], channel: None) -> str:
+        """채널 버전 생성 (InMemorySaver와 같은 문자열 형식)"""
+        if current is None:
+            current_v = 0
+        elif isinstance(current, int):
+            current_v = current
+        else:
+            current_v = int(current.split(".")[0])
+        next_v = current_v + 1
+        next_h = random.random()
+        return f"{next_v:032}.{next_h:016}"
+
+    # ------------------------------------------------------------------
+    # 정리 / 사용량
+    # ------------------------------------------------------------------
+    def evict_idle_threads(self, idle_seconds: Optional[float] = None) -> List[str]:
+        """지정한 시간(기본: 세션 타임아웃)보다 오래 갱신되지 않은 스레드 삭제"""
+        idle_seconds = self.session_timeout if idle_seconds is None else idle_seconds
+        with self._lock:
+            threshold = self._clock() - idle_seconds
+            rows = self._conn.execute(
+                "SELECT thread_id FROM checkpoints GROUP BY thread_id HAVING MAX(updated_at) < ?",
+                (threshold,),
+            ).fetchall()
+            # 아직 DB에 쓰지 않은 턴이 진행 중인 스레드는 제외
+            with self._pending_lock:
+                active = {key[0] for key, saved in self._pending.items() if not saved.persisted}
+            expired = [row[0] for row in rows if row[0] not in active]
+            for thread_id in expired:
+                self.delete_thread(thread_id)
+                notify_evicted(self.on_evict, thread_id)
+
+            if expired:
+                metrics.increment("checkpointer.evicted_threads_total", len(expired))
+                logger.info(f"유휴 스레드 {len(expired)}개 체크포인트 삭제")
+            return expired
+
+    def get_memory_usage(self) -> Dict[str, Any]:
+        """스레드별 캐시 메모리와 DB 파일 크기"""
+        with self._lock:
+            threads: Dict[str, int] = {}
+            with self._pending_lock:
+                pending_count = len(self._pending)
+                for (thread_id, _), saved in list(self._cache.items()) + list(self._pending.items()):
+                    threads[thread_id] = threads.get(thread_id, 0) + saved.size
+
+            thread_count = self._conn.execute(
+                "SELECT COUNT(DISTINCT thread_id) FROM checkpoints"
+            ).fetchone()[0]
+            checkpoint_count = self._conn.execute("SELECT COUNT(*) FROM checkpoints").fetchone()[0]
+
+        db_bytes = sum(
+            os.path.getsize(path)
+            for path in (self.path, f"{self.path}-wal")
+            if os.path.exists(path)
+        )
+        return {
+            "total_bytes": sum(threads.values()),
+            "db_bytes": db_bytes,
+            "thread_count": thread_count,
+            "checkpoint_count": checkpoint_count,
+            "cached_threads": len(self._cache),
+            "pending_threads": pending_count,
+            "threads": threads,
+        }
+
+    # ------------------------------------------------------------------
+    # 내부 구현
+    # ------------------------------------------------------------------
+    def _stage(
+        self, config: RunnableConfig, checkpoint: Checkpoint, metadata: CheckpointMetadata
+    ) -> Tuple[Tuple[str, str], List[_SavedCheckpoint]]:
+        """체크포인트를 직렬화해 보류 목록에 등록하고, 이번에 DB에 쓸 배치를 반환"""
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        key = (thread_id, checkpoint_ns)
+
+        message_bodies: MessageBodies = {}
+        if self.codec:
+            values, message_bodies = self.codec.encode(checkpoint["channel_values"])
+            checkpoint = {**checkpoint, "channel_values": values}
+
+        saved = _SavedCheckpoint(
+            checkpoint_id=checkpoint["id"],
+            parent_checkpoint_id=config["configurable"].get("checkpoint_id"),
+            checkpoint=self.serde.dumps_typed(checkpoint),
+            metadata=self.serde.dumps_typed(get_checkpoint_metadata(config, metadata)),
+            message_bodies=message_bodies,
+        )
+
+        with self._pending_lock:
+            previous = self._pending.get(key)
+            self._pending[key] = saved
+
+        if self.write_mode == WRITE_MODE_TURN:
+            return key, []
+        # 이전 스텝의 쓰기 + 새 체크포인트를 한 번에 저장 (새 체크포인트의 쓰기는 다음 스텝에)
+        return key, [previous, saved] if previous else [saved]
+
+    def _commit_stage(self, key: Tuple[str, str], batch: List[_SavedCheckpoint]) -> None:
+        """배치 기록 및 주기적인 유휴 스레드 정리"""
+        with self._lock:
+            if batch:
+                self._write_batch(key, batch)
+            self._maybe_sweep_idle_threads()
+
+    def _merge_writes(
+        self, config: RunnableConfig, writes: Sequence[Tuple[str, Any]], task_id: str, task_path: str
+    ) -> bool:
+        """보류 중인 체크포인트에 쓰기를 모음 (DB 작업 없음) - 대상이 보류 목록에 없으면 False"""
+        key = (config["configurable"]["thread_id"], config["configurable"].get("checkpoint_ns", ""))
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+        serialized = [
+            (
+                (task_id, WRITES_IDX_MAP.get(channel, index)),
+                (task_id, channel, self.serde.dumps_typed(value), task_path),
+            )
+            for index, (channel, value) in enumerate(writes)
+        ]
+
+        with self._pending_lock:
+            target = self._pending.get(key)
+            if target is None or target.checkpoint_id != checkpoint_id:
+                return False
+            for inner_key, value in serialized:
+                if inner_key[1] >= 0 and inner_key in target.writes:
+                    continue
+                target.writes[inner_key] = value
+        return True
+
+    @staticmethod
+    def _next_config(key: Tuple[str, str], checkpoint: Checkpoint) -> RunnableConfig:
+        """저장한 체크포인트를 가리키는 config"""
+        return {
+            "configurable": {
+                "thread_id": key[0],
+                "checkpoint_ns": key[1],
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    def _write_batch(self, key: Tuple[str, str], batch: List[_SavedCheckpoint]) -> None:
+        """체크포인트들과 그 쓰기를 한 트랜잭션으로 기록하고 오래된 체크포인트 정리"""
+        thread_id, checkpoint_ns = key
+        now = self._clock()
+        # 기록하는 동안 이벤트 루프가 쓰기를 더할 수 있으므로 스냅샷을 기록
+        with self._pending_lock:
+            snapshots = [dict(saved.writes) for saved in batch]
+
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            for saved, saved_writes in zip(batch, snapshots):
+                if not saved.persisted:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (
+                            thread_id, checkpoint_ns, saved.checkpoint_id, saved.parent_checkpoint_id,
+                            saved.checkpoint[0], saved.checkpoint[1],
+                            saved.metadata[0], saved.metadata[1], now,
+                        ),
+                    )
+                else:
+                    self._conn.execute(
+                        "UPDATE checkpoints SET updated_at = ? "
+                        "WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                        (now, thread_id, checkpoint_ns, saved.checkpoint_id),
+                    )
+                self._write_messages(thread_id, saved.message_bodies)
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO writes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            thread_id, checkpoint_ns, saved.checkpoint_id, task_id, idx,
+                            channel, value[0], value[1], task_path,
+                        )
+                        for (task_id, idx), (_, channel, value, task_path) in saved_writes.items()
+                        if (task_id, idx) not in saved.persisted_writes
+                    ],
+                )
+
+            # 최신 N개를 제외한 체크포인트 삭제
+            stale_ids = [
+                row[0]
+                for row in self._conn.execute(
+                    "SELECT checkpoint_id FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? "
+                    "ORDER BY checkpoint_id DESC LIMIT -1 OFFSET ?",
+                    (thread_id, checkpoint_ns, self.max_checkpoints_per_thread),
+                )
+            ]
+            for checkpoint_id in stale_ids:
+                self._conn.execute(
+                    "DELETE FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                    (thread_id, checkpoint_ns, checkpoint_id),
+                )
+                self._conn.execute(
+                    "DELETE FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                    (thread_id, checkpoint_ns, checkpoint_id),
+                )
+            released = self._release_unreferenced_messages(thread_id) if self.codec and stale_ids else set()
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+
+        for saved, saved_writes in zip(batch, snapshots):
+            saved.persisted = True
+            saved.persisted_writes.update(saved_writes)
+            if saved.message_bodies:
+                self._remember_messages(thread_id, saved.message_bodies)
+                saved.message_bodies = {}
+        if released and thread_id in self._known_messages:
+            self._known_messages[thread_id] -= released
+        metrics.increment("checkpointer.sqlite_transactions_total")
+
+    def _write_messages(self, thread_id: str, bodies: MessageBodies) -> None:
+        """스레드에 새로 등장한 메시지 본문만 기록 (이전 체크포인트 대비 추가분)"""
+        known = self._known_messages.get(thread_id, set())
+        new_bodies = [(key, body) for key, body in bodies.items() if key not in known]
+        if not new_bodies:
+            return
+
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO messages VALUES (?, ?, ?)",
+            [(key, body[0], body[1]) for key, body in new_bodies],
+        )
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO thread_messages VALUES (?, ?)",
+            [(thread_id, key) for key, _ in new_bodies],
+        )
+
+    def _release_unreferenced_messages(self, thread_id: str) -> Set[str]:
+        """스레드의 남은 체크포인트가 참조하지 않는 메시지 키 연결과 본문 삭제 (트랜잭션 안에서 호출)"""
+        referenced: Set[str] = set()
+        for checkpoint_type, checkpoint in self._conn.execute(
+            "SELECT checkpoint_type, checkpoint FROM checkpoints WHERE thread_id = ?", (thread_id,)
+        ):
+            channel_values = self.serde.loads_typed((checkpoint_type, checkpoint))["channel_values"]
+            keys = self.codec.referenced_keys(channel_values.get(self.codec.channel))
+            if keys is None:
+                # 참조 목록이 없는 이전 형식 체크포인트가 남아 있으면 정리하지 않음
+                return set()
+            referenced |= keys
+
+        unreferenced = [
+            row[0]
+            for row in self._conn.execute(
+                "SELECT message_key FROM thread_messages WHERE thread_id = ?", (thread_id,)
+            )
+            if row[0] not in referenced
+        ]
+        for chunk in _chunks(unreferenced):
+            self._conn.execute(
+                f"DELETE FROM thread_messages WHERE thread_id = ? AND message_key IN ({_placeholders(chunk)})",
+                [thread_id, *chunk],
+            )
+        self._delete_orphan_messages(unreferenced)
+        return set(unreferenced)
+
+    def _delete_orphan_messages(self, message_keys: Sequence[str]) -> None:
+        """다른 스레드가 참조하지 않는 메시지 본문만 삭제"""
+        for chunk in _chunks(message_keys):
+            self._conn.execute(
+                f"DELETE FROM messages WHERE message_key IN ({_placeholders(chunk)}) "
+                "AND NOT EXISTS (SELECT 1 FROM thread_messages t WHERE t.message_key = messages.message_key)",
+                chunk,
+            )
+
+    def _remember_messages(self, thread_id: str, bodies: MessageBodies) -> None:
+        """DB에 기록된 메시지 키를 스레드별로 기억"""
+        known = self._known_messages.setdefault(thread_id, set())
+        known.update(bodies)
+        self._known_messages.move_to_end(thread_id)
+        while len(self._known_messages) > self.cache_size:
+            self._known_messages.popitem(last=False)
+
+    def _load_message_bodies(self, keys: Sequence[str], saved: _SavedCheckpoint) -> MessageBodies:
+        """메시지 본문 조회 - 아직 기록하지 않은 본문은 메모리에서, 나머지는 DB에서"""
+        bodies = {key: saved.message_bodies[key] for key in keys if key in saved.message_bodies}
+        missing = [key for key in keys if key not in bodies]
+        with self._lock:
+            for chunk in _chunks(missing):
+                for key, value_type, value in self._conn.execute(
+                    f"SELECT message_key, value_type, value FROM messages WHERE message_key IN ({_placeholders(chunk)})",
+                    chunk,
+                ):
+                    bodies[key] = (value_type, value)
+        return bodies
+
+    def _remember(self, key: Tuple[str, str], saved: _SavedCheckpoint) -> None:
+        """최신 체크포인트를 LRU 캐시에 저장"""
+        self._cache[key] = saved
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _latest_checkpoint_id(self, thread_id: str, checkpoint_ns: str) -> Optional[str]:
+        """DB에 저장된 최신 체크포인트 ID (다른 워커가 쓴 것도 포함)"""
+        row = self._conn.execute(
+            "SELECT checkpoint_id FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? "
+            "ORDER BY checkpoint_id DESC LIMIT 1",
+            (thread_id, checkpoint_ns),
+        ).fetchone()
+        return row[0] if row else None
+
+    def _load_checkpoint(
+        self, thread_id: str, checkpoint_ns: str, checkpoint_id: str
+    ) -> Optional[_SavedCheckpoint]:
+        """DB에서 체크포인트와 쓰기를 읽어옴"""
+        row = self._conn.execute(
+            "SELECT parent_checkpoint_id, checkpoint_type, checkpoint, metadata_type, metadata "
+            "FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+            (thread_id, checkpoint_ns, checkpoint_id),
+        ).fetchone()
+        if row is None:
+            return None
+
+        writes: SavedWrites = {}
+        for task_id, idx, channel, value_type, value, task_path in self._conn.execute(
+            "SELECT task_id, idx, channel, value_type, value, task_path FROM writes "
+            "WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+            (thread_id, checkpoint_ns, checkpoint_id),
+        ):
+            writes[(task_id, idx)] = (task_id, channel, (value_type, value), task_path)
+
+        return _SavedCheckpoint(
+            checkpoint_id=checkpoint_id,
+            parent_checkpoint_id=row[0],
+            checkpoint=(row[1], row[2]),
+            metadata=(row[3], row[4]),
+            writes=writes,
+        )
+
+    def _to_tuple(
+        self, thread_id: str, checkpoint_ns: str, saved: _SavedCheckpoint
+    ) -> CheckpointTuple:
+        """직렬화된 체크포인트를 CheckpointTuple로 변환"""
+        with self._pending_lock:
+            writes = dict(saved.writes)
+        ordered_writes = [
+            writes[key] for key in sorted(writes, key=lambda k: writes_sort_key(writes[k][3], *k))
+        ]
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": saved.checkpoint_id,
+                }
+            },
+            checkpoint=self._load_checkpoint_values(saved),
+            metadata=self.serde.loads_typed(saved.metadata),
+            pending_writes=[
+                (task_id, channel, self.serde.loads_typed(value))
+                for task_id, channel, value, _ in ordered_writes
+            ],
+            parent_config=(
+                {
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": saved.parent_checkpoint_id,
+                    }
+                }
+                if saved.parent_checkpoint_id
+                else None
+            ),
+        )
+
+    def _load_checkpoint_values(self, saved: _SavedCheckpoint) -> Checkpoint:
+        """체크포인트 역직렬화 - 키 목록으로 저장된 messages는 본문으로 복원"""
+        checkpoint = self.serde.loads_typed(saved.checkpoint)
+        if self.codec is None and not MessageDeltaCodec.is_encoded(
+            checkpoint["channel_values"].get("messages")
+        ):
+            return checkpoint
+
+        codec = self.codec or MessageDeltaCodec(self.serde)
+        checkpoint["channel_values"] = codec.decode(
+            checkpoint["channel_values"],
+            lambda keys: self._load_message_bodies(keys, saved),
+        )
+        return checkpoint
+
+    def _maybe_sweep_idle_threads(self) -> None:
+        """세션 타임아웃 정리를 최대 1분에 한 번 수행"""
+        now = self._clock()
+        if now - self._last_idle_sweep < 60:
+            return
+        self._last_idle_sweep = now
+        self.evict_idle_threads()
+
+
+def _chunks(keys: Sequence[str], size: int = 500) -> Iterator[List[str]]:
+    """SQLite 변수 개수 제한을 넘지 않도록 키 목록을 나눔"""
+    for start in range(0, len(keys), size):
+        yield list(keys[start:start + size])
+
+
+def _placeholders(keys: Sequence[str]) -> str:
+    """IN 절 자리표시자"""
+    return ", ".join("?" for _ in keys)
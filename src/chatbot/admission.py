@@ -0,0 +1,202 @@
+"""승인 제어 - 세션별 턴 직렬화와 전역 동시 Agent 실행 수 제한"""
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import AsyncIterator, Deque, Dict, Optional, TypeVar
+
+from ..utils.exceptions import ServerBusyException, SessionBusyException
+from ..utils.metrics import metrics
+from .settings import chatbot_settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class FifoLimiter:
+    """
+    도착 순서대로 슬롯을 배정하는 비동기 동시 실행 제한기.
+
+    대기자 future를 호출한 쪽의 실행 중인 루프에서 만들기 때문에 특정 이벤트 루프에 묶이지 않습니다
+    (Streamlit처럼 요청마다 asyncio.run을 쓰는 진입점에서도 같은 인스턴스 공유 가능).
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def pending(self) -> int:
+        """슬롯을 기다리는 수"""
+        return len(self._waiters)
+
+    async def acquire(self, timeout: Optional[float] = None) -> bool:
+        """슬롯 획득 - timeout 안에 못 얻으면 False (None이면 무제한 대기)"""
+        if self.active < self.capacity and not self._waiters:
+            self.active += 1
+            return True
+        if timeout is not None and timeout <= 0:
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done() and not waiter.cancelled():
+                # 포기하는 순간 슬롯을 넘겨받았으면 다음 대기자에게 넘김
+                self.release()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            return False
+        return True
+
+    def release(self) -> None:
+        """슬롯 반납 - 대기자가 있으면 바로 넘김"""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(True)
+                return
+        self.active -= 1
+
+
+class Admission:
+    """
+    승인된 턴 하나.
+
+    전역 실행 슬롯은 승인 시점에 이미 확보되어 있고, `async with` 진입 시 같은 세션의 앞선 턴이 끝날 때까지 기다립니다.
+    release()는 여러 번 호출해도 안전합니다.
+    """
+
+    def __init__(self, control: "AdmissionControl", session_id: str):
+        self._control = control
+        self.session_id = session_id
+        self._session_acquired = False
+        self._released = False
+
+    async def __aenter__(self) -> "Admission":
+        session = self._control._sessions[self.session_id]
+        started_at = time.perf_counter()
+        await session.acquire()
+        self._session_acquired = True
+        metrics.observe("chatbot.admission.session_wait_seconds", time.perf_counter() - started_at)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.release()
+
+    def release(self) -> None:
+        """세션 슬롯, 전역 실행 슬롯, 세션 예약 반납"""
+        if self._released:
+            return
+        self._released = True
+        self._control._finish(self.session_id, self._session_acquired)
+
+
+class AdmittedStream(AsyncIterator[T]):
+    """
+    승인된 턴의 스트림.
+
+    비동기 생성기는 한 번도 소비되지 않은 채 닫히면 finally가 실행되지 않으므로
+    (예: 첫 바이트 전에 클라이언트 연결이 끊김) aclose()에서 승인 슬롯을 직접 반납합니다.
+    """
+
+    def __init__(self, stream: AsyncIterator[T], admission: Admission):
+        self._stream = stream
+        self.admission = admission
+
+    def __aiter__(self) -> "AdmittedStream[T]":
+        return self
+
+    async def __anext__(self) -> T:
+        return await self._stream.__anext__()
+
+    async def aclose(self) -> None:
+        """원본 스트림을 닫고 승인 슬롯 반납 (여러 번 호출해도 안전)"""
+        try:
+            aclose = getattr(self._stream, "aclose", None)
+            if aclose is not None:
+                await aclose()
+        finally:
+            self.admission.release()
+
+
+class AdmissionControl:
+    """
+    Agent 실행 승인 제어.
+
+    - 같은 세션의 턴은 도착 순서대로 하나씩 실행 (체크포인트 섞임/중복 LLM 호출 방지)
+    - 세션에 대기 중인 턴이 max_queued_turns를 넘으면 SessionBusyException (429)
+    - 전역 동시 실행이 max_concurrent_runs에 도달한 상태로 wait_timeout이 지나면 ServerBusyException (503)
+
+    세션 뒤에 줄 선 턴도 전역 슬롯을 차지하며, 그 수는 max_queued_turns로 제한됩니다.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_runs: Optional[int] = None,
+        wait_timeout: Optional[float] = None,
+        max_queued_turns: Optional[int] = None,
+    ):
+        self.max_concurrent_runs = max_concurrent_runs or chatbot_settings.max_concurrent_runs
+        self.wait_timeout = chatbot_settings.admission_wait_timeout if wait_timeout is None else wait_timeout
+        self.max_queued_turns = (
+            chatbot_settings.session_max_queued_turns if max_queued_turns is None else max_queued_turns
+        )
+        self.runs = FifoLimiter(self.max_concurrent_runs)
+        self._sessions: Dict[str, FifoLimiter] = {}
+        self._reserved: Dict[str, int] = {}
+
+    @property
+    def active_runs(self) -> int:
+        """승인된(실행 중 + 세션 대기 중) 턴 수"""
+        return self.runs.active
+
+    async def admit(self, session_id: str) -> Admission:
+        """턴 승인 - 한도를 넘으면 바로 예외"""
+        reserved = self._reserved.get(session_id, 0)
+        if reserved > self.max_queued_turns:
+            metrics.increment("chatbot.admission.rejected_session_total")
+            logger.warning(f"세션 대기 턴 초과로 거절 (세션: {session_id}, 대기: {reserved})")
+            raise SessionBusyException("이전 요청을 처리하는 중입니다. 잠시 후 다시 시도해주세요")
+
+        # 전역 슬롯을 기다리는 동안 같은 세션 요청이 더 들어와도 한도를 지키도록 먼저 예약
+        self._reserved[session_id] = reserved + 1
+        self._sessions.setdefault(session_id, FifoLimiter(1))
+        try:
+            acquired = await self.runs.acquire(self.wait_timeout)
+        except BaseException:
+            self._unreserve(session_id)
+            raise
+        if not acquired:
+            self._unreserve(session_id)
+            metrics.increment("chatbot.admission.rejected_busy_total")
+            logger.warning(f"동시 실행 한도({self.max_concurrent_runs}) 도달로 거절 (세션: {session_id})")
+            raise ServerBusyException("요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요")
+
+        metrics.increment("chatbot.admission.admitted_total")
+        metrics.set_gauge("chatbot.admission.active_runs", self.runs.active)
+        metrics.max_gauge("chatbot.admission.peak_active_runs", self.runs.active)
+        return Admission(self, session_id)
+
+    def _finish(self, session_id: str, session_acquired: bool) -> None:
+        """턴 종료 처리"""
+        if session_acquired:
+            self._sessions[session_id].release()
+        self.runs.release()
+        self._unreserve(session_id)
+        metrics.set_gauge("chatbot.admission.active_runs", self.runs.active)
+
+    def _unreserve(self, session_id: str) -> None:
+        """세션 예약 해제 - 남은 턴이 없으면 세션 항목 삭제"""
+        remaining = self._reserved.get(session_id, 0) - 1
+        if remaining > 0:
+            self._reserved[session_id] = remaining
+            return
+        self._reserved.pop(session_id, None)
+        self._sessions.pop(session_id, None)
@@ -0,0 +1,84 @@
+"""챗봇 응답 캐시 - 새 세션의 동일한 질문에 대한 답변 재사용"""
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from ..utils.metrics import metrics
+from .settings import chatbot_settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedResponse:
+    """캐시된 답변"""
+    content: str
+    expires_at: float
+
+
+class ResponseCache:
+    """
+    정규화한 입력 + 모델 설정 + 프롬프트 버전을 키로 답변을 보관하는 LRU 캐시.
+
+    대화 맥락이 없는 첫 턴 요청에만 사용합니다.
+    """
+
+    def __init__(
+        self,
+        enabled: Optional[bool] = None,
+        ttl: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.enabled = chatbot_settings.response_cache_enabled if enabled is None else enabled
+        self.ttl = ttl or chatbot_settings.response_cache_ttl
+        self.max_entries = max_entries or chatbot_settings.response_cache_max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+
+    @staticmethod
+    def normalize(user_input: str) -> str:
+        """입력 정규화 - 앞뒤/연속 공백 정리, 대소문자 통일"""
+        return " ".join(user_input.split()).casefold()
+
+    def make_key(self, user_input: str, fingerprint: str) -> str:
+        """캐시 키 생성 (fingerprint: 모델 설정 + 프롬프트 버전)"""
+        raw = f"{fingerprint}\0{self.normalize(user_input)}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """만료되지 않은 답변 조회"""
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at <= self._clock():
+            if entry is not None:
+                del self._entries[key]
+            metrics.increment("chatbot.response_cache_misses_total")
+            return None
+
+        self._entries.move_to_end(key)
+        metrics.increment("chatbot.response_cache_hits_total")
+        return entry.content
+
+    def put(self, key: str, content: str, expires_at: Optional[float] = None) -> None:
+        """답변 저장 - expires_at이 없으면 기본 TTL 적용 (기본 TTL보다 길게 보관하지 않음)"""
+        default_expiry = self._clock() + self.ttl
+        expires_at = default_expiry if expires_at is None else min(expires_at, default_expiry)
+        if not content or expires_at <= self._clock():
+            return
+
+        self._entries[key] = CachedResponse(content=content, expires_at=expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        metrics.set_gauge("chatbot.response_cache_entries", len(self._entries))
+
+    def clear(self) -> None:
+        """캐시 비우기"""
+        self._entries.clear()
+        metrics.set_gauge("chatbot.response_cache_entries", 0)
+
+    def __len__(self) -> int:
+        return len(self._entries)
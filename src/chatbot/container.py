@@ -3,6 +3,8 @@
 import logging
 from dependency_injector import containers, providers
 from src.chatbot.service import ChatbotService
+from src.chatbot.cache import ResponseCache
+from src.chatbot.admission import AdmissionControl
 from src.chatbot.entities import ChatbotConfig
 from src.agent.container import AgentContainer
 
@@ -22,12 +24,17 @@ class ChatbotContainer(containers.DeclarativeContainer):
         tools_enabled=True
     )
     
+    # 응답 캐시
+    response_cache = providers.Singleton(ResponseCache)
+    
+    # 승인 제어 (세션별 직렬화 + 전역 동시 실행 제한)
+    admission = providers.Singleton(AdmissionControl)
+    
     # 서비스들
     service = providers.Singleton(
         ChatbotService,
         config=config,
         agent_service=agent.service,
+        response_cache=response_cache,
+        admission=admission,
     )
-
-# 전역 컨테이너 인스턴스
-chatbot_container = ChatbotContainer()
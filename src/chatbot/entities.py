@@ -1,9 +1,11 @@
 """챗봇 엔티티 정의"""
 import logging
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional, AsyncGenerator
+from typing import List, Dict, Any, Optional, AsyncGenerator, AsyncIterator
 from datetime import datetime
 
+from ..agent.events import AgentEvent
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,11 +41,20 @@ class ChatResponse:
 
 @dataclass
 class StreamingResponse:
-    """스트리밍 응답"""
+    """스트리밍 응답 - generator(답변 텍스트)와 events(토큰/도구 이벤트) 중 하나만 소비"""
     session_id: str
     generator: AsyncGenerator[str, None]
     metadata: Dict[str, Any] = None
+    events: Optional[AsyncIterator[AgentEvent]] = None
     
     def __post_init__(self):
         if self.metadata is None:
-            self.metadata = {}
\ No newline at end of file
+            self.metadata = {}
+    
+    async def aclose(self) -> None:
+        """스트림 정리 - 소비를 시작하지 않았거나 중간에 멈춘 스트림도 닫아 승인 슬롯 반납 (여러 번 호출해도 안전)"""
+        try:
+            await self.generator.aclose()
+        finally:
+            if self.events is not None:
+                await self.events.aclose()
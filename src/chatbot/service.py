@@ -1,8 +1,13 @@
 """챗봇 서비스 - 가독성 개선"""
 import logging
+from typing import AsyncGenerator, Optional
 
-from ..agent.service import AgentService
+from ..agent.events import EVENT_PARTIAL, EVENT_TOKEN, EVENT_TOOL_END, AgentEvent, token_texts
+from ..model.usage import RequestUsage
 from ..utils.exceptions import InvalidSessionException, InvalidInputException, ChatbotException
+from ..utils.metrics import metrics
+from .admission import Admission, AdmissionControl, AdmittedStream
+from .cache import ResponseCache
 from .entities import ChatbotConfig, ChatResponse, StreamingResponse
 
 logger = logging.getLogger(__name__)
@@ -11,11 +16,28 @@ logger = logging.getLogger(__name__)
 class ChatbotService:
     """간단한 챗봇 서비스"""
     
-    def __init__(self, config: ChatbotConfig = None, agent_service=None):
+    def __init__(
+        self,
+        config: ChatbotConfig = None,
+        agent_service=None,
+        response_cache: ResponseCache = None,
+        admission: AdmissionControl = None,
+    ):
         self.config = config or ChatbotConfig()
         
         # 의존성 주입받은 에이전트 서비스
         self.agent_service = agent_service
+        
+        # 새 세션의 동일한 질문에 대한 응답 캐시
+        self.response_cache = response_cache or ResponseCache()
+        
+        # 세션별 턴 직렬화 + 전역 동시 실행 제한
+        self.admission = admission or AdmissionControl()
+        
+        # 세션 타임아웃은 에이전트 체크포인터에서, 히스토리 길이는 에이전트 히스토리 관리자에서 적용
+        if self.agent_service is not None:
+            self.agent_service.set_session_timeout(self.config.session_timeout)
+            self.agent_service.set_max_history(self.config.max_history)
     
     def _validate_chat_request(self, session_id: str, user_input: str) -> None:
         """채팅 요청 검증 - 필요시 exception raise"""
@@ -51,11 +73,16 @@ class ChatbotService:
         # 입력 검증
         self._validate_chat_request(session_id, user_input)
         
-        # 비즈니스 로직 실행
-        response_content = await self.agent_service.generate_response(user_input, session_id)
+        # 승인 후 비즈니스 로직 실행 (스트리밍과 같은 캐시 경로 사용)
+        admission = await self.admission.admit(session_id)
+        usage = RequestUsage()
+        response_content = "".join(
+            [text async for text in token_texts(self._respond_in_turn(admission, session_id, user_input, usage))]
+        )
         return ChatResponse(
             content=response_content,
-            session_id=session_id
+            session_id=session_id,
+            metadata={"usage": usage.to_dict()}
         )
     
     async def stream_chat(self, session_id: str, user_input: str) -> StreamingResponse:
@@ -63,17 +90,80 @@ class ChatbotService:
         # 입력 검증
         self._validate_chat_request(session_id, user_input)
         
-        # 비즈니스 로직 실행
-        generator = self.agent_service.stream_response(user_input, session_id)
+        # 승인은 스트림 시작 전에 (거절 시 바로 429/503), 실행은 세션 차례가 왔을 때
+        admission = await self.admission.admit(session_id)
+        # 사용량은 스트림이 끝난 뒤 확정됨
+        usage = RequestUsage()
+        # 소비되지 않은 채 닫혀도 슬롯이 반납되도록 승인과 함께 묶음
+        events = AdmittedStream(self._respond_in_turn(admission, session_id, user_input, usage), admission)
         return StreamingResponse(
             session_id=session_id,
-            generator=generator
+            generator=token_texts(events),
+            metadata={"usage": usage},
+            events=events
         )
     
-    def clear_session(self, session_id: str) -> None:
-        """세션 초기화"""
-        # 간단한 로깅만
+    async def _respond_in_turn(
+        self, admission: Admission, session_id: str, user_input: str, usage: Optional[RequestUsage] = None
+    ) -> AsyncGenerator[AgentEvent, None]:
+        """같은 세션의 앞선 턴이 끝난 뒤 응답 생성 - 스트림이 끝나거나 닫히면 슬롯 반납"""
+        try:
+            async with admission:
+                async for event in self._respond(session_id, user_input, usage):
+                    yield event
+        finally:
+            # 세션 차례를 기다리다 닫힌 경우
+            admission.release()
+    
+    async def _respond(
+        self, session_id: str, user_input: str, usage: Optional[RequestUsage] = None
+    ) -> AsyncGenerator[AgentEvent, None]:
+        """응답 이벤트 생성 - 첫 턴 요청은 응답 캐시를 먼저 확인 (캐시 응답은 토큰 사용량 0)"""
+        cache_key = None
+        if self.response_cache.enabled and not await self.agent_service.has_history(session_id):
+            cache_key = self.response_cache.make_key(
+                user_input, self.agent_service.get_response_fingerprint()
+            )
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"응답 캐시 사용 (세션: {session_id})")
+                # 다음 턴에서 맥락이 이어지도록 히스토리에 기록
+                await self.agent_service.record_turn(session_id, user_input, cached)
+                yield AgentEvent.token(cached)
+                return
+        
+        chunks = []
+        cacheable = True
+        async for event in self.agent_service.stream_events(user_input, session_id, usage=usage):
+            if event.type == EVENT_TOKEN:
+                chunks.append(event.text)
+            elif event.type == EVENT_PARTIAL or (event.type == EVENT_TOOL_END and event.data.get("status") != "success"):
+                # 예산 소진 부분 답변, 도구 오류를 바탕으로 한 답변은 캐시하지 않음
+                cacheable = False
+            yield event
+        
+        if cache_key is not None and not cacheable:
+            metrics.increment("chatbot.response_cache_skipped_total")
+            logger.info(f"부분/오류 답변이라 응답 캐시 저장 생략 (세션: {session_id})")
+        elif cache_key is not None:
+            # 시세를 사용한 답변은 시세 캐시와 함께 만료
+            self.response_cache.put(
+                cache_key, "".join(chunks), self.agent_service.get_quote_expiry(session_id)
+            )
+    
+    def clear_session(self, session_id: str) -> int:
+        """세션 초기화 - 대화 히스토리를 삭제하고 해제된 바이트 수 반환"""
+        if not session_id:
+            raise InvalidSessionException("세션 ID가 필요합니다")
+        
         logger.info(f"세션 초기화: {session_id}")
+        return self.agent_service.clear_history(session_id)
+    
+    def purge_idle_sessions(self, idle_seconds: Optional[float] = None) -> dict:
+        """유휴 세션 일괄 삭제 (기본: 세션 타임아웃)"""
+        if idle_seconds is not None and idle_seconds <= 0:
+            raise InvalidInputException("유휴 시간은 0보다 커야 합니다")
+        return self.agent_service.purge_idle_sessions(idle_seconds)
     
     def get_config(self) -> ChatbotConfig:
         """설정 반환"""
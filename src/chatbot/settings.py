@@ -0,0 +1,39 @@
+"""Chatbot 설정 관리"""
+import logging
+from typing import Optional
+from pydantic_settings import BaseSettings
+
+from ..utils.settings import LazySettings
+
+logger = logging.getLogger(__name__)
+
+
+class ChatbotSettings(BaseSettings):
+    """챗봇 관련 설정 - Pydantic 기반"""
+    
+    # 첫 턴 응답 캐시 설정 (시세를 사용한 답변은 시세 캐시가 만료될 때 함께 만료)
+    response_cache_enabled: bool = True
+    response_cache_ttl: float = 600
+    response_cache_max_entries: int = 1024
+    
+    # 승인 제어 - 전역 동시 Agent 실행 수, 슬롯 대기 시간(초, 넘으면 503), 세션당 대기 턴 수(넘으면 429)
+    max_concurrent_runs: int = 32
+    admission_wait_timeout: float = 0.5
+    session_max_queued_turns: int = 2
+    
+    # SSE 토큰 묶음 - 첫 토큰 이후 토큰은 이 글자 수 또는 시간 창(ms)마다 한 프레임으로 전송
+    sse_coalesce_max_chars: int = 64
+    sse_coalesce_window_ms: float = 30
+    
+    # 관리자 API(/admin) 토큰 - 설정하지 않으면 관리자 라우터를 등록하지 않음 (X-Admin-Token 헤더로 전달)
+    admin_token: Optional[str] = None
+    
+    model_config = {
+        "env_file": ".env",
+        "env_file_encoding": "utf-8",
+        "extra": "ignore",
+    }
+
+
+# 전역 설정 인스턴스
+chatbot_settings: ChatbotSettings = LazySettings(ChatbotSettings)  # 처음 접근할 때 로드
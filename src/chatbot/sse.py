@@ -0,0 +1,166 @@
+"""SSE 이벤트 프로토콜 - JSON 페이로드 + 이벤트 타입/ID, 토큰 묶음 전송"""
+import asyncio
+import json
+import logging
+from typing import Any, AsyncIterator, Awaitable, Dict, List, Optional
+
+from ..agent.events import EVENT_DONE, EVENT_ERROR, EVENT_TOKEN, EVENT_USAGE, AgentEvent
+from ..model.usage import RequestUsage
+from ..utils.exceptions import ClientDisconnectedException
+from ..utils.metrics import metrics
+from .settings import chatbot_settings
+
+logger = logging.getLogger(__name__)
+
+
+def format_sse(event_id: int, event_type: str, data: Dict[str, Any]) -> str:
+    """SSE 프레임 - data는 한 줄 JSON이라 토큰에 줄바꿈이 있어도 프레임이 깨지지 않음"""
+    payload = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    return f"id: {event_id}\nevent: {event_type}\ndata: {payload}\n\n"
+
+
+class TokenCoalescer:
+    """
+    연속된 token 이벤트를 하나의 프레임으로 묶습니다.
+
+    - 첫 토큰은 바로 내보내 체감 첫 응답 시간(TTFT)을 유지
+    - 이후 토큰은 묶음이 max_chars 이상이 되거나 묶음의 첫 토큰 후 window초가 지나면 전송
+    - 토큰이 아닌 이벤트(도구 시작/종료 등)는 쌓인 토큰을 먼저 보낸 뒤 그대로 전달
+
+    원본 스트림은 별도 태스크에서 읽어 큐에 넣으므로 시간 창 대기가 원본 생성기를 취소하지 않습니다.
+    disconnected가 먼저 완료되면 원본 읽기 태스크를 취소하고 ClientDisconnectedException을 발생시킵니다.
+    """
+
+    _END = object()
+    _DISCONNECTED = object()
+
+    def __init__(self, max_chars: Optional[int] = None, window: Optional[float] = None):
+        self.max_chars = max_chars if max_chars is not None else chatbot_settings.sse_coalesce_max_chars
+        self.window = window if window is not None else chatbot_settings.sse_coalesce_window_ms / 1000
+
+    async def coalesce(
+        self, events: AsyncIterator[AgentEvent], disconnected: Optional[Awaitable] = None
+    ) -> AsyncIterator[AgentEvent]:
+        """token 이벤트를 묶은 이벤트 스트림"""
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        pump = asyncio.ensure_future(self._pump(events, queue))
+        watcher = asyncio.ensure_future(self._watch(disconnected, queue)) if disconnected is not None else None
+        buffer: List[str] = []
+        buffered_chars = 0
+        deadline: Optional[float] = None
+        first_token_sent = False
+        token_events = frames = 0
+
+        try:
+            while True:
+                if deadline is None:
+                    item = await queue.get()
+                else:
+                    try:
+                        item = await asyncio.wait_for(queue.get(), max(deadline - loop.time(), 0))
+                    except asyncio.TimeoutError:
+                        # 시간 창 만료 - 쌓인 토큰 전송
+                        frames += 1
+                        yield AgentEvent.token("".join(buffer))
+                        buffer, buffered_chars, deadline = [], 0, None
+                        continue
+
+                if item is self._DISCONNECTED:
+                    # 연결이 끊겨 쌓인 토큰도 보낼 곳이 없음
+                    raise ClientDisconnectedException("클라이언트 연결이 끊겼습니다")
+                if item is self._END or isinstance(item, BaseException) or item.type != EVENT_TOKEN:
+                    if buffer:
+                        frames += 1
+                        yield AgentEvent.token("".join(buffer))
+                        buffer, buffered_chars, deadline = [], 0, None
+                    if item is self._END:
+                        return
+                    if isinstance(item, BaseException):
+                        raise item
+                    yield item
+                    continue
+
+                token_events += 1
+                if not first_token_sent:
+                    first_token_sent = True
+                    frames += 1
+                    yield item
+                    continue
+
+                buffer.append(item.text)
+                buffered_chars += len(item.text)
+                if deadline is None:
+                    deadline = loop.time() + self.window
+                if buffered_chars >= self.max_chars:
+                    frames += 1
+                    yield AgentEvent.token("".join(buffer))
+                    buffer, buffered_chars, deadline = [], 0, None
+        finally:
+            # 스트림당 한 번만 기록
+            metrics.increment("chat.sse.token_events_total", token_events)
+            metrics.increment("chat.sse.token_frames_total", frames)
+            # 끝나지 않은 원본(Agent 실행)은 취소 - 정리(턴 되돌리기 등)가 끝날 때까지 대기
+            if watcher is not None:
+                watcher.cancel()
+            pump.cancel()
+            await asyncio.gather(pump, return_exceptions=True)
+
+    async def _watch(self, disconnected: Awaitable, queue: asyncio.Queue) -> None:
+        """연결 종료를 큐에 알림"""
+        await disconnected
+        queue.put_nowait(self._DISCONNECTED)
+
+    async def _pump(self, events: AsyncIterator[AgentEvent], queue: asyncio.Queue) -> None:
+        """원본 스트림을 읽어 큐에 적재 (오류도 큐로 전달)"""
+        try:
+            async for event in events:
+                queue.put_nowait(event)
+            queue.put_nowait(self._END)
+        except Exception as e:
+            queue.put_nowait(e)
+        finally:
+            aclose = getattr(events, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+
+async def sse_stream(
+    events: AsyncIterator[AgentEvent],
+    session_id: str,
+    usage: Optional[RequestUsage] = None,
+    coalescer: Optional[TokenCoalescer] = None,
+    disconnected: Optional[Awaitable] = None,
+) -> AsyncIterator[str]:
+    """이벤트 스트림을 SSE 프레임으로 변환 - 끝에 usage, done (오류 시 error, 연결이 끊기면 Agent 실행 취소 후 중단)"""
+    coalescer = coalescer or TokenCoalescer()
+    event_id = 0
+
+    def frame(event_type: str, data: Dict[str, Any]) -> str:
+        nonlocal event_id
+        event_id += 1
+        return format_sse(event_id, event_type, data)
+
+    stream = coalescer.coalesce(events, disconnected)
+    try:
+        async for event in stream:
+            yield frame(event.type, event.data)
+        if usage is not None:
+            yield frame(EVENT_USAGE, usage.to_dict())
+        yield frame(EVENT_DONE, {"session_id": session_id})
+    except ClientDisconnectedException:
+        metrics.increment("chat.sse.client_disconnects_total")
+        logger.info(f"클라이언트 연결 종료로 스트리밍 중단 (세션: {session_id}, 전송 이벤트: {event_id}개)")
+    except asyncio.CancelledError:
+        # 서버가 응답 태스크를 취소한 경우 (연결 종료 감지 등)
+        metrics.increment("chat.sse.client_disconnects_total")
+        raise
+    except Exception as e:
+        logger.error(f"스트리밍 중 오류 (세션: {session_id}): {e}")
+        yield frame(EVENT_ERROR, {"message": str(e)})
+    finally:
+        # 중간에 닫혀도 원본 읽기 태스크를 정리한 뒤 원본 스트림(승인 슬롯 포함)을 닫음
+        await stream.aclose()
+        aclose = getattr(events, "aclose", None)
+        if aclose is not None:
+            await aclose()
@@ -0,0 +1,49 @@
+"""명령줄 챗봇 - 컴포지션 루트의 챗봇 서비스 사용
+
+사용 예:
+    python -m src.cli "AAPL 주가 알려줘"
+    python -m src.cli            # 대화형 모드 (빈 줄 또는 exit로 종료)
+"""
+
+import argparse
+import asyncio
+import sys
+import uuid
+
+from src.container import get_container
+
+
+async def ask(session_id: str, user_input: str) -> None:
+    """질문 한 개를 스트리밍으로 출력"""
+    chatbot_service = get_container().chatbot.service()
+    response = await chatbot_service.stream_chat(session_id, user_input)
+    async for chunk in response.generator:
+        sys.stdout.write(chunk)
+        sys.stdout.flush()
+    sys.stdout.write("\n")
+
+
+async def interactive(session_id: str) -> None:
+    """대화형 모드"""
+    while True:
+        user_input = await asyncio.to_thread(input, "> ")
+        if not user_input.strip() or user_input.strip() == "exit":
+            return
+        await ask(session_id, user_input)
+
+
+def main() -> None:
+    """명령줄 진입점"""
+    parser = argparse.ArgumentParser(description="주가 계산 챗봇 CLI")
+    parser.add_argument("question", nargs="?", help="질문 (없으면 대화형 모드)")
+    parser.add_argument("--session", default=f"cli_{uuid.uuid4().hex[:8]}", help="세션 ID")
+    args = parser.parse_args()
+
+    if args.question:
+        asyncio.run(ask(args.session, args.question))
+    else:
+        asyncio.run(interactive(args.session))
+
+
+if __name__ == "__main__":
+    main()
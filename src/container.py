@@ -0,0 +1,54 @@
+"""컴포지션 루트 - 모든 진입점(webapp, Streamlit, CLI)이 공유하는 단일 컨테이너"""
+
+import logging
+import threading
+from typing import Optional
+
+from dependency_injector import containers, providers
+from src.agent.container import AgentContainer
+from src.chatbot.container import ChatbotContainer
+from src.model.container import ModelContainer
+from src.tools.container import ToolsContainer
+
+logger = logging.getLogger(__name__)
+
+
+class ApplicationContainer(containers.DeclarativeContainer):
+    """애플리케이션 컨테이너 - 도메인 컨테이너를 한 번씩만 구성하고 서로 연결"""
+
+    # 도메인 컨테이너들 (싱글톤은 처음 요청될 때 생성)
+    model: ModelContainer = providers.Container(ModelContainer)
+    tools: ToolsContainer = providers.Container(ToolsContainer)
+    agent: AgentContainer = providers.Container(
+        AgentContainer,
+        model=model,
+        tools=tools,
+    )
+    chatbot: ChatbotContainer = providers.Container(
+        ChatbotContainer,
+        agent=agent,
+    )
+
+
+_container: Optional[ApplicationContainer] = None
+_container_lock = threading.Lock()
+
+
+def get_container() -> ApplicationContainer:
+    """프로세스 전역 컨테이너 반환 (최초 호출 시 생성)"""
+    global _container
+    if _container is None:
+        with _container_lock:
+            if _container is None:
+                _container = ApplicationContainer()
+                logger.info("Application container initialized")
+    return _container
+
+
+def reset_container() -> None:
+    """전역 컨테이너 폐기 (테스트용) - 다음 호출 시 새로 생성"""
+    global _container
+    with _container_lock:
+        if _container is not None:
+            _container.unwire()
+        _container = None
@@ -4,6 +4,8 @@ from dataclasses import dataclass, field
 from typing import Optional, Dict, Any
 from datetime import datetime
 
+from ..model.domains import get_model_pricing
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,18 +30,24 @@ class LLMConfig:
 
 @dataclass
 class TokenUsage:
-    """토큰 사용량"""
+    """토큰 사용량 (LLM 호출 1회)"""
     prompt_tokens: int
     completion_tokens: int
     total_tokens: int
     model: str
     timestamp: datetime
+    # 100만 토큰당 비용(USD) - 없으면 모델 가격표에서 조회
+    input_cost_per_1m: Optional[float] = None
+    output_cost_per_1m: Optional[float] = None
     
     @property
     def cost_estimate(self) -> float:
-        """비용 추정 (USD)"""
-        if "gpt-4" in self.model.lower():
-            return (self.prompt_tokens * 0.03 + self.completion_tokens * 0.06) / 1000
-        elif "gpt-3.5" in self.model.lower():
-            return (self.prompt_tokens * 0.0015 + self.completion_tokens * 0.002) / 1000
-        return 0.0
\ No newline at end of file
+        """비용 추정 (USD) - 가격을 모르는 모델은 0"""
+        if self.input_cost_per_1m is None:
+            pricing = get_model_pricing(self.model)
+            if pricing is None:
+                return 0.0
+            input_cost, output_cost = pricing
+        else:
+            input_cost, output_cost = self.input_cost_per_1m, self.output_cost_per_1m or 0.0
+        return (self.prompt_tokens * input_cost + self.completion_tokens * output_cost) / 1_000_000
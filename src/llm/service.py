@@ -16,6 +16,7 @@ from .domains import (
 from .entities import LLMConfig
 from .settings import llm_settings
 from ..utils.exceptions import ModelNotFoundException
+from ..utils.http_client import get_shared_async_client
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +46,8 @@ class OpenAILLM(BaseLLM):
                 max_tokens=self.config.max_tokens,
                 streaming=self.config.streaming,
                 timeout=self.config.timeout,
+                max_retries=self.config.retry_count,
+                http_async_client=get_shared_async_client(),
                 **self.config.extra_params
             )
         return self._client
@@ -142,6 +145,7 @@ class LLMService:
                 model=model_name,
                 api_key=llm_settings.openai_api_key,
                 stream_usage=True,
+                http_async_client=get_shared_async_client(),
             )
         else:
             raise ModelNotFoundException(f"지원하지 않는 모델: {model_name}")
@@ -3,6 +3,8 @@ import logging
 from pydantic_settings import BaseSettings
 from typing import Optional
 
+from ..utils.settings import LazySettings
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,8 +24,9 @@ class LLMSettings(BaseSettings):
     model_config = {
         "env_file": ".env",
         "env_file_encoding": "utf-8",
+        "extra": "ignore",
     }
 
 
 # 전역 설정 인스턴스
-llm_settings = LLMSettings()
\ No newline at end of file
+llm_settings: LLMSettings = LazySettings(LLMSettings)  # 처음 접근할 때 로드
\ No newline at end of file
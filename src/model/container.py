@@ -3,24 +3,40 @@
 import logging
 from dependency_injector import containers, providers
 from src.model.service import ModelService
-from src.model.model_execution_service import ModelExecutionService
 from src.model.settings import ModelSettings
+from src.utils.settings import load_settings
 
 logger = logging.getLogger(__name__)
 
+
+def create_execution_service(**kwargs):
+    """ModelExecutionService 생성 - langchain_core는 모델이 처음 필요할 때 임포트"""
+    from src.model.model_execution_service import ModelExecutionService
+    return ModelExecutionService(**kwargs)
+
+
+def create_routing_policy(**kwargs):
+    """ModelRoutingPolicy 생성 - 메시지 타입(langchain_core)은 라우터가 처음 필요할 때 임포트"""
+    from src.model.routing import ModelRoutingPolicy
+    return ModelRoutingPolicy(**kwargs)
+
+
 class ModelContainer(containers.DeclarativeContainer):
     """Model 도메인 의존성 주입 컨테이너 - dependency_injector 사용"""
     
-    # 설정
-    settings = providers.Singleton(ModelSettings)
+    # 설정 (전역 model_settings와 같은 캐시된 인스턴스)
+    settings = providers.Callable(load_settings, ModelSettings)
     
     # 서비스들
     model_service = providers.Singleton(ModelService)
     
     execution_service = providers.Singleton(
-        ModelExecutionService,
+        create_execution_service,
+        model_service=model_service,
+    )
+    
+    # 턴별 모델 라우팅 (레지스트리에 빠른 모델이 있을 때만 동작)
+    router = providers.Singleton(
+        create_routing_policy,
         model_service=model_service,
     )
-
-# 전역 컨테이너 인스턴스
-model_container = ModelContainer()
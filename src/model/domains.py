@@ -3,13 +3,18 @@
 import logging
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Literal, Optional
+from typing import Dict, List, Literal, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
-# OpenAI만 사용하므로 단순화
+# OpenAI + 오프라인 테스트용 가짜 모델
 ModelType = Literal["llm"]
-ModelVendor = Literal["OpenAI"]
+ModelVendor = Literal["OpenAI", "Fake"]
+
+# 라우팅 등급 - large: 복잡한 멀티 도구 턴, fast: 단순 턴 (더 빠르고 저렴)
+ModelTier = Literal["large", "fast"]
+TIER_LARGE = "large"
+TIER_FAST = "fast"
 
 @dataclass
 class Model:
@@ -97,19 +102,53 @@ class ProviderModel:
     config: dict
     is_default: bool = False
 
-# OpenAI 모델 정의 (GPT-4o만 사용)
+# OpenAI 모델 정의 (기본 GPT-4o, LLM_FAST_MODEL로 단순 턴용 모델 추가)
+# 비용은 100만 토큰당 USD
 OPENAI_MODELS: Dict[str, ProviderModel] = {
     "gpt-4o": ProviderModel(
         name="gpt-4o",
         type="llm",
-        config={"model": "gpt-4o", "enable_tool_calling": True},
+        config={
+            "model": "gpt-4o",
+            "enable_tool_calling": True,
+            "tier": TIER_LARGE,
+            "input_cost_per_1m": 2.5,
+            "output_cost_per_1m": 10.0,
+        },
         is_default=True
     ),
+    "gpt-4o-mini": ProviderModel(
+        name="gpt-4o-mini",
+        type="llm",
+        config={
+            "model": "gpt-4o-mini",
+            "enable_tool_calling": True,
+            "tier": TIER_FAST,
+            "input_cost_per_1m": 0.15,
+            "output_cost_per_1m": 0.6,
+        },
+    ),
+}
+
+# 가짜 모델 정의 (스크립트 재생, API 키 불필요) - fast 모델은 지연/토큰 속도가 speedup배 빠름
+FAKE_MODELS: Dict[str, ProviderModel] = {
+    "fake-scripted": ProviderModel(
+        name="fake-scripted",
+        type="llm",
+        config={"model": "fake-scripted", "enable_tool_calling": True, "tier": TIER_LARGE},
+        is_default=True
+    ),
+    "fake-scripted-fast": ProviderModel(
+        name="fake-scripted-fast",
+        type="llm",
+        config={"model": "fake-scripted-fast", "enable_tool_calling": True, "tier": TIER_FAST, "speedup": 3.0},
+    ),
 }
 
 # 프로바이더별 모델 매핑
 PROVIDER_MODELS: Dict[ModelVendor, Dict[str, ProviderModel]] = {
     "OpenAI": OPENAI_MODELS,
+    "Fake": FAKE_MODELS,
 }
 
 def get_provider_models(provider: ModelVendor) -> Dict[str, ProviderModel]:
@@ -130,3 +169,19 @@ def get_models_by_type(provider: ModelVendor, model_type: ModelType) -> List[Pro
     """프로바이더의 특정 타입 모델들을 반환"""
     models = get_provider_models(provider)
     return [model for model in models.values() if model.type == model_type]
+
+def get_model_pricing(model_name: str) -> Optional[Tuple[float, float]]:
+    """모델의 (입력, 출력) 100만 토큰당 비용(USD) - 날짜가 붙은 이름(gpt-4o-2024-08-06)은 가장 긴 접두사로 매칭"""
+    name = (model_name or "").lower()
+    matched: Optional[dict] = None
+    matched_length = -1
+    for models in PROVIDER_MODELS.values():
+        for model in models.values():
+            if "input_cost_per_1m" not in model.config:
+                continue
+            model_id = model.config.get("model", model.name).lower()
+            if (name == model_id or name.startswith(model_id + "-")) and len(model_id) > matched_length:
+                matched, matched_length = model.config, len(model_id)
+    if matched is None:
+        return None
+    return matched["input_cost_per_1m"], matched.get("output_cost_per_1m", 0.0)
@@ -1,15 +1,27 @@
 """LangChain 도구 실행기"""
-from langchain.tools import tool
-from typing import Any
+from langchain_core.tools import tool
+from langchain_core.runnables import RunnableConfig
+from typing import TYPE_CHECKING, Any, Optional
 
-from ...tools.container import tools_container
+if TYPE_CHECKING:
+    from ...tools.service import ToolService
 
-# 의존성 주입받은 도구 서비스 인스턴스
-tool_service = tools_container.service()
+
+def get_tool_service() -> "ToolService":
+    """도구 서비스 - 컴포지션 루트의 싱글톤 (모듈 전역 도구 함수라 주입 대신 조회)"""
+    from ...container import get_container
+    return get_container().tools.service()
+
+
+def _get_thread_id(config: Optional[RunnableConfig]) -> Optional[str]:
+    """실행 설정에서 현재 대화 스레드 ID를 꺼냅니다."""
+    if not config:
+        return None
+    return config.get("configurable", {}).get("thread_id")
 
 
 @tool(parse_docstring=True)
-def get_stock_price(ticker: str) -> str:
+async def get_stock_price(ticker: str, config: RunnableConfig) -> str:
     """Retrieves the stock price for a specific ticker
 
     Args:
@@ -18,20 +30,23 @@ def get_stock_price(ticker: str) -> str:
     Returns:
         str: The requested stock price value (currency: dollar) if available, error message otherwise.
     """
-    return tool_service.get_stock_price(ticker)
+    return await get_tool_service().get_stock_price(ticker, _get_thread_id(config))
 
 
 @tool(parse_docstring=True)
-def calculator(expression: str) -> str:
+def calculator(expression: str, config: RunnableConfig) -> str:
     """Calculate expression using Python's numexpr library.
 
+    Prices fetched earlier in this conversation can be referenced directly as
+    TICKER.price, TICKER.change or TICKER.change_percent instead of re-typing numbers.
+
     Args:
-        expression (str): A single-line mathematical expression to evaluate. For example: "37593 * 67" or "37593**(1/5)".
+        expression (str): A single-line mathematical expression to evaluate. For example: "37593 * 67", "37593**(1/5)" or "AAPL.price * 5 + NVDA.price * 2".
 
     Returns:
         str: The result of the evaluated expression.
     """
-    return tool_service.calculate(expression)
+    return get_tool_service().calculate(expression, _get_thread_id(config))
 
 
 # 도구 목록
@@ -0,0 +1,301 @@
+"""스크립트 기반 가짜 채팅 모델 - API 키 없이 오프라인 부하 테스트용"""
+
+import asyncio
+import json
+import logging
+import math
+import random
+import re
+import time
+import uuid
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Sequence, TypeVar
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from pydantic import Field, PrivateAttr
+
+logger = logging.getLogger(__name__)
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "normal", "lognormal")
+
+DEFAULT_SCRIPT: List[Dict[str, Any]] = [
+    {
+        "steps": [
+            {"content": "테스트용 가짜 모델의 응답입니다. 실제 모델 없이 스트리밍과 응답 경로를 확인할 수 있습니다."},
+        ],
+    },
+]
+
+_TOKEN_PATTERN = re.compile(r"\S+\s*|\s+")
+
+T = TypeVar("T")
+
+
+class LatencyDistribution:
+    """지연 시간 분포 (밀리초 단위 설정, 초 단위 샘플)"""
+
+    def __init__(self, kind: str = "fixed", mean_ms: float = 0.0, jitter_ms: float = 0.0, seed: Optional[int] = None):
+        if kind not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"지원하지 않는 지연 분포: {kind} (가능: {', '.join(LATENCY_DISTRIBUTIONS)})")
+        self.kind = kind
+        self.mean_ms = max(mean_ms, 0.0)
+        self.jitter_ms = max(jitter_ms, 0.0)
+        self._random = random.Random(seed)
+
+    def sample(self) -> float:
+        """지연 시간 한 개 샘플 (초)"""
+        if self.mean_ms <= 0 and self.jitter_ms <= 0:
+            return 0.0
+
+        if self.kind == "uniform":
+            value = self._random.uniform(self.mean_ms - self.jitter_ms, self.mean_ms + self.jitter_ms)
+        elif self.kind == "normal":
+            value = self._random.gauss(self.mean_ms, self.jitter_ms)
+        elif self.kind == "lognormal":
+            # mean_ms를 중앙값으로, jitter_ms/mean_ms를 로그 표준편차로 사용 (긴 꼬리)
+            sigma = self.jitter_ms / self.mean_ms if self.mean_ms else 0.0
+            value = self._random.lognormvariate(math.log(self.mean_ms), sigma) if self.mean_ms else 0.0
+        else:
+            value = self.mean_ms
+
+        return max(value, 0.0) / 1000
+
+
+def load_script(path: Optional[str]) -> List[Dict[str, Any]]:
+    """스크립트 파일 로드 - 시나리오 목록 또는 단계 목록(단일 시나리오) 형식"""
+    if not path:
+        return DEFAULT_SCRIPT
+
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    if isinstance(data, dict):
+        data = data.get("scenarios", [])
+    if data and all("steps" not in item for item in data):
+        data = [{"steps": data}]
+    if not data:
+        raise ValueError(f"가짜 모델 스크립트에 시나리오가 없습니다: {path}")
+    return data
+
+
+class FakeScript:
+    """
+    시나리오 스크립트 재생기 (가짜 모델/가짜 OpenAI 서버 공용).
+
+    - 시나리오: 마지막 사용자 메시지에 match(정규식)가 맞는 첫 시나리오, 없으면 match가 없는 기본 시나리오
+    - 단계: 현재 턴에서 몇 번째 모델 호출인지(마지막 사용자 메시지 이후 AI 응답 수)로 선택, 마지막 단계 반복
+    - 단계 형식: {"content": "답변"} 또는 {"tool_calls": [{"name": "...", "args": {...}}]}
+    - 재생 속도: 첫 청크 전 지연은 latency 분포에서 샘플링하고, 이후 청크는 tokens_per_second 속도
+    """
+
+    def __init__(
+        self,
+        scenarios: Optional[List[Dict[str, Any]]] = None,
+        tokens_per_second: float = 0.0,
+        latency: Optional[LatencyDistribution] = None,
+    ):
+        self.scenarios = scenarios or DEFAULT_SCRIPT
+        self.tokens_per_second = tokens_per_second  # 0이면 지연 없이 스트리밍
+        self.latency = latency or LatencyDistribution()
+        self._patterns = [
+            re.compile(scenario["match"]) if scenario.get("match") else None
+            for scenario in self.scenarios
+        ]
+
+    @classmethod
+    def from_file(
+        cls, path: Optional[str], tokens_per_second: float = 0.0, latency: Optional[LatencyDistribution] = None
+    ) -> "FakeScript":
+        """스크립트 파일로 생성 (경로가 없으면 기본 답변)"""
+        return cls(load_script(path), tokens_per_second, latency)
+
+    def step(self, user_input: str, step_index: int) -> Dict[str, Any]:
+        """사용자 입력과 턴 내 호출 순서로 재생할 단계 선택"""
+        steps = self._select_scenario(user_input)["steps"]
+        return steps[min(step_index, len(steps) - 1)]
+
+    def _select_scenario(self, user_input: str) -> Dict[str, Any]:
+        """사용자 입력에 맞는 시나리오 선택"""
+        fallback = None
+        for scenario, pattern in zip(self.scenarios, self._patterns):
+            if pattern is None:
+                fallback = fallback or scenario
+            elif pattern.search(user_input):
+                return scenario
+        return fallback or self.scenarios[-1]
+
+    @staticmethod
+    def tool_calls(step: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """단계의 도구 호출 (ID 부여)"""
+        return [
+            {"name": call["name"], "args": call.get("args", {}), "id": f"call_{uuid.uuid4().hex[:24]}"}
+            for call in step.get("tool_calls", [])
+        ]
+
+    @staticmethod
+    def tokens(step: Dict[str, Any]) -> List[str]:
+        """답변 내용을 공백 단위 토큰으로 분할"""
+        return _TOKEN_PATTERN.findall(step.get("content", ""))
+
+    @property
+    def token_delay(self) -> float:
+        """토큰 사이 지연 (초)"""
+        return 1 / self.tokens_per_second if self.tokens_per_second > 0 else 0.0
+
+    def response_delay(self, step: Dict[str, Any]) -> float:
+        """스트리밍하지 않는 응답의 지연 (첫 토큰 지연 + 모든 토큰 시간, 초)"""
+        return self.latency.sample() + self.token_delay * len(self.tokens(step))
+
+    def pace(self, chunks: Iterable[T]) -> Iterator[T]:
+        """첫 청크 전에는 첫 토큰 지연, 이후 청크 사이에는 토큰 간격만큼 기다리며 전달"""
+        time.sleep(self.latency.sample())
+        for i, chunk in enumerate(chunks):
+            if i:
+                time.sleep(self.token_delay)
+            yield chunk
+
+    async def apace(self, chunks: Iterable[T]) -> AsyncIterator[T]:
+        """pace의 비동기 버전"""
+        await asyncio.sleep(self.latency.sample())
+        for i, chunk in enumerate(chunks):
+            if i:
+                await asyncio.sleep(self.token_delay)
+            yield chunk
+
+
+class ScriptedChatModel(BaseChatModel):
+    """
+    스크립트(FakeScript)를 재생하는 가짜 채팅 모델.
+
+    - 첫 토큰 전 지연은 latency 분포에서 샘플링하고, 이후 토큰은 tokens_per_second 속도로 스트리밍
+      (재생 속도는 FakeScript가 처리하므로 가짜 OpenAI 서버와 같음)
+    """
+
+    scenarios: List[Dict[str, Any]] = Field(default_factory=lambda: DEFAULT_SCRIPT)
+    tokens_per_second: float = 0.0  # 0이면 지연 없이 스트리밍
+    latency: LatencyDistribution = Field(default_factory=LatencyDistribution)
+    model_name: str = "fake-scripted"
+
+    _script: FakeScript = PrivateAttr()
+
+    def model_post_init(self, __context: Any) -> None:
+        """시나리오 재생기 생성"""
+        self._script = FakeScript(self.scenarios, self.tokens_per_second, self.latency)
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-scripted"
+
+    @property
+    def _identifying_params(self) -> Dict[str, Any]:
+        return {"model_name": self.model_name, "tokens_per_second": self.tokens_per_second}
+
+    def bind_tools(self, tools: Sequence[Any], **kwargs: Any):
+        """도구 바인딩 - 스크립트가 도구 호출을 결정하므로 스키마만 전달"""
+        return self.bind(tools=[convert_to_openai_tool(tool) for tool in tools], **kwargs)
+
+    # 스크립트 선택
+    def _select_step(self, messages: List[BaseMessage]) -> Dict[str, Any]:
+        """대화 상태로 재생할 단계 선택"""
+        user_input = ""
+        step_index = 0
+        for message in reversed(messages):
+            if isinstance(message, HumanMessage):
+                user_input = message.content if isinstance(message.content, str) else str(message.content)
+                break
+            if isinstance(message, AIMessage):
+                step_index += 1
+
+        return self._script.step(user_input, step_index)
+
+    @staticmethod
+    def _usage(messages: List[BaseMessage], output_tokens: int) -> Dict[str, int]:
+        """대략적인 토큰 사용량 (문자 4개 = 1토큰)"""
+        input_tokens = sum(len(str(message.content)) for message in messages) // 4
+        return {
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+        }
+
+    def _build_result(self, messages: List[BaseMessage], step: Dict[str, Any]) -> ChatResult:
+        """단계 전체를 한 번에 담은 결과"""
+        tool_calls = self._script.tool_calls(step)
+        message = AIMessage(
+            content=step.get("content", ""),
+            tool_calls=tool_calls,
+            usage_metadata=self._usage(messages, len(self._script.tokens(step)) + len(tool_calls)),
+            response_metadata={"model_name": self.model_name},
+        )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _iter_chunks(self, messages: List[BaseMessage], step: Dict[str, Any]) -> Iterator[ChatGenerationChunk]:
+        """단계를 스트리밍 청크로 분할 (마지막 청크에 사용량/모델 이름 포함)"""
+        tool_calls = self._script.tool_calls(step)
+        tokens = self._script.tokens(step)
+        usage = self._usage(messages, len(tokens) + len(tool_calls))
+
+        if tool_calls:
+            tool_call_chunks = [
+                {"name": call["name"], "args": json.dumps(call["args"], ensure_ascii=False), "id": call["id"], "index": i}
+                for i, call in enumerate(tool_calls)
+            ]
+            yield ChatGenerationChunk(message=AIMessageChunk(
+                content="", tool_call_chunks=tool_call_chunks, usage_metadata=usage,
+                response_metadata={"model_name": self.model_name},
+            ))
+            return
+
+        for i, token in enumerate(tokens):
+            is_last = i == len(tokens) - 1
+            yield ChatGenerationChunk(message=AIMessageChunk(
+                content=token, usage_metadata=usage if is_last else None,
+                response_metadata={"model_name": self.model_name} if is_last else {},
+            ))
+
+    # 동기 실행
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        step = self._select_step(messages)
+        time.sleep(self._script.response_delay(step))
+        return self._build_result(messages, step)
+
+    def _stream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        step = self._select_step(messages)
+        yield from self._script.pace(self._iter_chunks(messages, step))
+
+    # 비동기 실행
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        step = self._select_step(messages)
+        await asyncio.sleep(self._script.response_delay(step))
+        return self._build_result(messages, step)
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        step = self._select_step(messages)
+        async for chunk in self._script.apace(self._iter_chunks(messages, step)):
+            yield chunk
@@ -0,0 +1,203 @@
+"""OpenAI 호환 로컬 Chat Completions 서버 - 실제 HTTP/SSE 경로 벤치마크용
+
+사용 예:
+    python -m src.model.fake_openai_server --port 8100 --script scripts/fake.json
+    OPENAI_BASE_URL=http://127.0.0.1:8100/v1 OPENAI_API_KEY=sk-local ...
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+import uuid
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from .fake_chat_model import FakeScript, LatencyDistribution
+from .settings import model_settings
+
+logger = logging.getLogger(__name__)
+
+
+def _turn_position(messages: List[Dict[str, Any]]) -> Tuple[str, int]:
+    """마지막 사용자 메시지 내용과 그 이후 assistant 응답 수"""
+    step_index = 0
+    for message in reversed(messages):
+        if message.get("role") == "user":
+            content = message.get("content") or ""
+            if isinstance(content, list):
+                content = "".join(part.get("text", "") for part in content if isinstance(part, dict))
+            return content, step_index
+        if message.get("role") == "assistant":
+            step_index += 1
+    return "", step_index
+
+
+def _usage(messages: List[Dict[str, Any]], completion_tokens: int) -> Dict[str, int]:
+    """대략적인 토큰 사용량 (문자 4개 = 1토큰)"""
+    prompt_tokens = sum(len(json.dumps(message.get("content") or "", ensure_ascii=False)) for message in messages) // 4
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+    }
+
+
+def _sse(payload: Any) -> str:
+    """SSE data 라인"""
+    data = payload if isinstance(payload, str) else json.dumps(payload, ensure_ascii=False)
+    return f"data: {data}\n\n"
+
+
+class FakeOpenAIServer:
+    """
+    스크립트 응답을 OpenAI Chat Completions 형식으로 돌려주는 서버.
+
+    - POST /v1/chat/completions: stream=false(JSON) / stream=true(SSE, [DONE]으로 종료) 모두 지원
+    - 도구 호출 단계는 tool_calls(한 청크) + finish_reason="tool_calls"로 응답
+    - 재생 속도(첫 토큰 지연, 토큰 속도)는 스크립트(FakeScript) 설정을 따름 - ScriptedChatModel과 같은 로직
+    """
+
+    def __init__(self, script: Optional[FakeScript] = None):
+        self.script = script or FakeScript()
+        self.request_count = 0
+
+    def create_app(self) -> FastAPI:
+        """FastAPI 앱 생성"""
+        app = FastAPI(title="Fake OpenAI Chat Completions")
+
+        @app.get("/v1/models")
+        async def list_models():
+            return {"object": "list", "data": [{"id": "fake-scripted", "object": "model", "owned_by": "local"}]}
+
+        @app.post("/v1/chat/completions")
+        async def chat_completions(body: Dict[str, Any]):
+            return await self.complete(body)
+
+        return app
+
+    async def complete(self, body: Dict[str, Any]):
+        """Chat Completions 요청 처리"""
+        self.request_count += 1
+        messages = body.get("messages", [])
+        user_input, step_index = _turn_position(messages)
+        step = self.script.step(user_input, step_index)
+        model = body.get("model", "fake-scripted")
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+
+        if body.get("stream"):
+            include_usage = bool((body.get("stream_options") or {}).get("include_usage"))
+            return StreamingResponse(
+                self._stream_chunks(completion_id, model, messages, step, include_usage),
+                media_type="text/event-stream",
+            )
+
+        tool_calls = self.script.tool_calls(step)
+        tokens = self.script.tokens(step)
+        await asyncio.sleep(self.script.response_delay(step))
+
+        message: Dict[str, Any] = {"role": "assistant", "content": step.get("content") or None}
+        if tool_calls:
+            message["tool_calls"] = self._format_tool_calls(tool_calls)
+        return JSONResponse({
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "message": message,
+                "finish_reason": "tool_calls" if tool_calls else "stop",
+            }],
+            "usage": _usage(messages, len(tokens) + len(tool_calls)),
+        })
+
+    async def _stream_chunks(
+        self,
+        completion_id: str,
+        model: str,
+        messages: List[Dict[str, Any]],
+        step: Dict[str, Any],
+        include_usage: bool,
+    ) -> AsyncIterator[str]:
+        """chat.completion.chunk SSE 스트림"""
+        created = int(time.time())
+
+        def chunk(delta: Dict[str, Any], finish_reason: Optional[str] = None) -> Dict[str, Any]:
+            return {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+            }
+
+        tool_calls = self.script.tool_calls(step)
+        tokens = self.script.tokens(step)
+
+        # 가짜 모델과 같은 청크 구성: 도구 호출은 한 청크, 답변은 토큰마다 한 청크 (첫 청크에 role 포함)
+        if tool_calls:
+            deltas = [{"tool_calls": [
+                {"index": index, **tool_call} for index, tool_call in enumerate(self._format_tool_calls(tool_calls))
+            ]}]
+        else:
+            deltas = [{"content": token} for token in tokens] or [{"content": ""}]
+        deltas[0] = {"role": "assistant", **deltas[0]}
+
+        async for delta in self.script.apace(deltas):
+            yield _sse(chunk(delta))
+
+        yield _sse(chunk({}, "tool_calls" if tool_calls else "stop"))
+        if include_usage:
+            yield _sse({
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [],
+                "usage": _usage(messages, len(tokens) + len(tool_calls)),
+            })
+        yield _sse("[DONE]")
+
+    @staticmethod
+    def _format_tool_calls(tool_calls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """OpenAI tool_calls 형식으로 변환"""
+        return [
+            {
+                "id": tool_call["id"],
+                "type": "function",
+                "function": {"name": tool_call["name"], "arguments": json.dumps(tool_call["args"], ensure_ascii=False)},
+            }
+            for tool_call in tool_calls
+        ]
+
+
+def main() -> None:
+    """로컬 서버 실행"""
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="OpenAI 호환 가짜 Chat Completions 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--script", default=model_settings.fake_script_path, help="시나리오 JSON 파일")
+    parser.add_argument("--tokens-per-second", type=float, default=model_settings.fake_tokens_per_second)
+    parser.add_argument("--latency-distribution", default=model_settings.fake_latency_distribution)
+    parser.add_argument("--latency-ms", type=float, default=model_settings.fake_latency_ms)
+    parser.add_argument("--jitter-ms", type=float, default=model_settings.fake_latency_jitter_ms)
+    parser.add_argument("--seed", type=int, default=model_settings.fake_seed)
+    args = parser.parse_args()
+
+    server = FakeOpenAIServer(FakeScript.from_file(
+        args.script,
+        tokens_per_second=args.tokens_per_second,
+        latency=LatencyDistribution(args.latency_distribution, args.latency_ms, args.jitter_ms, args.seed),
+    ))
+    logger.info(f"가짜 OpenAI 서버 시작: http://{args.host}:{args.port}/v1")
+    uvicorn.run(server.create_app(), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,36 +1,132 @@
 """Model execution service for LLM model execution."""
 
+import hashlib
+import json
 import logging
-from typing import Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from langchain_core.language_models.chat_models import BaseChatModel
-from langchain_openai import ChatOpenAI
+from langchain_core.runnables import Runnable
 from src.model.domains import Model, ModelProvider
+from src.model.fake_chat_model import LatencyDistribution, ScriptedChatModel, load_script
+from src.model.resilience import ResilientChatModel, RetryPolicy
 from src.model.service import ModelService
 from src.model.settings import model_settings
+from src.utils.http_client import get_shared_async_client
 
 logger = logging.getLogger(__name__)
 
+# langchain_openai(openai SDK 포함)는 무거워서 첫 OpenAI 모델 생성 시 임포트
+ChatOpenAI = None
+
+
+def _chat_openai_class():
+    """ChatOpenAI 클래스 (최초 호출 시 임포트)"""
+    global ChatOpenAI
+    if ChatOpenAI is None:
+        from langchain_openai import ChatOpenAI as chat_openai
+        ChatOpenAI = chat_openai
+    return ChatOpenAI
+
 class ModelExecutionService:
-    """모델 실행 서비스 - OpenAI GPT-4o만 사용"""
+    """모델 실행 서비스 - 레지스트리의 OpenAI 모델 (오프라인 테스트 시 가짜 모델)"""
     
     def __init__(self, model_service: ModelService):
         """모델 실행 서비스 초기화"""
         self.settings = model_settings
         self.model_service = model_service
+        
+        # 생성된 모델 풀 (설정이 바뀌면 초기화)
+        self._model_pool: Dict[Tuple, BaseChatModel] = {}
+        self._tool_bound_pool: Dict[Tuple, Runnable] = {}
+        self._pool_fingerprint: Optional[str] = None
         logger.info("ModelExecution 서비스 초기화 완료")
     
     async def load_llm_model(self, model_id: int) -> BaseChatModel:
-        """LLM 모델을 로딩하여 반환"""
+        """LLM 모델을 로딩하여 반환 (풀에 있으면 재사용)"""
+        _, chat_model = await self._load_pooled_llm_model(model_id)
+        return chat_model
+    
+    async def load_tool_bound_model(self, model_id: int, tools: Sequence[Any]) -> Runnable:
+        """도구가 바인딩된 모델을 반환 (모델 + 도구 조합별로 재사용)"""
+        model_key, chat_model = await self._load_pooled_llm_model(model_id)
+        
+        pool_key = (model_key, self._toolset_hash(tools))
+        if pool_key in self._tool_bound_pool:
+            return self._tool_bound_pool[pool_key]
+        
+        try:
+            bound_model = chat_model.bind_tools(tools)
+        except Exception as e:
+            logger.error(f"Error binding tools: {e}")
+            bound_model = chat_model
+        
+        # 재시도/헤징 적용 (Agent의 LLM 호출은 모두 이 경로)
+        policy = RetryPolicy.from_settings(self.settings)
+        if policy.enabled:
+            bound_model = ResilientChatModel(inner=bound_model, policy=policy)
+        
+        self._tool_bound_pool[pool_key] = bound_model
+        return bound_model
+    
+    async def _load_pooled_llm_model(self, model_id: int) -> Tuple[Tuple, BaseChatModel]:
+        """풀 키와 함께 LLM 모델을 반환 - 풀에 없으면 생성"""
+        self._sync_pool_with_settings()
         model = await self._get_and_validate_model(model_id, "llm")
         
+        pool_key = self._model_pool_key(model_id, model)
+        if pool_key in self._model_pool:
+            return pool_key, self._model_pool[pool_key]
+        
         # 프로바이더 정보 조회
         provider = await self._get_provider(model.model_provider_id)
         
-        # OpenAI 모델 로딩
+        # 벤더별 모델 로딩
         if provider.model_vendor == "OpenAI":
-            return self._create_openai_model(model)
+            chat_model = self._create_openai_model(model)
+        elif provider.model_vendor == "Fake":
+            chat_model = self._create_fake_model(model)
         else:
             raise ValueError(f"지원하지 않는 벤더: {provider.model_vendor}")
+        
+        self._model_pool[pool_key] = chat_model
+        logger.info(f"모델 풀에 추가: model_id={model_id}")
+        return pool_key, chat_model
+    
+    def clear_model_pool(self) -> None:
+        """모델 풀 초기화"""
+        self._model_pool.clear()
+        self._tool_bound_pool.clear()
+    
+    def _settings_fingerprint(self) -> str:
+        """모델 생성에 영향을 주는 설정의 지문"""
+        dumped = json.dumps(self.settings.model_dump(), sort_keys=True, default=str)
+        return hashlib.sha256(dumped.encode("utf-8")).hexdigest()
+    
+    def _sync_pool_with_settings(self) -> None:
+        """설정이 바뀌었으면 모델 풀을 비웁니다."""
+        fingerprint = self._settings_fingerprint()
+        if fingerprint != self._pool_fingerprint:
+            if self._pool_fingerprint is not None:
+                logger.info("모델 설정 변경 감지 - 모델 풀 초기화")
+            self.clear_model_pool()
+            self._pool_fingerprint = fingerprint
+    
+    def _model_pool_key(self, model_id: int, model: Model) -> Tuple:
+        """모델 풀 키 (모델 ID + 모델 설정)"""
+        return (model_id, json.dumps(model.model_config, sort_keys=True, default=str))
+    
+    def _toolset_hash(self, tools: Sequence[Any]) -> str:
+        """도구 목록 해시 (이름, 설명, 인자 스키마 기준)"""
+        toolset = [
+            (
+                getattr(tool, "name", str(tool)), 
+                getattr(tool, "description", ""), 
+                getattr(tool, "args", {})
+            )
+            for tool in tools
+        ]
+        dumped = json.dumps(toolset, sort_keys=True, default=str)
+        return hashlib.sha256(dumped.encode("utf-8")).hexdigest()
     
     async def _get_and_validate_model(self, model_id: int, expected_type: str) -> Model:
         """모델을 조회하고 타입을 검증"""
@@ -52,12 +148,38 @@ class ModelExecutionService:
     
     def _create_openai_model(self, model: Model) -> BaseChatModel:
         """OpenAI 모델 생성"""
-        return ChatOpenAI(
+        # 로컬 OpenAI 호환 서버(base_url)는 키를 검사하지 않으므로 자리표시 키 허용
+        api_key = self.settings.openai_api_key or ("sk-local" if self.settings.openai_base_url else "")
+        if not api_key:
+            raise ValueError("OpenAI API 키가 설정되지 않았습니다 (OPENAI_API_KEY)")
+        
+        return _chat_openai_class()(
             model=model.model_config.get("model", "gpt-4o"),
-            api_key=self.settings.openai_api_key,
+            api_key=api_key,
+            base_url=self.settings.openai_base_url,
             temperature=self.settings.llm_temperature,
             max_tokens=self.settings.llm_max_tokens,
             streaming=self.settings.llm_streaming,
+            # 스트리밍 응답에도 토큰 사용량 포함 (사용량/비용 집계)
+            stream_usage=True,
+            # 재시도는 ResilientChatModel이 담당 (SDK 재시도와 겹치면 시도 횟수가 곱해짐)
+            max_retries=0 if RetryPolicy.from_settings(self.settings).enabled else 2,
+            http_async_client=get_shared_async_client(),
+        )
+    
+    def _create_fake_model(self, model: Model) -> BaseChatModel:
+        """스크립트 기반 가짜 모델 생성 (API 키/네트워크 불필요) - fast 모델은 speedup배 빠름"""
+        speedup = model.model_config.get("speedup", 1.0)
+        return ScriptedChatModel(
+            model_name=model.model_config.get("model", "fake-scripted"),
+            scenarios=load_script(self.settings.fake_script_path),
+            tokens_per_second=self.settings.fake_tokens_per_second * speedup,
+            latency=LatencyDistribution(
+                self.settings.fake_latency_distribution,
+                self.settings.fake_latency_ms / speedup,
+                self.settings.fake_latency_jitter_ms / speedup,
+                self.settings.fake_seed,
+            ),
         )
     
     # 모델 정보 조회 메서드들
@@ -0,0 +1,206 @@
+"""모델 레지스트리 - 설정에서 읽은 모델/프로바이더 레코드의 인메모리 인덱스"""
+
+import json
+import logging
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.model.domains import (
+    TIER_LARGE, Model, ModelProvider, ModelVendor, get_default_models, get_model_pricing, get_provider_model,
+)
+from src.model.entities import ModelEntity, ModelProviderEntity
+
+logger = logging.getLogger(__name__)
+
+# 프로바이더 ID → (이름, 벤더, 키 ID)
+OPENAI_PROVIDER_ID = 1
+FAKE_PROVIDER_ID = 2
+PROVIDERS: Dict[int, Tuple[str, ModelVendor, Optional[int]]] = {
+    OPENAI_PROVIDER_ID: ("OpenAI", "OpenAI", 1),
+    FAKE_PROVIDER_ID: ("Fake", "Fake", None),
+}
+
+# 기본 레지스트리의 모델 ID (1: 기본 모델, 2: 단순 턴용 빠른 모델)
+DEFAULT_MODEL_ID = 1
+FAST_MODEL_ID = 2
+
+
+class ModelRegistry:
+    """
+    ModelEntity / ModelProviderEntity 레코드를 ID, 타입, 라우팅 등급(model_config["tier"])별로 색인합니다.
+
+    모델별 관측 지연시간(지수이동평균)도 함께 보관해 라우팅에 사용합니다.
+    """
+
+    def __init__(self, providers: Iterable[ModelProviderEntity], models: Iterable[ModelEntity]):
+        self._providers: Dict[int, ModelProviderEntity] = {
+            provider.model_provider_id: provider for provider in providers if not provider.is_deleted
+        }
+        self._models: Dict[int, ModelEntity] = {}
+        self._by_type: Dict[str, List[int]] = defaultdict(list)
+        self._by_tier: Dict[str, List[int]] = defaultdict(list)
+        self._latency: Dict[Tuple[int, Optional[str]], float] = {}  # (모델 ID, 턴 종류) → 지수이동평균
+
+        for model in sorted(models, key=lambda entity: entity.model_id):
+            if model.is_deleted:
+                continue
+            if model.model_provider_id not in self._providers:
+                logger.warning(f"프로바이더가 없는 모델 제외: {model.model_name} (provider_id={model.model_provider_id})")
+                continue
+            self._models[model.model_id] = model
+            self._by_type[model.model_type].append(model.model_id)
+            self._by_tier[self.tier_of(model)].append(model.model_id)
+
+    @staticmethod
+    def tier_of(model) -> str:
+        """모델의 라우팅 등급 (지정되지 않으면 large)"""
+        return model.model_config.get("tier", TIER_LARGE)
+
+    def get_model(self, model_id: int) -> Optional[Model]:
+        """ID로 모델 조회"""
+        entity = self._models.get(model_id)
+        return entity.to_domain() if entity else None
+
+    def get_provider(self, provider_id: int) -> Optional[ModelProvider]:
+        """ID로 프로바이더 조회"""
+        entity = self._providers.get(provider_id)
+        return entity.to_domain() if entity else None
+
+    def models(self, model_type: Optional[str] = None) -> List[Model]:
+        """모델 목록 (ID 순)"""
+        model_ids = self._by_type.get(model_type, []) if model_type else list(self._models)
+        return [self._models[model_id].to_domain() for model_id in model_ids]
+
+    def providers(self) -> List[ModelProvider]:
+        """모델이 하나 이상 등록된 프로바이더 목록"""
+        provider_ids = sorted({model.model_provider_id for model in self._models.values()})
+        return [self._providers[provider_id].to_domain() for provider_id in provider_ids]
+
+    def default_model_id(self, model_type: str = "llm") -> Optional[int]:
+        """기본 모델 ID - large 등급 중 ID가 가장 작은 모델 (없으면 첫 모델)"""
+        model_ids = self._by_type.get(model_type, [])
+        large = [model_id for model_id in model_ids if model_id in self._by_tier.get(TIER_LARGE, [])]
+        return (large or model_ids or [None])[0]
+
+    def candidates(self, tier: str, model_type: str = "llm") -> List[Model]:
+        """등급의 모델 목록 - 비용이 낮은 순, 같으면 관측 지연시간이 짧은 순"""
+        model_ids = [
+            model_id for model_id in self._by_tier.get(tier, [])
+            if self._models[model_id].model_type == model_type
+        ]
+        model_ids.sort(key=lambda model_id: (self.cost_per_1m(model_id), self._latency.get((model_id, None), 0.0)))
+        return [self._models[model_id].to_domain() for model_id in model_ids]
+
+    def cost_per_1m(self, model_id: int) -> float:
+        """입력+출력 100만 토큰당 비용(USD) 합 - 정보가 없으면 0"""
+        config = self._models[model_id].model_config
+        return config.get("input_cost_per_1m", 0.0) + config.get("output_cost_per_1m", 0.0)
+
+    def pricing(self, model_id: int) -> Optional[Tuple[float, float]]:
+        """모델의 (입력, 출력) 100만 토큰당 비용(USD) - 설정에 없으면 기본 가격표"""
+        config = self._models[model_id].model_config
+        if "input_cost_per_1m" in config:
+            return config["input_cost_per_1m"], config.get("output_cost_per_1m", 0.0)
+        return get_model_pricing(config.get("model", self._models[model_id].model_name))
+
+    def record_latency(self, model_id: int, seconds: float, alpha: float, turn_type: Optional[str] = None) -> None:
+        """모델 호출 지연시간을 지수이동평균으로 반영 (turn_type을 주면 전체와 턴 종류별로 각각)"""
+        for key in {(model_id, None), (model_id, turn_type)}:
+            previous = self._latency.get(key)
+            self._latency[key] = seconds if previous is None else alpha * seconds + (1 - alpha) * previous
+
+    def latency(self, model_id: int, turn_type: Optional[str] = None) -> Optional[float]:
+        """관측 지연시간 지수이동평균 - turn_type을 주면 그 종류의 턴만 (관측 전이면 None)"""
+        return self._latency.get((model_id, turn_type))
+
+    @classmethod
+    def from_records(cls, data: Dict[str, Any]) -> "ModelRegistry":
+        """{"providers": [...], "models": [...]} 레코드에서 생성 (필드는 엔티티와 동일)"""
+        providers = [
+            ModelProviderEntity(
+                model_provider_id=record["model_provider_id"],
+                model_provider_name=record["model_provider_name"],
+                model_key_id=record.get("model_key_id"),
+                model_vendor=record["model_vendor"],
+                is_deleted=record.get("is_deleted", False),
+                created_at=_parse_datetime(record.get("created_at")),
+            )
+            for record in data.get("providers", [])
+        ]
+        models = [
+            ModelEntity(
+                model_id=record["model_id"],
+                model_provider_id=record["model_provider_id"],
+                model_name=record["model_name"],
+                model_type=record.get("model_type", "llm"),
+                model_config=record.get("model_config", {"model": record["model_name"]}),
+                use_custom=record.get("use_custom", False),
+                is_deleted=record.get("is_deleted", False),
+                created_at=_parse_datetime(record.get("created_at")),
+            )
+            for record in data.get("models", [])
+        ]
+        return cls(providers, models)
+
+    @classmethod
+    def from_file(cls, path: str) -> "ModelRegistry":
+        """JSON 레코드 파일에서 생성"""
+        with Path(path).open(encoding="utf-8") as f:
+            return cls.from_records(json.load(f))
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    """ISO 형식 시각 파싱"""
+    return datetime.fromisoformat(value) if value else None
+
+
+def build_default_registry(provider_id: int, fast_model_name: Optional[str] = None) -> ModelRegistry:
+    """프로바이더의 기본 모델(ID 1)과 선택적 빠른 모델(ID 2)로 레지스트리 구성"""
+    providers = [
+        ModelProviderEntity(
+            model_provider_id=pid,
+            model_provider_name=name,
+            model_key_id=key_id,
+            model_vendor=vendor,
+            is_deleted=False,
+            created_at=None,  # 실제로는 datetime.now()
+        )
+        for pid, (name, vendor, key_id) in PROVIDERS.items()
+    ]
+
+    vendor = PROVIDERS[provider_id][1]
+    provider_models = [(DEFAULT_MODEL_ID, get_default_models(vendor)[0])]
+    if fast_model_name:
+        fast_model = get_provider_model(vendor, fast_model_name)
+        if fast_model is None:
+            logger.warning(f"{vendor}에 없는 빠른 모델이라 라우팅 없이 기본 모델만 사용: {fast_model_name}")
+        else:
+            provider_models.append((FAST_MODEL_ID, fast_model))
+
+    models = [
+        ModelEntity(
+            model_id=model_id,
+            model_provider_id=provider_id,
+            model_name=provider_model.name,
+            model_type=provider_model.type,
+            model_config=dict(provider_model.config),
+            use_custom=False,
+            is_deleted=False,
+            created_at=None,
+        )
+        for model_id, provider_model in provider_models
+    ]
+    return ModelRegistry(providers, models)
+
+
+def load_registry(settings) -> ModelRegistry:
+    """설정으로 레지스트리 구성 - model_registry_path가 있으면 레코드 파일 사용"""
+    if settings.model_registry_path:
+        registry = ModelRegistry.from_file(settings.model_registry_path)
+        logger.info(f"모델 레지스트리 로드: {settings.model_registry_path}")
+        return registry
+
+    provider_id = FAKE_PROVIDER_ID if settings.llm_provider == "fake" else OPENAI_PROVIDER_ID
+    return build_default_registry(provider_id, settings.llm_fast_model)
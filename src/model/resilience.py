@@ -0,0 +1,277 @@
+"""LLM 호출 복원력 - 재시도(지수 백오프 + 지터)와 첫 토큰 헤징"""
+
+import asyncio
+import contextvars
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, List, Optional
+
+import httpx
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.language_models.chat_models import BaseChatModel, agenerate_from_stream
+from langchain_core.messages import BaseMessage, BaseMessageChunk
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.runnables.config import var_child_runnable_config
+
+from src.utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# 재시도할 HTTP 상태 코드 (요청 시간 초과, 충돌, 속도 제한, 서버 오류)
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+
+# openai SDK는 첫 모델 생성 시에만 임포트하므로 클래스 이름으로 판별
+_RETRYABLE_ERROR_NAMES = {"APITimeoutError", "APIConnectionError", "RateLimitError", "InternalServerError"}
+
+# 내부 시도는 콜백 없이 실행 - 토큰은 이 모델의 콜백으로만 전달 (헤징에서 진 쪽 토큰이 섞이지 않도록)
+_ISOLATED_CONFIG = {"callbacks": []}
+
+
+def is_retryable(error: BaseException) -> bool:
+    """재시도해도 되는 오류인지 (타임아웃, 연결 오류, 429, 5xx)"""
+    if isinstance(error, (asyncio.TimeoutError, httpx.TimeoutException, httpx.TransportError)):
+        return True
+    status_code = getattr(error, "status_code", None)
+    if status_code is None:
+        status_code = getattr(getattr(error, "response", None), "status_code", None)
+    if isinstance(status_code, int):
+        return status_code in RETRYABLE_STATUS_CODES
+    return type(error).__name__ in _RETRYABLE_ERROR_NAMES
+
+
+def retry_after(error: BaseException) -> Optional[float]:
+    """응답의 Retry-After 헤더(초)"""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class RetryPolicy:
+    """재시도/헤징 정책"""
+    max_retries: int = 2
+    base_delay: float = 0.5
+    max_delay: float = 8.0
+    attempt_timeout: Optional[float] = 30.0  # 시도당 첫 토큰까지 제한 시간
+    hedge_delay: Optional[float] = None  # 이 시간 안에 첫 토큰이 없으면 헤지 요청 (None이면 헤징 안 함)
+    rng: random.Random = field(default_factory=random.Random)
+
+    @classmethod
+    def from_settings(cls, settings) -> "RetryPolicy":
+        """모델 설정으로 생성"""
+        return cls(
+            max_retries=settings.llm_max_retries,
+            base_delay=settings.llm_retry_base_delay,
+            max_delay=settings.llm_retry_max_delay,
+            attempt_timeout=settings.llm_attempt_timeout,
+            hedge_delay=settings.llm_hedge_delay,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """재시도나 헤징을 하는지"""
+        return self.max_retries > 0 or self.hedge_delay is not None
+
+    def backoff(self, attempt: int, error: Optional[BaseException] = None) -> float:
+        """attempt번째 재시도 전 대기 시간 - 전체 지터(0 ~ base * 2^attempt), Retry-After가 있으면 우선"""
+        hinted = retry_after(error) if error is not None else None
+        if hinted is not None:
+            return min(hinted, self.max_delay)
+        return self.rng.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+class ResilientChatModel(BaseChatModel):
+    """
+    채팅 모델(도구 바인딩 포함) 호출을 감싸 재시도와 헤징을 적용합니다.
+
+    - 첫 청크가 나오기 전의 재시도 가능한 오류/타임아웃만 재시도 (이미 사용자에게 보낸 토큰은 되돌릴 수 없음)
+    - hedge_delay 안에 첫 청크가 없으면 같은 요청을 한 번 더 보내고, 먼저 첫 청크를 낸 쪽을 사용하고 나머지는 취소
+    - 내부 시도는 콜백 없이 실행하고, 이긴 쪽 청크만 이 모델의 콜백(LangGraph 토큰 스트림)으로 전달
+    """
+
+    inner: Any
+    policy: Any = None
+
+    @property
+    def _llm_type(self) -> str:
+        return "resilient"
+
+    def _policy(self) -> RetryPolicy:
+        return self.policy or RetryPolicy()
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        """동기 호출 - 재시도만 적용 (헤징 없음)"""
+        policy = self._policy()
+        context = contextvars.copy_context()
+        context.run(var_child_runnable_config.set, None)
+        for attempt in range(policy.max_retries + 1):
+            try:
+                message = context.run(self.inner.invoke, messages, config=_ISOLATED_CONFIG, stop=stop, **kwargs)
+                return ChatResult(generations=[ChatGeneration(message=message)])
+            except Exception as e:
+                if attempt >= policy.max_retries or not is_retryable(e):
+                    raise
+                delay = policy.backoff(attempt, e)
+                self._record_retry(attempt, delay, e)
+                time.sleep(delay)
+        raise AssertionError("unreachable")
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        """비스트리밍 호출도 스트림 경로(재시도 + 헤징)를 모아서 사용"""
+        return await agenerate_from_stream(self._astream(messages, stop=stop, **kwargs))
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        """첫 청크까지 재시도/헤징한 뒤 이긴 시도의 청크를 그대로 전달"""
+        policy = self._policy()
+
+        def open_stream() -> AsyncIterator[BaseMessageChunk]:
+            return self.inner.astream(messages, config=_ISOLATED_CONFIG, stop=stop, **kwargs)
+
+        for attempt in range(policy.max_retries + 1):
+            try:
+                winner = await self._race_first_chunk(open_stream, policy)
+                break
+            except Exception as e:
+                if attempt >= policy.max_retries or not is_retryable(e):
+                    if attempt > 0:
+                        metrics.increment("model.resilience.retries_exhausted_total")
+                    raise
+                delay = policy.backoff(attempt, e)
+                self._record_retry(attempt, delay, e)
+                await asyncio.sleep(delay)
+
+        try:
+            async for chunk in winner.chunks():
+                yield ChatGenerationChunk(message=chunk)
+        finally:
+            await winner.cancel()
+
+    async def _race_first_chunk(
+        self, open_stream: Callable[[], AsyncIterator[BaseMessageChunk]], policy: RetryPolicy
+    ) -> "_Attempt":
+        """첫 청크를 먼저 낸 시도 반환 - 진 쪽은 취소 (모든 시도가 실패하면 마지막 오류)"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + policy.attempt_timeout if policy.attempt_timeout else None
+        attempts = [_Attempt(open_stream, hedge=False)]
+        try:
+            if policy.hedge_delay is not None:
+                hedge_wait = policy.hedge_delay if deadline is None else min(policy.hedge_delay, deadline - loop.time())
+                done, _ = await asyncio.wait([attempts[0].first], timeout=max(hedge_wait, 0))
+                if not done and (deadline is None or loop.time() < deadline):
+                    metrics.increment("model.resilience.hedged_total")
+                    logger.info(f"{policy.hedge_delay:.1f}초 안에 첫 토큰이 없어 헤지 요청 전송")
+                    attempts.append(_Attempt(open_stream, hedge=True))
+
+            error: Optional[BaseException] = None
+            pending = list(attempts)
+            while pending:
+                timeout = None if deadline is None else max(deadline - loop.time(), 0)
+                done, _ = await asyncio.wait(
+                    [attempt.first for attempt in pending], timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    metrics.increment("model.resilience.attempt_timeouts_total")
+                    raise asyncio.TimeoutError(f"첫 토큰 대기 시간 초과 ({policy.attempt_timeout:.1f}초)")
+
+                for attempt in [attempt for attempt in pending if attempt.first in done]:
+                    pending.remove(attempt)
+                    if attempt.first.exception() is not None:
+                        # 다른 시도가 남아 있으면 그 결과를 기다림
+                        error = attempt.first.exception()
+                        continue
+                    attempts.remove(attempt)
+                    if attempt.hedge:
+                        metrics.increment("model.resilience.hedge_wins_total")
+                    return attempt
+            raise error
+        finally:
+            # 진 쪽(또는 실패/시간 초과된) 시도 취소
+            for attempt in attempts:
+                await attempt.cancel()
+
+    @staticmethod
+    def _record_retry(attempt: int, delay: float, error: BaseException) -> None:
+        """재시도 기록"""
+        metrics.increment("model.resilience.retries_total")
+        logger.warning(f"LLM 호출 재시도 {attempt + 1}회차 ({delay:.2f}초 후): {type(error).__name__}: {error}")
+
+
+class _Attempt:
+    """
+    한 번의 스트리밍 호출.
+
+    별도 태스크가 스트림을 끝까지 읽어 큐에 넣고, 첫 청크(또는 오류/빈 스트림)가 오면 first를 완료합니다.
+    스트림을 한 태스크 안에서만 순회하므로 진 쪽 취소 시 생성기가 그 태스크에서 정리됩니다.
+    """
+
+    _END = object()
+
+    def __init__(self, open_stream: Callable[[], AsyncIterator[BaseMessageChunk]], hedge: bool):
+        self.hedge = hedge
+        self.first: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task = asyncio.ensure_future(self._pump(open_stream))
+
+    async def _pump(self, open_stream: Callable[[], AsyncIterator[BaseMessageChunk]]) -> None:
+        """스트림을 읽어 큐에 적재"""
+        # 도구 바인딩(RunnableBinding)은 컨텍스트의 부모 설정(노드 콜백)을 다시 합치므로 이 태스크에서는 비움
+        var_child_runnable_config.set(None)
+        stream = open_stream()
+        try:
+            async for chunk in stream:
+                self._queue.put_nowait(chunk)
+                if not self.first.done():
+                    self.first.set_result(True)
+            self._queue.put_nowait(self._END)
+            if not self.first.done():
+                self.first.set_result(True)
+        except Exception as e:
+            self._queue.put_nowait(e)
+            if not self.first.done():
+                self.first.set_exception(e)
+        finally:
+            await stream.aclose()
+
+    async def chunks(self) -> AsyncIterator[BaseMessageChunk]:
+        """적재된 청크를 순서대로 반환 (첫 청크 이후 오류는 그대로 전파)"""
+        while True:
+            item = await self._queue.get()
+            if item is self._END:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+
+    async def cancel(self) -> None:
+        """진행 중이면 취소하고 정리가 끝날 때까지 대기"""
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        if not self.first.done():
+            self.first.cancel()
+        elif not self.first.cancelled():
+            # 조회되지 않은 오류 경고 방지
+            self.first.exception()
@@ -0,0 +1,137 @@
+"""모델 라우팅 - 단순 턴은 빠르고 저렴한 모델, 복잡한 멀티 도구 턴은 기본(large) 모델"""
+
+import logging
+import re
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from langchain_core.messages import AnyMessage, HumanMessage, ToolMessage
+
+from src.model.domains import TIER_FAST, Model
+from src.model.registry import ModelRegistry
+from src.model.settings import model_settings
+from src.utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+REASON_DEFAULT = "default"  # 라우팅 비활성 또는 빠른 모델 없음
+REASON_SIMPLE = "simple"
+REASON_LONG_INPUT = "long_input"
+REASON_COMPLEX_INPUT = "complex_input"
+REASON_MULTI_TOOL = "multi_tool"
+REASON_FAST_SLOWER = "fast_slower"  # 단순 턴에서 빠른 모델의 관측 지연시간이 기본 모델보다 김
+REASON_EXPLORE = "explore"  # 느리다고 판단된 빠른 모델의 지연시간 재측정
+
+# 지연시간은 턴 종류별로 비교 (단순 턴과 복잡한 턴의 지연시간은 비교 대상이 아님)
+TURN_SIMPLE = "simple"
+TURN_COMPLEX = "complex"
+
+# 여러 종목/단계 추론이 필요한 질문 표현 ("엔비디아 5주랑 아마존 8주를 각자 얼마씩?")
+_COMPLEX_HINTS = re.compile(r"비교|분석|각자|나눠|나누|합쳐|합계|평균|수익률|비중|전망|추천|왜|그리고|랑\s|및")
+_TICKER = re.compile(r"(?<![A-Za-z])[A-Z]{2,5}(?![A-Za-z])")  # 한글 조사가 바로 붙어도 인식
+
+
+@dataclass
+class RoutingDecision:
+    """라우팅 결정"""
+    model_id: int
+    model_name: str
+    tier: str
+    reason: str
+    turn_type: str = TURN_COMPLEX
+
+
+class ModelRoutingPolicy:
+    """
+    턴 복잡도와 모델별 비용/관측 지연시간으로 호출할 모델을 고릅니다.
+
+    - 레지스트리에 fast 등급 모델이 없거나 라우팅이 꺼져 있으면 항상 기본 모델
+    - 긴 질문, 여러 종목/단계 표현, 이번 턴 도구 결과가 routing_multi_tool_threshold 이상이면 기본 모델
+    - 그 외에는 가장 저렴한 fast 모델 (단순 턴 관측상 기본 모델보다 느려졌으면 기본 모델)
+    - 기본 모델로 돌린 동안에도 routing_explore_every번째 단순 턴은 빠른 모델로 보내 지연시간을 다시 측정
+      (그러지 않으면 한 번 느렸던 빠른 모델의 지연시간이 갱신되지 않아 계속 기본 모델만 사용)
+    """
+
+    def __init__(self, model_service, settings=None):
+        self.model_service = model_service
+        self.settings = settings or model_settings
+        self._slower_turns = 0
+
+    def select(self, messages: List[AnyMessage]) -> RoutingDecision:
+        """이번 LLM 호출에 사용할 모델 결정"""
+        registry: ModelRegistry = self.model_service.registry
+        default_id = registry.default_model_id()
+        default_model = registry.get_model(default_id)
+        fast_models = registry.candidates(TIER_FAST)
+
+        if not self.settings.model_routing_enabled or not fast_models:
+            decision = self._decide(registry, default_model, REASON_DEFAULT)
+        elif (reason := self.complexity_reason(messages)) is not None:
+            decision = self._decide(registry, default_model, reason)
+        else:
+            fast_model = fast_models[0]
+            fast_latency = registry.latency(fast_model.model_id, TURN_SIMPLE)
+            default_latency = registry.latency(default_id, TURN_SIMPLE)
+            if default_latency is None:
+                # 기본 모델의 단순 턴 관측이 없으면 복잡한 턴 지연시간(단순 턴보다 길거나 같음)과 비교
+                default_latency = registry.latency(default_id, TURN_COMPLEX)
+            if fast_latency is not None and default_latency is not None and fast_latency > default_latency:
+                self._slower_turns += 1
+                explore_every = self.settings.routing_explore_every
+                if explore_every > 0 and self._slower_turns % explore_every == 0:
+                    decision = self._decide(registry, fast_model, REASON_EXPLORE, TURN_SIMPLE)
+                else:
+                    decision = self._decide(registry, default_model, REASON_FAST_SLOWER, TURN_SIMPLE)
+            else:
+                self._slower_turns = 0
+                decision = self._decide(registry, fast_model, REASON_SIMPLE, TURN_SIMPLE)
+
+        metrics.increment("model.routing.requests_total")
+        metrics.increment(f"model.routing.{decision.tier}_total")
+        metrics.increment(f"model.routing.reason.{decision.reason}_total")
+        logger.info(f"모델 라우팅: {decision.model_name} ({decision.tier}, {decision.reason})")
+        return decision
+
+    def complexity_reason(self, messages: List[AnyMessage]) -> Optional[str]:
+        """기본 모델이 필요한 이유 (단순 턴이면 None) - 마지막 사용자 메시지 이후가 이번 턴"""
+        turn_start = max(
+            (i for i, message in enumerate(messages) if isinstance(message, HumanMessage)), default=0
+        )
+        turn = messages[turn_start:]
+
+        tool_results = sum(1 for message in turn if isinstance(message, ToolMessage))
+        if tool_results >= self.settings.routing_multi_tool_threshold:
+            return REASON_MULTI_TOOL
+
+        user_input = turn[0].content if turn and isinstance(turn[0], HumanMessage) else ""
+        if not isinstance(user_input, str):
+            return REASON_COMPLEX_INPUT
+        if len(user_input) > self.settings.routing_long_input_chars:
+            return REASON_LONG_INPUT
+        if _COMPLEX_HINTS.search(user_input) or len(set(_TICKER.findall(user_input))) >= 2:
+            return REASON_COMPLEX_INPUT
+        return None
+
+    def record_latency(self, decision: RoutingDecision, seconds: float) -> None:
+        """모델 호출 지연시간 기록 (메트릭 + 라우팅용 턴 종류별 지수이동평균)"""
+        self.model_service.registry.record_latency(
+            decision.model_id, seconds, self.settings.routing_latency_ewma_alpha, decision.turn_type
+        )
+        metrics.observe(f"model.{decision.model_name}.latency_seconds", seconds)
+
+    def pricing(self, decision: RoutingDecision) -> Optional[Tuple[float, float]]:
+        """선택한 모델의 (입력, 출력) 100만 토큰당 비용"""
+        return self.model_service.registry.pricing(decision.model_id)
+
+    @staticmethod
+    def _decide(
+        registry: ModelRegistry, model: Model, reason: str, turn_type: str = TURN_COMPLEX
+    ) -> RoutingDecision:
+        """결정 생성"""
+        return RoutingDecision(
+            model_id=model.model_id,
+            model_name=model.model_name,
+            tier=registry.tier_of(model),
+            reason=reason,
+            turn_type=turn_type,
+        )
@@ -1,63 +1,54 @@
 """Model service for LLM model management."""
 
 import logging
-from typing import List, Optional
-from src.model.domains import Model, ModelProvider, get_default_models
+from typing import List, Optional, Tuple
+from src.model.domains import Model, ModelProvider
+from src.model.registry import ModelRegistry, load_registry
 from src.model.settings import model_settings
 
 logger = logging.getLogger(__name__)
 
 class ModelService:
-    """모델 서비스 - OpenAI GPT-4o만 사용하는 단순화된 버전"""
+    """모델 서비스 - 설정에서 구성한 모델 레지스트리로 모델/프로바이더 조회"""
     
     def __init__(self):
         """모델 서비스 초기화"""
         self.settings = model_settings
+        self._registry: Optional[ModelRegistry] = None
+        self._registry_key: Optional[Tuple] = None
         logger.info("Model 서비스 초기화 완료")
     
-    # Model CRUD (단순화된 버전)
+    @property
+    def registry(self) -> ModelRegistry:
+        """모델 레지스트리 (레지스트리 관련 설정이 바뀌면 다시 구성)"""
+        key = (self.settings.llm_provider, self.settings.llm_fast_model, self.settings.model_registry_path)
+        if key != self._registry_key:
+            self._registry = load_registry(self.settings)
+            self._registry_key = key
+            logger.info(f"모델 레지스트리 구성: {[model.model_name for model in self._registry.models()]}")
+        return self._registry
+    
+    # Model CRUD (레지스트리 조회)
     async def get_model(self, model_id: int) -> Optional[Model]:
-        """모델 ID로 모델 조회 - 현재는 기본 모델만 반환"""
-        if model_id == 1:  # 기본 GPT-4o 모델
-            return Model(
-                model_id=1,
-                model_provider_id=1,
-                model_name="gpt-4o",
-                model_type="llm",
-                model_config={"model": "gpt-4o", "enable_tool_calling": True},
-                use_custom=False,
-                is_deleted=False,
-                created_at=None  # 실제로는 datetime.now()
-            )
-        return None
+        """모델 ID로 모델 조회 (1: 기본 모델, 2: 설정된 경우 빠른 모델)"""
+        return self.registry.get_model(model_id)
     
     async def get_models_by_type(self, model_type: str) -> List[Model]:
         """모델 타입으로 모든 모델 조회"""
-        if model_type == "llm":
-            return [await self.get_model(1)]
-        return []
+        return self.registry.models(model_type)
     
     async def get_all_models(self) -> List[Model]:
         """모든 모델 조회"""
-        return [await self.get_model(1)]
+        return self.registry.models()
     
-    # ModelProvider CRUD (단순화된 버전)
+    # ModelProvider CRUD (레지스트리 조회)
     async def get_provider(self, provider_id: int) -> Optional[ModelProvider]:
         """프로바이더 ID로 프로바이더 조회"""
-        if provider_id == 1:  # OpenAI 프로바이더
-            return ModelProvider(
-                model_provider_id=1,
-                model_provider_name="OpenAI",
-                model_key_id=1,
-                model_vendor="OpenAI",
-                is_deleted=False,
-                created_at=None  # 실제로는 datetime.now()
-            )
-        return None
+        return self.registry.get_provider(provider_id)
     
     async def get_all_providers(self) -> List[ModelProvider]:
-        """모든 프로바이더 조회"""
-        return [await self.get_provider(1)]
+        """사용 중인(모델이 등록된) 프로바이더 조회"""
+        return self.registry.providers()
     
     # 모델 정보 조회 메서드들
     async def get_model_info(self, model_id: int) -> Optional[dict]:
@@ -1,27 +1,56 @@
 """Model settings for configuration management."""
 
 import logging
+from typing import Optional
 from pydantic_settings import BaseSettings
 
+from ..utils.settings import LazySettings
+
 logger = logging.getLogger(__name__)
 
 class ModelSettings(BaseSettings):
     """모델 관련 설정 - OpenAI만 사용"""
     
-    # OpenAI 설정 - .env에서 OPENAI_API_KEY 가져옴
-    openai_api_key: str
+    # OpenAI 설정 - .env에서 OPENAI_API_KEY 가져옴 (fake 프로바이더는 키 불필요)
+    openai_api_key: str = ""
+    openai_base_url: Optional[str] = None  # OpenAI 호환 서버 주소 (예: 로컬 가짜 서버 http://127.0.0.1:8100/v1)
     
     # 기본 LLM 설정
-    llm_provider: str = "openai"
+    llm_provider: str = "openai"  # openai | fake
     llm_model: str = "gpt-4o"
     llm_temperature: float = 0.7
     llm_max_tokens: int = 1000
     llm_streaming: bool = True
     
+    # 가짜 모델 설정 (llm_provider=fake) - 오프라인 부하 테스트용
+    fake_script_path: Optional[str] = None  # 시나리오 JSON 파일 (없으면 기본 답변)
+    fake_tokens_per_second: float = 50.0
+    fake_latency_distribution: str = "fixed"  # fixed | uniform | normal | lognormal
+    fake_latency_ms: float = 300.0  # 첫 토큰까지 지연 (평균/중앙값)
+    fake_latency_jitter_ms: float = 0.0
+    fake_seed: Optional[int] = None
+    
+    # 모델 레지스트리 / 라우팅 - 단순 턴은 빠른 모델, 복잡한 멀티 도구 턴은 기본 모델
+    llm_fast_model: Optional[str] = None  # 단순 턴용 모델 (예: gpt-4o-mini, fake-scripted-fast) - 없으면 기본 모델만 사용
+    model_registry_path: Optional[str] = None  # providers/models 레코드 JSON (지정하면 기본 레지스트리 대체)
+    model_routing_enabled: bool = True
+    routing_long_input_chars: int = 200  # 이보다 긴 질문은 기본 모델
+    routing_multi_tool_threshold: int = 2  # 이번 턴 도구 결과가 이 수 이상이면 기본 모델
+    routing_latency_ewma_alpha: float = 0.2  # 모델별 지연시간 지수이동평균 가중치 (단순/복잡 턴 따로)
+    routing_explore_every: int = 10  # 빠른 모델이 느리다고 판단된 동안에도 N번째 단순 턴은 빠른 모델로 보내 재측정 (0이면 끔)
+    
+    # LLM 호출 복원력 - 재시도 가능한 오류(타임아웃, 연결 오류, 429, 5xx)만 지수 백오프 + 지터로 재시도
+    llm_max_retries: int = 2
+    llm_retry_base_delay: float = 0.5
+    llm_retry_max_delay: float = 8.0
+    llm_attempt_timeout: Optional[float] = 30.0  # 시도당 첫 토큰까지 제한 시간(초)
+    llm_hedge_delay: Optional[float] = None  # 이 시간(초) 안에 첫 토큰이 없으면 헤지 요청 1회 (None이면 헤징 안 함)
+    
     model_config = {
         "env_file": ".env",
         "env_file_encoding": "utf-8",
+        "extra": "ignore",
     }
 
 # 전역 설정 인스턴스
-model_settings = ModelSettings()
+model_settings: ModelSettings = LazySettings(ModelSettings)  # 처음 접근할 때 로드
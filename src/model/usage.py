@@ -0,0 +1,178 @@
+"""토큰 사용량/비용 집계 - 요청별, 세션별, 모델별"""
+
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+from src.llm.entities import TokenUsage
+from src.utils.metrics import metrics
+
+if TYPE_CHECKING:
+    # 타입 힌트 전용 - 웹앱 임포트 시 langchain_core를 끌어오지 않도록
+    from langchain_core.messages import BaseMessage
+    from langchain_core.runnables import RunnableConfig
+
+logger = logging.getLogger(__name__)
+
+# config["configurable"]에서 요청별 집계를 찾는 키
+REQUEST_USAGE_KEY = "request_usage"
+UNKNOWN_MODEL = "unknown"
+
+
+@dataclass
+class UsageTotals:
+    """누적 토큰 사용량"""
+    calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    total_tokens: int = 0
+    cost_usd: float = 0.0
+
+    def add(self, usage: TokenUsage) -> None:
+        """호출 1회 사용량 누적"""
+        self.calls += 1
+        self.input_tokens += usage.prompt_tokens
+        self.output_tokens += usage.completion_tokens
+        self.total_tokens += usage.total_tokens
+        self.cost_usd += usage.cost_estimate
+
+    def to_dict(self) -> Dict[str, Any]:
+        """응답/메트릭용 딕셔너리"""
+        return {
+            "calls": self.calls,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "total_tokens": self.total_tokens,
+            "cost_usd": round(self.cost_usd, 8),
+        }
+
+
+@dataclass
+class RequestUsage:
+    """한 요청(턴)의 사용량 - config["configurable"]로 노드에 전달 (객체라 체크포인트 메타데이터에는 저장되지 않음)"""
+    totals: UsageTotals = field(default_factory=UsageTotals)
+    by_model: Dict[str, UsageTotals] = field(default_factory=dict)
+
+    @classmethod
+    def from_config(cls, config: Optional["RunnableConfig"]) -> Optional["RequestUsage"]:
+        """실행 설정에서 요청별 집계 조회 (없으면 None)"""
+        return (config or {}).get("configurable", {}).get(REQUEST_USAGE_KEY)
+
+    def to_configurable(self) -> Dict[str, Any]:
+        """config["configurable"]에 넣을 값"""
+        return {REQUEST_USAGE_KEY: self}
+
+    def add(self, usage: TokenUsage) -> None:
+        """호출 1회 사용량 누적"""
+        self.totals.add(usage)
+        self.by_model.setdefault(usage.model, UsageTotals()).add(usage)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """응답 메타데이터용 딕셔너리"""
+        return {
+            **self.totals.to_dict(),
+            "by_model": {model: totals.to_dict() for model, totals in self.by_model.items()},
+        }
+
+
+class UsageTracker:
+    """
+    프로세스 전체 토큰 사용량 집계.
+
+    호출마다 잠금 안에서 정수/실수 덧셈만 하므로 부담이 작습니다.
+    세션별 집계는 최근 사용 순으로 max_sessions개까지만 보관합니다.
+    """
+
+    def __init__(self, max_sessions: int = 10000):
+        self.max_sessions = max_sessions
+        self._lock = threading.Lock()
+        self._total = UsageTotals()
+        self._models: Dict[str, UsageTotals] = {}
+        self._sessions: "OrderedDict[str, UsageTotals]" = OrderedDict()
+
+    def record(self, session_id: Optional[str], usage: TokenUsage) -> None:
+        """호출 1회 사용량 기록"""
+        with self._lock:
+            self._total.add(usage)
+            self._models.setdefault(usage.model, UsageTotals()).add(usage)
+            if session_id:
+                totals = self._sessions.pop(session_id, None) or UsageTotals()
+                totals.add(usage)
+                self._sessions[session_id] = totals
+                while len(self._sessions) > self.max_sessions:
+                    self._sessions.popitem(last=False)
+
+    def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """세션 누적 사용량 (기록이 없으면 None)"""
+        with self._lock:
+            totals = self._sessions.get(session_id)
+            return totals.to_dict() if totals else None
+
+    def clear_session(self, session_id: str) -> None:
+        """세션 집계 삭제 (모델별/전체 집계는 유지)"""
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """전체/모델별 누적 사용량 스냅샷"""
+        with self._lock:
+            return {
+                "total": self._total.to_dict(),
+                "models": {model: totals.to_dict() for model, totals in self._models.items()},
+                "sessions": len(self._sessions),
+            }
+
+    def reset(self) -> None:
+        """모든 집계 초기화"""
+        with self._lock:
+            self._total = UsageTotals()
+            self._models.clear()
+            self._sessions.clear()
+
+
+def extract_usage(
+    message: "BaseMessage", model: Optional[str] = None, pricing: Optional[Tuple[float, float]] = None
+) -> Optional[TokenUsage]:
+    """LLM 응답 메시지의 usage_metadata를 TokenUsage로 변환 (프로바이더가 보고하지 않았으면 None)"""
+    usage_metadata = getattr(message, "usage_metadata", None)
+    if not isinstance(usage_metadata, dict) or not usage_metadata:
+        return None
+    input_tokens = usage_metadata.get("input_tokens", 0)
+    output_tokens = usage_metadata.get("output_tokens", 0)
+    input_cost, output_cost = pricing if pricing is not None else (None, None)
+    return TokenUsage(
+        prompt_tokens=input_tokens,
+        completion_tokens=output_tokens,
+        total_tokens=usage_metadata.get("total_tokens", input_tokens + output_tokens),
+        model=model or (getattr(message, "response_metadata", None) or {}).get("model_name") or UNKNOWN_MODEL,
+        timestamp=datetime.now(),
+        input_cost_per_1m=input_cost,
+        output_cost_per_1m=output_cost,
+    )
+
+
+def record_usage(
+    message: "BaseMessage",
+    config: Optional["RunnableConfig"] = None,
+    model: Optional[str] = None,
+    pricing: Optional[Tuple[float, float]] = None,
+) -> Optional[TokenUsage]:
+    """LLM 호출 1회 사용량을 요청별/세션별/모델별 집계에 기록"""
+    usage = extract_usage(message, model, pricing)
+    if usage is None:
+        metrics.increment("llm.usage.missing_total")
+        return None
+
+    configurable = (config or {}).get("configurable", {})
+    usage_tracker.record(configurable.get("thread_id"), usage)
+    request_usage = RequestUsage.from_config(config)
+    if request_usage is not None:
+        request_usage.add(usage)
+    return usage
+
+
+# 전역 사용량 집계 인스턴스
+usage_tracker = UsageTracker()
@@ -11,6 +11,3 @@ class ToolsContainer(containers.DeclarativeContainer):
     
     # 서비스들
     service = providers.Singleton(ToolService)
-
-# 전역 컨테이너 인스턴스
-tools_container = ToolsContainer()
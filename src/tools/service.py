@@ -1,12 +1,13 @@
 """도구 서비스들 - 가독성 개선"""
 import asyncio
+import re
 import time
 import logging
+from collections import OrderedDict
 from typing import Dict, Any, Optional
 from decimal import Decimal, InvalidOperation
 
-import yfinance as yf
-import numexpr as ne
+# yfinance(pandas 포함)와 numexpr는 무거워서 처음 조회/계산할 때 임포트
 
 from ..utils.exceptions import InvalidTickerException, InvalidExpressionException, StockPriceException, CalculatorException
 from .entities import StockPrice, CalculationResult
@@ -15,11 +16,12 @@ logger = logging.getLogger(__name__)
 
 
 class StockPriceService:
-    """주가 조회 서비스 - 순차 처리"""
+    """주가 조회 서비스 - 종목별 순차 처리"""
     
     def __init__(self):
-        self._lock = asyncio.Lock()  # 순차 처리를 위한 Lock
-        self._cache: Dict[str, tuple] = {}  # (timestamp, data)
+        self._locks: Dict[str, asyncio.Lock] = {}  # 같은 종목의 중복 조회 방지용 Lock (사용 중인 동안만 보관)
+        self._lock_users: Dict[str, int] = {}
+        self._cache: Dict[str, tuple] = {}  # (timestamp, StockPrice)
         self._cache_ttl = 30  # 30초 캐시
     
     def _validate_ticker(self, ticker: str) -> str:
@@ -32,7 +34,7 @@ class StockPriceService:
         
         return ticker.upper()
     
-    def _check_cache(self, ticker: str, current_time: float) -> Optional[str]:
+    def _check_cache(self, ticker: str, current_time: float) -> Optional[StockPrice]:
         """캐시 확인"""
         if ticker in self._cache:
             cached_time, cached_data = self._cache[ticker]
@@ -41,60 +43,115 @@ class StockPriceService:
                 return cached_data
         return None
     
-    def _create_stock_result(self, ticker: str, hist) -> str:
-        """주가 결과 생성"""
+    def quote_expires_at(self, ticker: str) -> Optional[float]:
+        """캐시된 시세의 만료 시각 (epoch 초)"""
+        cached = self._cache.get(ticker.upper())
+        if cached is None:
+            return None
+        return cached[0] + self._cache_ttl
+    
+    def _create_stock_quote(self, ticker: str, hist) -> StockPrice:
+        """주가 정보(구조화된 시세) 생성"""
         if hist.empty:
             raise StockPriceException(f"No historical data found for ticker {ticker}")
         
-        # 주가 정보 생성
-        current_price = hist['Close'].iloc[-1]
-        result = f"The current stock price of {ticker} is ${current_price:.2f}"
+        current_price = Decimal(str(hist['Close'].iloc[-1]))
+        quote = StockPrice(symbol=ticker, price=current_price)
         
         # 변동률 계산
         if len(hist) > 1:
-            prev_price = hist['Close'].iloc[-2]
-            change = current_price - prev_price
-            change_percent = (change / prev_price) * 100
-            change_sign = "+" if change >= 0 else ""
-            result += f" ({change_sign}${change:.2f}, {change_sign}{change_percent:.2f}%)"
+            prev_price = Decimal(str(hist['Close'].iloc[-2]))
+            quote.change = current_price - prev_price
+            quote.change_percent = (quote.change / prev_price) * 100
+        
+        return quote
+    
+    def format_quote(self, quote: StockPrice) -> str:
+        """주가 결과 문자열 생성"""
+        result = f"The current stock price of {quote.symbol} is {quote.formatted_price}"
+        
+        if quote.change is not None:
+            change_sign = "+" if quote.change >= 0 else ""
+            result += f" ({change_sign}${quote.change:.2f}, {change_sign}{quote.change_percent:.2f}%)"
         
         return result
     
-    async def get_stock_price(self, ticker: str) -> str:
-        """주가 조회 - validate 함수로 깔끔하게 처리"""
+    def format_quote_answer(self, quote: StockPrice) -> str:
+        """사용자에게 보여줄 한국어 시세 답변 생성"""
+        answer = f"{quote.symbol}의 현재 주가는 {quote.formatted_price}입니다"
+        
+        if quote.change is not None:
+            change_sign = "+" if quote.change >= 0 else ""
+            answer += f" (전일 대비 {change_sign}${quote.change:.2f}, {change_sign}{quote.change_percent:.2f}%)"
+        
+        return answer + "."
+    
+    def _create_stock_result(self, ticker: str, hist) -> str:
+        """주가 결과 생성"""
+        return self.format_quote(self._create_stock_quote(ticker, hist))
+    
+    def _fetch_history(self, ticker: str):
+        """yfinance에서 가격 이력 조회 (동기)"""
+        import yfinance as yf
+        
+        stock = yf.Ticker(ticker)
+        hist = stock.history(period="1d")
+        
+        if hist.empty:
+            logger.warning(f"No data found for {ticker}, trying with 5d period")
+            hist = stock.history(period="5d")
+        
+        return hist
+    
+    async def get_stock_quote(self, ticker: str) -> StockPrice:
+        """구조화된 주가 조회 - validate 함수로 깔끔하게 처리"""
         # 입력 검증
         ticker = self._validate_ticker(ticker)
         
-        current_time = time.time()
-        
-        # 전체 처리를 순차적으로 실행
-        async with self._lock:
-            # 캐시 확인
-            cached_result = self._check_cache(ticker, current_time)
-            if cached_result:
-                return cached_result
-            
-            # API 호출
-            logger.info(f"Fetching fresh data for {ticker}")
-            stock = yf.Ticker(ticker)
-            hist = stock.history(period="1d")
-            
-            if hist.empty:
-                logger.warning(f"No data found for {ticker}, trying with 5d period")
-                hist = stock.history(period="5d")
-            
-            result = self._create_stock_result(ticker, hist)
-            
-            # 성공한 경우만 캐시에 저장
-            self._cache[ticker] = (current_time, result)
-            
-            logger.info(f"Successfully processed {ticker}")
-            return result
+        # 같은 종목만 순차 처리 (다른 종목은 동시에 조회)
+        lock = self._locks.setdefault(ticker, asyncio.Lock())
+        self._lock_users[ticker] = self._lock_users.get(ticker, 0) + 1
+        try:
+            async with lock:
+                current_time = time.time()
+                
+                # 캐시 확인
+                cached_quote = self._check_cache(ticker, current_time)
+                if cached_quote:
+                    return cached_quote
+                
+                # API 호출 (yfinance는 동기 호출이므로 스레드에서 실행)
+                logger.info(f"Fetching fresh data for {ticker}")
+                hist = await asyncio.to_thread(self._fetch_history, ticker)
+                
+                quote = self._create_stock_quote(ticker, hist)
+                
+                # 성공한 경우만 캐시에 저장
+                self._cache[ticker] = (current_time, quote)
+                
+                logger.info(f"Successfully processed {ticker}")
+                return quote
+        finally:
+            # 기다리는 요청이 없으면 Lock 삭제 (조회한 종목 수만큼 쌓이지 않도록)
+            self._lock_users[ticker] -= 1
+            if not self._lock_users[ticker]:
+                del self._lock_users[ticker]
+                del self._locks[ticker]
+    
+    async def get_stock_price(self, ticker: str) -> str:
+        """주가 조회 (문자열 결과)"""
+        quote = await self.get_stock_quote(ticker)
+        return self.format_quote(quote)
 
 
 class CalculatorService:
     """계산 서비스"""
     
+    # 이전 주가 조회 결과 참조 (예: "AAPL.price * 5", "BRK.B.price", "005930.KS.price")
+    REFERENCE_PATTERN = re.compile(
+        r"(?<![\w.])([A-Za-z0-9][A-Za-z0-9.]*)\.(price|change_percent|change)\b"
+    )
+    
     def _validate_expression(self, expression: str) -> None:
         """수식 검증 - 필요시 exception raise"""
         if not expression:
@@ -103,20 +160,36 @@ class CalculatorService:
         if not expression.strip():
             raise InvalidExpressionException("계산식이 비어있습니다")
         
-        # 위험한 문자 체크 (보안)
+        # 위험한 문자 체크 (보안) - 종목 참조(예: OPEN.price)는 시세 값으로 치환되므로 제외하고 검사
         dangerous_chars = ['import', 'exec', 'eval', '__', 'open', 'file']
-        expression_lower = expression.lower()
+        expression_lower = self.REFERENCE_PATTERN.sub("", expression).lower()
         for char in dangerous_chars:
             if char in expression_lower:
                 raise InvalidExpressionException(f"보안상 허용되지 않는 문자가 포함되어 있습니다: {char}")
     
+    def _resolve_references(self, expression: str, quotes: Dict[str, StockPrice]) -> str:
+        """수식의 종목 참조(TICKER.field)를 조회된 시세 값으로 치환"""
+        def replace(match) -> str:
+            symbol, field = match.group(1).upper(), match.group(2)
+            quote = quotes.get(symbol)
+            if quote is None:
+                raise InvalidExpressionException(
+                    f"이 대화에서 조회되지 않은 종목입니다: {match.group(0)}"
+                )
+            
+            value = getattr(quote, field)
+            if value is None:
+                raise InvalidExpressionException(f"참조할 값이 없습니다: {match.group(0)}")
+            return f"({value})"
+        
+        return self.REFERENCE_PATTERN.sub(replace, expression)
+    
     def _create_success_result(self, expression: str, result) -> CalculationResult:
         """성공 결과 생성"""
         decimal_result = Decimal(str(result))
         return CalculationResult(
             expression=expression,
-            result=decimal_result,
-            is_success=True
+            result=decimal_result
         )
     
     def _create_error_result(self, expression: str, error_message: str) -> CalculationResult:
@@ -125,17 +198,27 @@ class CalculatorService:
         return CalculationResult(
             expression=expression,
             result=None,
-            is_success=False,
-            error_message=error_message
+            error=error_message
         )
     
-    def calculate(self, expression: str) -> CalculationResult:
+    def calculate(
+        self, 
+        expression: str, 
+        quotes: Optional[Dict[str, StockPrice]] = None
+    ) -> CalculationResult:
         """수식 계산 - validate 함수로 깔끔하게 처리"""
         # 입력 검증
         self._validate_expression(expression)
         
-        # 계산 실행
-        result = ne.evaluate(expression)
+        # 종목 참조 치환
+        resolved = self._resolve_references(expression, quotes or {})
+        
+        # 계산 실행 (numexpr는 0차원 배열을 반환)
+        import numexpr as ne
+        
+        result = ne.evaluate(resolved)
+        if getattr(result, "ndim", None) == 0:
+            result = result.item()
         
         if isinstance(result, (int, float)):
             return self._create_success_result(expression, result)
@@ -147,21 +230,59 @@ class CalculatorService:
 
 
 class ToolService:
-    """통합 도구 서비스"""
+    """통합 도구 서비스 - 스레드별 시세는 최근 사용 순으로 max_threads개까지만 보관"""
     
-    def __init__(self):
+    def __init__(self, max_threads: int = 10000):
         self.stock_service = StockPriceService()
         self.calculator_service = CalculatorService()
+        self.max_threads = max_threads
+        # 스레드별로 조회된 시세 (계산기 참조용)
+        self._thread_quotes: "OrderedDict[str, Dict[str, StockPrice]]" = OrderedDict()
     
-    async def get_stock_price(self, ticker: str) -> str:
-        """주가 조회 - 순차 처리 보장"""
-        return await self.stock_service.get_stock_price(ticker)
+    async def get_stock_quote(self, ticker: str, thread_id: Optional[str] = None) -> StockPrice:
+        """구조화된 주가 조회 - 스레드가 주어지면 계산기 참조용으로 시세를 기록"""
+        quote = await self.stock_service.get_stock_quote(ticker)
+        
+        if thread_id:
+            self._thread_quotes.setdefault(thread_id, {})[quote.symbol] = quote
+            self._thread_quotes.move_to_end(thread_id)
+            while len(self._thread_quotes) > self.max_threads:
+                self._thread_quotes.popitem(last=False)
+        
+        return quote
     
-    def calculate(self, expression: str) -> str:
-        """계산"""
-        calc_result = self.calculator_service.calculate(expression)
+    async def get_stock_price(self, ticker: str, thread_id: Optional[str] = None) -> str:
+        """주가 조회 (문자열 결과)"""
+        quote = await self.get_stock_quote(ticker, thread_id)
+        return self.stock_service.format_quote(quote)
+    
+    def get_thread_quotes(self, thread_id: Optional[str]) -> Dict[str, StockPrice]:
+        """스레드에서 조회된 시세 목록 반환"""
+        if not thread_id:
+            return {}
+        return dict(self._thread_quotes.get(thread_id, {}))
+    
+    def get_thread_quote_expiry(self, thread_id: Optional[str]) -> Optional[float]:
+        """스레드에서 조회된 시세 중 가장 먼저 만료되는 시각 (조회한 시세가 없으면 None)"""
+        expiries = [
+            self.stock_service.quote_expires_at(symbol)
+            for symbol in self.get_thread_quotes(thread_id)
+        ]
+        expiries = [expiry for expiry in expiries if expiry is not None]
+        return min(expiries) if expiries else None
+    
+    def clear_thread_quotes(self, thread_id: str) -> None:
+        """스레드에 기록된 시세 삭제"""
+        self._thread_quotes.pop(thread_id, None)
+    
+    def calculate(self, expression: str, thread_id: Optional[str] = None) -> str:
+        """계산 - 스레드에서 조회된 시세를 참조로 사용"""
+        calc_result = self.calculator_service.calculate(
+            expression, 
+            self.get_thread_quotes(thread_id)
+        )
         
         if calc_result.is_success:
             return str(calc_result.result)
         else:
-            return f"계산 오류: {calc_result.error_message}"
\ No newline at end of file
+            return f"계산 오류: {calc_result.error}"
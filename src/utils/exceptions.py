@@ -204,6 +204,18 @@ class InvalidInputException(ChatbotException):
     """유효하지 않은 입력"""
 
 
+class SessionBusyException(ChatbotException):
+    """같은 세션에 처리 대기 중인 턴이 너무 많을 때 (429)"""
+
+
+class ServerBusyException(ChatbotException):
+    """동시 Agent 실행 수가 한도에 도달했을 때 (503)"""
+
+
+class ClientDisconnectedException(ChatbotException):
+    """스트리밍 중 클라이언트 연결이 끊겼을 때 (응답 중단)"""
+
+
 """
 Agent 관련 예외
 """
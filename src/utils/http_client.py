@@ -0,0 +1,193 @@
+"""LLM 호출용 공유 HTTP 클라이언트 - 커넥션 풀 재사용 및 메트릭"""
+import asyncio
+import importlib.util
+import logging
+import weakref
+from typing import Callable, Optional
+
+import httpx
+from pydantic_settings import BaseSettings
+
+from .metrics import MetricsRegistry, metrics
+from .settings import load_settings
+
+logger = logging.getLogger(__name__)
+
+
+class HttpClientSettings(BaseSettings):
+    """공유 HTTP 클라이언트 설정 - Pydantic 기반"""
+
+    llm_http_max_connections: int = 100
+    llm_http_max_keepalive_connections: int = 20
+    llm_http_keepalive_expiry: float = 30.0
+    llm_http2: bool = True
+
+    model_config = {
+        "env_file": ".env",
+        "env_file_encoding": "utf-8",
+        "extra": "ignore",
+    }
+
+
+def is_http2_available() -> bool:
+    """HTTP/2 지원 패키지(h2) 설치 여부"""
+    return importlib.util.find_spec("h2") is not None
+
+
+class _MeteredResponseStream(httpx.AsyncByteStream):
+    """응답 스트림이 닫힐 때 in-flight 카운트를 줄이는 래퍼"""
+
+    def __init__(self, stream: httpx.AsyncByteStream, on_close: Callable[[], None]):
+        self._stream = stream
+        self._on_close = on_close
+        self._closed = False
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._closed:
+                self._closed = True
+                self._on_close()
+
+
+class MeteredAsyncTransport(httpx.AsyncBaseTransport):
+    """
+    이벤트 루프별 커넥션 풀을 두고, 커넥션 재사용과 풀 포화도를 메트릭으로 남기는 트랜스포트.
+
+    httpcore 커넥션은 생성된 이벤트 루프에 묶여 있어서, 루프를 새로 만드는 실행 환경(Streamlit 등)에서도
+    안전하게 공유할 수 있도록 루프마다 내부 트랜스포트를 따로 만듭니다.
+    """
+
+    METRIC_PREFIX = "llm_http"
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        transport_factory: Optional[Callable[[], httpx.AsyncBaseTransport]] = None,
+        registry: MetricsRegistry = metrics,
+    ):
+        self.max_connections = max_connections
+        self.http2 = http2
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._transport_factory = transport_factory or self._create_transport
+        self._transports = weakref.WeakKeyDictionary()
+        self._known_streams = weakref.WeakSet()
+        self._in_flight = 0
+        self._metrics = registry
+
+    def _create_transport(self) -> httpx.AsyncBaseTransport:
+        """기본 내부 트랜스포트 생성"""
+        return httpx.AsyncHTTPTransport(limits=self._limits, http2=self.http2)
+
+    def _get_transport(self) -> httpx.AsyncBaseTransport:
+        """현재 이벤트 루프의 내부 트랜스포트 반환"""
+        loop = asyncio.get_running_loop()
+        transport = self._transports.get(loop)
+        if transport is None:
+            transport = self._transport_factory()
+            self._transports[loop] = transport
+        return transport
+
+    def _metric(self, name: str) -> str:
+        return f"{self.METRIC_PREFIX}.{name}"
+
+    def _on_request_start(self) -> None:
+        if self._in_flight >= self.max_connections:
+            self._metrics.increment(self._metric("pool_saturated_total"))
+        self._in_flight += 1
+        self._metrics.increment(self._metric("requests_total"))
+        self._metrics.set_gauge(self._metric("in_flight"), self._in_flight)
+        self._metrics.max_gauge(self._metric("in_flight_peak"), self._in_flight)
+
+    def _on_request_end(self) -> None:
+        self._in_flight -= 1
+        self._metrics.set_gauge(self._metric("in_flight"), self._in_flight)
+
+    def _record_connection(self, response: httpx.Response) -> None:
+        """응답의 네트워크 스트림으로 새 커넥션/재사용 커넥션을 구분"""
+        network_stream = response.extensions.get("network_stream")
+        if network_stream is None:
+            return
+
+        try:
+            is_reused = network_stream in self._known_streams
+            if not is_reused:
+                self._known_streams.add(network_stream)
+        except TypeError:
+            return
+
+        name = "connections_reused_total" if is_reused else "connections_opened_total"
+        self._metrics.increment(self._metric(name))
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self._on_request_start()
+        try:
+            response = await self._get_transport().handle_async_request(request)
+        except BaseException:
+            self._on_request_end()
+            self._metrics.increment(self._metric("errors_total"))
+            raise
+
+        self._record_connection(response)
+        response.stream = _MeteredResponseStream(response.stream, self._on_request_end)
+        return response
+
+    async def aclose(self) -> None:
+        """현재 이벤트 루프의 내부 트랜스포트를 닫습니다."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        transport = self._transports.pop(loop, None)
+        if transport is not None:
+            await transport.aclose()
+
+
+_shared_async_client: Optional[httpx.AsyncClient] = None
+
+
+def create_async_client(settings: Optional[HttpClientSettings] = None) -> httpx.AsyncClient:
+    """커넥션 풀 설정이 적용된 AsyncClient 생성"""
+    settings = settings or load_settings(HttpClientSettings)
+    http2 = settings.llm_http2 and is_http2_available()
+    if settings.llm_http2 and not http2:
+        logger.info("h2 패키지가 없어 HTTP/1.1로 LLM 커넥션을 유지합니다")
+
+    transport = MeteredAsyncTransport(
+        max_connections=settings.llm_http_max_connections,
+        max_keepalive_connections=settings.llm_http_max_keepalive_connections,
+        keepalive_expiry=settings.llm_http_keepalive_expiry,
+        http2=http2,
+    )
+    # OpenAI SDK 기본 클라이언트와 동일하게 리다이렉트를 따라가고, 타임아웃은 요청별로 SDK가 지정
+    return httpx.AsyncClient(transport=transport, follow_redirects=True)
+
+
+def get_shared_async_client() -> httpx.AsyncClient:
+    """프로세스 전역 공유 AsyncClient 반환 (최초 호출 시 생성)"""
+    global _shared_async_client
+    if _shared_async_client is None or _shared_async_client.is_closed:
+        _shared_async_client = create_async_client()
+        logger.info("공유 LLM HTTP 클라이언트 생성")
+    return _shared_async_client
+
+
+async def aclose_shared_async_client() -> None:
+    """공유 AsyncClient 종료"""
+    global _shared_async_client
+    if _shared_async_client is not None:
+        await _shared_async_client.aclose()
+        _shared_async_client = None
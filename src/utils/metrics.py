@@ -0,0 +1,107 @@
+"""인메모리 메트릭 수집기"""
+import logging
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class MetricSummary:
+    """관측값 요약 (횟수/합계/최소/최대)"""
+    count: int = 0
+    total: float = 0.0
+    min: Optional[float] = None
+    max: Optional[float] = None
+
+    def add(self, value: float) -> None:
+        """관측값 추가"""
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    @property
+    def avg(self) -> float:
+        """평균값"""
+        return self.total / self.count if self.count else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리 변환"""
+        return {
+            "count": self.count,
+            "sum": round(self.total, 6),
+            "min": self.min,
+            "max": self.max,
+            "avg": round(self.avg, 6),
+        }
+
+
+class MetricsRegistry:
+    """카운터/게이지/요약 메트릭 저장소 - 스레드 안전"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, float] = defaultdict(float)
+        self._gauges: Dict[str, float] = {}
+        self._summaries: Dict[str, MetricSummary] = defaultdict(MetricSummary)
+
+    def increment(self, name: str, value: float = 1) -> None:
+        """카운터 증가"""
+        with self._lock:
+            self._counters[name] += value
+
+    def set_gauge(self, name: str, value: float) -> None:
+        """게이지 값 설정"""
+        with self._lock:
+            self._gauges[name] = value
+
+    def max_gauge(self, name: str, value: float) -> None:
+        """게이지를 최댓값으로 갱신 (peak 추적용)"""
+        with self._lock:
+            self._gauges[name] = max(self._gauges.get(name, value), value)
+
+    def observe(self, name: str, value: float) -> None:
+        """관측값 기록"""
+        with self._lock:
+            self._summaries[name].add(value)
+
+    def get_counter(self, name: str) -> float:
+        """카운터 값 조회"""
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def get_gauge(self, name: str) -> Optional[float]:
+        """게이지 값 조회"""
+        with self._lock:
+            return self._gauges.get(name)
+
+    def get_summary(self, name: str) -> MetricSummary:
+        """요약 메트릭 조회 (복사본)"""
+        with self._lock:
+            summary = self._summaries.get(name, MetricSummary())
+            return MetricSummary(summary.count, summary.total, summary.min, summary.max)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """전체 메트릭 스냅샷"""
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "gauges": dict(self._gauges),
+                "summaries": {
+                    name: summary.to_dict() for name, summary in self._summaries.items()
+                },
+            }
+
+    def reset(self) -> None:
+        """모든 메트릭 초기화"""
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._summaries.clear()
+
+
+# 전역 메트릭 인스턴스
+metrics = MetricsRegistry()
@@ -0,0 +1,57 @@
+"""설정 로더 - 설정 클래스별로 처음 사용할 때 한 번만 생성"""
+import logging
+import threading
+from typing import Any, Dict, Generic, Type, TypeVar
+
+from pydantic_settings import BaseSettings
+
+logger = logging.getLogger(__name__)
+
+SettingsT = TypeVar("SettingsT", bound=BaseSettings)
+
+_settings_cache: Dict[type, BaseSettings] = {}
+_settings_lock = threading.Lock()
+
+
+def load_settings(settings_cls: Type[SettingsT]) -> SettingsT:
+    """설정 인스턴스 반환 - 최초 호출 시에만 환경변수/.env를 읽음"""
+    settings = _settings_cache.get(settings_cls)
+    if settings is None:
+        with _settings_lock:
+            settings = _settings_cache.get(settings_cls)
+            if settings is None:
+                settings = settings_cls()
+                _settings_cache[settings_cls] = settings
+                logger.debug(f"설정 로드: {settings_cls.__name__}")
+    return settings
+
+
+def clear_settings_cache() -> None:
+    """캐시된 설정 폐기 (테스트용) - 다음 접근 시 다시 로드"""
+    with _settings_lock:
+        _settings_cache.clear()
+
+
+class LazySettings(Generic[SettingsT]):
+    """
+    모듈 전역 설정 프록시.
+
+    임포트 시점에는 아무것도 읽지 않고, 처음 속성에 접근할 때 load_settings로 로드한 인스턴스에 위임합니다.
+    """
+
+    __slots__ = ("_settings_cls",)
+
+    def __init__(self, settings_cls: Type[SettingsT]):
+        object.__setattr__(self, "_settings_cls", settings_cls)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(load_settings(self._settings_cls), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(load_settings(self._settings_cls), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(load_settings(self._settings_cls), name)
+
+    def __repr__(self) -> str:
+        return f"LazySettings({self._settings_cls.__name__})"
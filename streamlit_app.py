@@ -30,8 +30,8 @@ st.set_page_config(
 def init_chatbot():
     """챗봇 서비스 초기화 (의존성 주입)"""
     try:
-        from src.chatbot.container import chatbot_container
-        return chatbot_container.service()
+        from src.container import get_container
+        return get_container().chatbot.service()
     except Exception as e:
         st.error(f"챗봇 초기화 실패: {e}")
         return None
@@ -39,7 +39,12 @@ def init_chatbot():
 
 def check_environment():
     """환경 설정 체크"""
-    if not os.getenv("OPENAI_API_KEY"):
+    from src.model.settings import model_settings
+    if model_settings.llm_provider == "fake" or model_settings.openai_base_url:
+        # 가짜 모델, 로컬 OpenAI 호환 서버(키가 없으면 자리표시 키 사용)는 키 확인 생략
+        return
+    
+    if not (model_settings.openai_api_key or os.getenv("OPENAI_API_KEY")):
         st.error("❌ OpenAI API 키가 설정되지 않았습니다!")
         st.info("📝 .env 파일에 OPENAI_API_KEY=your_api_key_here를 추가해주세요")
         st.stop()
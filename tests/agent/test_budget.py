@@ -0,0 +1,168 @@
+"""요청 실행 예산 단위테스트."""
+
+import asyncio
+import time
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langchain_core.runnables import RunnableLambda
+from src.agent.budget import REASON_DEADLINE, REASON_MAX_STEPS, RequestBudget
+from src.agent.events import EVENT_PARTIAL
+from src.agent.nodes import ToolNode
+from src.agent.service import AgentService
+from src.agent.settings import agent_settings
+from src.utils.metrics import metrics
+
+
+def tool_call_message(index):
+    """계산기 도구를 호출하는 AI 메시지"""
+    return AIMessage(
+        content="",
+        tool_calls=[{"name": "calculator", "args": {"expression": f"{index} + 1"}, "id": f"call_{index}"}],
+    )
+
+
+class TestRequestBudget:
+    """RequestBudget 테스트"""
+
+    def test_unlimited_without_config(self):
+        """설정이 없으면 제한이 없는지 테스트"""
+        budget = RequestBudget.from_config(None)
+
+        assert budget.remaining() is None
+        assert not budget.expired()
+        assert budget.limit_timeout(15.0) == 15.0
+        assert not budget.steps_exhausted([tool_call_message(i) for i in range(10)])
+
+    def test_timeout_limited_by_remaining_time(self):
+        """개별 타임아웃이 남은 시간으로 제한되는지 테스트"""
+        budget = RequestBudget.from_config({"configurable": RequestBudget.start(1.0, None).to_configurable()})
+
+        assert budget.limit_timeout(15.0) <= 1.0
+        assert budget.limit_timeout(0.1) == 0.1
+        assert RequestBudget(deadline=time.monotonic() - 1).expired()
+
+    def test_steps_counted_within_current_turn(self):
+        """현재 턴의 agent 응답만 스텝으로 세는지 테스트"""
+        messages = [
+            HumanMessage(content="이전 질문"), AIMessage(content="이전 답변"),
+            HumanMessage(content="질문"), tool_call_message(0),
+            ToolMessage(content="1", tool_call_id="call_0"),
+        ]
+        budget = RequestBudget(max_steps=2)
+
+        assert budget.steps_used(messages) == 1
+        assert not budget.steps_exhausted(messages)
+        assert budget.steps_exhausted(messages + [tool_call_message(1)])
+
+    def test_partial_answer_includes_tool_results(self):
+        """부분 답변에 현재 턴의 성공한 도구 결과가 포함되는지 테스트"""
+        messages = [
+            HumanMessage(content="질문"), tool_call_message(0),
+            ToolMessage(content="AAPL 현재가 $190", tool_call_id="call_0"),
+            ToolMessage(content="실패", tool_call_id="call_1", status="error"),
+        ]
+
+        answer = RequestBudget().partial_answer(messages, REASON_DEADLINE)
+
+        assert "제한 시간" in answer.content
+        assert "AAPL 현재가 $190" in answer.content
+        assert "실패" not in answer.content
+        assert answer.response_metadata[RequestBudget.PARTIAL_ANSWER_KEY] == REASON_DEADLINE
+
+
+class TestToolNodeDeadline:
+    """ToolNode 마감 시간 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_tool_timeout_limited_by_deadline(self):
+        """도구 타임아웃보다 요청 마감이 먼저면 마감에 맞춰 중단되는지 테스트"""
+        async def hang(args, config=None):
+            await asyncio.sleep(1.0)
+
+        tool = MagicMock()
+        tool.name = "hang"
+        tool.ainvoke = AsyncMock(side_effect=hang)
+        tool_node = ToolNode([tool], tool_timeout=15.0)
+        config = {"configurable": RequestBudget.start(0.05, None).to_configurable()}
+
+        start = time.perf_counter()
+        result = await tool_node({"messages": [AIMessage(
+            content="", tool_calls=[{"name": "hang", "args": {}, "id": "call_0"}]
+        )]}, config)
+
+        assert time.perf_counter() - start < 0.5
+        assert result["messages"][0].status == "error"
+
+
+class TestAgentServiceBudget:
+    """AgentService 요청 예산 테스트 (실제 그래프 + 가짜 모델)"""
+
+    @pytest.fixture
+    def mock_model_execution_service(self):
+        """Mock ModelExecutionService 생성"""
+        return AsyncMock()
+
+    @pytest.fixture
+    def agent_service(self, mock_model_execution_service):
+        """AgentService 인스턴스 생성 (빠른 경로/직접 반환 비활성화)"""
+        service = AgentService(mock_model_execution_service)
+        service.router = None
+        service.tool_node.direct_return_policy = None
+        return service
+
+    @pytest.mark.asyncio
+    async def test_step_budget_returns_partial_answer(self, agent_service, mock_model_execution_service, monkeypatch):
+        """도구 호출만 반복하는 모델이 스텝 예산에서 멈추고 부분 답변을 주는지 테스트"""
+        monkeypatch.setattr(agent_settings, "max_agent_steps", 2)
+        calls = []
+
+        def looping_model(messages):
+            calls.append(messages)
+            return tool_call_message(len(calls))
+
+        mock_model_execution_service.load_tool_bound_model.return_value = RunnableLambda(looping_model)
+        before = metrics.get_counter(f"agent.budget.{REASON_MAX_STEPS}_exhausted_total")
+
+        chunks = [chunk async for chunk in agent_service.stream_response("계산해줘", "budget_steps")]
+
+        assert len(calls) == 2
+        assert len(chunks) == 1
+        assert "중간에 멈췄습니다" in chunks[0]
+        assert "- 2" in chunks[0] and "- 3" in chunks[0]
+        assert metrics.get_counter(f"agent.budget.{REASON_MAX_STEPS}_exhausted_total") == before + 1
+
+    @pytest.mark.asyncio
+    async def test_deadline_cuts_slow_llm_call(self, agent_service, mock_model_execution_service):
+        """LLM 호출이 요청 마감을 넘기면 기다리지 않고 부분 답변을 주는지 테스트"""
+        async def slow_model(messages):
+            await asyncio.sleep(1.0)
+            return AIMessage(content="늦은 답변")
+
+        mock_model_execution_service.load_tool_bound_model.return_value = RunnableLambda(slow_model)
+
+        start = time.perf_counter()
+        chunks = [chunk async for chunk in agent_service.stream_response("질문", "budget_deadline", timeout=0.05)]
+
+        assert time.perf_counter() - start < 0.5
+        assert len(chunks) == 1
+        assert "제한 시간" in chunks[0]
+
+        # 부분 답변도 히스토리에 남아 다음 턴이 이어짐
+        state = await agent_service.agent.aget_state({"configurable": {"thread_id": "budget_deadline"}})
+        assert state.values["messages"][-1].content == chunks[0]
+
+    @pytest.mark.asyncio
+    async def test_partial_answer_marked_with_event(self, agent_service, mock_model_execution_service):
+        """부분 답변 앞에 partial 이벤트가 오는지 테스트 (응답 캐시 저장 제외 기준)"""
+        async def slow_model(messages):
+            await asyncio.sleep(1.0)
+            return AIMessage(content="늦은 답변")
+
+        mock_model_execution_service.load_tool_bound_model.return_value = RunnableLambda(slow_model)
+
+        events = [event async for event in agent_service.stream_events("질문", "budget_partial", timeout=0.05)]
+
+        assert [event.type for event in events] == [EVENT_PARTIAL, "token"]
+        assert events[0].data == {"reason": REASON_DEADLINE}
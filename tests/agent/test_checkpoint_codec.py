@@ -0,0 +1,171 @@
+"""Checkpoint codec 단위테스트."""
+
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, RemoveMessage, ToolMessage
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from src.agent.checkpoint_codec import MESSAGE_REFS, MessageDeltaCodec
+from src.agent.checkpointer import BoundedMemorySaver
+from src.agent.sqlite_checkpointer import SqliteCheckpointSaver
+from tests.agent.test_checkpointer import build_echo_graph, run_turn
+
+
+class TestMessageDeltaCodec:
+    """MessageDeltaCodec 테스트"""
+
+    @pytest.fixture
+    def codec(self):
+        """MessageDeltaCodec 인스턴스 생성"""
+        return MessageDeltaCodec(JsonPlusSerializer(), cache_size=16)
+
+    def test_roundtrip(self, codec):
+        """인코딩한 메시지가 그대로 복원되는지 테스트"""
+        messages = [
+            HumanMessage(content="안녕", id="1"),
+            AIMessage(content="", id="2", tool_calls=[{"name": "calculator", "args": {"expression": "1+1"}, "id": "c1"}]),
+            ToolMessage(content="x" * 100, tool_call_id="c1", id="3"),
+        ]
+        encoded, bodies = codec.encode({"messages": messages, "other": 1})
+
+        assert encoded["other"] == 1
+        assert len(encoded["messages"][MESSAGE_REFS]) == 3
+
+        # 캐시가 없는 새 코덱으로 본문에서 복원
+        fresh = MessageDeltaCodec(JsonPlusSerializer(), cache_size=16)
+        decoded = fresh.decode(encoded, lambda keys: {key: bodies[key] for key in keys})
+        assert decoded["messages"] == messages
+
+    def test_long_content_interned_across_messages(self, codec):
+        """ID가 다른 메시지의 같은 긴 내용은 한 번만 저장되는지 테스트"""
+        content = "주식 분석 결과 " * 20
+        _, bodies = codec.encode({"messages": [
+            ToolMessage(content=content, tool_call_id="a", id="1"),
+            ToolMessage(content=content, tool_call_id="b", id="2"),
+        ]})
+
+        # 메시지 본문 2개 + 공유 내용 1개
+        assert len(bodies) == 3
+
+    def test_only_new_messages_serialized(self, codec):
+        """이미 인코딩한 메시지 객체는 다시 직렬화하지 않는지 테스트"""
+        messages = [HumanMessage(content="질문", id="1"), AIMessage(content="답변", id="2")]
+        codec.encode({"messages": messages})
+
+        appended = messages + [HumanMessage(content="다음 질문", id="3")]
+        with patch.object(codec.serde, "dumps_typed", wraps=codec.serde.dumps_typed) as dumps:
+            codec.encode({"messages": appended})
+
+        assert dumps.call_count == 1
+
+    def test_missing_body_raises(self, codec):
+        """본문이 없으면 예외가 발생하는지 테스트"""
+        encoded, _ = codec.encode({"messages": [HumanMessage(content="안녕", id="1")]})
+        fresh = MessageDeltaCodec(JsonPlusSerializer(), cache_size=16)
+
+        with pytest.raises(KeyError):
+            fresh.decode(encoded, lambda keys: {})
+
+
+class TestDeltaEncodedCheckpointers:
+    """델타 인코딩을 사용하는 체크포인터 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_memory_saver_stores_each_message_once(self):
+        """인메모리 체크포인터가 메시지 본문을 한 번씩만 보관하는지 테스트"""
+        saver = BoundedMemorySaver(max_checkpoints_per_thread=10, delta_encoding=True)
+        graph = build_echo_graph(saver)
+
+        for i in range(5):
+            result = await run_turn(graph, "thread_1", f"질문 {i}")
+
+        assert len(result["messages"]) == 10
+        assert len(saver._message_bodies) == 10
+
+        saver.delete_thread("thread_1")
+        assert saver._message_bodies == {}
+
+    @pytest.mark.asyncio
+    async def test_sqlite_saver_stores_each_message_once(self, tmp_path):
+        """SQLite 체크포인터가 메시지 본문을 한 번씩만 저장하고 새 인스턴스에서 복원하는지 테스트"""
+        path = str(tmp_path / "checkpoints.sqlite")
+        saver = SqliteCheckpointSaver(path=path, delta_encoding=True)
+        graph = build_echo_graph(saver)
+
+        for i in range(3):
+            await run_turn(graph, "thread_1", f"질문 {i}")
+
+        with sqlite3.connect(path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM messages").fetchone()[0] == 6
+
+        reopened = SqliteCheckpointSaver(path=path, delta_encoding=True)
+        state = await build_echo_graph(reopened).aget_state({"configurable": {"thread_id": "thread_1"}})
+        assert [message.content for message in state.values["messages"]][-2:] == ["질문 2", "echo: 질문 2"]
+
+        reopened.delete_thread("thread_1")
+        with sqlite3.connect(path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM messages").fetchone()[0] == 0
+
+    async def run_turns_removing_first(self, saver):
+        """긴 내용이 담긴 첫 턴을 RemoveMessage로 지운 뒤 턴을 더 실행하고 최종 메시지 목록 반환"""
+        graph = build_echo_graph(saver)
+        config = {"configurable": {"thread_id": "thread_1"}}
+        result = await run_turn(graph, "thread_1", "긴 질문 " * 20)
+        await run_turn(graph, "thread_1", "질문 1")
+
+        # 취소 롤백이나 히스토리 정리처럼 메시지 삭제
+        await graph.aupdate_state(
+            config, {"messages": [RemoveMessage(id=message.id) for message in result["messages"]]}, as_node="agent"
+        )
+        for i in range(2, 4):
+            await run_turn(graph, "thread_1", f"질문 {i}")
+
+        state = await graph.aget_state(config)
+        return state.values["messages"]
+
+    @pytest.mark.asyncio
+    async def test_memory_saver_releases_removed_messages(self):
+        """정리된 체크포인트만 참조하던 메시지 본문(분리한 긴 내용 포함)이 해제되는지 테스트"""
+        saver = BoundedMemorySaver(max_checkpoints_per_thread=2, delta_encoding=True)
+
+        messages = await self.run_turns_removing_first(saver)
+
+        assert [message.content for message in messages][0] == "질문 1"
+        assert len(saver._message_bodies) == len(messages)
+        assert len(saver._thread_messages["thread_1"]) == len(messages)
+
+    @pytest.mark.asyncio
+    async def test_sqlite_saver_releases_removed_messages(self, tmp_path):
+        """SQLite 체크포인터가 남은 체크포인트가 참조하지 않는 본문을 삭제하는지 테스트"""
+        path = str(tmp_path / "checkpoints.sqlite")
+        saver = SqliteCheckpointSaver(path=path, delta_encoding=True, max_checkpoints_per_thread=2)
+
+        messages = await self.run_turns_removing_first(saver)
+
+        with sqlite3.connect(path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM messages").fetchone()[0] == len(messages)
+            assert conn.execute("SELECT COUNT(*) FROM thread_messages").fetchone()[0] == len(messages)
+
+        # 새 워커에서도 남은 대화가 복원됨
+        reopened = SqliteCheckpointSaver(path=path, delta_encoding=True)
+        state = await build_echo_graph(reopened).aget_state({"configurable": {"thread_id": "thread_1"}})
+        assert state.values["messages"] == messages
+
+    @pytest.mark.asyncio
+    async def test_sqlite_rewrites_body_collected_by_other_worker(self, tmp_path):
+        """다른 워커가 정리한 내용 본문이 다시 등장하면 기록한 키를 믿지 않고 다시 저장하는지 테스트"""
+        path = str(tmp_path / "checkpoints.sqlite")
+        first = SqliteCheckpointSaver(path=path, delta_encoding=True, max_checkpoints_per_thread=2)
+        second = SqliteCheckpointSaver(path=path, delta_encoding=True, max_checkpoints_per_thread=2)
+        await run_turn(build_echo_graph(first), "thread_1", "긴 질문 " * 20)
+
+        # 두 번째 워커가 첫 턴을 지우고 이어가면서 본문을 정리
+        await self.run_turns_removing_first(second)
+
+        # 첫 번째 워커에서 같은 긴 내용을 다시 보냄
+        await run_turn(build_echo_graph(first), "thread_1", "긴 질문 " * 20)
+
+        reopened = SqliteCheckpointSaver(path=path, delta_encoding=True)
+        state = await build_echo_graph(reopened).aget_state({"configurable": {"thread_id": "thread_1"}})
+        assert state.values["messages"][-2].content == "긴 질문 " * 20
@@ -0,0 +1,145 @@
+"""Agent checkpointer 단위테스트."""
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.graph import StateGraph
+from src.agent.checkpointer import BoundedMemorySaver
+from src.agent.nodes import LangGraphAgentState
+
+
+class FakeClock:
+    """테스트용 시계"""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+def build_echo_graph(checkpointer):
+    """사용자 메시지에 답하는 간단한 그래프 생성"""
+    async def echo(state):
+        return {"messages": [AIMessage(content=f"echo: {state['messages'][-1].content}")]}
+    
+    return (
+        StateGraph(LangGraphAgentState)
+        .add_node("agent", echo)
+        .set_entry_point("agent")
+        .compile(checkpointer=checkpointer)
+    )
+
+
+async def run_turn(graph, thread_id, text):
+    """한 턴 실행"""
+    config = {"configurable": {"thread_id": thread_id}}
+    return await graph.ainvoke({"messages": [HumanMessage(content=text)]}, config=config)
+
+
+class TestBoundedMemorySaver:
+    """BoundedMemorySaver 테스트"""
+    
+    @pytest.fixture
+    def clock(self):
+        """가짜 시계"""
+        return FakeClock()
+    
+    @pytest.fixture
+    def checkpointer(self, clock):
+        """BoundedMemorySaver 인스턴스 생성"""
+        return BoundedMemorySaver(
+            max_checkpoints_per_thread=2,
+            session_timeout=60,
+            max_memory_bytes=10 * 1024 * 1024,
+            clock=clock,
+        )
+    
+    @pytest.mark.asyncio
+    async def test_keeps_latest_checkpoints_only(self, checkpointer):
+        """스레드별 최신 N개 체크포인트만 보관하는지 테스트"""
+        graph = build_echo_graph(checkpointer)
+        
+        for i in range(5):
+            result = await run_turn(graph, "thread_1", f"질문 {i}")
+        
+        # 대화 상태는 온전히 유지
+        assert len(result["messages"]) == 10
+        assert result["messages"][-1].content == "echo: 질문 4"
+        assert len(checkpointer.storage["thread_1"][""]) == 2
+        
+        # 남은 체크포인트가 참조하지 않는 채널 값은 삭제
+        state = await graph.aget_state({"configurable": {"thread_id": "thread_1"}})
+        assert len(state.values["messages"]) == 10
+        assert len(checkpointer._blob_keys["thread_1"]) < 5 * 3
+    
+    @pytest.mark.asyncio
+    async def test_idle_threads_evicted_after_timeout(self, checkpointer, clock):
+        """세션 타임아웃이 지난 스레드가 삭제되는지 테스트"""
+        graph = build_echo_graph(checkpointer)
+        await run_turn(graph, "old", "안녕")
+        
+        clock.now = 120
+        await run_turn(graph, "new", "안녕")
+        
+        assert "old" not in checkpointer.storage
+        assert "new" in checkpointer.storage
+        assert checkpointer.get_memory_usage()["thread_count"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_memory_cap_evicts_least_recently_used(self, clock):
+        """메모리 상한 초과 시 LRU 스레드가 삭제되는지 테스트"""
+        checkpointer = BoundedMemorySaver(
+            max_checkpoints_per_thread=2, session_timeout=3600, max_memory_bytes=1, clock=clock
+        )
+        graph = build_echo_graph(checkpointer)
+        
+        await run_turn(graph, "first", "안녕")
+        clock.now = 1
+        await run_turn(graph, "second", "안녕")
+        
+        assert "first" not in checkpointer.storage
+        assert "second" in checkpointer.storage
+    
+    @pytest.mark.asyncio
+    async def test_eviction_notifies_callback(self, clock):
+        """타임아웃/메모리 상한으로 퇴출한 스레드를 on_evict로 알리는지 테스트"""
+        checkpointer = BoundedMemorySaver(
+            max_checkpoints_per_thread=2, session_timeout=60, max_memory_bytes=1, clock=clock
+        )
+        evicted = []
+        checkpointer.on_evict = evicted.append
+        graph = build_echo_graph(checkpointer)
+        
+        await run_turn(graph, "first", "안녕")
+        clock.now = 1
+        await run_turn(graph, "second", "안녕")
+        clock.now = 120
+        await run_turn(graph, "third", "안녕")
+        
+        assert evicted == ["first", "second"]
+    
+    @pytest.mark.asyncio
+    async def test_memory_usage_report(self, checkpointer):
+        """메모리 사용량 보고 테스트"""
+        graph = build_echo_graph(checkpointer)
+        await run_turn(graph, "thread_1", "안녕")
+        await run_turn(graph, "thread_2", "안녕하세요")
+        
+        usage = checkpointer.get_memory_usage()
+        
+        assert usage["thread_count"] == 2
+        assert set(usage["threads"]) == {"thread_1", "thread_2"}
+        assert usage["total_bytes"] == sum(usage["threads"].values()) > 0
+    
+    @pytest.mark.asyncio
+    async def test_delete_thread(self, checkpointer):
+        """스레드 삭제 테스트"""
+        graph = build_echo_graph(checkpointer)
+        await run_turn(graph, "thread_1", "안녕")
+        
+        checkpointer.delete_thread("thread_1")
+        
+        assert "thread_1" not in checkpointer.storage
+        assert not any(key[0] == "thread_1" for key in checkpointer.blobs)
+        assert not any(key[0] == "thread_1" for key in checkpointer.writes)
+        assert checkpointer.total_bytes == 0
@@ -0,0 +1,130 @@
+"""Agent history 단위테스트."""
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+from src.agent.history import HistoryManager, TokenEstimator
+
+
+def make_turn(index, with_tool=False):
+    """사용자 질문 + (도구 호출/결과) + 답변으로 이루어진 한 턴 생성"""
+    messages = [HumanMessage(content=f"질문 {index} " + "x" * 200, id=f"h{index}")]
+    if with_tool:
+        messages.append(AIMessage(
+            content="",
+            tool_calls=[{"name": "get_stock_price", "args": {"ticker": "AAPL"}, "id": f"call_{index}"}],
+            id=f"tc{index}",
+        ))
+        messages.append(ToolMessage(
+            content="The current stock price of AAPL is $150.00",
+            tool_call_id=f"call_{index}",
+            name="get_stock_price",
+            id=f"t{index}",
+        ))
+    messages.append(AIMessage(content=f"답변 {index} " + "y" * 200, id=f"a{index}"))
+    return messages
+
+
+class TestTokenEstimator:
+    """TokenEstimator 테스트"""
+    
+    def test_estimate_text(self):
+        """ASCII/비ASCII 토큰 추정 테스트"""
+        estimator = TokenEstimator()
+        
+        assert estimator.estimate_text("") == 0
+        assert estimator.estimate_text("abcdefgh") == 2
+        assert estimator.estimate_text("주가") == 2
+    
+    def test_estimate_message_includes_tool_calls(self):
+        """도구 호출 인자가 포함되는지 테스트"""
+        estimator = TokenEstimator()
+        plain = AIMessage(content="")
+        with_call = AIMessage(
+            content="",
+            tool_calls=[{"name": "calculator", "args": {"expression": "1 + 2"}, "id": "c"}],
+        )
+        
+        assert estimator.estimate_message(with_call) > estimator.estimate_message(plain)
+
+
+class TestHistoryManager:
+    """HistoryManager 테스트"""
+    
+    @pytest.fixture
+    def history_manager(self):
+        """작은 예산의 HistoryManager 생성"""
+        return HistoryManager(token_budget=400, max_messages=50, summary_max_tokens=100)
+    
+    def test_short_history_kept_verbatim(self, history_manager):
+        """예산 안의 히스토리는 그대로 유지되는지 테스트"""
+        messages = make_turn(0)
+        
+        result = history_manager.prepare("시스템", messages, "thread")
+        
+        assert isinstance(result[0], SystemMessage)
+        assert result[0].content == "시스템"
+        assert result[1:] == messages
+    
+    def test_long_history_is_trimmed_with_summary(self, history_manager):
+        """예산을 넘는 히스토리가 요약과 최근 턴으로 줄어드는지 테스트"""
+        messages = [m for i in range(6) for m in make_turn(i)]
+        
+        result = history_manager.prepare("시스템", messages, "thread")
+        estimator = TokenEstimator()
+        
+        assert HistoryManager.SUMMARY_HEADER in result[0].content
+        assert "답변 4" in result[0].content  # 가장 최근에 접힌 턴은 요약에 남음
+        assert result[-1] == messages[-1]
+        assert isinstance(result[1], HumanMessage)
+        assert estimator.estimate_messages(result) <= 400 + 100
+    
+    def test_tool_call_never_split_from_tool_message(self, history_manager):
+        """도구 호출과 결과가 분리되지 않는지 테스트"""
+        messages = [m for i in range(6) for m in make_turn(i, with_tool=True)]
+        
+        result = history_manager.prepare("시스템", messages, "thread")
+        kept = result[1:]
+        
+        assert isinstance(kept[0], HumanMessage)
+        call_ids = {c["id"] for m in kept if isinstance(m, AIMessage) for c in m.tool_calls}
+        result_ids = {m.tool_call_id for m in kept if isinstance(m, ToolMessage)}
+        assert call_ids == result_ids
+    
+    def test_last_turn_kept_even_over_budget(self):
+        """마지막 턴은 예산을 넘어도 유지되는지 테스트"""
+        history_manager = HistoryManager(token_budget=10, summary_max_tokens=5)
+        messages = make_turn(0) + make_turn(1, with_tool=True)
+        
+        result = history_manager.prepare("시스템", messages, "thread")
+        
+        assert result[1:] == make_turn(1, with_tool=True)
+    
+    def test_rolling_summary_is_cached_and_stable(self, history_manager):
+        """요약이 캐시되고 자르는 위치가 유지되는지 테스트"""
+        messages = [m for i in range(6) for m in make_turn(i)]
+        first = history_manager.prepare("시스템", messages, "thread")
+        
+        # 다음 스텝: 짧은 메시지 추가 - 자르는 위치는 그대로
+        messages.append(HumanMessage(content="짧은 질문", id="h_next"))
+        second = history_manager.prepare("시스템", messages, "thread")
+        
+        assert second[0].content == first[0].content
+        assert second[1:-1] == first[1:]
+    
+    def test_max_messages_enforced(self):
+        """최대 메시지 수 제한 테스트"""
+        history_manager = HistoryManager(token_budget=100000, max_messages=4, summary_max_tokens=100)
+        messages = [m for i in range(5) for m in make_turn(i)]
+        
+        result = history_manager.prepare("시스템", messages, "thread")
+        
+        assert len(result) - 1 <= 4
+    
+    def test_clear_removes_cached_summary(self, history_manager):
+        """요약 캐시 삭제 테스트"""
+        messages = [m for i in range(6) for m in make_turn(i)]
+        history_manager.prepare("시스템", messages, "thread")
+        
+        history_manager.clear("thread")
+        
+        assert "thread" not in history_manager._summaries
@@ -1,5 +1,8 @@
 """Agent nodes 단위테스트."""
 
+import asyncio
+import time
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from langchain_core.messages import HumanMessage, AIMessage, ToolMessage
@@ -76,22 +79,21 @@ class TestAgentNode:
         """채팅 모델 로딩 성공 테스트"""
         # Mock 설정
         mock_llm = MagicMock()
-        mock_llm.bind_tools.return_value = mock_llm
-        mock_model_execution_service.load_llm_model.return_value = mock_llm
+        mock_model_execution_service.load_tool_bound_model.return_value = mock_llm
         
         # 테스트 실행
         result = await agent_node.load_chat_model()
         
         # 검증
         assert result == mock_llm
-        mock_model_execution_service.load_llm_model.assert_called_once_with(1)
-        mock_llm.bind_tools.assert_called_once()
+        mock_model_execution_service.load_tool_bound_model.assert_called_once()
+        assert mock_model_execution_service.load_tool_bound_model.call_args.args[0] == 1
     
     @pytest.mark.asyncio
     async def test_load_chat_model_error(self, agent_node, mock_model_execution_service):
         """채팅 모델 로딩 에러 테스트"""
         # Mock 설정 - 에러 발생
-        mock_model_execution_service.load_llm_model.side_effect = Exception("모델 로딩 실패")
+        mock_model_execution_service.load_tool_bound_model.side_effect = Exception("모델 로딩 실패")
         
         # 테스트 실행
         result = await agent_node.load_chat_model()
@@ -257,3 +259,93 @@ class TestToolNode:
         
         with pytest.raises(ToolCallException, match="도구를 찾을 수 없습니다: non_existent_tool"):
             await tool_node(state)
+
+
+class TestToolNodeConcurrency:
+    """ToolNode 동시 실행 테스트"""
+    
+    def _make_tool(self, name, delay=0.0, result=None, error=None):
+        """지연/에러를 주입할 수 있는 Mock 도구 생성"""
+        async def ainvoke(args, config=None):
+            await asyncio.sleep(delay)
+            if error:
+                raise error
+            return result or f"{name} 결과"
+        
+        tool = MagicMock()
+        tool.name = name
+        tool.ainvoke = AsyncMock(side_effect=ainvoke)
+        return tool
+    
+    def _make_state(self, *names):
+        """도구 호출 메시지가 담긴 상태 생성"""
+        message = AIMessage(
+            content="",
+            tool_calls=[
+                {"name": name, "args": {}, "id": f"call_{i}"}
+                for i, name in enumerate(names)
+            ]
+        )
+        return {"messages": [message]}
+    
+    @pytest.mark.asyncio
+    async def test_tool_calls_run_concurrently_in_order(self):
+        """도구 호출이 동시에 실행되고 원래 순서로 반환되는지 테스트"""
+        tools = [
+            self._make_tool("slow", delay=0.2),
+            self._make_tool("fast", delay=0.05),
+            self._make_tool("medium", delay=0.1),
+        ]
+        tool_node = ToolNode(tools, max_concurrency=3)
+        
+        start = time.perf_counter()
+        result = await tool_node(self._make_state("slow", "fast", "medium"))
+        elapsed = time.perf_counter() - start
+        
+        assert elapsed < 0.3
+        assert [m.tool_call_id for m in result["messages"]] == ["call_0", "call_1", "call_2"]
+        assert [m.name for m in result["messages"]] == ["slow", "fast", "medium"]
+    
+    @pytest.mark.asyncio
+    async def test_concurrency_limit(self):
+        """동시 실행 제한 테스트"""
+        tools = [self._make_tool("a", delay=0.1), self._make_tool("b", delay=0.1)]
+        tool_node = ToolNode(tools, max_concurrency=1)
+        
+        start = time.perf_counter()
+        await tool_node(self._make_state("a", "b"))
+        
+        assert time.perf_counter() - start >= 0.2
+    
+    def test_invalid_concurrency_rejected(self):
+        """동시 실행 수 0을 기본값으로 바꾸지 않고 거부하는지 테스트"""
+        with pytest.raises(ValueError, match="1 이상"):
+            ToolNode([self._make_tool("a")], max_concurrency=0)
+    
+    @pytest.mark.asyncio
+    async def test_failing_tool_returns_error_message(self):
+        """실패한 도구가 에러 ToolMessage로 반환되는지 테스트"""
+        tools = [
+            self._make_tool("ok", result="정상"),
+            self._make_tool("broken", error=RuntimeError("yfinance 오류")),
+        ]
+        tool_node = ToolNode(tools)
+        
+        result = await tool_node(self._make_state("ok", "broken"))
+        
+        ok_message, error_message = result["messages"]
+        assert ok_message.content == "정상"
+        assert ok_message.status == "success"
+        assert error_message.status == "error"
+        assert "yfinance 오류" in error_message.content
+        assert error_message.tool_call_id == "call_1"
+    
+    @pytest.mark.asyncio
+    async def test_tool_timeout_returns_error_message(self):
+        """도구 타임아웃 테스트"""
+        tool_node = ToolNode([self._make_tool("hang", delay=1.0)], tool_timeout=0.05)
+        
+        result = await tool_node(self._make_state("hang"))
+        
+        assert result["messages"][0].status == "error"
+        assert "시간이 초과" in result["messages"][0].content
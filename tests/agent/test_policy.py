@@ -0,0 +1,104 @@
+"""Agent direct-return policy 단위테스트."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from decimal import Decimal
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from src.agent.graph import LangGraphBuilder
+from src.agent.nodes import ToolNode
+from src.agent.policy import DirectReturnPolicy
+from src.tools.entities import StockPrice
+from src.tools.service import StockPriceService
+
+
+def make_state(user_input, *tool_names):
+    """사용자 질문과 도구 호출 메시지가 담긴 상태 생성"""
+    call_message = AIMessage(
+        content="",
+        tool_calls=[
+            {"name": name, "args": {"ticker": "aapl"}, "id": f"call_{i}"}
+            for i, name in enumerate(tool_names)
+        ]
+    )
+    return {"messages": [HumanMessage(content=user_input), call_message]}
+
+
+def make_tool(name, result="The current stock price of AAPL is $150.00"):
+    """Mock 도구 생성"""
+    tool = MagicMock()
+    tool.name = name
+    tool.ainvoke = AsyncMock(return_value=result)
+    return tool
+
+
+class TestDirectReturnPolicy:
+    """DirectReturnPolicy 테스트"""
+    
+    @pytest.fixture
+    def policy(self):
+        """DirectReturnPolicy 인스턴스 생성"""
+        return DirectReturnPolicy(tool_names=["get_stock_price"])
+    
+    @pytest.mark.parametrize("text, expected", [
+        ("Apple 주식 지금 얼마에 거래돼?", True),
+        ("테슬라 주가 궁금해", True),
+        ("AAPL 10주 사면 얼마야?", False),
+        ("애플과 테슬라 비교해줘", False),
+        ("엔비디아 주가 전망은?", False),
+    ])
+    def test_is_plain_lookup(self, policy, text, expected):
+        """단순 조회 판별 테스트"""
+        assert policy.is_plain_lookup(text) is expected
+    
+    def test_should_return_directly(self, policy):
+        """허용된 도구 1회 호출 + 단순 조회 + 성공 결과일 때만 직접 반환하는지 테스트"""
+        success = [ToolMessage(content="ok", tool_call_id="call_0", name="get_stock_price")]
+        error = [ToolMessage(content="오류", tool_call_id="call_0", name="get_stock_price", status="error")]
+        
+        assert policy.should_return_directly(make_state("애플 주가 궁금해", "get_stock_price")["messages"], success)
+        assert not policy.should_return_directly(make_state("애플 주가 궁금해", "get_stock_price")["messages"], error)
+        assert not policy.should_return_directly(make_state("애플 주가 궁금해", "calculator")["messages"], success)
+        assert not policy.should_return_directly(
+            make_state("애플 주가 궁금해", "get_stock_price", "get_stock_price")["messages"], success * 2
+        )
+    
+    def test_render_stock_price_in_korean(self, policy):
+        """시세 조회 결과가 한국어 답변으로 변환되는지 테스트"""
+        state = make_state("애플 주가 궁금해", "get_stock_price")
+        quote = StockPrice(symbol="AAPL", price=Decimal("150.00"))
+        tool_message = ToolMessage(content="The current stock price of AAPL is $150.00", tool_call_id="call_0", name="get_stock_price")
+        
+        with patch("src.agent.policy.get_tool_service") as get_tool_service:
+            mock_tool_service = get_tool_service.return_value
+            mock_tool_service.get_thread_quotes.return_value = {"AAPL": quote}
+            mock_tool_service.stock_service = StockPriceService()
+            answer = policy.render(state["messages"][-1], tool_message, {"configurable": {"thread_id": "t1"}})
+        
+        assert answer.content == "AAPL의 현재 주가는 $150.00입니다."
+        assert DirectReturnPolicy.is_direct_answer(answer)
+
+
+class TestToolNodeDirectReturn:
+    """ToolNode 직접 반환 테스트"""
+    
+    @pytest.mark.asyncio
+    async def test_direct_answer_appended_and_graph_ends(self):
+        """직접 반환 시 최종 답변이 추가되고 그래프가 종료 방향으로 가는지 테스트"""
+        policy = DirectReturnPolicy(tool_names=["get_stock_price"], renderers={"get_stock_price": lambda c, t, cfg: "직접 답변"})
+        tool_node = ToolNode([make_tool("get_stock_price")], direct_return_policy=policy)
+        
+        result = await tool_node(make_state("애플 주가 궁금해", "get_stock_price"))
+        
+        assert [type(m) for m in result["messages"]] == [ToolMessage, AIMessage]
+        assert result["messages"][-1].content == "직접 답변"
+        assert LangGraphBuilder.tools_return_condition(result) == "__end__"
+    
+    @pytest.mark.asyncio
+    async def test_no_policy_returns_to_agent(self):
+        """정책이 없으면 도구 결과만 반환하고 agent로 돌아가는지 테스트"""
+        tool_node = ToolNode([make_tool("get_stock_price")])
+        
+        result = await tool_node(make_state("애플 주가 궁금해", "get_stock_price"))
+        
+        assert [type(m) for m in result["messages"]] == [ToolMessage]
+        assert LangGraphBuilder.tools_return_condition(result) == "agent"
@@ -0,0 +1,75 @@
+"""Agent intent router 단위테스트."""
+
+import pytest
+from src.agent.router import INTENT_CALCULATE, INTENT_STOCK_PRICE, IntentRouter, RoutedIntent
+from src.utils.metrics import metrics
+
+
+class TestIntentRouter:
+    """IntentRouter 테스트"""
+    
+    @pytest.fixture
+    def router(self):
+        """IntentRouter 인스턴스 생성"""
+        metrics.reset()
+        return IntentRouter()
+    
+    @pytest.mark.parametrize("text, expression", [
+        ("100 * 1.5는?", "100 * 1.5"),
+        ("2 + 3 * 4", "2 + 3 * 4"),
+        ("(10 + 5) / 3 계산해줘", "(10 + 5) / 3"),
+        ("2^10은 얼마야?", "2**10"),
+        ("37593 × 67 =", "37593 * 67"),
+    ])
+    def test_route_calculation(self, router, text, expression):
+        """순수 계산식 판별 테스트"""
+        assert router.route(text) == RoutedIntent(INTENT_CALCULATE, expression)
+    
+    @pytest.mark.parametrize("text, ticker", [
+        ("AAPL 주가 알려줘", "AAPL"),
+        ("TSLA 현재가?", "TSLA"),
+        ("애플 주가는?", "AAPL"),
+        ("엔비디아의 주가 알려주세요", "NVDA"),
+        ("마이크로소프트 시세 어때", "MSFT"),
+    ])
+    def test_route_stock_price(self, router, text, ticker):
+        """단일 종목 시세 질문 판별 테스트"""
+        assert router.route(text) == RoutedIntent(INTENT_STOCK_PRICE, ticker)
+    
+    @pytest.mark.parametrize("text", [
+        "AAPL과 TSLA 주가를 비교해줘",
+        "삼성전자 주가 알려줘",
+        "AAPL 주식 5주 사면 얼마야?",
+        "안녕하세요",
+        "42",
+        "그럼 두 배는?",
+        # 알려진 티커가 아닌 영문 단어, 소문자 입력
+        "gold 가격 알려줘",
+        "usd 가격",
+        "what 가격",
+        "USD 가격",
+        "tsla 현재가?",
+    ])
+    def test_unsure_inputs_fall_through(self, router, text):
+        """확신할 수 없는 입력은 판별하지 않는지 테스트"""
+        assert router.route(text) is None
+    
+    def test_custom_tickers(self):
+        """설정한 티커 목록으로 빠른 경로 대상을 넓힐 수 있는지 테스트"""
+        router = IntentRouter(tickers=["IBM"])
+        
+        assert router.route("IBM 주가 알려줘") == RoutedIntent(INTENT_STOCK_PRICE, "IBM")
+        assert router.route("애플 주가는?") == RoutedIntent(INTENT_STOCK_PRICE, "AAPL")
+        assert router.route("AAPL 주가 알려줘") == RoutedIntent(INTENT_STOCK_PRICE, "AAPL")
+        assert router.route("ORCL 주가 알려줘") is None
+    
+    def test_hit_rate_tracked(self, router):
+        """히트율 메트릭이 기록되는지 테스트"""
+        router.route("2 + 2")
+        router.route("AAPL 주가 알려줘")
+        router.route("안녕하세요")
+        router.route("오늘 시장 어때?")
+        
+        assert metrics.get_counter("agent.router.requests_total") == 4
+        assert metrics.get_counter("agent.router.hits_total") == 2
+        assert metrics.get_gauge("agent.router.hit_rate") == 0.5
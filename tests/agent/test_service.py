@@ -1,9 +1,72 @@
 """Agent service 단위테스트."""
 
+import asyncio
+
 import pytest
+from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
+from langchain_core.messages import AIMessage, AIMessageChunk, ToolMessage
+from langgraph.graph import StateGraph
+from src.agent.router import IntentRouter
 from src.agent.service import AgentService
+from src.agent.nodes import LangGraphAgentState
+from src.tools.entities import StockPrice
+from src.tools.service import StockPriceService
 from src.utils.exceptions import AgentException
+from src.utils.metrics import metrics
+from tests.agent.test_checkpointer import FakeClock, build_echo_graph, run_turn
+
+
+def make_stream_agent(items):
+    """messages 스트림 모드로 (청크, 메타데이터)를 내보내는 Mock 그래프 생성"""
+    async def astream(*args, **kwargs):
+        for item in items:
+            yield item
+    
+    mock_agent = MagicMock()
+    mock_agent.astream = MagicMock(side_effect=astream)
+    return mock_agent
+
+
+def build_hanging_graph(checkpointer, started):
+    """답변을 기록한 뒤 끝나지 않는 도구 노드에서 멈추는 그래프 생성"""
+    async def agent(state):
+        return {"messages": [AIMessage(content="", tool_calls=[{"name": "calculator", "args": {}, "id": "call_1"}])]}
+    
+    async def tools(state):
+        started.set()
+        await asyncio.sleep(60)
+        return {}
+    
+    return (
+        StateGraph(LangGraphAgentState)
+        .add_node("agent", agent)
+        .add_node("tools", tools)
+        .set_entry_point("agent")
+        .add_edge("agent", "tools")
+        .compile(checkpointer=checkpointer)
+    )
+
+
+async def cancel_turn(agent_service, thread_id, text):
+    """도구 실행 중에 턴을 취소"""
+    started = asyncio.Event()
+    agent_service.agent = build_hanging_graph(agent_service.checkpointer, started)
+    
+    async def consume():
+        async for _ in agent_service.stream_events(text, thread_id):
+            pass
+    
+    task = asyncio.ensure_future(consume())
+    await asyncio.wait_for(started.wait(), 5)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+def agent_token(content, **kwargs):
+    """agent 노드에서 나온 토큰 청크"""
+    return AIMessageChunk(content=content, **kwargs), {"langgraph_node": "agent"}
 
 
 class TestAgentService:
@@ -16,8 +79,10 @@ class TestAgentService:
     
     @pytest.fixture
     def agent_service(self, mock_model_execution_service):
-        """AgentService 인스턴스 생성"""
-        return AgentService(mock_model_execution_service)
+        """AgentService 인스턴스 생성 (그래프 경로 테스트를 위해 빠른 경로 비활성화)"""
+        service = AgentService(mock_model_execution_service)
+        service.router = None
+        return service
     
     def test_validate_input_valid(self, agent_service):
         """유효한 입력 검증 테스트"""
@@ -51,10 +116,10 @@ class TestAgentService:
     async def test_generate_response_success(self, agent_service, mock_model_execution_service):
         """응답 생성 성공 테스트"""
         # Mock 설정
-        mock_agent = AsyncMock()
-        mock_agent.astream.return_value = [
-            {"messages": [{"content": "안녕하세요! 주식 관련 질문이 있으시면 도와드리겠습니다."}]}
-        ]
+        mock_agent = make_stream_agent([
+            agent_token("안녕하세요! 주식 관련 질문이 있으시면"),
+            agent_token(" 도와드리겠습니다."),
+        ])
         agent_service.agent = mock_agent
         
         # 테스트 실행
@@ -74,12 +139,11 @@ class TestAgentService:
     async def test_stream_response_success(self, agent_service, mock_model_execution_service):
         """스트리밍 응답 성공 테스트"""
         # Mock 설정
-        mock_agent = AsyncMock()
-        mock_agent.astream.return_value = [
-            {"messages": [{"content": "안녕하세요!"}]},
-            {"messages": [{"content": " 주식 관련 질문이 있으시면"}]},
-            {"messages": [{"content": " 도와드리겠습니다."}]}
-        ]
+        mock_agent = make_stream_agent([
+            agent_token("안녕하세요!"),
+            agent_token(" 주식 관련 질문이 있으시면"),
+            agent_token(" 도와드리겠습니다."),
+        ])
         agent_service.agent = mock_agent
         
         # 테스트 실행
@@ -87,10 +151,21 @@ class TestAgentService:
         async for chunk in agent_service.stream_response("안녕하세요", "session_123"):
             chunks.append(chunk)
         
-        # 검증
-        assert len(chunks) > 0
-        assert any("안녕하세요!" in chunk for chunk in chunks)
+        # 검증 - 토큰 단위로 그대로 전달
+        assert chunks == ["안녕하세요!", " 주식 관련 질문이 있으시면", " 도와드리겠습니다."]
         mock_agent.astream.assert_called_once()
+        assert mock_agent.astream.call_args.kwargs["stream_mode"] == "messages"
+    
+    @pytest.mark.asyncio
+    async def test_stream_response_records_ttft(self, agent_service):
+        """첫 토큰 응답 시간 기록 테스트"""
+        agent_service.agent = make_stream_agent([agent_token("안녕하세요!")])
+        before = metrics.get_summary("agent.ttft_seconds").count
+        
+        async for _ in agent_service.stream_response("안녕하세요", "session_123"):
+            pass
+        
+        assert metrics.get_summary("agent.ttft_seconds").count == before + 1
     
     @pytest.mark.asyncio
     async def test_stream_response_invalid_input(self, agent_service):
@@ -101,13 +176,19 @@ class TestAgentService:
     
     @pytest.mark.asyncio
     async def test_stream_response_with_tool_calls(self, agent_service, mock_model_execution_service):
-        """도구 호출이 포함된 스트리밍 응답 테스트"""
+        """도구 호출이 포함된 스트리밍 응답 테스트 - 도구 호출 청크와 도구 결과는 제외"""
         # Mock 설정
-        mock_agent = AsyncMock()
-        mock_agent.astream.return_value = [
-            {"messages": [{"content": "AAPL 주가를 조회해드리겠습니다.", "tool_calls": [{"name": "get_stock_price", "args": {"ticker": "AAPL"}}]}]},
-            {"messages": [{"content": "Apple Inc.의 현재 주가는 $150.0입니다."}]}
-        ]
+        mock_agent = make_stream_agent([
+            agent_token("", tool_call_chunks=[
+                {"name": "get_stock_price", "args": '{"ticker": "AAPL"}', "id": "call_1", "index": 0}
+            ]),
+            (
+                ToolMessage(content="The current stock price of AAPL is $150.00", tool_call_id="call_1"),
+                {"langgraph_node": "tools"},
+            ),
+            agent_token("Apple Inc.의 현재 주가는"),
+            agent_token(" $150.0입니다."),
+        ])
         agent_service.agent = mock_agent
         
         # 테스트 실행
@@ -116,9 +197,31 @@ class TestAgentService:
             chunks.append(chunk)
         
         # 검증
-        assert len(chunks) > 0
-        assert any("AAPL 주가를 조회해드리겠습니다." in chunk for chunk in chunks)
-        assert any("Apple Inc.의 현재 주가는 $150.0입니다." in chunk for chunk in chunks)
+        assert "".join(chunks) == "Apple Inc.의 현재 주가는 $150.0입니다."
+        assert not any("The current stock price" in chunk for chunk in chunks)
+    
+    @pytest.mark.asyncio
+    async def test_stream_events_with_tool_calls(self, agent_service):
+        """도구 호출 청크는 tool_start, 도구 결과는 tool_end 이벤트로 전달되는지 테스트"""
+        agent_service.agent = make_stream_agent([
+            agent_token("", tool_call_chunks=[
+                {"name": "get_stock_price", "args": '{"tic', "id": "call_1", "index": 0}
+            ]),
+            agent_token("", tool_call_chunks=[{"name": None, "args": 'ker": "AAPL"}', "id": None, "index": 0}]),
+            (
+                ToolMessage(content="AAPL $150.00", tool_call_id="call_1", name="get_stock_price"),
+                {"langgraph_node": "tools"},
+            ),
+            agent_token("$150입니다."),
+        ])
+        
+        events = [event async for event in agent_service.stream_events("AAPL 주가 알려줘", "session_123")]
+        
+        assert [(event.type, event.data) for event in events] == [
+            ("tool_start", {"id": "call_1", "name": "get_stock_price"}),
+            ("tool_end", {"id": "call_1", "name": "get_stock_price", "status": "success"}),
+            ("token", {"text": "$150입니다."}),
+        ]
     
     @pytest.mark.asyncio
     async def test_stream_response_error_handling(self, agent_service, mock_model_execution_service):
@@ -137,3 +240,131 @@ class TestAgentService:
         assert len(chunks) > 0
         assert any("죄송합니다" in chunk for chunk in chunks)
         assert any("오류가 발생했습니다" in chunk for chunk in chunks)
+    
+    def test_set_max_history(self, agent_service):
+        """최대 히스토리 메시지 수가 히스토리 관리자에 적용되는지 테스트"""
+        agent_service.set_max_history(10)
+        
+        assert agent_service.agent_node.history_manager.max_messages == 10
+    
+    @pytest.mark.asyncio
+    async def test_clear_history_deletes_thread_state(self, agent_service):
+        """대화 히스토리 초기화 시 체크포인트와 스레드별 상태가 삭제되는지 테스트"""
+        graph = build_echo_graph(agent_service.checkpointer)
+        await run_turn(graph, "session_123", "안녕하세요")
+        await run_turn(graph, "session_456", "안녕하세요")
+        agent_service.agent_node.history_manager._summaries["session_123"] = ("id", "요약")
+        
+        with patch.object(agent_service, "tool_service") as mock_tool_service:
+            reclaimed = agent_service.clear_history("session_123")
+        
+        config = {"configurable": {"thread_id": "session_123"}}
+        assert reclaimed > 0
+        assert agent_service.checkpointer.get_tuple(config) is None
+        assert "session_123" not in agent_service.agent_node.history_manager._summaries
+        mock_tool_service.clear_thread_quotes.assert_called_once_with("session_123")
+        
+        # 다른 세션은 유지
+        assert agent_service.checkpointer.get_tuple({"configurable": {"thread_id": "session_456"}}) is not None
+    
+    @pytest.mark.asyncio
+    async def test_evicted_thread_state_released(self, agent_service):
+        """체크포인터가 자동으로 퇴출한 스레드의 요약/시세 상태도 삭제되는지 테스트"""
+        clock = FakeClock()
+        agent_service.checkpointer._clock = clock
+        graph = build_echo_graph(agent_service.checkpointer)
+        await run_turn(graph, "session_123", "안녕하세요")
+        agent_service.agent_node.history_manager._summaries["session_123"] = ("id", "요약")
+        
+        clock.now = agent_service.checkpointer.session_timeout + 1
+        with patch.object(agent_service, "tool_service") as mock_tool_service:
+            await run_turn(graph, "session_456", "안녕하세요")
+        
+        assert "session_123" not in agent_service.agent_node.history_manager._summaries
+        mock_tool_service.clear_thread_quotes.assert_called_once_with("session_123")
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_turn_rolled_back(self, agent_service):
+        """실행 중 취소된 턴의 메시지(응답 없는 도구 호출 포함)가 되돌려지는지 테스트"""
+        await run_turn(build_echo_graph(agent_service.checkpointer), "session_123", "안녕하세요")
+        cancelled_before = metrics.get_counter("agent.runs_cancelled_total")
+        
+        await cancel_turn(agent_service, "session_123", "계산해줘")
+        
+        state = await agent_service.agent.aget_state({"configurable": {"thread_id": "session_123"}})
+        assert [message.content for message in state.values["messages"]] == ["안녕하세요", "echo: 안녕하세요"]
+        assert metrics.get_counter("agent.runs_cancelled_total") == cancelled_before + 1
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_first_turn_deletes_thread(self, agent_service):
+        """첫 턴이 취소되면 스레드와 스레드별 상태가 남지 않는지 테스트"""
+        with patch.object(agent_service, "tool_service") as mock_tool_service:
+            await cancel_turn(agent_service, "session_123", "계산해줘")
+        
+        assert not await agent_service.has_history("session_123")
+        mock_tool_service.clear_thread_quotes.assert_called_once_with("session_123")
+    
+    @pytest.mark.asyncio
+    async def test_purge_idle_sessions_reports_reclaimed_memory(self, agent_service):
+        """유휴 세션 일괄 삭제 결과에 해제된 메모리가 보고되는지 테스트"""
+        graph = build_echo_graph(agent_service.checkpointer)
+        await run_turn(graph, "session_123", "안녕하세요")
+        
+        with patch.object(agent_service, "tool_service") as mock_tool_service:
+            report = agent_service.purge_idle_sessions(idle_seconds=-1)
+        
+        assert report["purged_threads"] == 1
+        assert report["thread_ids"] == ["session_123"]
+        assert report["reclaimed_bytes"] > 0
+        assert report["remaining_bytes"] == 0
+        mock_tool_service.clear_thread_quotes.assert_called_once_with("session_123")
+    
+    @pytest.mark.asyncio
+    async def test_record_turn_seeds_history(self, agent_service):
+        """그래프 실행 없이 기록한 턴이 히스토리에 남는지 테스트"""
+        assert not await agent_service.has_history("session_123")
+        
+        await agent_service.record_turn("session_123", "2 + 3 * 4", "14입니다")
+        
+        assert await agent_service.has_history("session_123")
+        state = await agent_service.agent.aget_state({"configurable": {"thread_id": "session_123"}})
+        assert [message.content for message in state.values["messages"]] == ["2 + 3 * 4", "14입니다"]
+    
+    @pytest.mark.asyncio
+    async def test_fast_path_calculation_skips_graph(self, agent_service):
+        """단순 계산은 그래프 없이 답변하고 히스토리에 기록하는지 테스트"""
+        agent_service.router = IntentRouter()
+        agent_service.agent.astream = MagicMock()
+        
+        chunks = [chunk async for chunk in agent_service.stream_response("100 * 1.5는?", "session_123")]
+        
+        assert chunks == ["계산 결과: 100 * 1.5 = 150"]
+        agent_service.agent.astream.assert_not_called()
+        assert await agent_service.has_history("session_123")
+    
+    @pytest.mark.asyncio
+    async def test_fast_path_stock_price(self, agent_service):
+        """단일 종목 시세 질문은 도구를 직접 호출해 템플릿 답변하는지 테스트"""
+        agent_service.router = IntentRouter()
+        quote = StockPrice(symbol="AAPL", price=Decimal("150.00"), change=Decimal("1.50"), change_percent=Decimal("1.01"))
+        
+        with patch.object(agent_service, "tool_service") as mock_tool_service:
+            mock_tool_service.get_stock_quote = AsyncMock(return_value=quote)
+            mock_tool_service.stock_service = StockPriceService()
+            chunks = [chunk async for chunk in agent_service.stream_response("애플 주가 알려줘", "session_123")]
+        
+        assert chunks == ["AAPL의 현재 주가는 $150.00입니다 (전일 대비 +$1.50, +1.01%)."]
+        mock_tool_service.get_stock_quote.assert_awaited_once_with("AAPL", "session_123")
+    
+    @pytest.mark.asyncio
+    async def test_fast_path_falls_back_to_graph_on_tool_error(self, agent_service):
+        """빠른 경로 도구 호출이 실패하면 그래프로 처리하는지 테스트"""
+        agent_service.router = IntentRouter()
+        agent_service.agent = make_stream_agent([agent_token("조회에 실패했습니다.")])
+        
+        with patch.object(agent_service, "tool_service") as mock_tool_service:
+            mock_tool_service.get_stock_quote = AsyncMock(side_effect=Exception("네트워크 오류"))
+            chunks = [chunk async for chunk in agent_service.stream_response("AAPL 주가 알려줘", "session_123")]
+        
+        assert chunks == ["조회에 실패했습니다."]
+        agent_service.agent.astream.assert_called_once()
@@ -0,0 +1,169 @@
+"""SQLite checkpointer 단위테스트."""
+
+import asyncio
+import sqlite3
+import threading
+import time
+
+import pytest
+from langgraph.checkpoint.base import empty_checkpoint
+from src.agent.checkpointer import BoundedMemorySaver, create_checkpointer
+from src.agent.sqlite_checkpointer import SqliteCheckpointSaver
+from tests.agent.test_checkpointer import FakeClock, build_echo_graph, run_turn
+
+
+def count_rows(path, table):
+    """DB 테이블의 행 수 조회 (다른 워커처럼 별도 연결 사용)"""
+    with sqlite3.connect(path) as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+class TestSqliteCheckpointSaver:
+    """SqliteCheckpointSaver 테스트"""
+
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        """임시 DB 경로"""
+        return str(tmp_path / "checkpoints.sqlite")
+
+    @pytest.fixture
+    def clock(self):
+        """가짜 시계"""
+        return FakeClock()
+
+    def create_saver(self, db_path, clock, write_mode="step"):
+        """SqliteCheckpointSaver 인스턴스 생성"""
+        return SqliteCheckpointSaver(
+            path=db_path,
+            write_mode=write_mode,
+            cache_size=8,
+            max_checkpoints_per_thread=2,
+            session_timeout=60,
+            clock=clock,
+        )
+
+    @pytest.mark.asyncio
+    async def test_conversation_survives_new_saver(self, db_path, clock):
+        """다른 워커(새 인스턴스)에서도 대화가 이어지는지 테스트"""
+        first = self.create_saver(db_path, clock)
+        await run_turn(build_echo_graph(first), "thread_1", "안녕")
+
+        second = self.create_saver(db_path, clock)
+        result = await run_turn(build_echo_graph(second), "thread_1", "다시 안녕")
+
+        assert [message.content for message in result["messages"]] == [
+            "안녕", "echo: 안녕", "다시 안녕", "echo: 다시 안녕",
+        ]
+
+        # 첫 번째 워커는 캐시가 오래됐어도 DB의 최신 상태를 읽음
+        state = await build_echo_graph(first).aget_state({"configurable": {"thread_id": "thread_1"}})
+        assert len(state.values["messages"]) == 4
+
+    @pytest.mark.asyncio
+    async def test_keeps_latest_checkpoints_only(self, db_path, clock):
+        """스레드별 최신 N개 체크포인트만 DB에 남는지 테스트"""
+        saver = self.create_saver(db_path, clock)
+        graph = build_echo_graph(saver)
+
+        for i in range(4):
+            await run_turn(graph, "thread_1", f"질문 {i}")
+
+        assert count_rows(db_path, "checkpoints") == 2
+
+    @pytest.mark.asyncio
+    async def test_turn_mode_writes_final_state_on_flush(self, db_path, clock):
+        """turn 모드는 flush 전까지 DB에 쓰지 않고, 최종 상태만 저장하는지 테스트"""
+        saver = self.create_saver(db_path, clock, write_mode="turn")
+        graph = build_echo_graph(saver)
+
+        result = await run_turn(graph, "thread_1", "안녕")
+        assert count_rows(db_path, "checkpoints") == 0
+
+        # flush 전에도 같은 워커에서는 상태 조회 가능
+        state = await graph.aget_state({"configurable": {"thread_id": "thread_1"}})
+        assert len(state.values["messages"]) == len(result["messages"])
+
+        await saver.aflush("thread_1")
+        assert count_rows(db_path, "checkpoints") == 1
+
+        reopened = self.create_saver(db_path, clock)
+        state = await build_echo_graph(reopened).aget_state({"configurable": {"thread_id": "thread_1"}})
+        assert state.values["messages"][-1].content == "echo: 안녕"
+
+    @pytest.mark.asyncio
+    async def test_read_served_from_cache(self, db_path, clock):
+        """최신 체크포인트 조회가 캐시에서 처리되는지 테스트"""
+        saver = self.create_saver(db_path, clock)
+        graph = build_echo_graph(saver)
+        await run_turn(graph, "thread_1", "안녕")
+
+        saver._load_checkpoint = None  # DB 본문을 다시 읽으면 실패
+
+        state = await graph.aget_state({"configurable": {"thread_id": "thread_1"}})
+        assert state.values["messages"][-1].content == "echo: 안녕"
+
+    @pytest.mark.asyncio
+    async def test_delete_and_evict_threads(self, db_path, clock):
+        """스레드 삭제와 유휴 스레드 정리 테스트"""
+        saver = self.create_saver(db_path, clock)
+        graph = build_echo_graph(saver)
+        await run_turn(graph, "old", "안녕")
+        clock.now = 30
+        await run_turn(graph, "new", "안녕")
+
+        clock.now = 70
+        assert saver.evict_idle_threads() == ["old"]
+        assert await saver.aget_tuple({"configurable": {"thread_id": "old"}}) is None
+
+        saver.delete_thread("new")
+        assert count_rows(db_path, "checkpoints") == 0
+        assert count_rows(db_path, "writes") == 0
+        assert saver.get_memory_usage()["thread_count"] == 0
+
+    @pytest.mark.asyncio
+    async def test_staging_does_not_wait_for_db_lock(self, db_path, clock):
+        """다른 스레드가 DB 잠금을 잡고 있어도 체크포인트 등록과 쓰기 모으기가 막히지 않는지 테스트"""
+        saver = self.create_saver(db_path, clock, write_mode="turn")
+        checkpoint = empty_checkpoint()
+        config = {"configurable": {"thread_id": "thread_1", "checkpoint_ns": ""}}
+
+        locked, release = threading.Event(), threading.Event()
+
+        def hold_db_lock():
+            with saver._lock:  # flush/삭제 중인 워커 스레드처럼 DB 잠금 점유
+                locked.set()
+                release.wait(3)
+
+        holder = threading.Thread(target=hold_db_lock)
+        holder.start()
+        locked.wait(5)
+        try:
+            # 루프가 막히면 wait_for로는 감지할 수 없으므로 걸린 시간으로 확인
+            started = time.perf_counter()
+            saved_config = await saver.aput(config, checkpoint, {}, {})
+            await saver.aput_writes(saved_config, [("messages", "안녕")], "task_1")
+            elapsed = time.perf_counter() - started
+        finally:
+            release.set()
+            holder.join()
+
+        assert elapsed < 1
+
+        await saver.aflush("thread_1")
+        saved = await saver.aget_tuple({"configurable": {"thread_id": "thread_1"}})
+        assert saved.pending_writes == [("task_1", "messages", "안녕")]
+
+
+
+class TestCreateCheckpointer:
+    """create_checkpointer 테스트"""
+
+    def test_backend_selection(self, tmp_path, monkeypatch):
+        """설정한 백엔드의 체크포인터가 생성되는지 테스트"""
+        from src.agent.settings import agent_settings
+        monkeypatch.setattr(agent_settings, "checkpoint_sqlite_path", str(tmp_path / "db.sqlite"))
+
+        assert isinstance(create_checkpointer("memory"), BoundedMemorySaver)
+        assert isinstance(create_checkpointer("sqlite"), SqliteCheckpointSaver)
+        with pytest.raises(ValueError):
+            create_checkpointer("redis")
@@ -0,0 +1 @@
+"""Chatbot tests."""
@@ -0,0 +1,218 @@
+"""승인 제어 단위테스트."""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from src.agent.events import AgentEvent
+from src.chatbot.admission import AdmissionControl, FifoLimiter
+from src.chatbot.cache import ResponseCache
+from src.chatbot.service import ChatbotService
+from src.utils.exceptions import ServerBusyException, SessionBusyException
+
+
+def make_slow_agent_service(started: list, release: asyncio.Event):
+    """release 이벤트가 설정될 때까지 응답을 멈추는 Mock AgentService"""
+    running = {"now": 0, "peak": 0}
+
+    async def stream_events(user_input, thread_id, usage=None):
+        running["now"] += 1
+        running["peak"] = max(running["peak"], running["now"])
+        started.append((thread_id, user_input))
+        try:
+            await release.wait()
+            yield AgentEvent.token(f"{user_input} 답변")
+        finally:
+            running["now"] -= 1
+
+    agent_service = MagicMock()
+    agent_service.has_history = AsyncMock(return_value=True)
+    agent_service.stream_events = MagicMock(side_effect=stream_events)
+    agent_service.running = running
+    return agent_service
+
+
+def make_chatbot_service(agent_service, **admission_options):
+    """응답 캐시를 끈 ChatbotService 생성"""
+    return ChatbotService(
+        agent_service=agent_service,
+        response_cache=ResponseCache(enabled=False),
+        admission=AdmissionControl(**admission_options),
+    )
+
+
+async def collect(streaming_response):
+    """스트리밍 응답 수집"""
+    return "".join([chunk async for chunk in streaming_response.generator])
+
+
+class TestFifoLimiter:
+    """FifoLimiter 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_slots_granted_in_arrival_order(self):
+        """반납된 슬롯이 도착 순서대로 넘어가는지 테스트"""
+        limiter = FifoLimiter(1)
+        order = []
+        assert await limiter.acquire()
+
+        async def worker(name):
+            await limiter.acquire()
+            order.append(name)
+            limiter.release()
+
+        tasks = [asyncio.create_task(worker(name)) for name in ("a", "b", "c")]
+        await asyncio.sleep(0)
+        assert limiter.pending == 3
+
+        limiter.release()
+        await asyncio.gather(*tasks)
+
+        assert order == ["a", "b", "c"]
+        assert limiter.active == 0
+
+    @pytest.mark.asyncio
+    async def test_timeout_and_cancel_leave_no_waiters(self):
+        """시간 초과/취소된 대기자가 슬롯을 점유하지 않는지 테스트"""
+        limiter = FifoLimiter(1)
+        await limiter.acquire()
+
+        assert await limiter.acquire(timeout=0) is False
+        assert await limiter.acquire(timeout=0.01) is False
+        waiting = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+
+        limiter.release()
+        assert limiter.pending == 0
+        assert limiter.active == 0
+
+
+class TestChatbotAdmission:
+    """ChatbotService 세션 직렬화 / 승인 제어 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_same_session_turns_run_one_at_a_time(self):
+        """같은 세션의 동시 요청은 순서대로 하나씩 실행되는지 테스트"""
+        started, release = [], asyncio.Event()
+        agent_service = make_slow_agent_service(started, release)
+        chatbot_service = make_chatbot_service(agent_service)
+
+        first = asyncio.create_task(collect(await chatbot_service.stream_chat("session_1", "첫 질문")))
+        second = asyncio.create_task(collect(await chatbot_service.stream_chat("session_1", "두번째 질문")))
+        await asyncio.sleep(0.01)
+
+        # 두 번째 턴은 첫 턴이 끝날 때까지 그래프를 시작하지 않음
+        assert started == [("session_1", "첫 질문")]
+
+        release.set()
+        assert await asyncio.gather(first, second) == ["첫 질문 답변", "두번째 질문 답변"]
+        assert agent_service.running["peak"] == 1
+        assert chatbot_service.admission.active_runs == 0
+
+    @pytest.mark.asyncio
+    async def test_different_sessions_run_in_parallel(self):
+        """다른 세션은 동시에 실행되는지 테스트"""
+        started, release = [], asyncio.Event()
+        agent_service = make_slow_agent_service(started, release)
+        chatbot_service = make_chatbot_service(agent_service)
+
+        tasks = [
+            asyncio.create_task(chatbot_service.chat(f"session_{i}", "질문"))
+            for i in range(3)
+        ]
+        await asyncio.sleep(0.01)
+
+        assert agent_service.running["now"] == 3
+
+        release.set()
+        await asyncio.gather(*tasks)
+
+    @pytest.mark.asyncio
+    async def test_session_queue_full_rejected(self):
+        """세션 대기 턴이 한도를 넘으면 바로 거절(429)하는지 테스트"""
+        started, release = [], asyncio.Event()
+        agent_service = make_slow_agent_service(started, release)
+        chatbot_service = make_chatbot_service(agent_service, max_queued_turns=1)
+
+        running = await chatbot_service.stream_chat("session_1", "첫 질문")
+        queued = await chatbot_service.stream_chat("session_1", "두번째 질문")
+
+        with pytest.raises(SessionBusyException):
+            await chatbot_service.stream_chat("session_1", "세번째 질문")
+        # 다른 세션은 영향 없음
+        other = await chatbot_service.stream_chat("session_2", "질문")
+
+        release.set()
+        await asyncio.gather(collect(running), collect(queued), collect(other))
+        assert chatbot_service.admission.active_runs == 0
+
+    @pytest.mark.asyncio
+    async def test_global_limit_rejected_quickly(self):
+        """전역 동시 실행 한도에 도달하면 짧게 기다린 뒤 거절(503)하는지 테스트"""
+        started, release = [], asyncio.Event()
+        agent_service = make_slow_agent_service(started, release)
+        chatbot_service = make_chatbot_service(agent_service, max_concurrent_runs=2, wait_timeout=0.05)
+
+        running = [
+            asyncio.create_task(chatbot_service.chat(f"session_{i}", "질문")) for i in range(2)
+        ]
+        await asyncio.sleep(0.01)
+
+        loop = asyncio.get_running_loop()
+        rejected_at = loop.time()
+        with pytest.raises(ServerBusyException):
+            await chatbot_service.chat("session_3", "질문")
+        assert loop.time() - rejected_at < 0.5
+
+        release.set()
+        await asyncio.gather(*running)
+        # 슬롯이 반납되면 다시 승인
+        assert (await chatbot_service.chat("session_3", "질문")).content == "질문 답변"
+
+    @pytest.mark.asyncio
+    async def test_closed_stream_releases_slots(self):
+        """세션 차례를 기다리다 닫힌 스트림이 슬롯을 반납하는지 테스트"""
+        started, release = [], asyncio.Event()
+        agent_service = make_slow_agent_service(started, release)
+        chatbot_service = make_chatbot_service(agent_service, max_concurrent_runs=2)
+
+        first = asyncio.create_task(collect(await chatbot_service.stream_chat("session_1", "첫 질문")))
+        queued = await chatbot_service.stream_chat("session_1", "두번째 질문")
+        waiting = asyncio.create_task(queued.generator.__anext__())
+        await asyncio.sleep(0.01)
+
+        # 클라이언트가 끊겨 대기 중인 스트림 취소
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        await queued.generator.aclose()
+
+        release.set()
+        await first
+        assert started == [("session_1", "첫 질문")]
+        assert chatbot_service.admission.active_runs == 0
+
+    @pytest.mark.asyncio
+    async def test_never_iterated_stream_releases_slots(self):
+        """한 번도 소비되지 않은 채 닫힌 스트림도 슬롯을 반납하는지 테스트"""
+        started, release = [], asyncio.Event()
+        agent_service = make_slow_agent_service(started, release)
+        chatbot_service = make_chatbot_service(agent_service, max_concurrent_runs=1, wait_timeout=0)
+
+        # 첫 바이트 전에 연결이 끊긴 경우
+        streaming_response = await chatbot_service.stream_chat("session_1", "질문")
+        await streaming_response.events.aclose()
+        assert chatbot_service.admission.active_runs == 0
+
+        # 응답 전체 정리도 여러 번 호출해도 안전
+        streaming_response = await chatbot_service.stream_chat("session_1", "질문")
+        await streaming_response.aclose()
+        await streaming_response.aclose()
+        assert chatbot_service.admission.active_runs == 0
+
+        release.set()
+        assert await collect(await chatbot_service.stream_chat("session_2", "질문")) == "질문 답변"
+        assert started == [("session_2", "질문")]
@@ -0,0 +1,52 @@
+"""Chatbot response cache 단위테스트."""
+
+import pytest
+from src.chatbot.cache import ResponseCache
+from tests.agent.test_checkpointer import FakeClock
+
+
+class TestResponseCache:
+    """ResponseCache 테스트"""
+    
+    @pytest.fixture
+    def clock(self):
+        """가짜 시계"""
+        clock = FakeClock()
+        clock.now = 1000.0
+        return clock
+    
+    @pytest.fixture
+    def cache(self, clock):
+        """ResponseCache 인스턴스 생성"""
+        return ResponseCache(enabled=True, ttl=60, max_entries=2, clock=clock)
+    
+    def test_key_normalizes_input(self, cache):
+        """공백과 대소문자만 다른 입력은 같은 키를 쓰는지 테스트"""
+        assert cache.make_key("  AAPL   주가 알려줘 ", "fp") == cache.make_key("aapl 주가 알려줘", "fp")
+        assert cache.make_key("AAPL 주가 알려줘", "fp") != cache.make_key("AAPL 주가 알려줘", "other")
+    
+    def test_entry_expires_after_ttl(self, cache, clock):
+        """기본 TTL이 지나면 만료되는지 테스트"""
+        cache.put("key", "답변")
+        assert cache.get("key") == "답변"
+        
+        clock.now += 61
+        assert cache.get("key") is None
+        assert len(cache) == 0
+    
+    def test_quote_expiry_shortens_ttl(self, cache, clock):
+        """시세 만료 시각이 더 빠르면 그 시각에 만료되는지 테스트"""
+        cache.put("key", "AAPL은 $150입니다", expires_at=clock.now + 30)
+        
+        clock.now += 31
+        assert cache.get("key") is None
+    
+    def test_lru_eviction(self, cache):
+        """최대 개수를 넘으면 가장 오래 사용되지 않은 항목이 삭제되는지 테스트"""
+        cache.put("a", "1")
+        cache.put("b", "2")
+        cache.get("a")
+        cache.put("c", "3")
+        
+        assert cache.get("a") == "1"
+        assert cache.get("b") is None
@@ -0,0 +1,113 @@
+"""Chatbot service 단위테스트."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from src.agent.events import EVENT_PARTIAL, EVENT_TOOL_END, AgentEvent
+from src.chatbot.cache import ResponseCache
+from src.chatbot.entities import ChatbotConfig
+from src.chatbot.service import ChatbotService
+from src.utils.exceptions import InvalidInputException
+
+
+def make_agent_service(chunks, has_history=False, quote_expiry=None):
+    """Mock AgentService 생성 - chunks의 문자열은 토큰 이벤트로, AgentEvent는 그대로 전달"""
+    async def stream_events(user_input, thread_id, usage=None):
+        for chunk in chunks:
+            yield chunk if isinstance(chunk, AgentEvent) else AgentEvent.token(chunk)
+    
+    agent_service = MagicMock()
+    agent_service.has_history = AsyncMock(return_value=has_history)
+    agent_service.record_turn = AsyncMock()
+    agent_service.get_response_fingerprint.return_value = "fingerprint"
+    agent_service.get_quote_expiry.return_value = quote_expiry
+    agent_service.stream_events = MagicMock(side_effect=stream_events)
+    return agent_service
+
+
+async def collect(streaming_response):
+    """스트리밍 응답 수집"""
+    return [chunk async for chunk in streaming_response.generator]
+
+
+class TestChatbotConfig:
+    """ChatbotConfig 적용 및 세션 관리 테스트"""
+    
+    def test_config_applied_to_agent_service(self):
+        """세션 타임아웃과 최대 히스토리가 에이전트 서비스에 전달되는지 테스트"""
+        agent_service = make_agent_service([])
+        
+        ChatbotService(ChatbotConfig(max_history=10, session_timeout=60), agent_service=agent_service)
+        
+        agent_service.set_session_timeout.assert_called_once_with(60)
+        agent_service.set_max_history.assert_called_once_with(10)
+    
+    @pytest.mark.parametrize("idle_seconds", [0, -1])
+    def test_non_positive_idle_seconds_rejected(self, idle_seconds):
+        """유휴 시간이 0 이하이면 세션을 삭제하지 않고 거부하는지 테스트"""
+        agent_service = make_agent_service([])
+        chatbot_service = ChatbotService(agent_service=agent_service)
+        
+        with pytest.raises(InvalidInputException):
+            chatbot_service.purge_idle_sessions(idle_seconds)
+        agent_service.purge_idle_sessions.assert_not_called()
+
+
+class TestChatbotResponseCache:
+    """ChatbotService 응답 캐시 테스트"""
+    
+    @pytest.mark.asyncio
+    async def test_first_turn_answer_served_from_cache(self):
+        """새 세션의 같은 질문은 캐시된 답변을 스트리밍하는지 테스트"""
+        agent_service = make_agent_service(["14", "입니다"])
+        chatbot_service = ChatbotService(agent_service=agent_service, response_cache=ResponseCache(enabled=True))
+        
+        first = await collect(await chatbot_service.stream_chat("session_1", "2 + 3 * 4"))
+        second = await collect(await chatbot_service.stream_chat("session_2", " 2 + 3 * 4 "))
+        
+        assert first == ["14", "입니다"]
+        assert second == ["14입니다"]
+        assert agent_service.stream_events.call_count == 1
+        agent_service.record_turn.assert_awaited_once_with("session_2", " 2 + 3 * 4 ", "14입니다")
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("marker", [
+        AgentEvent(EVENT_PARTIAL, {"reason": "deadline"}),
+        AgentEvent(EVENT_TOOL_END, {"id": "call_1", "name": "get_stock_price", "status": "error"}),
+    ])
+    async def test_partial_or_tool_error_answer_not_cached(self, marker):
+        """부분 답변이나 도구 오류를 바탕으로 한 답변은 캐시하지 않는지 테스트"""
+        agent_service = make_agent_service([marker, "일부", " 답변"])
+        cache = ResponseCache(enabled=True)
+        chatbot_service = ChatbotService(agent_service=agent_service, response_cache=cache)
+        
+        await chatbot_service.chat("session_1", "AAPL 주가")
+        second = await chatbot_service.chat("session_2", "AAPL 주가")
+        
+        assert second.content == "일부 답변"
+        assert agent_service.stream_events.call_count == 2
+        assert len(cache) == 0
+    
+    @pytest.mark.asyncio
+    async def test_follow_up_turn_not_cached(self):
+        """대화가 있는 세션은 캐시를 사용하지 않는지 테스트"""
+        agent_service = make_agent_service(["답변"], has_history=True)
+        cache = ResponseCache(enabled=True)
+        chatbot_service = ChatbotService(agent_service=agent_service, response_cache=cache)
+        
+        await chatbot_service.chat("session_1", "그럼 두 배는?")
+        await chatbot_service.chat("session_1", "그럼 두 배는?")
+        
+        assert agent_service.stream_events.call_count == 2
+        assert len(cache) == 0
+    
+    @pytest.mark.asyncio
+    async def test_expired_quote_answer_not_cached(self):
+        """이미 만료된 시세를 사용한 답변은 캐시하지 않는지 테스트"""
+        agent_service = make_agent_service(["AAPL은 $150입니다"], quote_expiry=0)
+        cache = ResponseCache(enabled=True)
+        chatbot_service = ChatbotService(agent_service=agent_service, response_cache=cache)
+        
+        response = await chatbot_service.chat("session_1", "AAPL 주가 알려줘")
+        
+        assert response.content == "AAPL은 $150입니다"
+        assert len(cache) == 0
@@ -0,0 +1,153 @@
+"""SSE 이벤트 프로토콜 단위테스트."""
+
+import asyncio
+import json
+
+import pytest
+from src.agent.events import EVENT_TOOL_END, EVENT_TOOL_START, AgentEvent
+from src.chatbot.sse import TokenCoalescer, format_sse, sse_stream
+from src.model.usage import RequestUsage
+
+
+async def event_source(items):
+    """(지연 초, 이벤트) 목록을 차례로 내보내는 스트림 - 이벤트 대신 예외면 발생"""
+    for delay, item in items:
+        if delay:
+            await asyncio.sleep(delay)
+        if isinstance(item, Exception):
+            raise item
+        yield item
+
+
+def parse_frames(frames):
+    """SSE 프레임을 (id, event, data) 목록으로 변환"""
+    parsed = []
+    for frame in frames:
+        fields = dict(line.split(": ", 1) for line in frame.strip().split("\n"))
+        parsed.append((int(fields["id"]), fields["event"], json.loads(fields["data"])))
+    return parsed
+
+
+async def collect(events):
+    """이벤트 스트림 수집"""
+    return [event async for event in events]
+
+
+class TestFormatSse:
+    """SSE 프레임 테스트"""
+
+    def test_newline_in_token_kept_in_single_data_line(self):
+        """줄바꿈이 있는 토큰도 한 줄 JSON data로 직렬화되는지 테스트"""
+        frame = format_sse(3, "token", {"text": "첫 줄\n\n둘째 줄"})
+
+        assert frame.endswith("\n\n")
+        assert frame.count("\n") == 4
+        assert parse_frames([frame]) == [(3, "token", {"text": "첫 줄\n\n둘째 줄"})]
+
+
+class TestTokenCoalescer:
+    """TokenCoalescer 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_first_token_immediate_then_batched_by_size(self):
+        """첫 토큰은 바로, 이후 토큰은 max_chars 단위로 묶는지 테스트"""
+        tokens = [(0, AgentEvent.token(text)) for text in ["안녕", "하", "세", "요", "!"]]
+
+        events = await collect(TokenCoalescer(max_chars=2, window=10).coalesce(event_source(tokens)))
+
+        assert [event.text for event in events] == ["안녕", "하세", "요!"]
+
+    @pytest.mark.asyncio
+    async def test_window_flushes_pending_tokens(self):
+        """시간 창이 지나면 다음 토큰을 기다리지 않고 쌓인 토큰을 보내는지 테스트"""
+        items = [(0, AgentEvent.token("a")), (0, AgentEvent.token("b")), (0, AgentEvent.token("c")),
+                 (0.2, AgentEvent.token("d"))]
+        coalescer = TokenCoalescer(max_chars=100, window=0.02)
+        loop = asyncio.get_running_loop()
+
+        arrivals = []
+        async for event in coalescer.coalesce(event_source(items)):
+            arrivals.append((event.text, loop.time()))
+
+        assert [text for text, _ in arrivals] == ["a", "bc", "d"]
+        # "bc"는 "d"가 나오기 전에 전송됨
+        assert arrivals[2][1] - arrivals[1][1] > 0.1
+
+    @pytest.mark.asyncio
+    async def test_non_token_event_flushes_buffer_in_order(self):
+        """도구 이벤트 앞의 토큰이 먼저 전송되어 순서가 유지되는지 테스트"""
+        items = [
+            (0, AgentEvent.token("잠시")), (0, AgentEvent.token("만")), (0, AgentEvent.token("요")),
+            (0, AgentEvent(EVENT_TOOL_START, {"id": "call_1", "name": "calculator"})),
+            (0, AgentEvent(EVENT_TOOL_END, {"id": "call_1", "name": "calculator", "status": "success"})),
+            (0, AgentEvent.token("150")),
+        ]
+
+        events = await collect(TokenCoalescer(max_chars=100, window=10).coalesce(event_source(items)))
+
+        assert [(event.type, event.text) for event in events] == [
+            ("token", "잠시"), ("token", "만요"), (EVENT_TOOL_START, ""), (EVENT_TOOL_END, ""), ("token", "150"),
+        ]
+
+
+class TestSseStream:
+    """sse_stream 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_stream_ends_with_usage_and_done(self):
+        """토큰 뒤에 usage, done 이벤트가 순서대로 붙고 ID가 증가하는지 테스트"""
+        items = [(0, AgentEvent.token(text)) for text in ["가", "나", "다"]]
+
+        frames = parse_frames(await collect(sse_stream(
+            event_source(items), "session_1", usage=RequestUsage(), coalescer=TokenCoalescer(max_chars=100, window=10)
+        )))
+
+        assert [(event_id, event) for event_id, event, _ in frames] == [
+            (1, "token"), (2, "token"), (3, "usage"), (4, "done"),
+        ]
+        assert frames[1][2] == {"text": "나다"}
+        assert frames[2][2]["total_tokens"] == 0
+        assert frames[3][2] == {"session_id": "session_1"}
+
+    @pytest.mark.asyncio
+    async def test_error_event_after_pending_tokens(self):
+        """스트림 도중 오류가 나면 쌓인 토큰을 보낸 뒤 error 이벤트로 끝나는지 테스트"""
+        items = [(0, AgentEvent.token("부분")), (0, AgentEvent.token(" 답변")), (0, RuntimeError("모델 호출 실패"))]
+
+        frames = parse_frames(await collect(sse_stream(
+            event_source(items), "session_1", coalescer=TokenCoalescer(max_chars=100, window=10)
+        )))
+
+        assert [event for _, event, _ in frames] == ["token", "token", "error"]
+        assert frames[1][2] == {"text": " 답변"}
+        assert frames[2][2] == {"message": "모델 호출 실패"}
+
+    @pytest.mark.asyncio
+    async def test_client_disconnect_cancels_source(self):
+        """연결이 끊기면 원본 스트림(Agent 실행)을 취소하고 done 없이 끝나는지 테스트"""
+        from src.utils.metrics import metrics
+
+        disconnected = asyncio.Event()
+        source_closed = asyncio.Event()
+
+        async def endless_source():
+            try:
+                yield AgentEvent.token("시작")
+                while True:
+                    await asyncio.sleep(0.01)
+                    yield AgentEvent.token(".")
+            finally:
+                source_closed.set()
+
+        before = metrics.get_counter("chat.sse.client_disconnects_total")
+        frames = []
+        async for frame in sse_stream(
+            endless_source(), "session_1", usage=RequestUsage(),
+            coalescer=TokenCoalescer(max_chars=100, window=10), disconnected=disconnected.wait(),
+        ):
+            frames.append(frame)
+            disconnected.set()
+
+        assert [event for _, event, _ in parse_frames(frames)] == ["token"]
+        assert source_closed.is_set()
+        assert metrics.get_counter("chat.sse.client_disconnects_total") == before + 1
@@ -0,0 +1,143 @@
+"""Fake chat model 단위테스트."""
+
+import json
+import time
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from src.agent.service import AgentService
+from src.model.fake_chat_model import LatencyDistribution, ScriptedChatModel, load_script
+from src.model.model_execution_service import ModelExecutionService
+from src.model.service import ModelService
+from src.model.settings import model_settings
+
+CALCULATOR_SCRIPT = [
+    {
+        "match": "계산",
+        "steps": [
+            {"tool_calls": [{"name": "calculator", "args": {"expression": "100 * 1.5"}}]},
+            {"content": "계산 결과는 150 입니다."},
+        ],
+    },
+    {"steps": [{"content": "무엇을 도와드릴까요?"}]},
+]
+
+
+class TestLatencyDistribution:
+    """LatencyDistribution 테스트"""
+
+    def test_fixed_and_seeded_samples(self):
+        """고정 분포는 항상 같은 값, 시드가 같으면 같은 샘플인지 테스트"""
+        assert LatencyDistribution("fixed", 200).sample() == 0.2
+
+        first = LatencyDistribution("lognormal", 100, 50, seed=7)
+        second = LatencyDistribution("lognormal", 100, 50, seed=7)
+        samples = [first.sample() for _ in range(20)]
+
+        assert samples == [second.sample() for _ in range(20)]
+        assert all(sample >= 0 for sample in samples)
+
+    def test_invalid_distribution(self):
+        """지원하지 않는 분포는 예외가 발생하는지 테스트"""
+        with pytest.raises(ValueError, match="지원하지 않는 지연 분포"):
+            LatencyDistribution("poisson")
+
+
+class TestScriptedChatModel:
+    """ScriptedChatModel 테스트"""
+
+    @pytest.fixture
+    def model(self):
+        """계산기 시나리오를 재생하는 가짜 모델"""
+        return ScriptedChatModel(scenarios=CALCULATOR_SCRIPT)
+
+    @pytest.mark.asyncio
+    async def test_replays_steps_within_turn(self, model):
+        """턴 안의 호출 순서대로 도구 호출 → 답변을 재생하는지 테스트"""
+        first = await model.ainvoke([HumanMessage(content="100 * 1.5 계산해줘")])
+        assert first.tool_calls[0]["name"] == "calculator"
+
+        second = await model.ainvoke([
+            HumanMessage(content="100 * 1.5 계산해줘"),
+            first,
+            ToolMessage(content="150", tool_call_id=first.tool_calls[0]["id"]),
+        ])
+        assert second.content == "계산 결과는 150 입니다."
+        assert second.usage_metadata["output_tokens"] == 4
+
+    @pytest.mark.asyncio
+    async def test_fallback_scenario(self, model):
+        """맞는 시나리오가 없으면 기본 시나리오를 재생하는지 테스트"""
+        result = await model.ainvoke([
+            HumanMessage(content="이전 질문"), AIMessage(content="이전 답변"),
+            HumanMessage(content="안녕"),
+        ])
+
+        assert result.content == "무엇을 도와드릴까요?"
+
+    @pytest.mark.asyncio
+    async def test_streams_at_token_rate(self):
+        """토큰 속도와 첫 토큰 지연이 적용되는지 테스트"""
+        model = ScriptedChatModel(
+            scenarios=[{"steps": [{"content": "하나 둘 셋 넷 다섯"}]}],
+            tokens_per_second=50,
+            latency=LatencyDistribution("fixed", 50),
+        )
+
+        start = time.perf_counter()
+        chunks = [chunk.content async for chunk in model.astream("안녕")]
+        elapsed = time.perf_counter() - start
+
+        assert "".join(chunks) == "하나 둘 셋 넷 다섯"
+        assert len([chunk for chunk in chunks if chunk]) == 5
+        assert elapsed >= 0.05 + 4 / 50
+
+    def test_load_script_formats(self, tmp_path):
+        """시나리오 목록/단계 목록 형식의 스크립트를 모두 읽는지 테스트"""
+        scenarios_path = tmp_path / "scenarios.json"
+        scenarios_path.write_text(json.dumps({"scenarios": CALCULATOR_SCRIPT}), encoding="utf-8")
+        steps_path = tmp_path / "steps.json"
+        steps_path.write_text(json.dumps([{"content": "답변"}]), encoding="utf-8")
+
+        assert load_script(str(scenarios_path)) == CALCULATOR_SCRIPT
+        assert load_script(str(steps_path)) == [{"steps": [{"content": "답변"}]}]
+
+
+class TestFakeProviderSelection:
+    """설정으로 가짜 모델을 선택하는 테스트"""
+
+    @pytest.fixture
+    def fake_settings(self, monkeypatch, tmp_path):
+        """가짜 프로바이더 설정 (API 키 없음)"""
+        script_path = tmp_path / "script.json"
+        script_path.write_text(json.dumps(CALCULATOR_SCRIPT), encoding="utf-8")
+        monkeypatch.setattr(model_settings, "llm_provider", "fake")
+        monkeypatch.setattr(model_settings, "openai_api_key", "")
+        monkeypatch.setattr(model_settings, "fake_script_path", str(script_path))
+        monkeypatch.setattr(model_settings, "fake_latency_ms", 0.0)
+        monkeypatch.setattr(model_settings, "fake_tokens_per_second", 0.0)
+
+    @pytest.mark.asyncio
+    async def test_model_service_returns_fake_model(self, fake_settings):
+        """llm_provider=fake이면 가짜 모델이 로드되는지 테스트"""
+        model_service = ModelService()
+        model = await model_service.get_model(1)
+        provider = await model_service.get_provider(model.model_provider_id)
+
+        assert model.model_name == "fake-scripted"
+        assert provider.model_vendor == "Fake"
+
+        chat_model = await ModelExecutionService(model_service).load_llm_model(1)
+        assert isinstance(chat_model, ScriptedChatModel)
+
+    @pytest.mark.asyncio
+    async def test_agent_pipeline_runs_offline(self, fake_settings):
+        """API 키 없이 Agent 전체 경로(도구 호출 포함)가 실행되는지 테스트"""
+        agent_service = AgentService(ModelExecutionService(ModelService()))
+        agent_service.router = None
+
+        chunks = [chunk async for chunk in agent_service.stream_response("100 * 1.5 계산해줘", "fake_thread")]
+
+        assert "".join(chunks) == "계산 결과는 150 입니다."
+        state = await agent_service.agent.aget_state({"configurable": {"thread_id": "fake_thread"}})
+        assert any(isinstance(message, ToolMessage) and message.content for message in state.values["messages"])
@@ -0,0 +1,137 @@
+"""Fake OpenAI server 단위테스트."""
+
+import asyncio
+import json
+import socket
+
+import httpx
+import pytest
+import uvicorn
+from langchain_core.messages import HumanMessage
+from langchain_openai import ChatOpenAI
+from src.agent.service import AgentService
+from src.model.fake_chat_model import FakeScript, LatencyDistribution, ScriptedChatModel
+from src.model.fake_openai_server import FakeOpenAIServer
+from src.model.model_execution_service import ModelExecutionService
+from src.model.service import ModelService
+from src.model.settings import model_settings
+from src.utils.http_client import aclose_shared_async_client
+from tests.model.test_fake_chat_model import CALCULATOR_SCRIPT
+
+
+def free_port():
+    """사용 가능한 로컬 포트"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TestFakeOpenAIServer:
+    """FakeOpenAIServer 테스트 (ASGI 트랜스포트로 실제 OpenAI 클라이언트 사용)"""
+
+    @pytest.fixture
+    def server(self):
+        """계산기 시나리오를 재생하는 서버"""
+        return FakeOpenAIServer(script=FakeScript(CALCULATOR_SCRIPT))
+
+    @pytest.fixture
+    def chat_model(self, server):
+        """가짜 서버를 base_url로 사용하는 ChatOpenAI"""
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=server.create_app()))
+        return ChatOpenAI(
+            model="fake-scripted",
+            api_key="sk-local",
+            base_url="http://fake-openai/v1",
+            http_async_client=client,
+        )
+
+    @pytest.mark.asyncio
+    async def test_non_streaming_completion(self, chat_model):
+        """stream=false 응답이 OpenAI 클라이언트로 파싱되는지 테스트"""
+        result = await chat_model.ainvoke([HumanMessage(content="안녕")])
+
+        assert result.content == "무엇을 도와드릴까요?"
+        assert result.usage_metadata["output_tokens"] == 2
+
+    @pytest.mark.asyncio
+    async def test_streaming_tool_call(self, chat_model):
+        """SSE 스트림의 도구 호출이 OpenAI 클라이언트로 파싱되는지 테스트"""
+        merged = None
+        async for chunk in chat_model.astream([HumanMessage(content="100 * 1.5 계산해줘")]):
+            merged = chunk if merged is None else merged + chunk
+
+        assert merged.tool_calls[0]["name"] == "calculator"
+        assert merged.tool_calls[0]["args"] == {"expression": "100 * 1.5"}
+
+    @pytest.mark.asyncio
+    async def test_streaming_tokens(self, server):
+        """토큰이 chat.completion.chunk 단위로 전송되고 [DONE]으로 끝나는지 테스트"""
+        server.script.tokens_per_second = 1000
+        server.script.latency = LatencyDistribution("fixed", 10)
+        transport = httpx.ASGITransport(app=server.create_app())
+
+        async with httpx.AsyncClient(transport=transport, base_url="http://fake-openai") as client:
+            response = await client.post("/v1/chat/completions", json={
+                "model": "fake-scripted",
+                "stream": True,
+                "stream_options": {"include_usage": True},
+                "messages": [{"role": "user", "content": "안녕"}],
+            })
+
+        events = [line[len("data: "):] for line in response.text.splitlines() if line.startswith("data: ")]
+        assert events[-1] == "[DONE]"
+        chunks = [json.loads(event) for event in events[:-1]]
+        contents = [chunk["choices"][0]["delta"].get("content", "") for chunk in chunks if chunk["choices"]]
+        assert "".join(contents) == "무엇을 도와드릴까요?"
+        assert chunks[-1]["usage"]["completion_tokens"] == 2
+
+    @pytest.mark.asyncio
+    async def test_stream_chunks_match_scripted_model(self, server):
+        """서버와 가짜 모델이 같은 스크립트를 같은 청크 단위로 스트리밍하는지 테스트"""
+        model = ScriptedChatModel(scenarios=CALCULATOR_SCRIPT)
+        transport = httpx.ASGITransport(app=server.create_app())
+
+        async with httpx.AsyncClient(transport=transport, base_url="http://fake-openai") as client:
+            response = await client.post("/v1/chat/completions", json={
+                "model": "fake-scripted",
+                "stream": True,
+                "messages": [{"role": "user", "content": "안녕"}],
+            })
+
+        events = [line[len("data: "):] for line in response.text.splitlines() if line.startswith("data: ")]
+        deltas = [json.loads(event)["choices"][0]["delta"] for event in events[:-1]]
+        server_contents = [delta["content"] for delta in deltas if delta.get("content")]
+        model_contents = [chunk.content async for chunk in model.astream([HumanMessage(content="안녕")]) if chunk.content]
+        assert server_contents == model_contents
+
+
+class TestBaseUrlPipeline:
+    """model_settings.openai_base_url로 로컬 서버를 사용하는 전체 경로 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_agent_over_local_http(self, monkeypatch):
+        """실제 소켓/HTTP/SSE 경로로 Agent 턴(도구 호출 포함)이 실행되는지 테스트"""
+        server_impl = FakeOpenAIServer(script=FakeScript(CALCULATOR_SCRIPT))
+        port = free_port()
+        server = uvicorn.Server(uvicorn.Config(
+            server_impl.create_app(), host="127.0.0.1", port=port, log_level="warning",
+        ))
+        serve_task = asyncio.create_task(server.serve())
+        while not server.started:
+            await asyncio.sleep(0.01)
+
+        monkeypatch.setattr(model_settings, "llm_provider", "openai")
+        monkeypatch.setattr(model_settings, "openai_api_key", "")
+        monkeypatch.setattr(model_settings, "openai_base_url", f"http://127.0.0.1:{port}/v1")
+        try:
+            agent_service = AgentService(ModelExecutionService(ModelService()))
+            agent_service.router = None
+
+            chunks = [chunk async for chunk in agent_service.stream_response("100 * 1.5 계산해줘", "http_thread")]
+
+            assert "".join(chunks) == "계산 결과는 150 입니다."
+            assert server_impl.request_count == 2
+        finally:
+            await aclose_shared_async_client()
+            server.should_exit = True
+            await serve_task
@@ -5,6 +5,13 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from langchain_openai import ChatOpenAI
 from src.model.model_execution_service import ModelExecutionService
 from src.model.service import ModelService
+from src.model.settings import model_settings
+
+
+@pytest.fixture(autouse=True)
+def openai_api_key(monkeypatch):
+    """환경변수와 무관하게 OpenAI 키 설정 (ChatOpenAI는 Mock이라 실제 호출 없음)"""
+    monkeypatch.setattr(model_settings, "openai_api_key", "sk-test")
 
 
 class TestModelExecutionService:
@@ -145,3 +152,76 @@ class TestModelExecutionService:
         # 검증
         assert result == expected_models
         mock_model_service.get_available_models.assert_called_once_with("llm")
+
+
+class TestModelExecutionServicePool:
+    """ModelExecutionService 모델 풀 테스트"""
+    
+    @pytest.fixture
+    def model_service(self):
+        """실제 ModelService 사용 (기본 GPT-4o 모델)"""
+        return ModelService()
+    
+    @pytest.fixture
+    def model_execution_service(self, model_service):
+        """ModelExecutionService 인스턴스 생성"""
+        return ModelExecutionService(model_service)
+    
+    @pytest.fixture
+    def tools(self):
+        """Mock 도구 목록 생성"""
+        tool = MagicMock()
+        tool.name = "get_stock_price"
+        tool.description = "주가 조회"
+        tool.args = {"ticker": {"type": "string"}}
+        return [tool]
+    
+    @pytest.mark.asyncio
+    async def test_load_llm_model_reuses_instance(self, model_execution_service):
+        """같은 모델을 다시 로딩하면 재사용하는지 테스트"""
+        with patch('src.model.model_execution_service.ChatOpenAI') as mock_chat_openai:
+            first = await model_execution_service.load_llm_model(1)
+            second = await model_execution_service.load_llm_model(1)
+        
+        assert first is second
+        mock_chat_openai.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_load_tool_bound_model_reuses_binding(self, model_execution_service, tools):
+        """도구 바인딩 결과를 재사용하는지 테스트"""
+        with patch('src.model.model_execution_service.ChatOpenAI') as mock_chat_openai:
+            first = await model_execution_service.load_tool_bound_model(1, tools)
+            second = await model_execution_service.load_tool_bound_model(1, tools)
+        
+        assert first is second
+        mock_chat_openai.return_value.bind_tools.assert_called_once_with(tools)
+    
+    @pytest.mark.asyncio
+    async def test_different_toolset_binds_again(self, model_execution_service, tools):
+        """도구 구성이 다르면 새로 바인딩하는지 테스트"""
+        other_tool = MagicMock()
+        other_tool.name = "calculator"
+        other_tool.description = "계산"
+        other_tool.args = {}
+        
+        with patch('src.model.model_execution_service.ChatOpenAI') as mock_chat_openai:
+            await model_execution_service.load_tool_bound_model(1, tools)
+            await model_execution_service.load_tool_bound_model(1, tools + [other_tool])
+        
+        mock_chat_openai.assert_called_once()
+        assert mock_chat_openai.return_value.bind_tools.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_settings_change_invalidates_pool(self, model_execution_service, tools):
+        """설정이 바뀌면 풀이 초기화되는지 테스트"""
+        with patch('src.model.model_execution_service.ChatOpenAI') as mock_chat_openai:
+            mock_chat_openai.side_effect = lambda **kwargs: MagicMock()
+            first = await model_execution_service.load_llm_model(1)
+            
+            model_execution_service.settings = model_execution_service.settings.model_copy(
+                update={"llm_temperature": 0.1}
+            )
+            second = await model_execution_service.load_llm_model(1)
+        
+        assert first is not second
+        assert mock_chat_openai.call_count == 2
@@ -0,0 +1,97 @@
+"""Model registry 단위테스트."""
+
+import json
+
+import pytest
+from src.model.registry import (
+    DEFAULT_MODEL_ID, FAKE_PROVIDER_ID, FAST_MODEL_ID, OPENAI_PROVIDER_ID,
+    ModelRegistry, build_default_registry,
+)
+from src.model.service import ModelService
+from src.model.settings import model_settings
+
+REGISTRY_RECORDS = {
+    "providers": [
+        {"model_provider_id": 1, "model_provider_name": "OpenAI", "model_vendor": "OpenAI", "model_key_id": 1},
+    ],
+    "models": [
+        {"model_id": 1, "model_provider_id": 1, "model_name": "gpt-4o",
+         "model_config": {"model": "gpt-4o", "tier": "large", "input_cost_per_1m": 2.5, "output_cost_per_1m": 10.0}},
+        {"model_id": 2, "model_provider_id": 1, "model_name": "gpt-4.1-mini",
+         "model_config": {"model": "gpt-4.1-mini", "tier": "fast", "input_cost_per_1m": 0.4, "output_cost_per_1m": 1.6}},
+        {"model_id": 3, "model_provider_id": 1, "model_name": "gpt-4o-mini",
+         "model_config": {"model": "gpt-4o-mini", "tier": "fast", "input_cost_per_1m": 0.15, "output_cost_per_1m": 0.6}},
+        {"model_id": 4, "model_provider_id": 1, "model_name": "retired", "is_deleted": True,
+         "model_config": {"model": "retired", "tier": "fast"}},
+        {"model_id": 5, "model_provider_id": 9, "model_name": "orphan", "model_config": {"model": "orphan"}},
+    ],
+}
+
+
+class TestModelRegistry:
+    """ModelRegistry 테스트"""
+
+    def test_default_registry_has_only_default_model(self):
+        """빠른 모델을 설정하지 않으면 기본 모델 하나만 등록되는지 테스트"""
+        registry = build_default_registry(OPENAI_PROVIDER_ID)
+
+        assert [model.model_name for model in registry.models()] == ["gpt-4o"]
+        assert registry.default_model_id() == DEFAULT_MODEL_ID
+        assert registry.candidates("fast") == []
+
+    def test_default_registry_with_fast_model(self):
+        """설정한 빠른 모델이 ID 2의 fast 등급으로 등록되는지 테스트"""
+        registry = build_default_registry(FAKE_PROVIDER_ID, "fake-scripted-fast")
+
+        fast_models = registry.candidates("fast")
+        assert [model.model_id for model in fast_models] == [FAST_MODEL_ID]
+        assert fast_models[0].model_name == "fake-scripted-fast"
+        assert registry.get_model(DEFAULT_MODEL_ID).model_name == "fake-scripted"
+        assert [provider.model_vendor for provider in registry.providers()] == ["Fake"]
+
+    def test_unknown_fast_model_ignored(self):
+        """프로바이더에 없는 빠른 모델 이름은 무시되는지 테스트"""
+        registry = build_default_registry(OPENAI_PROVIDER_ID, "no-such-model")
+
+        assert len(registry.models()) == 1
+
+    def test_from_records_indexes_active_models(self, tmp_path):
+        """레코드 파일에서 삭제/고아 모델을 제외하고 색인하는지 테스트"""
+        path = tmp_path / "registry.json"
+        path.write_text(json.dumps(REGISTRY_RECORDS), encoding="utf-8")
+
+        registry = ModelRegistry.from_file(str(path))
+
+        assert [model.model_id for model in registry.models("llm")] == [1, 2, 3]
+        assert registry.get_model(4) is None
+        assert registry.get_model(5) is None
+        # 비용이 낮은 fast 모델 먼저
+        assert [model.model_name for model in registry.candidates("fast")] == ["gpt-4o-mini", "gpt-4.1-mini"]
+
+    def test_record_latency_ewma(self):
+        """지연시간이 지수이동평균으로 반영되는지 테스트"""
+        registry = ModelRegistry.from_records(REGISTRY_RECORDS)
+
+        assert registry.latency(1) is None
+        registry.record_latency(1, 1.0, alpha=0.5)
+        registry.record_latency(1, 3.0, alpha=0.5)
+
+        assert registry.latency(1) == pytest.approx(2.0)
+
+
+class TestModelServiceRegistry:
+    """ModelService 레지스트리 연동 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_registry_follows_settings(self, monkeypatch, tmp_path):
+        """레지스트리 관련 설정이 바뀌면 다시 구성하는지 테스트"""
+        model_service = ModelService()
+        assert len(await model_service.get_all_models()) == 1
+
+        monkeypatch.setattr(model_settings, "llm_fast_model", "gpt-4o-mini")
+        assert [model.model_name for model in await model_service.get_all_models()] == ["gpt-4o", "gpt-4o-mini"]
+
+        path = tmp_path / "registry.json"
+        path.write_text(json.dumps(REGISTRY_RECORDS), encoding="utf-8")
+        monkeypatch.setattr(model_settings, "model_registry_path", str(path))
+        assert (await model_service.get_model(3)).model_name == "gpt-4o-mini"
@@ -0,0 +1,148 @@
+"""LLM 호출 복원력 단위테스트."""
+
+import asyncio
+import random
+import time
+from typing import List
+
+import pytest
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessageChunk, HumanMessage
+from langchain_core.outputs import ChatGenerationChunk
+from src.model.resilience import ResilientChatModel, RetryPolicy, is_retryable
+from src.utils.metrics import metrics
+
+
+class StatusError(Exception):
+    """HTTP 상태 코드가 있는 API 오류"""
+
+    def __init__(self, status_code):
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+
+
+class APIConnectionError(Exception):
+    """openai SDK 연결 오류와 같은 이름의 오류"""
+
+
+class FlakyChatModel(BaseChatModel):
+    """호출 순서별로 첫 청크 지연/오류를 정할 수 있는 모델"""
+
+    delays: List[float] = []
+    failures: List = []
+    calls: int = 0
+    closed: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "flaky"
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        raise NotImplementedError
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs):
+        call = self.calls
+        self.calls += 1
+        try:
+            if call < len(self.delays):
+                await asyncio.sleep(self.delays[call])
+            if call < len(self.failures) and self.failures[call] is not None:
+                raise self.failures[call]
+            for token in [f"응답{call} ", "끝"]:
+                yield ChatGenerationChunk(message=AIMessageChunk(content=token))
+        finally:
+            self.closed += 1
+
+
+def make_model(inner, **policy_options):
+    """지연 없는 재시도 정책으로 감싼 모델"""
+    policy = RetryPolicy(**{"base_delay": 0.0, "rng": random.Random(0), **policy_options})
+    return ResilientChatModel(inner=inner, policy=policy)
+
+
+class TestRetryPolicy:
+    """재시도 판별 / 백오프 테스트"""
+
+    @pytest.mark.parametrize("error, expected", [
+        (asyncio.TimeoutError(), True),
+        (StatusError(429), True),
+        (StatusError(503), True),
+        (StatusError(400), False),
+        (APIConnectionError("연결 실패"), True),
+        (ValueError("잘못된 요청"), False),
+    ])
+    def test_is_retryable(self, error, expected):
+        """타임아웃/연결 오류/429/5xx만 재시도 대상인지 테스트"""
+        assert is_retryable(error) is expected
+
+    def test_backoff_full_jitter(self):
+        """백오프가 0 ~ min(max, base * 2^n) 범위의 지터인지 테스트"""
+        policy = RetryPolicy(base_delay=0.5, max_delay=2.0, rng=random.Random(1))
+        delays = [policy.backoff(attempt) for attempt in range(6) for _ in range(20)]
+
+        assert all(0 <= delay <= 2.0 for delay in delays)
+        assert max(policy.backoff(0) for _ in range(50)) <= 0.5
+        assert len(set(delays)) > 1
+
+
+class TestResilientChatModel:
+    """ResilientChatModel 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_retries_retryable_errors(self):
+        """재시도 가능한 오류는 재시도 후 성공하는지 테스트"""
+        inner = FlakyChatModel(failures=[asyncio.TimeoutError(), StatusError(503)])
+        retries = metrics.get_counter("model.resilience.retries_total")
+
+        message = await make_model(inner).ainvoke([HumanMessage(content="안녕")])
+
+        assert message.content == "응답2 끝"
+        assert inner.calls == 3
+        assert metrics.get_counter("model.resilience.retries_total") == retries + 2
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_error_raised_immediately(self):
+        """재시도할 수 없는 오류는 바로 전파하는지 테스트"""
+        inner = FlakyChatModel(failures=[StatusError(400)])
+
+        with pytest.raises(StatusError):
+            await make_model(inner).ainvoke([HumanMessage(content="안녕")])
+        assert inner.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_attempt_timeout_retried(self):
+        """첫 토큰이 시도 제한 시간을 넘기면 다시 시도하는지 테스트"""
+        inner = FlakyChatModel(delays=[5.0])
+
+        message = await make_model(inner, attempt_timeout=0.05, max_retries=1).ainvoke(
+            [HumanMessage(content="안녕")]
+        )
+
+        assert message.content == "응답1 끝"
+        assert inner.closed == 2
+
+    @pytest.mark.asyncio
+    async def test_hedged_request_wins_and_loser_cancelled(self):
+        """첫 토큰이 늦으면 헤지 요청을 보내고, 먼저 응답한 쪽만 스트리밍하고 진 쪽은 취소하는지 테스트"""
+        inner = FlakyChatModel(delays=[5.0, 0.0])
+        hedge_wins = metrics.get_counter("model.resilience.hedge_wins_total")
+        model = make_model(inner, max_retries=0, hedge_delay=0.05)
+
+        started_at = time.perf_counter()
+        tokens = [chunk.content async for chunk in model.astream([HumanMessage(content="안녕")]) if chunk.content]
+
+        assert tokens == ["응답1 ", "끝"]
+        assert time.perf_counter() - started_at < 1.0
+        assert inner.calls == 2
+        assert inner.closed == 2
+        assert metrics.get_counter("model.resilience.hedge_wins_total") == hedge_wins + 1
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_not_hedged(self):
+        """제때 응답하면 헤지 요청을 보내지 않는지 테스트"""
+        inner = FlakyChatModel()
+
+        message = await make_model(inner, hedge_delay=1.0).ainvoke([HumanMessage(content="안녕")])
+
+        assert message.content == "응답0 끝"
+        assert inner.calls == 1
@@ -0,0 +1,164 @@
+"""Model routing 단위테스트."""
+
+import json
+
+import pytest
+from unittest.mock import patch
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from src.agent.service import AgentService
+from src.model.model_execution_service import ModelExecutionService
+from src.model.registry import DEFAULT_MODEL_ID, FAST_MODEL_ID
+from src.model.routing import (
+    REASON_COMPLEX_INPUT, REASON_DEFAULT, REASON_EXPLORE, REASON_FAST_SLOWER, REASON_LONG_INPUT,
+    REASON_MULTI_TOOL, REASON_SIMPLE, TURN_SIMPLE, ModelRoutingPolicy,
+)
+from src.model.service import ModelService
+from src.model.settings import model_settings
+from src.utils.metrics import metrics
+
+# 종목 두 개를 조회한 뒤 답변하는 시나리오
+TWO_QUOTES_SCRIPT = [
+    {
+        "match": "계산",
+        "steps": [
+            {"tool_calls": [
+                {"name": "calculator", "args": {"expression": "5 * 2"}},
+                {"name": "calculator", "args": {"expression": "8 * 3"}},
+            ]},
+            {"content": "합계는 34 입니다."},
+        ],
+    },
+    {"steps": [{"content": "안녕하세요!"}]},
+]
+
+
+def tool_result(name, call_id):
+    """도구 결과 메시지"""
+    return ToolMessage(content="42", tool_call_id=call_id, name=name)
+
+
+class TestModelRoutingPolicy:
+    """ModelRoutingPolicy 테스트"""
+
+    @pytest.fixture
+    def routing_settings(self, monkeypatch):
+        """빠른 모델이 등록된 설정"""
+        monkeypatch.setattr(model_settings, "llm_fast_model", "gpt-4o-mini")
+
+    @pytest.fixture
+    def policy(self, routing_settings):
+        """라우팅 정책"""
+        return ModelRoutingPolicy(ModelService())
+
+    def test_without_fast_model_uses_default(self):
+        """빠른 모델이 없으면 항상 기본 모델인지 테스트"""
+        decision = ModelRoutingPolicy(ModelService()).select([HumanMessage(content="안녕")])
+
+        assert (decision.model_id, decision.reason) == (DEFAULT_MODEL_ID, REASON_DEFAULT)
+
+    def test_simple_turn_routed_to_fast_model(self, policy):
+        """단순 턴은 빠른 모델로 보내고 결정을 기록하는지 테스트"""
+        before = metrics.get_counter("model.routing.fast_total")
+
+        decision = policy.select([HumanMessage(content="AAPL 주가 알려줘")])
+
+        assert (decision.model_id, decision.model_name, decision.tier, decision.reason) == (
+            FAST_MODEL_ID, "gpt-4o-mini", "fast", REASON_SIMPLE
+        )
+        assert metrics.get_counter("model.routing.fast_total") == before + 1
+
+    @pytest.mark.parametrize("user_input, reason", [
+        ("엔비디아 5주랑 아마존 8주를 두명이 사려는데 각자 얼마야?", REASON_COMPLEX_INPUT),
+        ("NVDA와 AMZN 주가 알려줘", REASON_COMPLEX_INPUT),
+        ("주가 " * 120, REASON_LONG_INPUT),
+    ])
+    def test_complex_input_stays_on_default(self, policy, user_input, reason):
+        """여러 종목/단계 질문이나 긴 질문은 기본 모델인지 테스트"""
+        decision = policy.select([HumanMessage(content=user_input)])
+
+        assert (decision.model_id, decision.reason) == (DEFAULT_MODEL_ID, reason)
+
+    def test_multi_tool_turn_stays_on_default(self, policy):
+        """이번 턴에 도구 결과가 여러 개면 기본 모델인지 테스트 (이전 턴 도구 결과는 제외)"""
+        previous_turn = [HumanMessage(content="AAPL 주가"), tool_result("get_stock_price", "a"),
+                         tool_result("get_stock_price", "b"), AIMessage(content="답변")]
+        single = previous_turn + [HumanMessage(content="TSLA 주가"), tool_result("get_stock_price", "c")]
+        multi = single + [tool_result("calculator", "d")]
+
+        assert policy.select(single).reason == REASON_SIMPLE
+        assert policy.select(multi).reason == REASON_MULTI_TOOL
+
+    def test_slow_fast_model_falls_back_to_default(self, policy):
+        """빠른 모델의 관측 지연시간이 기본 모델보다 길면 기본 모델인지 테스트"""
+        fast = policy.select([HumanMessage(content="안녕")])
+        policy.record_latency(fast, 5.0)
+        complex_turn = policy.select([HumanMessage(content="NVDA와 AMZN 비교해줘")])
+        policy.record_latency(complex_turn, 1.0)
+
+        assert policy.select([HumanMessage(content="안녕")]).reason == REASON_FAST_SLOWER
+
+    def test_latency_compared_within_simple_turns(self, policy):
+        """기본 모델의 단순 턴 지연시간이 있으면 복잡한 턴 지연시간 대신 그것과 비교하는지 테스트"""
+        registry = policy.model_service.registry
+        policy.record_latency(policy.select([HumanMessage(content="안녕")]), 2.0)
+        policy.record_latency(policy.select([HumanMessage(content="NVDA와 AMZN 비교해줘")]), 1.0)
+        slower = policy.select([HumanMessage(content="안녕")])
+        assert slower.reason == REASON_FAST_SLOWER
+
+        # 기본 모델도 단순 턴에서는 더 느림
+        policy.record_latency(slower, 3.0)
+
+        assert registry.latency(DEFAULT_MODEL_ID, TURN_SIMPLE) == pytest.approx(3.0)
+        assert policy.select([HumanMessage(content="안녕")]).reason == REASON_SIMPLE
+
+    def test_slow_fast_model_explored_and_recovers(self, policy, monkeypatch):
+        """빠른 모델이 한 번 느렸어도 주기적으로 다시 측정해 회복되는지 테스트"""
+        monkeypatch.setattr(model_settings, "routing_explore_every", 3)
+        monkeypatch.setattr(model_settings, "routing_latency_ewma_alpha", 1.0)
+        policy.record_latency(policy.select([HumanMessage(content="안녕")]), 5.0)
+        policy.record_latency(policy.select([HumanMessage(content="NVDA와 AMZN 비교해줘")]), 1.0)
+
+        reasons = [policy.select([HumanMessage(content="안녕")]).reason for _ in range(2)]
+        explore = policy.select([HumanMessage(content="안녕")])
+        assert reasons == [REASON_FAST_SLOWER, REASON_FAST_SLOWER]
+        assert (explore.model_id, explore.reason) == (FAST_MODEL_ID, REASON_EXPLORE)
+
+        # 재측정 결과 다시 빨라지면 빠른 모델로 복귀
+        policy.record_latency(explore, 0.5)
+        assert policy.select([HumanMessage(content="안녕")]).reason == REASON_SIMPLE
+
+
+class TestAgentModelRouting:
+    """Agent 경로의 모델 라우팅 테스트 (가짜 모델)"""
+
+    @pytest.fixture
+    def fake_settings(self, monkeypatch, tmp_path):
+        """가짜 프로바이더 + 빠른 가짜 모델 설정"""
+        script_path = tmp_path / "script.json"
+        script_path.write_text(json.dumps(TWO_QUOTES_SCRIPT), encoding="utf-8")
+        monkeypatch.setattr(model_settings, "llm_provider", "fake")
+        monkeypatch.setattr(model_settings, "llm_fast_model", "fake-scripted-fast")
+        monkeypatch.setattr(model_settings, "fake_script_path", str(script_path))
+        monkeypatch.setattr(model_settings, "fake_latency_ms", 0.0)
+        monkeypatch.setattr(model_settings, "fake_tokens_per_second", 0.0)
+
+    @pytest.mark.asyncio
+    async def test_models_selected_per_step(self, fake_settings):
+        """단순 턴은 빠른 모델, 멀티 도구 결과 이후 호출은 기본 모델을 사용하는지 테스트"""
+        model_service = ModelService()
+        execution_service = ModelExecutionService(model_service)
+        agent_service = AgentService(execution_service, model_router=ModelRoutingPolicy(model_service))
+        agent_service.router = None
+
+        with patch.object(
+            execution_service, "load_tool_bound_model", wraps=execution_service.load_tool_bound_model
+        ) as load_model:
+            greeting = "".join([chunk async for chunk in agent_service.stream_response("안녕", "routing_1")])
+            answer = "".join([chunk async for chunk in agent_service.stream_response("계산해줘", "routing_2")])
+
+        assert greeting == "안녕하세요!"
+        assert answer == "합계는 34 입니다."
+        assert [call.args[0] for call in load_model.call_args_list] == [
+            FAST_MODEL_ID, FAST_MODEL_ID, DEFAULT_MODEL_ID
+        ]
+        assert model_service.registry.latency(FAST_MODEL_ID) is not None
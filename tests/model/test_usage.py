@@ -0,0 +1,145 @@
+"""Token usage 집계 단위테스트."""
+
+import json
+from datetime import datetime
+
+import pytest
+from langchain_core.messages import AIMessage
+from src.agent.service import AgentService
+from src.llm.entities import TokenUsage
+from src.model.domains import get_model_pricing
+from src.model.model_execution_service import ModelExecutionService
+from src.model.routing import ModelRoutingPolicy
+from src.model.service import ModelService
+from src.model.settings import model_settings
+from src.model.usage import RequestUsage, UsageTracker, record_usage, usage_tracker
+
+CALCULATOR_SCRIPT = [
+    {
+        "match": "계산",
+        "steps": [
+            {"tool_calls": [{"name": "calculator", "args": {"expression": "100 * 1.5"}}]},
+            {"content": "계산 결과는 150 입니다."},
+        ],
+    },
+    {"steps": [{"content": "안녕하세요!"}]},
+]
+
+
+def make_usage(model="gpt-4o", prompt_tokens=1000, completion_tokens=500):
+    """호출 1회 사용량"""
+    return TokenUsage(
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        total_tokens=prompt_tokens + completion_tokens,
+        model=model,
+        timestamp=datetime.now(),
+    )
+
+
+class TestModelPricing:
+    """모델 가격표 테스트"""
+
+    @pytest.mark.parametrize("model_name, expected", [
+        ("gpt-4o", (2.5, 10.0)),
+        ("gpt-4o-2024-08-06", (2.5, 10.0)),
+        ("gpt-4o-mini", (0.15, 0.6)),
+        ("gpt-4o-mini-2024-07-18", (0.15, 0.6)),
+        ("fake-scripted", None),
+        ("gpt-4", None),
+    ])
+    def test_pricing_lookup(self, model_name, expected):
+        """라우팅 대상 모델과 날짜가 붙은 이름을 가장 긴 접두사로 찾는지 테스트"""
+        assert get_model_pricing(model_name) == expected
+
+    def test_cost_estimate(self):
+        """100만 토큰당 가격으로 비용을 계산하는지 테스트"""
+        assert make_usage("gpt-4o").cost_estimate == pytest.approx(0.0025 + 0.005)
+        assert make_usage("gpt-4o-mini").cost_estimate == pytest.approx(0.00015 + 0.0003)
+        assert make_usage("unknown-model").cost_estimate == 0.0
+
+
+class TestUsageTracker:
+    """UsageTracker 테스트"""
+
+    def test_aggregates_per_model_and_session(self):
+        """모델별/세션별/전체 사용량을 누적하는지 테스트"""
+        tracker = UsageTracker()
+        tracker.record("session_1", make_usage("gpt-4o"))
+        tracker.record("session_1", make_usage("gpt-4o-mini"))
+        tracker.record("session_2", make_usage("gpt-4o-mini"))
+
+        snapshot = tracker.snapshot()
+        assert snapshot["total"]["calls"] == 3
+        assert snapshot["total"]["total_tokens"] == 4500
+        assert snapshot["models"]["gpt-4o-mini"]["calls"] == 2
+        assert snapshot["sessions"] == 2
+        assert tracker.get_session("session_1")["cost_usd"] == pytest.approx(0.00795)
+
+    def test_session_map_bounded(self):
+        """세션별 집계가 최근 사용 순으로 max_sessions개까지만 남는지 테스트"""
+        tracker = UsageTracker(max_sessions=2)
+        for session_id in ["a", "b", "a", "c"]:
+            tracker.record(session_id, make_usage())
+
+        assert tracker.get_session("b") is None
+        assert tracker.get_session("a")["calls"] == 2
+        tracker.clear_session("a")
+        assert tracker.get_session("a") is None
+        assert tracker.snapshot()["total"]["calls"] == 4
+
+    def test_record_usage_from_message(self):
+        """메시지의 usage_metadata를 요청별 집계에 기록하고, 없으면 건너뛰는지 테스트"""
+        request_usage = RequestUsage()
+        config = {"configurable": {"thread_id": "usage_message", **request_usage.to_configurable()}}
+        message = AIMessage(
+            content="답변",
+            usage_metadata={"input_tokens": 10, "output_tokens": 5, "total_tokens": 15},
+            response_metadata={"model_name": "gpt-4o-2024-08-06"},
+        )
+
+        usage = record_usage(message, config)
+
+        assert usage.model == "gpt-4o-2024-08-06"
+        assert record_usage(AIMessage(content="보고 없음"), config) is None
+        assert request_usage.to_dict()["by_model"]["gpt-4o-2024-08-06"]["total_tokens"] == 15
+        assert usage_tracker.get_session("usage_message")["calls"] == 1
+
+
+class TestAgentUsage:
+    """Agent 경로의 사용량 집계 테스트 (가짜 모델)"""
+
+    @pytest.fixture
+    def fake_settings(self, monkeypatch, tmp_path):
+        """가짜 프로바이더 + 빠른 가짜 모델 설정"""
+        script_path = tmp_path / "script.json"
+        script_path.write_text(json.dumps(CALCULATOR_SCRIPT), encoding="utf-8")
+        monkeypatch.setattr(model_settings, "llm_provider", "fake")
+        monkeypatch.setattr(model_settings, "llm_fast_model", "fake-scripted-fast")
+        monkeypatch.setattr(model_settings, "fake_script_path", str(script_path))
+        monkeypatch.setattr(model_settings, "fake_latency_ms", 0.0)
+        monkeypatch.setattr(model_settings, "fake_tokens_per_second", 0.0)
+
+    @pytest.mark.asyncio
+    async def test_streamed_calls_recorded_per_request(self, fake_settings):
+        """스트리밍 LLM 호출마다 라우팅된 모델 이름으로 요청별/세션별 사용량을 기록하는지 테스트"""
+        model_service = ModelService()
+        agent_service = AgentService(
+            ModelExecutionService(model_service), model_router=ModelRoutingPolicy(model_service)
+        )
+        agent_service.router = None
+        request_usage = RequestUsage()
+
+        chunks = [
+            chunk async for chunk in agent_service.stream_response("100 * 1.5 계산해줘", "usage_thread", usage=request_usage)
+        ]
+
+        assert "".join(chunks) == "계산 결과는 150 입니다."
+        summary = request_usage.to_dict()
+        assert summary["calls"] == 2
+        assert list(summary["by_model"]) == ["fake-scripted-fast"]
+        assert summary["output_tokens"] > 0
+        assert usage_tracker.get_session("usage_thread")["calls"] == 2
+
+        agent_service.clear_history("usage_thread")
+        assert usage_tracker.get_session("usage_thread") is None
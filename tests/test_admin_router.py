@@ -0,0 +1,72 @@
+"""관리자 라우터 단위테스트."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.chatbot.service import ChatbotService
+from src.chatbot.settings import chatbot_settings
+from webapp.dependency import agent_service_dependency, chatbot_service_dependency
+from webapp.routers import admin
+
+ADMIN_TOKEN = "admin-secret"
+
+
+class TestAdminRouter:
+    """관리자 라우터 테스트"""
+
+    @pytest.fixture
+    def agent_service(self):
+        """Mock AgentService"""
+        agent_service = MagicMock()
+        agent_service.purge_idle_sessions.return_value = {
+            "purged_threads": 0, "thread_ids": [], "reclaimed_bytes": 0, "remaining_bytes": 0,
+        }
+        agent_service.get_memory_usage.return_value = {"total_bytes": 0}
+        return agent_service
+
+    @pytest.fixture
+    def client(self, agent_service, monkeypatch):
+        """관리자 라우터만 등록한 테스트 클라이언트 (관리자 토큰 설정)"""
+        monkeypatch.setattr(chatbot_settings, "admin_token", ADMIN_TOKEN)
+        app = FastAPI()
+        app.include_router(admin.router)
+        app.dependency_overrides[chatbot_service_dependency] = lambda: ChatbotService(agent_service=agent_service)
+        app.dependency_overrides[agent_service_dependency] = lambda: agent_service
+        return TestClient(app)
+
+    def test_requests_without_valid_token_rejected(self, client, agent_service):
+        """관리자 토큰이 없거나 틀리면 거부하는지 테스트"""
+        assert client.post("/admin/sessions/purge").status_code == 401
+        assert client.get("/admin/sessions/memory", headers={"X-Admin-Token": "wrong"}).status_code == 401
+        agent_service.purge_idle_sessions.assert_not_called()
+
+    def test_disabled_without_configured_token(self, client, monkeypatch):
+        """관리자 토큰이 설정되지 않으면 토큰과 무관하게 거부하는지 테스트"""
+        monkeypatch.setattr(chatbot_settings, "admin_token", None)
+
+        response = client.get("/admin/sessions/memory", headers={"X-Admin-Token": ""})
+
+        assert response.status_code == 403
+
+    def test_purge_with_token(self, client, agent_service):
+        """올바른 토큰이면 유휴 세션을 삭제하는지 테스트"""
+        response = client.post(
+            "/admin/sessions/purge", params={"idle_seconds": 60}, headers={"X-Admin-Token": ADMIN_TOKEN}
+        )
+
+        assert response.status_code == 200
+        agent_service.purge_idle_sessions.assert_called_once_with(60)
+
+    @pytest.mark.parametrize("idle_seconds", [0, -1])
+    def test_non_positive_idle_seconds_rejected(self, client, agent_service, idle_seconds):
+        """유휴 시간이 0 이하이면 모든 세션을 지우지 않고 거부하는지 테스트"""
+        response = client.post(
+            "/admin/sessions/purge",
+            params={"idle_seconds": idle_seconds},
+            headers={"X-Admin-Token": ADMIN_TOKEN},
+        )
+
+        assert response.status_code == 422
+        agent_service.purge_idle_sessions.assert_not_called()
@@ -0,0 +1,49 @@
+"""FastAPI 앱 환경 체크 단위테스트."""
+
+import pytest
+from src.model.settings import model_settings
+
+
+class TestCheckEnvironment:
+    """check_environment 테스트"""
+
+    @pytest.fixture
+    def check_environment(self, monkeypatch):
+        """키 없는 OpenAI 설정에서 check_environment 반환 (앱 임포트 시 체크는 가짜 모델로 통과)"""
+        monkeypatch.setattr(model_settings, "llm_provider", "fake")
+        from webapp.app import check_environment
+
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        monkeypatch.setattr(model_settings, "llm_provider", "openai")
+        monkeypatch.setattr(model_settings, "openai_api_key", "")
+        monkeypatch.setattr(model_settings, "openai_base_url", None)
+        return check_environment
+
+    def test_missing_key_exits(self, check_environment):
+        """OpenAI 키도 호환 서버 주소도 없으면 종료하는지 테스트"""
+        with pytest.raises(SystemExit):
+            check_environment()
+
+    def test_base_url_without_key_allowed(self, check_environment, monkeypatch):
+        """OpenAI 호환 서버 주소가 있으면 키 없이 시작하는지 테스트"""
+        monkeypatch.setattr(model_settings, "openai_base_url", "http://127.0.0.1:8100/v1")
+
+        check_environment()
+
+
+class TestCreateApp:
+    """create_app 테스트"""
+
+    @pytest.mark.parametrize("admin_token, status_code", [(None, 404), ("admin-secret", 401)])
+    def test_admin_routes_mounted_only_with_token(self, monkeypatch, admin_token, status_code):
+        """관리자 토큰을 설정한 경우에만 관리자 라우터를 등록하는지 테스트 (등록 시 토큰 없는 요청은 401)"""
+        from fastapi.testclient import TestClient
+        from src.chatbot.settings import chatbot_settings
+
+        monkeypatch.setattr(model_settings, "llm_provider", "fake")
+        monkeypatch.setattr(chatbot_settings, "admin_token", admin_token)
+        from webapp.app import create_app
+
+        response = TestClient(create_app()).post("/admin/sessions/purge", params={"idle_seconds": 0})
+
+        assert response.status_code == status_code
@@ -0,0 +1,30 @@
+"""채팅 라우터 단위테스트."""
+
+import pytest
+from webapp.routers.chat import ClosingStreamingResponse
+
+
+class TestClosingStreamingResponse:
+    """ClosingStreamingResponse 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_disconnect_before_first_byte_closes_streams(self):
+        """본문을 읽기 전에 연결이 끊겨도 on_close가 호출되는지 테스트"""
+        closed = []
+
+        async def body():
+            yield "data: {}\n\n"
+
+        async def on_close():
+            closed.append(True)
+
+        async def receive():
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            pass
+
+        response = ClosingStreamingResponse(body(), on_close=on_close, media_type="text/event-stream")
+        await response({"type": "http", "asgi": {"spec_version": "2.3"}}, receive, send)
+
+        assert closed == [True]
@@ -0,0 +1,138 @@
+"""컴포지션 루트 단위테스트."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from src.agent.service import AgentService
+from src.container import get_container, reset_container
+from src.model.executors.langchain_tools import get_tool_service
+from src.model.settings import model_settings
+from src.tools.service import ToolService
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# 처음 사용할 때까지 임포트하면 안 되는 모듈
+LAZY_MODULES = {
+    "yfinance", "pandas", "numexpr", "langchain_openai", "openai", "langchain", "langchain_core", "langgraph", "streamlit",
+}
+# 에이전트 그래프 구성에 필요해 서비스 생성 시점에 임포트되는 모듈
+GRAPH_MODULES = {"langchain_core", "langgraph"}
+
+# 시간 예산 검사는 부하에 따라 흔들리므로 RUN_PERF_TESTS=1일 때만 실행 (예산은 환경변수로 조정)
+perf_test = pytest.mark.skipif(not os.getenv("RUN_PERF_TESTS"), reason="RUN_PERF_TESTS=1일 때만 실행하는 성능 테스트")
+STARTUP_BUILD_BUDGET = float(os.getenv("STARTUP_BUILD_BUDGET", "0.5"))  # 콜드 프로세스 서비스 그래프 구성(초)
+STARTUP_TOTAL_BUDGET = float(os.getenv("STARTUP_TOTAL_BUDGET", "15.0"))
+IMPORT_TIME_BUDGET = float(os.getenv("IMPORT_TIME_BUDGET", "4.0"))  # webapp.app 누적 임포트(초, -X importtime 기준)
+
+STARTUP_SCRIPT = """
+import json, sys, time
+started = time.perf_counter()
+from src.container import get_container
+imported = time.perf_counter()
+service = get_container().chatbot.service()
+built = time.perf_counter()
+print(json.dumps({
+    "import": imported - started,
+    "build": built - imported,
+    "modules": sorted(sys.modules),
+    "agent_shared": service.agent_service is get_container().agent.service(),
+}))
+"""
+
+
+def run_python(*args):
+    """프로젝트 루트에서 새 파이썬 프로세스 실행 (키가 없으면 테스트용 키 사용)"""
+    env = {**os.environ, "OPENAI_API_KEY": os.environ.get("OPENAI_API_KEY", "sk-test")}
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True, timeout=60, check=True,
+    )
+
+
+def import_profile():
+    """webapp.app 임포트의 모듈별 누적 임포트 시간(µs)"""
+    result = run_python("-X", "importtime", "-c", "import webapp.app")
+
+    # "import time: self [us] | cumulative | imported package"
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, total, name = line[len("import time:"):].split("|")
+        cumulative[name.strip()] = int(total)
+    return cumulative
+
+
+def cold_startup():
+    """콜드 프로세스에서 컨테이너 구성 결과"""
+    return json.loads(run_python("-c", STARTUP_SCRIPT).stdout.strip().splitlines()[-1])
+
+
+class TestCompositionRoot:
+    """ApplicationContainer 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def fresh_container(self):
+        """테스트마다 새 컨테이너 사용"""
+        reset_container()
+        yield
+        reset_container()
+
+    def test_services_are_shared_singletons(self):
+        """모든 진입점이 같은 서비스 인스턴스를 공유하는지 테스트"""
+        container = get_container()
+        chatbot_service = container.chatbot.service()
+        agent_service = container.agent.service()
+
+        assert get_container() is container
+        assert chatbot_service.agent_service is agent_service
+        assert agent_service.model_execution_service is container.model.execution_service()
+        # webapp 도구 서비스, Agent, LangChain 도구 함수가 같은 시세 기록을 사용
+        assert agent_service.tool_service is container.tools.service()
+        assert get_tool_service() is container.tools.service()
+
+    def test_entry_points_build_each_service_once(self, monkeypatch):
+        """webapp/Streamlit/CLI 경로를 모두 거쳐도 서비스가 한 번씩만 생성되는지 테스트"""
+        # webapp 연결 시 webapp.app 임포트의 환경 체크를 OPENAI_API_KEY 없이 통과하도록 가짜 모델 사용
+        monkeypatch.setattr(model_settings, "llm_provider", "fake")
+        from webapp.container import create_container
+
+        with patch.object(AgentService, "__init__", autospec=True, side_effect=AgentService.__init__) as agent_init, \
+                patch.object(ToolService, "__init__", autospec=True, side_effect=ToolService.__init__) as tool_init:
+            webapp_container = create_container()
+            webapp_container.chatbot.service()
+            get_container().chatbot.service()  # Streamlit / CLI
+            get_tool_service()
+
+        assert webapp_container is get_container()
+        assert agent_init.call_count == 1
+        assert tool_init.call_count == 1
+
+    def test_import_keeps_heavy_modules_lazy(self):
+        """webapp.app 임포트가 무거운 의존성을 끌어오지 않는지 테스트"""
+        assert LAZY_MODULES.isdisjoint(import_profile())
+
+    def test_cold_startup_builds_without_heavy_modules(self):
+        """콜드 프로세스에서 서비스 그래프를 만들어도 무거운 의존성을 임포트하지 않는지 테스트"""
+        startup = cold_startup()
+
+        assert startup["agent_shared"]
+        assert (LAZY_MODULES - GRAPH_MODULES).isdisjoint(startup["modules"])
+
+    @perf_test
+    def test_import_time_budget(self):
+        """webapp.app 누적 임포트 시간이 예산 안인지 테스트"""
+        assert import_profile()["webapp.app"] / 1_000_000 < IMPORT_TIME_BUDGET
+
+    @perf_test
+    def test_startup_time_budget(self):
+        """콜드 프로세스에서 컨테이너 구성 시간이 예산 안인지 테스트"""
+        timings = cold_startup()
+
+        assert timings["build"] < STARTUP_BUILD_BUDGET
+        assert timings["import"] + timings["build"] < STARTUP_TOTAL_BUDGET
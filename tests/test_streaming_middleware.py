@@ -0,0 +1,84 @@
+"""Streaming middleware 단위테스트."""
+
+import pytest
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+from webapp.middleware.benchmark import run_benchmark
+from webapp.middleware.streaming import StreamingMiddleware
+
+
+async def stream(request):
+    """라우트가 일부 헤더를 직접 설정하는 SSE 응답"""
+    async def generate():
+        yield "event: token\ndata: {}\n\n"
+    return StreamingResponse(generate(), media_type="text/event-stream", headers={"Cache-Control": "no-store"})
+
+
+async def busy(request):
+    """스트리밍 경로의 JSON 오류 응답"""
+    return JSONResponse({"detail": "busy"}, status_code=503)
+
+
+@pytest.fixture
+def client():
+    """미들웨어를 적용한 테스트 앱"""
+    app = Starlette(
+        routes=[
+            Route("/chat/stream", stream, methods=["POST"]),
+            Route("/busy/stream", busy, methods=["POST"]),
+            Route("/health", busy),
+        ],
+        middleware=[Middleware(StreamingMiddleware)],
+    )
+    return TestClient(app)
+
+
+class TestStreamingMiddleware:
+    """StreamingMiddleware 테스트"""
+
+    def test_adds_missing_sse_headers_only(self, client):
+        """스트리밍 경로에 없는 SSE 헤더만 추가하고 라우트 헤더는 유지하는지 테스트"""
+        response = client.post("/chat/stream")
+
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert response.headers["cache-control"] == "no-store"
+        assert response.headers["x-accel-buffering"] == "no"
+        assert response.text == "event: token\ndata: {}\n\n"
+
+    def test_non_sse_response_untouched(self, client):
+        """스트리밍 경로라도 JSON 오류 응답과 다른 경로는 건드리지 않는지 테스트"""
+        busy_response = client.post("/busy/stream")
+        health_response = client.get("/health")
+
+        assert busy_response.headers["content-type"] == "application/json"
+        assert "x-accel-buffering" not in busy_response.headers
+        assert "x-accel-buffering" not in health_response.headers
+
+    @pytest.mark.asyncio
+    async def test_body_passed_through_without_copy(self):
+        """본문 메시지 객체를 그대로 전달하는지 테스트"""
+        sent_messages = []
+        body_message = {"type": "http.response.body", "body": b"data: {}\n\n", "more_body": False}
+
+        async def app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send(body_message)
+
+        async def send(message):
+            sent_messages.append(message)
+
+        await StreamingMiddleware(app)({"type": "http", "path": "/chat/stream"}, None, send)
+
+        assert sent_messages[1] is body_message
+        assert (b"content-type", b"text/event-stream") in sent_messages[0]["headers"]
+
+    @pytest.mark.asyncio
+    async def test_benchmark_runs(self):
+        """벤치마크가 미들웨어별 청크 플러시 지연을 측정하는지 테스트"""
+        results = await run_benchmark(chunks=5, interval=0.0, runs=1, names=["base_http", "asgi"])
+
+        assert set(results) == {"base_http", "asgi"}
+        assert all(result["p50_us"] >= 0 for result in results.values())
@@ -1,9 +1,13 @@
 """Tools service 단위테스트."""
 
+import asyncio
+
 import pytest
+from decimal import Decimal
 from unittest.mock import patch, MagicMock
 import pandas as pd
-from src.tools.service import StockPriceService, CalculatorService
+from src.tools.entities import StockPrice
+from src.tools.service import StockPriceService, CalculatorService, ToolService
 from src.utils.exceptions import InvalidTickerException, InvalidExpressionException, StockPriceException
 
 
@@ -37,6 +41,19 @@ class TestStockPriceService:
             assert "150.0" in result
             mock_ticker.assert_called_once_with("AAPL")
     
+    @pytest.mark.asyncio
+    async def test_ticker_locks_dropped_after_use(self, stock_service):
+        """조회가 끝난 종목의 Lock이 남지 않는지 테스트"""
+        with patch('yfinance.Ticker') as mock_ticker:
+            mock_ticker.return_value.history.return_value = pd.DataFrame({'Close': [150.0, 151.0]})
+            
+            await asyncio.gather(*(stock_service.get_stock_quote("AAPL") for _ in range(3)))
+            await stock_service.get_stock_quote("TSLA")
+        
+        # 동시 요청은 Lock으로 한 번만 조회
+        assert mock_ticker.call_count == 2
+        assert stock_service._locks == {}
+    
     @pytest.mark.asyncio
     async def test_get_stock_price_invalid_ticker(self, stock_service):
         """잘못된 티커로 주식 가격 조회 테스트"""
@@ -177,3 +194,96 @@ class TestCalculatorService:
         
         assert error_msg in result
         assert "계산 실패" in result
+
+
+class TestCalculatorReferences:
+    """계산기 종목 참조 테스트"""
+    
+    @pytest.fixture
+    def quotes(self):
+        """조회된 시세 목록 생성"""
+        return {
+            "AAPL": StockPrice(
+                symbol="AAPL",
+                price=Decimal("150"),
+                change=Decimal("2"),
+                change_percent=Decimal("1.5")
+            ),
+            "NVDA": StockPrice(symbol="NVDA", price=Decimal("100")),
+            "BRK.B": StockPrice(symbol="BRK.B", price=Decimal("400")),
+            "005930.KS": StockPrice(symbol="005930.KS", price=Decimal("70000")),
+            "OPEN": StockPrice(symbol="OPEN", price=Decimal("2")),
+        }
+    
+    def test_calculate_with_references(self, quotes):
+        """종목 참조가 포함된 계산 테스트"""
+        result = CalculatorService().calculate("AAPL.price * 5 + NVDA.price * 2", quotes)
+        
+        assert result.is_success
+        assert result.result == Decimal("950")
+    
+    def test_calculate_reference_case_insensitive(self, quotes):
+        """소문자 티커 참조 테스트"""
+        result = CalculatorService().calculate("aapl.change * 10", quotes)
+        
+        assert result.result == Decimal("20")
+    
+    @pytest.mark.parametrize("expression, expected", [
+        ("BRK.B.price * 2", Decimal("800")),
+        ("005930.KS.price / 1000", Decimal("70")),
+        ("005930.ks.price - BRK.B.price", Decimal("69600")),
+    ])
+    def test_calculate_dotted_and_numeric_tickers(self, quotes, expression, expected):
+        """점이 들어간 티커와 숫자로 시작하는 한국 종목 티커 참조 테스트"""
+        result = CalculatorService().calculate(expression, quotes)
+        
+        assert result.result == expected
+    
+    def test_reference_not_rejected_as_dangerous(self, quotes):
+        """위험 문자열이 들어간 티커(OPEN)는 참조로 치환되어 허용되는지 테스트"""
+        assert CalculatorService().calculate("OPEN.price * 3", quotes).result == Decimal("6")
+        
+        with pytest.raises(InvalidExpressionException, match="open"):
+            CalculatorService().calculate("open('x') + OPEN.price", quotes)
+    
+    def test_calculate_unknown_reference(self, quotes):
+        """조회되지 않은 종목 참조 테스트"""
+        with pytest.raises(InvalidExpressionException, match="조회되지 않은 종목입니다: MSFT.price"):
+            CalculatorService().calculate("MSFT.price * 2", quotes)
+    
+    def test_calculate_missing_field(self, quotes):
+        """값이 없는 필드 참조 테스트"""
+        with pytest.raises(InvalidExpressionException, match="참조할 값이 없습니다: NVDA.change"):
+            CalculatorService().calculate("NVDA.change", quotes)
+    
+    @pytest.mark.asyncio
+    async def test_tool_service_binds_quotes_to_thread(self):
+        """스레드별 시세 기록 테스트"""
+        tool_service = ToolService()
+        quote = StockPrice(symbol="AAPL", price=Decimal("150"))
+        
+        with patch.object(tool_service.stock_service, "get_stock_quote", return_value=quote):
+            await tool_service.get_stock_price("AAPL", "thread_1")
+        
+        assert tool_service.calculate("AAPL.price * 2", "thread_1") == "300"
+        with pytest.raises(InvalidExpressionException):
+            tool_service.calculate("AAPL.price * 2", "thread_2")
+        
+        tool_service.clear_thread_quotes("thread_1")
+        assert tool_service.get_thread_quotes("thread_1") == {}
+    
+    @pytest.mark.asyncio
+    async def test_thread_quotes_bounded(self):
+        """스레드별 시세가 최근 사용 순으로 max_threads개까지만 남는지 테스트"""
+        tool_service = ToolService(max_threads=2)
+        quote = StockPrice(symbol="AAPL", price=Decimal("150"))
+        
+        with patch.object(tool_service.stock_service, "get_stock_quote", return_value=quote):
+            await tool_service.get_stock_quote("AAPL", "thread_1")
+            await tool_service.get_stock_quote("AAPL", "thread_2")
+            await tool_service.get_stock_quote("AAPL", "thread_1")
+            await tool_service.get_stock_quote("AAPL", "thread_3")
+        
+        assert list(tool_service.get_thread_quotes("thread_1")) == ["AAPL"]
+        assert tool_service.get_thread_quotes("thread_2") == {}
+        assert list(tool_service.get_thread_quotes("thread_3")) == ["AAPL"]
@@ -0,0 +1,87 @@
+"""공유 HTTP 클라이언트 단위테스트."""
+
+import asyncio
+
+import httpx
+import pytest
+from src.utils.http_client import HttpClientSettings, MeteredAsyncTransport, create_async_client
+from src.utils.metrics import MetricsRegistry
+
+
+class FakeTransport(httpx.AsyncBaseTransport):
+    """지정한 네트워크 스트림으로 응답하는 가짜 트랜스포트"""
+    
+    def __init__(self, streams):
+        self.streams = list(streams)
+    
+    async def handle_async_request(self, request):
+        return httpx.Response(
+            200, 
+            stream=httpx.ByteStream(b"ok"), 
+            extensions={"network_stream": self.streams.pop(0)}
+        )
+
+
+class FakeNetworkStream:
+    """커넥션을 대신하는 객체"""
+
+
+class TestMeteredAsyncTransport:
+    """MeteredAsyncTransport 테스트"""
+    
+    @pytest.fixture
+    def registry(self):
+        """테스트 전용 메트릭 저장소"""
+        return MetricsRegistry()
+    
+    @pytest.mark.asyncio
+    async def test_connection_reuse_metrics(self, registry):
+        """커넥션 신규/재사용 메트릭 테스트"""
+        first, second = FakeNetworkStream(), FakeNetworkStream()
+        transport = MeteredAsyncTransport(
+            transport_factory=lambda: FakeTransport([first, first, second]),
+            registry=registry,
+        )
+        
+        async with httpx.AsyncClient(transport=transport) as client:
+            for _ in range(3):
+                response = await client.get("http://llm.local/v1/chat/completions")
+                assert response.text == "ok"
+        
+        assert registry.get_counter("llm_http.requests_total") == 3
+        assert registry.get_counter("llm_http.connections_opened_total") == 2
+        assert registry.get_counter("llm_http.connections_reused_total") == 1
+        assert registry.get_gauge("llm_http.in_flight") == 0
+    
+    @pytest.mark.asyncio
+    async def test_pool_saturation_metric(self, registry):
+        """풀 포화 메트릭 테스트"""
+        release = asyncio.Event()
+        
+        class SlowTransport(httpx.AsyncBaseTransport):
+            async def handle_async_request(self, request):
+                await release.wait()
+                return httpx.Response(200, stream=httpx.ByteStream(b"ok"))
+        
+        transport = MeteredAsyncTransport(
+            max_connections=1,
+            transport_factory=SlowTransport,
+            registry=registry,
+        )
+        
+        async with httpx.AsyncClient(transport=transport) as client:
+            tasks = [asyncio.create_task(client.get("http://llm.local/")) for _ in range(2)]
+            await asyncio.sleep(0.01)
+            release.set()
+            await asyncio.gather(*tasks)
+        
+        assert registry.get_counter("llm_http.pool_saturated_total") == 1
+        assert registry.get_gauge("llm_http.in_flight_peak") == 2
+    
+    def test_create_async_client_without_h2(self):
+        """h2 미설치 환경에서도 클라이언트가 생성되는지 테스트"""
+        settings = HttpClientSettings(llm_http2=True, llm_http_max_connections=5)
+        client = create_async_client(settings)
+        
+        assert isinstance(client._transport, MeteredAsyncTransport)
+        assert client._transport.max_connections == 5
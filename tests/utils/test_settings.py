@@ -0,0 +1,52 @@
+"""설정 로더 단위테스트."""
+
+from typing import ClassVar
+
+import pytest
+from pydantic_settings import BaseSettings
+from src.utils.settings import LazySettings, clear_settings_cache, load_settings
+
+
+class CountingSettings(BaseSettings):
+    """생성 횟수를 세는 설정"""
+
+    created: ClassVar[int] = 0
+
+    value: int = 1
+
+    def __init__(self, **kwargs):
+        type(self).created += 1
+        super().__init__(**kwargs)
+
+
+class TestSettingsLoader:
+    """load_settings / LazySettings 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def reset(self):
+        """캐시와 생성 횟수 초기화"""
+        clear_settings_cache()
+        CountingSettings.created = 0
+        yield
+        clear_settings_cache()
+
+    def test_load_settings_once(self):
+        """같은 설정 클래스는 한 번만 생성되는지 테스트"""
+        first = load_settings(CountingSettings)
+
+        assert load_settings(CountingSettings) is first
+        assert CountingSettings.created == 1
+
+    def test_lazy_settings_defers_loading(self, monkeypatch):
+        """프록시는 처음 접근할 때 로드하고 이후 같은 인스턴스에 위임하는지 테스트"""
+        settings = LazySettings(CountingSettings)
+        assert CountingSettings.created == 0
+
+        assert settings.value == 1
+        monkeypatch.setattr(settings, "value", 5)
+
+        assert load_settings(CountingSettings).value == 5
+        assert CountingSettings.created == 1
+
+        monkeypatch.undo()
+        assert settings.value == 1
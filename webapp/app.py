@@ -2,6 +2,7 @@
 import os
 import sys
 import logging
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 # 프로젝트 루트를 Python 경로에 추가
@@ -15,7 +16,10 @@ from webapp.middleware.streaming import StreamingMiddleware
 from webapp.container import create_container
 from webapp.logger import initialize_logger
 
-from webapp.routers import health, chat
+from webapp.routers import health, chat, metrics, admin
+from src.chatbot.settings import chatbot_settings
+from src.model.settings import model_settings
+from src.utils.http_client import aclose_shared_async_client
 
 # 환경변수 로드
 load_dotenv()
@@ -29,7 +33,15 @@ logger = initialize_logger()
 
 def check_environment():
     """환경 설정 체크"""
-    api_key = os.getenv("OPENAI_API_KEY")
+    if model_settings.llm_provider == "fake":
+        logger.info("🧪 가짜 모델(LLM_PROVIDER=fake)로 실행 - OpenAI API 키 확인 생략")
+        return
+    if model_settings.openai_base_url:
+        # 로컬 OpenAI 호환 서버는 키가 없으면 자리표시 키 사용
+        logger.info(f"🔌 OpenAI 호환 서버({model_settings.openai_base_url})로 실행 - OpenAI API 키 확인 생략")
+        return
+    
+    api_key = model_settings.openai_api_key or os.getenv("OPENAI_API_KEY")
     if not api_key:
         logger.error("❌ OpenAI API 키가 설정되지 않았습니다!")
         logger.info("📝 .env 파일에 OPENAI_API_KEY=your_api_key_here 추가")
@@ -37,6 +49,14 @@ def check_environment():
     logger.info("✅ 환경 설정 완료")
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 수명주기 - 종료 시 공유 HTTP 커넥션 정리"""
+    yield
+    await aclose_shared_async_client()
+    logger.info("공유 LLM HTTP 클라이언트 종료")
+
+
 def create_app() -> FastAPI:
     """FastAPI 애플리케이션 생성"""
     # 환경 체크
@@ -49,7 +69,8 @@ def create_app() -> FastAPI:
     app = FastAPI(
         title="Stock Analysis Chatbot API",
         description="Layered Architecture를 적용한 주가 분석 챗봇 API",
-        version="2.0.0"
+        version="2.0.0",
+        lifespan=lifespan
     )
     
     # CORS 설정
@@ -67,6 +88,10 @@ def create_app() -> FastAPI:
     # 라우터 등록
     app.include_router(health.router)
     app.include_router(chat.router)
+    app.include_router(metrics.router)
+    if chatbot_settings.admin_token:
+        # 세션 일괄 삭제 등 관리자 API는 토큰을 설정한 경우에만 노출
+        app.include_router(admin.router)
     
     # 컨테이너를 앱에 연결
     app.container = container
@@ -1,37 +1,19 @@
 """Application container for dependency injection."""
 
 import logging
-from dependency_injector import containers, providers
-from src.agent.container import AgentContainer
-from src.chatbot.container import ChatbotContainer
-from src.model.container import ModelContainer
-from src.tools.container import ToolsContainer
+from src.container import ApplicationContainer, get_container
 
 logger = logging.getLogger(__name__)
 
-class ApplicationContainer(containers.DeclarativeContainer):
-    """애플리케이션 컨테이너 - 모든 도메인 컨테이너를 통합"""
-    
-    wiring_config = containers.WiringConfiguration(packages=["webapp"])
-    
-    # 도메인 컨테이너들
-    model: ModelContainer = providers.Container(ModelContainer)
-    tools: ToolsContainer = providers.Container(ToolsContainer)
-    agent: AgentContainer = providers.Container(
-        AgentContainer,
-        model=model,
-    )
-    chatbot: ChatbotContainer = providers.Container(
-        ChatbotContainer,
-        agent=agent,
-    )
+__all__ = ["ApplicationContainer", "create_container"]
+
 
 def create_container() -> ApplicationContainer:
-    """컨테이너 생성 및 초기화"""
-    container = ApplicationContainer()
+    """컴포지션 루트 컨테이너를 가져와 webapp 의존성에 연결"""
+    container = get_container()
     
-    # 컨테이너 초기화
-    container.wire(modules=["webapp"])
+    # FastAPI 의존성(Provide[...]) 연결
+    container.wire(packages=["webapp"])
     
-    logger.info("Application container initialized")
+    logger.info("Webapp container wired")
     return container
@@ -1,16 +1,21 @@
 """Dependency injection for webapp."""
 
 import logging
-from typing import Annotated, Optional
+import secrets
+from typing import TYPE_CHECKING, Annotated, Optional
 from dependency_injector.wiring import Provide, inject
-from fastapi import Depends
+from fastapi import Depends, Header, HTTPException
 
 from src.chatbot.service import ChatbotService
-from src.agent.service import AgentService
-from src.model.model_execution_service import ModelExecutionService
+from src.chatbot.settings import chatbot_settings
 from src.model.service import ModelService
 from src.tools.service import ToolService
 
+if TYPE_CHECKING:
+    # langgraph/langchain_core를 끌어오므로 타입 검사 때만 임포트 (서비스는 첫 요청 시 생성)
+    from src.agent.service import AgentService
+    from src.model.model_execution_service import ModelExecutionService
+
 from webapp.container import ApplicationContainer
 
 logger = logging.getLogger(__name__)
@@ -27,19 +32,19 @@ def chatbot_service_dependency(
 
 @inject
 def agent_service_dependency(
-    service: AgentService = Depends(
+    service: "AgentService" = Depends(
         Provide[ApplicationContainer.agent.service]
     ),
-) -> AgentService:
+) -> "AgentService":
     """에이전트 서비스 의존성 주입"""
     return service
 
 @inject
 def model_execution_service_dependency(
-    service: ModelExecutionService = Depends(
+    service: "ModelExecutionService" = Depends(
         Provide[ApplicationContainer.model.execution_service]
     ),
-) -> ModelExecutionService:
+) -> "ModelExecutionService":
     """모델 실행 서비스 의존성 주입"""
     return service
 
@@ -60,3 +65,13 @@ def tool_service_dependency(
 ) -> ToolService:
     """도구 서비스 의존성 주입"""
     return service
+
+def admin_token_dependency(
+    admin_token: Optional[str] = Header(None, alias="X-Admin-Token"),
+) -> None:
+    """관리자 토큰 검증 - 토큰이 설정되지 않았거나 일치하지 않으면 거부"""
+    expected = chatbot_settings.admin_token
+    if not expected:
+        raise HTTPException(status_code=403, detail="관리자 API가 비활성화되어 있습니다")
+    if not admin_token or not secrets.compare_digest(admin_token, expected):
+        raise HTTPException(status_code=401, detail="유효하지 않은 관리자 토큰입니다")
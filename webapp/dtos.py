@@ -2,7 +2,7 @@
 
 import logging
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, ConfigDict
 from pydantic.alias_generators import to_camel
 
@@ -25,6 +25,8 @@ class ChatResponse(CamelModel):
     session_id: str
     message_id: Optional[str] = None
     timestamp: Optional[datetime] = None
+    # 이 요청의 LLM 토큰 사용량/추정 비용 (모델별 포함)
+    usage: Optional[Dict[str, Any]] = None
 
 class HealthResponse(CamelModel):
     """헬스체크 응답 모델"""
@@ -32,6 +34,13 @@ class HealthResponse(CamelModel):
     timestamp: datetime
     version: str
 
+class PurgeSessionsResponse(CamelModel):
+    """유휴 세션 일괄 삭제 응답 모델"""
+    purged_threads: int
+    thread_ids: List[str]
+    reclaimed_bytes: int
+    remaining_bytes: int
+
 class OkDTO(CamelModel):
     """성공 응답 모델"""
     ok: bool = True
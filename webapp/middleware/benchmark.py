@@ -0,0 +1,158 @@
+"""스트리밍 미들웨어 벤치마크 - 청크 플러시 지연 비교 (BaseHTTPMiddleware vs 순수 ASGI)
+
+    python -m webapp.middleware.benchmark --chunks 200 --interval-ms 2 --runs 20
+
+네트워크 없이 ASGI 앱을 직접 호출해 라우트 생성기가 청크를 내놓은 시각부터
+서버(send)에 http.response.body 메시지가 도착한 시각까지를 청크마다 측정합니다.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Dict, List, Optional
+
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import StreamingResponse
+from starlette.routing import Route
+
+from webapp.middleware.streaming import SSE_HEADERS, StreamingMiddleware
+
+STREAM_PATH = "/chat/stream"
+
+
+class BaseHTTPStreamingMiddleware(BaseHTTPMiddleware):
+    """비교 기준 - 이전 방식 (BaseHTTPMiddleware로 응답을 중계하며 헤더 덮어쓰기)"""
+
+    async def dispatch(self, request: Request, call_next):
+        response = await call_next(request)
+        if request.url.path.endswith(STREAM_PATH):
+            response.headers["Content-Type"] = "text/event-stream"
+            for name, value in SSE_HEADERS:
+                response.headers[name] = value
+        return response
+
+
+MIDDLEWARES: Dict[str, Optional[type]] = {
+    "none": None,
+    "base_http": BaseHTTPStreamingMiddleware,
+    "asgi": StreamingMiddleware,
+}
+
+
+def build_app(middleware_class: Optional[type], chunks: int, interval: float, produced: List[float]) -> Starlette:
+    """chunks개의 SSE 프레임을 interval초 간격으로 보내는 앱 (생성 시각은 produced에 기록)"""
+
+    async def stream(request: Request) -> StreamingResponse:
+        async def generate():
+            for i in range(chunks):
+                if interval:
+                    await asyncio.sleep(interval)
+                produced.append(time.perf_counter())
+                yield f"id: {i}\nevent: token\ndata: {{\"text\":\"토큰{i}\"}}\n\n"
+
+        return StreamingResponse(generate(), media_type="text/event-stream")
+
+    middleware = [Middleware(middleware_class)] if middleware_class else []
+    return Starlette(routes=[Route(STREAM_PATH, stream, methods=["POST"])], middleware=middleware)
+
+
+async def run_once(app: Starlette, received: List[float]) -> None:
+    """요청 한 번 실행 (본문 메시지 도착 시각은 received에 기록)"""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.3"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": STREAM_PATH,
+        "raw_path": STREAM_PATH.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"content-type", b"application/json")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("127.0.0.1", 8000),
+    }
+    request_sent = False
+    disconnected = asyncio.Event()
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"{}", "more_body": False}
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.body" and message.get("body"):
+            received.append(time.perf_counter())
+
+    try:
+        await app(scope, receive, send)
+    finally:
+        disconnected.set()
+
+
+async def measure(middleware_class: Optional[type], chunks: int, interval: float, runs: int) -> Dict[str, float]:
+    """청크 플러시 지연(µs) 분포와 요청당 총 시간(ms)"""
+    latencies: List[float] = []
+    durations: List[float] = []
+    for _ in range(runs):
+        produced: List[float] = []
+        received: List[float] = []
+        app = build_app(middleware_class, chunks, interval, produced)
+        started_at = time.perf_counter()
+        await run_once(app, received)
+        durations.append((time.perf_counter() - started_at) * 1000)
+        latencies.extend((sent - made) * 1_000_000 for made, sent in zip(produced, received))
+
+    latencies.sort()
+    return {
+        "mean_us": statistics.fmean(latencies),
+        "p50_us": latencies[len(latencies) // 2],
+        "p99_us": latencies[min(int(len(latencies) * 0.99), len(latencies) - 1)],
+        "request_ms": statistics.fmean(durations),
+    }
+
+
+def format_table(results: Dict[str, Dict[str, float]]) -> str:
+    """결과 표"""
+    lines = [f"{'middleware':<10} {'mean(µs)':>10} {'p50(µs)':>10} {'p99(µs)':>10} {'request(ms)':>12}"]
+    for name, result in results.items():
+        lines.append(
+            f"{name:<10} {result['mean_us']:>10.1f} {result['p50_us']:>10.1f} "
+            f"{result['p99_us']:>10.1f} {result['request_ms']:>12.2f}"
+        )
+    return "\n".join(lines)
+
+
+async def run_benchmark(
+    chunks: int, interval: float, runs: int, names: Optional[List[str]] = None
+) -> Dict[str, Dict[str, float]]:
+    """미들웨어별 측정 (워밍업 1회 후)"""
+    results = {}
+    for name in names or list(MIDDLEWARES):
+        await measure(MIDDLEWARES[name], chunks, interval, 1)
+        results[name] = await measure(MIDDLEWARES[name], chunks, interval, runs)
+    return results
+
+
+def main() -> None:
+    """벤치마크 실행"""
+    parser = argparse.ArgumentParser(description="스트리밍 미들웨어 청크 플러시 지연 벤치마크")
+    parser.add_argument("--chunks", type=int, default=200, help="요청당 청크 수")
+    parser.add_argument("--interval-ms", type=float, default=0.0, help="청크 간격(ms) - 0이면 연속 전송")
+    parser.add_argument("--runs", type=int, default=20, help="미들웨어별 요청 수")
+    args = parser.parse_args()
+
+    results = asyncio.run(run_benchmark(args.chunks, args.interval_ms / 1000, args.runs))
+    print(f"chunks={args.chunks} interval={args.interval_ms}ms runs={args.runs}")
+    print(format_table(results))
+
+
+if __name__ == "__main__":
+    main()
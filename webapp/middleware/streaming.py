@@ -1,51 +1,65 @@
 """Streaming middleware for real-time response handling."""
 
 import logging
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from typing import Iterable, Tuple
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
-class StreamingMiddleware(BaseHTTPMiddleware):
+# 스트리밍 응답 기본 헤더 (라우트가 이미 설정한 값은 유지)
+SSE_HEADERS: Tuple[Tuple[str, str], ...] = (
+    ("Cache-Control", "no-cache"),
+    ("Connection", "keep-alive"),
+    ("X-Accel-Buffering", "no"),  # Nginx 버퍼링 비활성화
+    ("Access-Control-Expose-Headers", "Content-Type, Cache-Control, X-Session-ID"),
+)
+SSE_MEDIA_TYPE = "text/event-stream"
+
+
+class StreamingMiddleware:
     """
-    StreamingMiddleware는 스트리밍 응답을 처리하기 위한 미들웨어입니다.
+    StreamingMiddleware는 스트리밍 엔드포인트 응답에 SSE 헤더를 채워 넣는 순수 ASGI 미들웨어입니다.
 
-    스트리밍 응답은 서버에서 클라이언트로 데이터를 실시간 스트리밍 방식으로 전송하며, 이 미들웨어는 FastAPI 응답 흐름을 제어하여
-    서버가 응답을 즉시 플러시(Flush)하고 클라이언트로 전송할 수 있도록 보장합니다.
+    BaseHTTPMiddleware는 응답 본문을 별도 태스크와 메모리 스트림으로 한 번 더 중계하므로 청크마다 비용이 들고
+    플러시가 늦어질 수 있습니다. 이 미들웨어는 http.response.start 메시지의 헤더만 보완하고
+    본문 메시지는 복사 없이 그대로 전달합니다. 스트리밍이 아닌 경로는 send를 감싸지도 않습니다.
 
-    이 미들웨어가 없을 경우, 서버는 응답을 버퍼에 계속 쌓아두고 전체 응답이 끝날 때 한 번에 반환하는 현상이 발생할 수 있습니다.
-    이 미들웨어는 이러한 버퍼링 문제를 해결하여 클라이언트가 실시간으로 데이터를 수신할 수 있도록 도와줍니다.
+    - 라우트가 설정한 헤더는 덮어쓰지 않음 (없는 헤더만 추가)
+    - Content-Type이 SSE가 아닌 응답(예: 429/503 JSON 오류)은 건드리지 않음
+    - CORS 헤더는 CORSMiddleware가 담당
     """
 
-    async def dispatch(self, request: Request, call_next):
-        """요청을 처리하고 스트리밍 응답을 최적화합니다."""
-        response = await call_next(request)
-        
-        # 스트리밍 엔드포인트인지 확인
-        if self._is_streaming_endpoint(request):
-            response = self._configure_streaming_response(response)
-            logger.info(f"스트리밍 응답 설정 완료: {request.url.path}")
-        
-        return response
-    
-    def _is_streaming_endpoint(self, request: Request) -> bool:
+    def __init__(self, app: ASGIApp, streaming_paths: Iterable[str] = ("/chat/stream", "/stream")):
+        self.app = app
+        self.streaming_paths = tuple(streaming_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._is_streaming_path(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_sse_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                self._add_sse_headers(message)
+            await send(message)
+
+        await self.app(scope, receive, send_with_sse_headers)
+
+    def _is_streaming_path(self, path: str) -> bool:
         """스트리밍 엔드포인트인지 확인합니다."""
-        streaming_paths = ["/chat/stream", "/stream"]
-        return any(path in str(request.url.path) for path in streaming_paths)
-    
-    def _configure_streaming_response(self, response: Response) -> Response:
-        """스트리밍 응답에 필요한 헤더를 설정합니다."""
-        # Server-Sent Events (SSE) 헤더 설정
-        response.headers["Content-Type"] = "text/event-stream"
-        response.headers["Cache-Control"] = "no-cache"
-        response.headers["Connection"] = "keep-alive"
-        response.headers["X-Accel-Buffering"] = "no"  # Nginx 버퍼링 비활성화
-        
-        # CORS 헤더 (스트리밍용)
-        response.headers["Access-Control-Allow-Origin"] = "*"
-        response.headers["Access-Control-Allow-Methods"] = "GET, POST, OPTIONS"
-        response.headers["Access-Control-Allow-Headers"] = "Content-Type, Authorization"
-        response.headers["Access-Control-Expose-Headers"] = "Content-Type, Cache-Control"
-        
-        return response
+        return path.endswith(self.streaming_paths)
+
+    @staticmethod
+    def _add_sse_headers(message: Message) -> None:
+        """응답 시작 메시지에 없는 SSE 헤더만 추가합니다."""
+        message.setdefault("headers", [])
+        headers = MutableHeaders(scope=message)
+        content_type = headers.get("content-type")
+        if content_type is None:
+            headers["Content-Type"] = SSE_MEDIA_TYPE
+        elif not content_type.startswith(SSE_MEDIA_TYPE):
+            return
+        for name, value in SSE_HEADERS:
+            headers.setdefault(name, value)
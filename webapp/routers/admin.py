@@ -0,0 +1,35 @@
+"""Admin endpoints for session maintenance."""
+
+import logging
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Depends, Query
+
+from webapp.dependency import admin_token_dependency, agent_service_dependency, chatbot_service_dependency
+from webapp.dtos import PurgeSessionsResponse
+from src.utils.exceptions import InvalidInputException
+
+logger = logging.getLogger(__name__)
+
+# 라우터 생성 (모든 엔드포인트에 관리자 토큰 필요)
+router = APIRouter(prefix="/admin", tags=["Admin"], dependencies=[Depends(admin_token_dependency)])
+
+@router.post("/sessions/purge", response_model=PurgeSessionsResponse)
+async def purge_idle_sessions(
+    idle_seconds: Optional[float] = Query(None, gt=0, description="이 시간(초)보다 오래 사용되지 않은 세션 삭제 (기본: 세션 타임아웃)"),
+    chatbot_service = Depends(chatbot_service_dependency)
+):
+    """유휴 세션 일괄 삭제"""
+    try:
+        return PurgeSessionsResponse(**chatbot_service.purge_idle_sessions(idle_seconds))
+    except InvalidInputException as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"유휴 세션 삭제 실패: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/sessions/memory", response_model=dict)
+async def get_session_memory(
+    agent_service = Depends(agent_service_dependency)
+):
+    """세션 체크포인트 메모리 사용량"""
+    return agent_service.get_memory_usage()
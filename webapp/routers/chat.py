@@ -1,10 +1,14 @@
 """Chat endpoints for chatbot functionality."""
 
 import logging
+from typing import Awaitable, Callable
 from uuid import uuid4
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request
 from fastapi.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
 
+from src.chatbot.sse import sse_stream
+from src.utils.exceptions import ServerBusyException, SessionBusyException
 from webapp.dependency import chatbot_service_dependency
 from webapp.dtos import ChatRequest, ChatResponse
 
@@ -13,6 +17,41 @@ logger = logging.getLogger(__name__)
 # 라우터 생성
 router = APIRouter(prefix="", tags=["Chat"])
 
+# 승인 거절 시 재시도 안내(초)
+RETRY_AFTER_SECONDS = "1"
+
+
+def _admission_rejected(e: Exception) -> HTTPException:
+    """승인 거절 응답 - 세션 대기 초과는 429, 전역 한도 초과는 503"""
+    status_code = 429 if isinstance(e, SessionBusyException) else 503
+    return HTTPException(status_code=status_code, detail=e.message, headers={"Retry-After": RETRY_AFTER_SECONDS})
+
+
+class ClosingStreamingResponse(StreamingResponse):
+    """응답이 끝나거나 취소되면 본문 스트림과 on_close를 정리하는 StreamingResponse
+
+    Starlette는 첫 바이트 전에 연결이 끊기면 본문 생성기를 시작하지 않고 끝내므로 생성기의 finally에 기대지 않습니다.
+    """
+
+    def __init__(self, content, on_close: Callable[[], Awaitable[None]], **kwargs):
+        super().__init__(content, **kwargs)
+        self.on_close = on_close
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            try:
+                await self.body_iterator.aclose()
+            finally:
+                await self.on_close()
+
+
+async def _wait_for_disconnect(request: Request) -> None:
+    """클라이언트 연결이 끊길 때까지 대기 (요청 본문은 이미 읽었으므로 다음 메시지는 연결 종료)"""
+    while (await request.receive())["type"] != "http.disconnect":
+        pass
+
 @router.post("/chat", response_model=ChatResponse)
 async def chat(
     request: ChatRequest,
@@ -27,9 +66,12 @@ async def chat(
             content=response.content,
             session_id=response.session_id,
             message_id=response.message_id,
-            timestamp=response.timestamp
+            timestamp=response.timestamp,
+            usage=response.metadata.get("usage")
         )
         
+    except (SessionBusyException, ServerBusyException) as e:
+        raise _admission_rejected(e)
     except Exception as e:
         logger.error(f"채팅 처리 실패: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -37,24 +79,25 @@ async def chat(
 @router.post("/chat/stream")
 async def stream_chat(
     request: ChatRequest,
+    http_request: Request,
     chatbot_service = Depends(chatbot_service_dependency)
 ):
-    """스트리밍 채팅"""
+    """스트리밍 채팅 - token / tool_start / tool_end / usage / done / error 이벤트 (JSON data)
+
+    클라이언트 연결이 끊기면 Agent 실행(진행 중인 LLM/도구 호출 포함)을 취소하고 이번 턴의 대화 기록을 되돌립니다.
+    """
     try:
         session_id = request.session_id or f"session_{uuid4()}"
         streaming_response = await chatbot_service.stream_chat(session_id, request.message)
         
-        async def generate():
-            try:
-                async for chunk in streaming_response.generator:
-                    yield f"data: {chunk}\n\n"
-                yield "data: [DONE]\n\n"
-            except Exception as e:
-                logger.error(f"스트리밍 중 오류: {e}")
-                yield f"data: ERROR: {str(e)}\n\n"
-        
-        return StreamingResponse(
-            generate(),
+        return ClosingStreamingResponse(
+            sse_stream(
+                streaming_response.events,
+                session_id,
+                usage=streaming_response.metadata.get("usage"),
+                disconnected=_wait_for_disconnect(http_request),
+            ),
+            on_close=streaming_response.aclose,
             media_type="text/event-stream",  # SSE 형식으로 변경
             headers={
                 "Cache-Control": "no-cache",
@@ -64,6 +107,8 @@ async def stream_chat(
             }
         )
         
+    except (SessionBusyException, ServerBusyException) as e:
+        raise _admission_rejected(e)
     except Exception as e:
         logger.error(f"스트리밍 채팅 처리 실패: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -75,8 +120,11 @@ async def clear_session(
 ):
     """세션 초기화"""
     try:
-        chatbot_service.clear_session(session_id)
-        return {"message": f"세션 {session_id}가 초기화되었습니다"}
+        reclaimed_bytes = chatbot_service.clear_session(session_id)
+        return {
+            "message": f"세션 {session_id}가 초기화되었습니다",
+            "reclaimedBytes": reclaimed_bytes
+        }
     except Exception as e:
         logger.error(f"세션 초기화 실패: {e}")
         raise HTTPException(status_code=500, detail=str(e))
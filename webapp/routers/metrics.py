@@ -0,0 +1,30 @@
+"""Metrics endpoints."""
+
+import logging
+from fastapi import APIRouter, HTTPException
+
+from src.model.usage import usage_tracker
+from src.utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# 라우터 생성
+router = APIRouter(prefix="", tags=["Metrics"])
+
+@router.get("/metrics", response_model=dict)
+async def get_metrics():
+    """인메모리 메트릭 스냅샷 (커넥션 풀, 지연시간, 토큰 사용량 등)"""
+    return {**metrics.snapshot(), "usage": usage_tracker.snapshot()}
+
+@router.get("/metrics/usage", response_model=dict)
+async def get_usage():
+    """전체/모델별 누적 토큰 사용량과 추정 비용"""
+    return usage_tracker.snapshot()
+
+@router.get("/metrics/usage/{session_id}", response_model=dict)
+async def get_session_usage(session_id: str):
+    """세션 누적 토큰 사용량과 추정 비용"""
+    usage = usage_tracker.get_session(session_id)
+    if usage is None:
+        raise HTTPException(status_code=404, detail=f"사용량 기록이 없는 세션입니다: {session_id}")
+    return usage